@@ -0,0 +1,324 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+BATCH_METHODS = ("nearest_neighbor", "2-opt", "held_karp")
+
+# Largest instance the batched Held-Karp program accepts: its table takes 4.4 MB per instance of 16 cities
+BATCH_HELD_KARP_MAX_CITIES = 16
+
+# Number of float entries each vectorized chunk may allocate at once (about 32 MB of float64)
+CHUNK_ENTRIES = 2 ** 22
+
+def solve_tsp_batch(distance_matrices, method="2-opt", start=1, max_workers=None):
+    """
+    Solve many small TSP instances at once, without printing or plotting anything.
+
+    Instances of the same size are stacked into one 3D array and solved together: every step of the
+    built-in methods is a NumPy operation over all instances of the chunk, so thousands of 10-50 city
+    instances cost a few hundred array operations instead of thousands of Python calls. Any other
+    solver can be passed as a function; the instances are then fanned out to a process pool.
+
+    Parameters:
+    - distance_matrices (3D numpy array or list of 2D arrays): The distance matrices, either stacked as a
+      (num_instances, n, n) array or as a list of square matrices of varying size. Any instance can also be
+      given as its upper triangle in a condensed 1D array (a 2D array then stacks condensed instances).
+    - method (str or callable): How every instance is solved. Defaults to "2-opt".
+        - "nearest_neighbor": Nearest Neighbor from the starting city.
+        - "2-opt": Nearest Neighbor improved with best-improvement 2-opt until no improving move is left.
+        - "held_karp": The Held-Karp dynamic program, exact for up to BATCH_HELD_KARP_MAX_CITIES (16) cities.
+        - A function taking one distance matrix and returning a result that unpacks as (tour, total_distance, ...),
+          e.g., solve_tsp_with_branch_and_bound. The tour can be a list of cities or of edges (i, j); further
+          values (bound, gap) are ignored. It must be picklable, i.e., defined at the top level of a module.
+    - start (int): The city every tour starts and ends at (1-based index). Defaults to City 1.
+    - max_workers (int): Number of worker processes. The built-in methods run in this process unless
+      max_workers is greater than 1, in which case their chunks are spread over a pool; a function always
+      runs on a pool. Defaults to None (the number of CPUs for functions).
+
+    Returns:
+    - results (numpy structured array): One record per instance, in the input order, with the fields
+        - "n" (int32): Number of cities.
+        - "total_distance" (float64): Total distance of the tour.
+        - "optimal" (bool): Whether the tour is known to be optimal ("held_karp").
+        - "tour" (int32 array): The closed 1-based tour, e.g., [1, 3, 4, 2, 1], padded with zeros after
+          its n + 1 cities up to the size of the largest instance: results["tour"][k, :results["n"][k] + 1].
+    """
+    if not callable(method) and method not in BATCH_METHODS:
+        raise ValueError(f"Unknown batch method {method!r}, expected one of {BATCH_METHODS} or a function")
+
+    matrices = as_matrix_list(distance_matrices)
+    sizes = np.array([len(matrix) for matrix in matrices], dtype=np.int32)
+    if method == "held_karp" and len(sizes) and sizes.max() > BATCH_HELD_KARP_MAX_CITIES:
+        raise ValueError(f"The batched Held-Karp program handles at most {BATCH_HELD_KARP_MAX_CITIES} cities per instance.")
+    if len(sizes) and start > sizes.min():
+        raise ValueError("The starting city must exist in every instance.")
+
+    width = int(sizes.max()) + 1 if len(sizes) else 1
+    results = np.zeros(len(matrices), dtype=[("n", np.int32), ("total_distance", np.float64),
+                                             ("optimal", np.bool_), ("tour", np.int32, (width,))])
+    results["n"] = sizes
+
+    if callable(method):
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+            solved = executor.map(_solve_with_function, [method] * len(matrices), matrices, chunksize=8)
+            for k, order in enumerate(solved):
+                _store(results, [k], [order], matrices[k][None], start, optimal=False)
+        return results
+
+    # Stack the instances of every size into chunks that fit in CHUNK_ENTRIES
+    chunks = []
+    for n in np.unique(sizes).tolist():
+        indices = np.flatnonzero(sizes == n)
+        per_instance = max(n * n, (1 << max(n - 1, 0)) * n if method == "held_karp" else 0)
+        chunk_size = max(1, CHUNK_ENTRIES // per_instance)
+        for first in range(0, len(indices), chunk_size):
+            chunk = indices[first:first + chunk_size]
+            chunks.append((chunk, np.stack([matrices[k] for k in chunk])))
+
+    if max_workers is not None and max_workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            orders = list(executor.map(_solve_chunk, [method] * len(chunks), [stack for _, stack in chunks],
+                                       [start - 1] * len(chunks)))
+    else:
+        orders = [_solve_chunk(method, stack, start - 1) for _, stack in chunks]
+
+    for (chunk, stack), order in zip(chunks, orders):
+        _store(results, chunk, order, stack, start, optimal=method == "held_karp")
+    return results
+
+def as_matrix_list(distance_matrices):
+    """
+    Turn a stacked 3D array or a list of matrices into a list of square float arrays. Condensed 1D
+    instances are expanded first. float32 matrices keep their dtype; anything else becomes float64.
+    """
+    matrices = []
+    for matrix in distance_matrices:
+        matrix = np.asarray(matrix)
+        if matrix.ndim == 1:
+            matrix = square_distance_matrix(matrix)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Every instance must be a square distance matrix.")
+        if matrix.dtype != np.float32:
+            matrix = matrix.astype(float, copy=False)
+        matrices.append(matrix)
+    return matrices
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def _solve_chunk(method, distances, start):
+    """Solve a (batch, n, n) stack of instances with a built-in method, returning the (batch, n) orders."""
+    if method == "held_karp":
+        return batch_held_karp(distances)
+    order = batch_nearest_neighbor(distances, start)
+    if method == "2-opt":
+        order = batch_two_opt(distances, order)
+    return order
+
+def _solve_with_function(method, distance_matrix):
+    """Pool task: solve one instance with a solver function and return its order of cities (0-based)."""
+    tour = list(next(iter(method(distance_matrix))))
+    if tour and isinstance(tour[0], tuple):
+        tour = [i for i, _ in tour]  # Edges (i, j) in the order of the tour
+    elif len(tour) > 1 and tour[0] == tour[-1]:
+        tour = tour[:-1]
+    return np.asarray(tour, dtype=np.intp) - 1
+
+def _store(results, indices, orders, distances, start, optimal):
+    """Rotate the orders to the starting city and write tours and lengths into the result records."""
+    orders = np.asarray(orders)
+    n = orders.shape[1]
+    rows = np.arange(len(orders))[:, None]
+    if n > 0:
+        shift = np.argmax(orders == start - 1, axis=1)
+        orders = orders[rows, (np.arange(n) + shift[:, None]) % n]
+        lengths = distances[rows, orders, np.roll(orders, -1, axis=1)].astype(float).sum(axis=1)
+    else:
+        lengths = np.zeros(len(orders))
+    results["total_distance"][indices] = lengths
+    results["optimal"][indices] = optimal
+    tours = np.zeros((len(orders), results["tour"].shape[1]), dtype=np.int32)
+    tours[:, :n] = orders + 1
+    if n > 0:
+        tours[:, n] = start
+    results["tour"][indices] = tours
+
+def batch_nearest_neighbor(distances, start=0):
+    """
+    Run Nearest Neighbor on a stack of instances at once.
+
+    Parameters:
+    - distances (numpy array): (batch, n, n) array of distance matrices.
+    - start (int): The starting city (0-based index).
+
+    Returns:
+    - order (numpy array): (batch, n) array of the cities of every tour in the order visited (0-based).
+    """
+    batch, n, _ = distances.shape
+    rows = np.arange(batch)
+    order = np.empty((batch, n), dtype=np.intp)
+    if n == 0:
+        return order
+
+    # Visited cities carry an infinite penalty so argmin never selects them
+    visited_mask = np.zeros((batch, n))
+    current_city = np.full(batch, start, dtype=np.intp)
+    order[:, 0] = current_city
+    visited_mask[rows, current_city] = np.inf
+    for step in range(1, n):
+        current_city = np.argmin(distances[rows, current_city] + visited_mask, axis=1)
+        order[:, step] = current_city
+        visited_mask[rows, current_city] = np.inf
+    return order
+
+def batch_two_opt(distances, order):
+    """
+    Improve a stack of tours with best-improvement 2-opt at once.
+
+    Every pass evaluates all 2-opt moves of all tours as one (batch, n, n) array, applies the best move
+    of every tour that still has an improving one, and stops once none has.
+
+    Parameters:
+    - distances (numpy array): (batch, n, n) array of distance matrices.
+    - order (numpy array): (batch, n) array of tours (0-based).
+
+    Returns:
+    - order (numpy array): The improved tours.
+    """
+    batch, n, _ = distances.shape
+    order = order.copy()
+    if n < 4:
+        return order
+
+    # Valid moves (i, j): edges (order[i], order[i+1]) and (order[j], order[j+1]) that share no city
+    i_index, j_index = np.triu_indices(n, 2)
+    keep = ~((i_index == 0) & (j_index == n - 1))
+    i_index, j_index = i_index[keep], j_index[keep]
+    positions = np.arange(n)
+
+    active = np.arange(batch)
+    while len(active):
+        rows = active[:, None]
+        tours = order[active]
+        following = np.roll(tours, -1, axis=1)
+        a, b = tours[:, i_index], following[:, i_index]
+        c, d = tours[:, j_index], following[:, j_index]
+        delta = (distances[rows, a, c] + distances[rows, b, d]
+                 - distances[rows, a, b] - distances[rows, c, d])
+        best = np.argmin(delta, axis=1)
+        improving = delta[np.arange(len(active)), best] < -1e-10
+        active, best = active[improving], best[improving]
+        if not len(active):
+            break
+
+        # Reverse positions i + 1 .. j of every improving tour
+        low, high = i_index[best][:, None] + 1, j_index[best][:, None]
+        inside = (positions >= low) & (positions <= high)
+        source = np.where(inside, low + high - positions, positions)
+        order[active] = np.take_along_axis(order[active], source, axis=1)
+    return order
+
+def batch_held_karp(distances):
+    """
+    Solve a stack of instances exactly with the Held-Karp dynamic program at once.
+
+    This is the bitmask program of solve_tsp_with_held_karp with a leading instance axis: bit j - 1 of a
+    mask stands for city j, the costs are float64 and the parents int8, and the subsets with the same
+    number of cities are processed together for all instances. float32 costs would lose the exact path
+    lengths above 2^24 and could pick a longer tour.
+
+    Parameters:
+    - distances (numpy array): (batch, n, n) array of distance matrices.
+
+    Returns:
+    - order (numpy array): (batch, n) array of optimal tours (0-based), starting with city 0.
+    """
+    batch, n, _ = distances.shape
+    if n <= 2:
+        return np.tile(np.arange(n), (batch, 1))  # A single tour, in either direction
+
+    m = n - 1
+    size = 1 << m
+    rows = np.arange(batch)
+    d = distances.astype(np.float64)
+    into = d[:, 1:, 1:]  # into[b, k, j]: distance from city k + 1 to city j + 1
+
+    # cost[b, mask, j]: shortest path from city 0 through the cities of mask, ending at city j + 1
+    cost = np.full((batch, size, m), np.inf, dtype=np.float64)
+    parent = np.full((batch, size, m), -1, dtype=np.int8)
+    cost[:, 1 << np.arange(m), np.arange(m)] = d[:, 0, 1:]
+
+    # Group the masks by their number of cities; every group only depends on the one before it
+    masks = np.arange(size)
+    city_count = np.zeros(size, dtype=np.int8)
+    for j in range(m):
+        city_count += (masks >> j) & 1
+    by_count = np.argsort(city_count, kind="stable")
+    bounds = np.searchsorted(city_count[by_count], np.arange(m + 2))
+
+    for count in range(2, m + 1):
+        layer = by_count[bounds[count]:bounds[count + 1]]
+        for j in range(m):
+            ending = layer[(layer >> j) & 1 == 1]
+            # Cities outside the previous mask have an infinite cost, so they are never selected
+            candidates = cost[:, ending ^ (1 << j)] + into[:, None, :, j]
+            best = np.argmin(candidates, axis=2)
+            cost[:, ending, j] = np.take_along_axis(candidates, best[..., None], axis=2)[..., 0]
+            parent[:, ending, j] = best
+
+    # Close the tours back to city 0 and walk the parents back from the full mask
+    mask = np.full(batch, size - 1)
+    last = np.argmin(cost[:, size - 1] + d[:, 1:, 0], axis=1)
+    order = np.zeros((batch, n), dtype=np.intp)
+    for position in range(m, 0, -1):
+        order[:, position] = last + 1
+        mask, last = mask ^ (1 << last), parent[rows, mask, last].astype(np.intp)
+    return order
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    # One instance per driver shift: 2,000 shifts of 12 to 40 stops
+    rng = np.random.default_rng(0)
+    instances = []
+    for _ in range(2000):
+        stops = rng.random((int(rng.integers(12, 41)), 2)) * 100
+        instances.append(np.sqrt(((stops[:, None, :] - stops[None, :, :]) ** 2).sum(axis=2)))
+
+    start_time = time.perf_counter()
+    results = solve_tsp_batch(instances, method="2-opt")
+    print("2-opt:", len(results), "instances in", f"{time.perf_counter() - start_time:.2f} s")
+    print("First Tour:", results["tour"][0, :results["n"][0] + 1].tolist())
+    print("Total Distance of All Tours:", results["total_distance"].sum(), "\n")
+
+    # Exact tours for small instances, all of the same size
+    small = np.stack([matrix[:12, :12] for matrix in instances[:500]])
+    start_time = time.perf_counter()
+    results = solve_tsp_batch(small, method="held_karp")
+    print("Held-Karp:", len(results), "instances in", f"{time.perf_counter() - start_time:.2f} s")
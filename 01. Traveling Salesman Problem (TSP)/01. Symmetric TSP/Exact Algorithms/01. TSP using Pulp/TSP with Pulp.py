@@ -1,9 +1,70 @@
 #!pip install pulp
-import matplotlib.pyplot as plt
 from pulp import *
 import numpy as np
+import math
+import os
+import re
+import tempfile
+import time
 
-def solve_tsp_with_pulp(distance_matrix, show_route=True, show_model=False):
+# Instances up to this size are solved with the Held-Karp dynamic program instead of CBC
+HELD_KARP_MAX_CITIES = 16
+
+class TSPResult:
+    """
+    Result of a TSP solver. It unpacks like a tuple: tour, total_distance, bound, gap = result.
+
+    Attributes:
+    - tour (list of tuples): The tour as a list of edges, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], or None if no
+      solution was found.
+    - total_distance (float): Total distance of the tour.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the
+      time limit without a solution), or the solver status otherwise.
+    - build_time (float): Time spent building the model in seconds (0 for the Held-Karp path).
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, tour, total_distance, bound, gap, status, build_time, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
+
+class UnionFind:
+    """Union-Find structure to manage connected components."""
+
+    def __init__(self, nodes):
+        # Initialize each node as its own parent (self-loop) for disjoint sets
+        self.parent = {node: node for node in nodes}
+
+    def find(self, node):
+        # Find the root of the node with path compression for efficiency
+        if self.parent[node] != node:
+            self.parent[node] = self.find(self.parent[node])  # Path compression
+        return self.parent[node]
+
+    def union(self, node1, node2):
+        # Connect the roots of the two nodes to unify their components
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 != root2:
+            self.parent[root2] = root1
+
+def solve_tsp_with_pulp(distance_matrix, show_route=False, show_model=False, subtour_elimination=None, formulation="directed", warm_start=None,
+                        time_limit=None, mip_gap=None, threads=None, held_karp_max_cities=HELD_KARP_MAX_CITIES, msg=False):
     """
     Solve the Traveling Salesman Problem (TSP) using linear programming with PuLP.
 
@@ -11,83 +72,659 @@ def solve_tsp_with_pulp(distance_matrix, show_route=True, show_model=False):
     the shortest possible route that visits each city exactly once and returns to the starting city.
 
     Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
-    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to True.
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as a
+      condensed 1D array.
+    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to False.
     - show_model (bool): If True, prints the linear programming model used to solve the TSP. Defaults to False.
+    - subtour_elimination (str): How subtours are eliminated. Defaults to "mtz" for the directed
+      formulation and "lazy" for the symmetric one.
+        - "mtz": Add all Miller-Tucker-Zemlin constraints up front (directed formulation only).
+        - "lazy": Start from the degree constraints only. After each solve, find the subtours of the
+          integer solution with union-find, add the violated Dantzig-Fulkerson-Johnson (DFJ) subtour
+          cuts and re-solve, warm-started from the subtours patched into one tour. The DFJ cuts give a
+          much tighter relaxation, so instances with 100-200 cities become tractable.
+    - formulation (str): Decision variables of the model. Defaults to "directed".
+        - "directed": One binary x_ij per ordered pair of cities, with one outgoing and one incoming edge per city.
+        - "symmetric": One binary x_ij per undirected edge (i < j), with exactly two edges per city. This
+          halves the number of variables and assumes a symmetric distance matrix (the upper triangle is used).
+    - warm_start (list): Tour of cities (1-based index) to start from, e.g., [1, 3, 4, 2, 1] as returned by
+      the Nearest Neighbor or insertion heuristics. It is passed to CBC as the first incumbent (with the
+      MTZ u_i set to the position of city i on the tour), so the search starts with an upper bound.
+      Defaults to None (cold start, or the Nearest Neighbor tour with lazy subtour elimination).
+    - time_limit (float): Time limit in seconds for the whole solve. When it is reached, the best tour found
+      so far is reported together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which CBC stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - held_karp_max_cities (int): Instances with at most this many cities are solved in process with the
+      Held-Karp dynamic program, which takes milliseconds where building the model and starting CBC takes
+      far longer. The other options are then ignored, except show_route. Set it to 0 to always use CBC.
+      Defaults to HELD_KARP_MAX_CITIES (16).
+    - msg (bool): Show the CBC log. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The best tour found as a list of edges, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], its total
+      distance, the best bound, the gap, the status and the build and solve times. It unpacks like the tuple
+      (tour, total_distance, bound, gap). Without a solution, the tour and the distances are None.
     """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix).tolist()
+
+    if formulation not in ("directed", "symmetric"):
+        raise ValueError(f"Unknown formulation '{formulation}', expected 'directed' or 'symmetric'.")
+    if subtour_elimination is None:
+        subtour_elimination = "mtz" if formulation == "directed" else "lazy"
+    if subtour_elimination not in ("mtz", "lazy"):
+        raise ValueError(f"Unknown subtour elimination '{subtour_elimination}', expected 'mtz' or 'lazy'.")
+    if subtour_elimination == "mtz" and formulation == "symmetric":
+        raise ValueError("MTZ constraints need the directed formulation, use subtour_elimination='lazy'.")
 
     # Get number of cities
     n = len(distance_matrix)
 
+    # Small instances are solved exactly without building a model (unless the model should be shown)
+    if n <= held_karp_max_cities and not show_model:
+        if formulation == "symmetric":
+            # The symmetric formulation only reads the upper triangle
+            upper = np.triu(np.asarray(distance_matrix, dtype=float))
+            distance_matrix = upper + upper.T
+        return solve_tsp_with_held_karp(distance_matrix, show_route)
+
+    build_start = time.perf_counter()
+    deadline = None if time_limit is None else build_start + time_limit
+
     # Initialize the problem
     tsp = LpProblem("Traveling_Salesman_Problem", LpMinimize)
 
-    # Create binary decision variables x_ij for each pair of cities (1 to n)
-    x = LpVariable.dicts("x", ((i, j) for i in range(1, n+1) for j in range(1, n+1) if i != j), cat='Binary')
+    if formulation == "directed":
+        # Create binary decision variables x_ij for each pair of cities (1 to n)
+        x = LpVariable.dicts("x", ((i, j) for i in range(1, n+1) for j in range(1, n+1) if i != j), cat='Binary')
+    else:
+        # Create binary decision variables x_ij for each undirected edge (i < j)
+        x = LpVariable.dicts("x", ((i, j) for i in range(1, n+1) for j in range(i+1, n+1)), cat='Binary')
 
-    # Create auxiliary variables u_i for subtour elimination
-    u = LpVariable.dicts("u", (i for i in range(1, n+1)), lowBound=0, upBound=n, cat='Continuous')
+    # Column of every variable: its edge (i, j) in the coefficient arrays
+    variables = list(x.values())
+    edges = np.array(list(x), dtype=int).reshape(-1, 2)
+    first, second = edges[:, 0], edges[:, 1]
+    columns = np.arange(len(edges))
+    ones = np.ones(len(edges), dtype=int)
 
     # Objective function: Minimize the total travel distance
-    tsp += lpSum(distance_matrix[i-1][j-1] * x[i, j] for i in range(1, n+1) for j in range(1, n+1) if i != j), "Total_Distance"
+    tsp += LpAffineExpression(zip(variables, np.asarray(distance_matrix)[first-1, second-1].tolist())), "Total_Distance"
 
     # Constraints
-    # 1. Each city must have exactly one outgoing edge
-    for i in range(1, n+1):
-        tsp += lpSum(x[i, j] for j in range(1, n+1) if i != j) == 1, f"Outflow_Constraint_{i}"
-
-    # 2. Each city must have exactly one incoming edge
-    for j in range(1, n+1):
-        tsp += lpSum(x[i, j] for i in range(1, n+1) if i != j) == 1, f"Inflow_Constraint_{j}"
-
-    # 3. Subtour elimination constraints (MTZ constraints)
-    for i in range(2, n+1):
-        for j in range(2, n+1):
-            if i != j:
-                tsp += u[i] - u[j] + n * x[i, j] <= n - 1, f"Subtour_Elimination_{i}_{j}"
-
-    # Solve the problem
-    tsp.solve()
-
-    # Retrieve and print the solution
-    if tsp.status == LpStatusOptimal:
-        # Find the tour by starting from city 1 and following the path
-        tour = []
-        current_city = 1
-        visited_cities = set([current_city])
-
-        while len(visited_cities) < n:
-            for j in range(1, n+1):
-                if current_city != j and value(x[current_city, j]) == 1:
-                    tour.append((current_city, j))
-                    visited_cities.add(j)
-                    current_city = j
+    if formulation == "directed":
+        # 1. Each city must have exactly one outgoing edge
+        add_constraints_in_bulk(tsp, variables, first - 1, columns, ones, LpConstraintEQ, 1,
+                                [f"Outflow_Constraint_{i}" for i in range(1, n+1)])
+
+        # 2. Each city must have exactly one incoming edge
+        add_constraints_in_bulk(tsp, variables, second - 1, columns, ones, LpConstraintEQ, 1,
+                                [f"Inflow_Constraint_{j}" for j in range(1, n+1)])
+    else:
+        # 1-2. Each city must have exactly two incident edges
+        add_constraints_in_bulk(tsp, variables, np.concatenate([first, second]) - 1, np.concatenate([columns, columns]),
+                                np.concatenate([ones, ones]), LpConstraintEQ, 2,
+                                [f"Degree_Constraint_{i}" for i in range(1, n+1)])
+
+    if subtour_elimination == "mtz":
+        # Create auxiliary variables u_i for subtour elimination
+        u = LpVariable.dicts("u", (i for i in range(1, n+1)), lowBound=0, upBound=n, cat='Continuous')
+
+        # 3. Subtour elimination constraints (MTZ constraints): u_i - u_j + n * x_ij <= n - 1 for i, j >= 2
+        pairs = np.flatnonzero((first >= 2) & (second >= 2))
+        rows = np.arange(len(pairs))
+        u_columns = len(variables) - 1  # Column of u_i is u_columns + i
+        add_constraints_in_bulk(tsp, variables + list(u.values()), np.concatenate([rows, rows, rows]),
+                                np.concatenate([u_columns + first[pairs], u_columns + second[pairs], pairs]),
+                                np.concatenate([ones[pairs], -ones[pairs], n * ones[pairs]]), LpConstraintLE, n - 1,
+                                [f"Subtour_Elimination_{i}_{j}" for i, j in edges[pairs].tolist()])
+
+    # Best known tour, as the successor of every city
+    incumbent = None if warm_start is None else tour_successors(warm_start, n)
+
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
+    if subtour_elimination == "mtz":
+        if incumbent is not None:
+            # Seed the incumbent tour, with u_i the position of city i on the tour starting from city 1
+            set_initial_tour(x, incumbent, formulation)
+            current_city = 1
+            for position in range(n):
+                u[current_city].setInitialValue(position)
+                current_city = incumbent[current_city]
+
+        # Solve the problem
+        status, bound, gap = solve_with_limits(tsp, time_left(deadline), mip_gap, threads, warm_start=incumbent is not None, msg=msg)
+        if status in ("Optimal", "Feasible"):
+            successor = follow_edges([(i, j) for (i, j), var in x.items() if var.varValue > 0.5], formulation)
+            total_distance = value(tsp.objective)
+    else:
+        # 3. Subtour elimination constraints (DFJ cuts), added only when violated. Every component S
+        #    of a solution must be left: at most |S| - 1 edges inside S
+        num_cuts = 0
+
+        # Without a warm start, the nearest neighbor tour is the incumbent, so a run that is out of time
+        # before the first integer solution still returns a tour
+        if incumbent is None:
+            incumbent = nearest_neighbor_successors(distance_matrix)
+
+        # First rounds on the LP relaxation: cut the components of its support graph, and once it is
+        # connected, every set S with less than 2 units of flow across its boundary (minimum cuts).
+        # Each relaxation is valid for the full model, so its objective is a bound on the optimal tour
+        lp_bound = best_bound = solve_relaxation(tsp, time_left(deadline))
+        while lp_bound is not None and time_left(deadline) != 0:
+            best_bound = lp_bound
+            support = [(i, j) for (i, j), var in x.items() if var.varValue > 1e-6]
+            subtours = find_subtours(support, n)
+            if len(subtours) == 1:
+                weights = np.zeros((n, n))
+                for i, j in support:
+                    weights[i-1, j-1] += x[i, j].varValue
+                    weights[j-1, i-1] += x[i, j].varValue
+                subtours = [cities for cut_weight, cities in minimum_cut_phases(weights) if cut_weight < 2 - 1e-6]
+                if not subtours:
                     break
+            for subtour in subtours:
+                num_cuts += 1
+                tsp += lpSum(x[i, j] for i in subtour for j in subtour if (i, j) in x) <= len(subtour) - 1, f"Subtour_Cut_{num_cuts}"
+            lp_bound = solve_relaxation(tsp, time_left(deadline))
 
-        # Add the last leg returning to the starting city
-        for j in range(1, n+1):
-            if current_city != j and value(x[current_city, j]) == 1:
-                tour.append((current_city, j))
+        # Integer rounds until the solution is a single tour. Every round solves a relaxation of the
+        # full model, so its bound stays valid for the best patched tour if the time runs out first
+        status, subtours = "Not Solved", []
+        set_initial_tour(x, incumbent, formulation)
+        while time_left(deadline) != 0:
+            status, bound, gap = solve_with_limits(tsp, time_left(deadline), mip_gap, threads, warm_start=True, msg=msg)
+            if status not in ("Optimal", "Feasible"):
                 break
+            best_bound = bound
+            selected = [(i, j) for (i, j), var in x.items() if var.varValue > 0.5]
+            subtours = find_subtours(selected, n)
+            if len(subtours) == 1:
+                break
+            for subtour in subtours:
+                num_cuts += 1
+                tsp += lpSum(x[i, j] for i in subtour for j in subtour if (i, j) in x) <= len(subtour) - 1, f"Subtour_Cut_{num_cuts}"
 
-        # Print the results in the specified format
-        print("Optimal Total Distance:", value(tsp.objective), "\n")
-        print("Optimal Tour:", tour)
+            # Warm start the next solve from the subtours patched into a single tour, unless the
+            # incumbent tour is shorter
+            successor = patch_subtours(distance_matrix, follow_edges(selected, formulation), subtours)
+            if tour_length(distance_matrix, successor) < tour_length(distance_matrix, incumbent):
+                incumbent = successor
+            set_initial_tour(x, incumbent, formulation)
+            if status == "Feasible" and (mip_gap is None or gap is None or gap > mip_gap):
+                break  # Stopped on the time limit rather than the gap tolerance
 
-        # Show the model summary if show_model is set to True
-        if show_model:
-            print("\nModel Summary:\n")
-            print(tsp)
+        if len(subtours) == 1 and (status == "Optimal" or value(tsp.objective) <= tour_length(distance_matrix, incumbent)):
+            successor = follow_edges(selected, formulation)
+            total_distance = value(tsp.objective)
+        else:
+            # Out of time before the solution became a single tour: fall back to the best tour found
+            successor, total_distance = incumbent, tour_length(distance_matrix, incumbent)
+            status, bound = "Feasible", best_bound
+            gap = None if bound is None else abs(total_distance - bound) / max(abs(total_distance), 1e-10)
 
-        print("\n")
+    solve_time = time.perf_counter() - solve_start
 
-        # Show the Optimal Route if show_route is set to True
-        if show_route:
-          plot_optimal_route_linear(tour, value(tsp.objective))
+    # Show the model summary if show_model is set to True
+    if show_model:
+        print("\nModel Summary:\n")
+        print(tsp)
 
-    else:
+    if status not in ("Optimal", "Feasible"):
+        return TSPResult(None, None, None, None, status, build_time, solve_time)
+
+    # Find the tour by starting from city 1 and following the path
+    tour = []
+    current_city = 1
+    for _ in range(n):
+        tour.append((current_city, successor[current_city]))
+        current_city = successor[current_city]
+
+    result = TSPResult(tour, total_distance, bound, gap, status, build_time, solve_time)
+
+    # Show the Optimal Route if show_route is set to True
+    if show_route:
+        plot_optimal_route_linear(tour, total_distance)
+
+    return result
+
+def solve_tsp_with_held_karp(distance_matrix, show_route=False):
+    """
+    Solve the Traveling Salesman Problem (TSP) exactly with the Held-Karp dynamic program.
+
+    For every subset S of the cities 2 to n and every city j in S, the program stores the length of
+    the shortest path that starts at city 1, visits exactly the cities of S and ends at j:
+
+        C(S, j) = min over k in S - {j} of C(S - {j}, k) + d(k, j)
+
+    The subsets are bitmasks indexing a NumPy array, and the subsets with the same number of cities
+    are processed together, one vectorized minimum per end city. The table takes O(2^n n) memory and
+    O(2^n n^2) time, so up to about 20 cities are solved in about a second in process, without building
+    a model or starting a solver. The distances are taken in the direction of travel, so asymmetric
+    matrices are solved as well.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as a
+      condensed 1D array.
+    - show_route (bool): If True, displays a plot of the optimal route. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The optimal tour as a list of edges, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], its total
+      distance, the bound (equal to the total distance), the gap (always 0) and the solve time. It unpacks
+      like the tuple (tour, total_distance, bound, gap).
+    """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix)
+    distances = np.asarray(distance_matrix, dtype=float)
+    n = len(distances)
+
+    solve_start = time.perf_counter()
+    order = held_karp(distances)
+    solve_time = time.perf_counter() - solve_start
+
+    # Follow the optimal order from city 1, with the distances of the original matrix
+    tour = [(int(order[t]) + 1, int(order[(t + 1) % n]) + 1) for t in range(n)]
+    total_distance = sum(distance_matrix[i-1][j-1] for i, j in tour)
+
+    result = TSPResult(tour, total_distance, total_distance, 0.0, "Optimal", 0.0, solve_time)
+
+    # Show the Optimal Route if show_route is set to True
+    if show_route:
+        plot_optimal_route_linear(tour, total_distance)
+
+    return result
+
+def held_karp(distances):
+    """
+    Find an optimal tour with the Held-Karp dynamic program over bitmask-indexed NumPy arrays.
+
+    Bit j - 1 of a mask stands for city j (0-based, cities 1 to n - 1); city 0 is the start. The cost
+    table is float64, so every path length is exact and the minimum picks the right predecessor, and the
+    parent table (the city visited before j) is int8. 16 cities take 4 MB and 0.5 MB.
+
+    Parameters:
+    - distances (numpy array): n x n matrix of distances between cities.
+
+    Returns:
+    - order (list): Cities of an optimal tour in the order visited (0-based), starting with city 0.
+    """
+    n = len(distances)
+    if n <= 2:
+        return list(range(n))
+
+    m = n - 1
+    size = 1 << m
+    d = np.asarray(distances, dtype=np.float64)
+    into = d[1:, 1:]  # into[k, j]: distance from city k + 1 to city j + 1
+
+    # cost[mask, j]: shortest path from city 0 through the cities of mask, ending at city j + 1
+    cost = np.full((size, m), np.inf, dtype=np.float64)
+    parent = np.full((size, m), -1, dtype=np.int8)
+    cost[1 << np.arange(m), np.arange(m)] = d[0, 1:]
+
+    # Group the masks by their number of cities; every group only depends on the one before it
+    masks = np.arange(size)
+    city_count = np.zeros(size, dtype=np.int8)
+    for j in range(m):
+        city_count += (masks >> j) & 1
+    by_count = np.argsort(city_count, kind="stable")
+    bounds = np.searchsorted(city_count[by_count], np.arange(m + 2))
+
+    for count in range(2, m + 1):
+        layer = by_count[bounds[count]:bounds[count + 1]]
+        for j in range(m):
+            ending = layer[(layer >> j) & 1 == 1]
+            # Cities outside the previous mask have an infinite cost, so they are never selected
+            candidates = cost[ending ^ (1 << j)] + into[:, j]
+            best = np.argmin(candidates, axis=1)
+            cost[ending, j] = candidates[np.arange(len(ending)), best]
+            parent[ending, j] = best
+
+    # Close the tour back to city 0 and walk the parents back from the full mask
+    mask = size - 1
+    last = int(np.argmin(cost[mask] + d[1:, 0]))
+    order = []
+    while last >= 0:
+        order.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+    return [0] + order[::-1]
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def print_result(result):
+    """
+    Prints a TSP result: the build and solve times, then the optimal tour, or the best tour found with its
+    bound and gap when the solver stopped early.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.tour is None:
         print("No optimal solution found.")
+        return
+
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+        print("Optimal Tour:", result.tour)
+    else:
+        # Stopped early: report the best tour found with its bound
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+        print("Best Tour Found:", result.tour)
+    print("\n")
+
+def solve_with_limits(problem, time_limit=None, mip_gap=None, threads=None, warm_start=False, msg=True):
+    """
+    Solve a PuLP problem with CBC under an optional time limit and relative MIP gap, keeping the best
+    solution found when the solver stops early.
+
+    Parameters:
+    - problem (LpProblem): The problem to solve.
+    - time_limit (float): Time limit in seconds. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - warm_start (bool): Start from the initial values of the variables. Defaults to False.
+    - msg (bool): Show the solver log. Defaults to True.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the time
+      limit before any solution was found), or the PuLP status otherwise, e.g., "Infeasible".
+    - bound (float): Best bound on the objective value (None without a solution).
+    - gap (float): Relative gap between the objective value and the bound (None without a solution).
+    """
+    # CBC only reports the bound in its log, so the log goes to a temporary file when the search can stop early
+    log_path = None
+    if time_limit is not None or mip_gap is not None:
+        handle, log_path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+
+    solve_start = time.perf_counter()
+    problem.solve(PULP_CBC_CMD(msg=msg and log_path is None, timeLimit=time_limit, gapRel=mip_gap, threads=threads,
+                               warmStart=warm_start, logPath=log_path))
+
+    log = ""
+    if log_path is not None:
+        with open(log_path) as file:
+            log = file.read()
+        os.remove(log_path)
+        if msg:
+            print(log)
+
+    if problem.sol_status not in (LpSolutionOptimal, LpSolutionIntegerFeasible):
+        # Stopped on the time limit without an integer solution, PuLP reports whatever status the unfinished
+        # search left in the solution file, which can be "Infeasible" for a feasible problem
+        if "Stopped on time" in log or (time_limit is not None and time.perf_counter() - solve_start >= time_limit):
+            return "Time Limit", None, None
+        return LpStatus[problem.status], None, None
+
+    objective = value(problem.objective)
+    match = re.search(r"^(?:Lower|Upper) bound:\s+(\S+)", log, re.MULTILINE)
+    bound = float(match.group(1)) if match else objective
+    gap = abs(objective - bound) / max(abs(objective), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal" in CBC, but the solution is only known to be within the gap
+    optimal = problem.sol_status == LpSolutionOptimal and (mip_gap is None or gap <= 1e-9)
+    return ("Optimal" if optimal else "Feasible"), bound, gap
+
+def solve_relaxation(problem, time_limit=None):
+    """
+    Solve the LP relaxation of a PuLP problem with CBC under an optional time limit.
+
+    Parameters:
+    - problem (LpProblem): The problem to solve, with its integer variables relaxed.
+    - time_limit (float): Time limit in seconds. Defaults to None (no limit).
+
+    Returns:
+    - objective (float): Optimal objective value of the relaxation, or None if it was not solved to
+      optimality (e.g., no time left).
+    """
+    if time_limit == 0:
         return None
+    problem.solve(PULP_CBC_CMD(msg=False, mip=False, timeLimit=time_limit))
+    return value(problem.objective) if problem.status == LpStatusOptimal else None
+
+def time_left(deadline):
+    """Seconds left until the deadline (never negative), or None without a deadline."""
+    return None if deadline is None else max(deadline - time.perf_counter(), 0)
+
+def add_constraints_in_bulk(problem, variables, rows, columns, coefficients, sense, rhs, names):
+    """
+    Add a block of linear constraints to a PuLP problem from NumPy coefficient arrays.
+
+    The block is given in coordinate form: term t adds coefficients[t] * variables[columns[t]] to
+    constraint rows[t]. The terms are grouped by constraint with a single stable sort and every
+    constraint is built directly from (variable, coefficient) pairs, instead of summing products
+    of variables and coefficients with lpSum.
+
+    Parameters:
+    - problem (LpProblem): The problem to add the constraints to.
+    - variables (list): Decision variables, indexed by the column numbers.
+    - rows (numpy array): Constraint (0-based, in the order of names) of every term.
+    - columns (numpy array): Variable of every term.
+    - coefficients (numpy array): Coefficient of every term.
+    - sense (int): LpConstraintEQ, LpConstraintLE or LpConstraintGE, shared by the whole block.
+    - rhs (number or list): Right-hand side of the constraints, one value for all or one per constraint.
+    - names (list): Name of every constraint.
+    """
+    if not isinstance(rhs, list):
+        rhs = [rhs] * len(names)
+
+    order = np.argsort(rows, kind="stable")
+    bounds = np.searchsorted(rows[order], np.arange(len(names) + 1)).tolist()
+    terms = list(zip([variables[c] for c in columns[order].tolist()], coefficients[order].tolist()))
+    for r, name in enumerate(names):
+        problem.addConstraint(LpConstraint(LpAffineExpression(terms[bounds[r]:bounds[r + 1]]), sense, name, rhs[r]))
+
+def find_subtours(edges, n):
+    """
+    Split the cities into the connected components of the selected edges with union-find. For an
+    integer solution, these are its subtours.
+
+    Parameters:
+    - edges (iterable of tuples): Selected edges (i, j), e.g., [(1, 3), (3, 1), (2, 4), (4, 2)].
+    - n (int): Number of cities.
+
+    Returns:
+    - subtours (list of lists): Cities of every component, e.g., [[1, 3], [2, 4]].
+    """
+    union_find = UnionFind(range(1, n+1))
+    for i, j in edges:
+        union_find.union(i, j)
+
+    subtours = {}
+    for i in range(1, n+1):
+        subtours.setdefault(union_find.find(i), []).append(i)
+    return list(subtours.values())
+
+def minimum_cut_phases(weights):
+    """
+    Run the Stoer-Wagner minimum cut algorithm and return the cut of every phase.
+
+    Each phase orders the remaining (merged) cities by maximum adjacency; the last city separated
+    from the rest is a cut, after which the last two cities are merged. The lightest of these cuts
+    is a global minimum cut.
+
+    Parameters:
+    - weights (numpy array): Symmetric n x n matrix of edge weights.
+
+    Returns:
+    - cuts (list of tuples): (cut_weight, cities) for every phase, where cities (1-based) is the
+      smaller side of the cut.
+    """
+    n = len(weights)
+    weights = weights.copy()
+    groups = [[i + 1] for i in range(n)]
+    active = list(range(n))
+    cuts = []
+
+    while len(active) > 1:
+        sub_weights = weights[np.ix_(active, active)]
+        m = len(active)
+        added = np.zeros(m, dtype=bool)
+        connection = np.zeros(m)
+        previous = last = 0
+        for _ in range(m):
+            # Add the city most tightly connected to the cities added so far
+            candidate = int(np.argmax(np.where(added, -np.inf, connection)))
+            cut_weight = connection[candidate]
+            previous, last = last, candidate
+            added[candidate] = True
+            connection += sub_weights[candidate]
+
+        cities = groups[active[last]]
+        if 2 * len(cities) > n:
+            cities = sorted(set(range(1, n + 1)) - set(cities))
+        cuts.append((cut_weight, list(cities)))
+
+        # Merge the last city into the one added before it
+        a, b = active[previous], active[last]
+        weights[a] += weights[b]
+        weights[:, a] += weights[:, b]
+        weights[a, a] = 0
+        groups[a] = groups[a] + groups[b]
+        active.remove(b)
+    return cuts
+
+def follow_edges(edges, formulation):
+    """
+    Turn the selected edges of a solution into the next city of every city.
+
+    Parameters:
+    - edges (list of tuples): Selected edges (i, j), each city having one outgoing and one incoming
+      edge (directed) or two incident edges (symmetric).
+    - formulation (str): "directed" or "symmetric". Undirected cycles are followed from their lowest
+      city towards its lower-numbered neighbor.
+
+    Returns:
+    - successor (dict): Next city of every city, e.g., {1: 3, 3: 1, 2: 4, 4: 2}.
+    """
+    if formulation == "directed":
+        return dict(edges)
+
+    neighbors = {}
+    for i, j in edges:
+        neighbors.setdefault(i, []).append(j)
+        neighbors.setdefault(j, []).append(i)
+
+    successor = {}
+    for start in sorted(neighbors):
+        if start in successor:
+            continue
+        previous, current = start, min(neighbors[start])
+        successor[start] = current
+        while current != start:
+            following = neighbors[current][0] if neighbors[current][0] != previous else neighbors[current][1]
+            successor[current] = following
+            previous, current = current, following
+    return successor
+
+def patch_subtours(distance_matrix, successor, subtours):
+    """
+    Patch subtours into a single tour, joining each subtour to the main one with the cheapest exchange
+    of one edge (a, b) of the tour and one edge (c, d) of the subtour for (a, d) and (c, b).
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+    - successor (dict): Next city of every city (1 to n).
+    - subtours (list of lists): Cities of every subtour, as returned by find_subtours.
+
+    Returns:
+    - successor (dict): Next city of every city in the patched tour.
+    """
+    successor = dict(successor)
+    tour_cities = list(subtours[0])
+    for subtour in subtours[1:]:
+        _, a, c = min((distance_matrix[a-1][successor[c]-1] + distance_matrix[c-1][successor[a]-1]
+                       - distance_matrix[a-1][successor[a]-1] - distance_matrix[c-1][successor[c]-1], a, c)
+                      for a in tour_cities for c in subtour)
+        successor[a], successor[c] = successor[c], successor[a]
+        tour_cities += subtour
+    return successor
+
+def tour_successors(tour, n):
+    """
+    Convert a tour into the successor of every city.
+
+    Parameters:
+    - tour (list): Tour of cities (1-based index), e.g., [1, 3, 4, 2, 1]. The closing city may be omitted.
+    - n (int): Number of cities.
+
+    Returns:
+    - successor (dict): Next city of every city (1 to n) on the tour.
+    """
+    cities = list(tour)
+    if len(cities) > 1 and cities[0] == cities[-1]:
+        cities = cities[:-1]
+    if sorted(cities) != list(range(1, n+1)):
+        raise ValueError("The warm start tour must visit every city (1 to n) exactly once.")
+    return {city: cities[(t + 1) % n] for t, city in enumerate(cities)}
+
+def nearest_neighbor_successors(distance_matrix):
+    """
+    Build a tour with the Nearest Neighbor heuristic, starting from city 1.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+
+    Returns:
+    - successor (dict): Next city of every city (1 to n) on the tour.
+    """
+    distances = np.asarray(distance_matrix, dtype=float)
+    n = len(distances)
+    unvisited = np.ones(n, dtype=bool)
+    unvisited[0] = False
+    successor, current = {}, 0
+    for _ in range(n - 1):
+        following = int(np.argmin(np.where(unvisited, distances[current], np.inf)))
+        unvisited[following] = False
+        successor[current + 1], current = following + 1, following
+    successor[current + 1] = 1
+    return successor
+
+def tour_length(distance_matrix, successor):
+    """Total distance of the tour given by the successor of every city."""
+    return sum(distance_matrix[i-1][j-1] for i, j in successor.items())
+
+def set_initial_tour(x, successor, formulation):
+    """
+    Set the initial values of the edge variables to a tour, for a warm-started solve.
+
+    Parameters:
+    - x (dict): Binary edge variables, keyed by (i, j).
+    - successor (dict): Next city of every city on the tour.
+    - formulation (str): "directed" or "symmetric" (x_ij with i < j stands for both directions).
+    """
+    for (i, j), var in x.items():
+        var.setInitialValue(1 if successor[i] == j or (formulation == "symmetric" and successor[j] == i) else 0)
 
 def plot_optimal_route_linear(optimal_tour, total_distance):
     """
@@ -97,6 +734,9 @@ def plot_optimal_route_linear(optimal_tour, total_distance):
     - optimal_tour (list of tuples): Optimal path, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)].
     - total_distance (float): Total distance of the optimal tour.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     # Extract the order of cities from the optimal tour
     ordered_cities = [optimal_tour[0][0]]  # Start with the first city in the tour
     for _, next_city in optimal_tour:
@@ -137,4 +777,5 @@ if __name__ == "__main__":
         [20, 25, 30, 0]
     ]
 
-    solve_tsp_with_pulp(distance_matrix, show_route=True, show_model=False)
\ No newline at end of file
+    result = solve_tsp_with_pulp(distance_matrix, show_route=True, show_model=False)
+    print_result(result)
\ No newline at end of file
@@ -9,11 +9,70 @@ Original file is located at
 
 #!pip install pyomo
 #!apt-get install -y -qq glpk-utils
-import matplotlib.pyplot as plt
 import numpy as np
 from pyomo.environ import *
+from pyomo.opt import SolutionStatus
+import math
+import time
 
-def solve_tsp_with_pyomo(distance_matrix, show_route=True):
+# Names of the relative MIP gap and thread count options of the supported solvers
+MIP_GAP_OPTIONS = {"glpk": "mipgap", "cbc": "ratioGap", "gurobi": "MIPGap"}
+THREADS_OPTIONS = {"cbc": "threads", "gurobi": "Threads"}
+
+class TSPResult:
+    """
+    Result of a TSP solver. It unpacks like a tuple: tour, total_distance, bound, gap = result.
+
+    Attributes:
+    - tour (list of tuples): The tour as a list of edges, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], or None if no
+      solution was found.
+    - total_distance (float): Total distance of the tour.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the solver status otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, tour, total_distance, bound, gap, status, build_time, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
+
+class UnionFind:
+    """Union-Find structure to manage connected components."""
+
+    def __init__(self, nodes):
+        # Initialize each node as its own parent (self-loop) for disjoint sets
+        self.parent = {node: node for node in nodes}
+
+    def find(self, node):
+        # Find the root of the node with path compression for efficiency
+        if self.parent[node] != node:
+            self.parent[node] = self.find(self.parent[node])  # Path compression
+        return self.parent[node]
+
+    def union(self, node1, node2):
+        # Connect the roots of the two nodes to unify their components
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 != root2:
+            self.parent[root2] = root1
+
+def solve_tsp_with_pyomo(distance_matrix, show_route=False, subtour_elimination=None, formulation="directed", warm_start=None,
+                         time_limit=None, mip_gap=None, threads=None):
     """
     Solve the Traveling Salesman Problem (TSP) using linear programming with Pyomo.
 
@@ -21,10 +80,53 @@ def solve_tsp_with_pyomo(distance_matrix, show_route=True):
     the shortest possible route that visits each city exactly once and returns to the starting city.
 
     Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
-    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to True.
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as a
+      condensed 1D array.
+    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to False.
     - show_model (bool): If True, prints the linear programming model used to solve the TSP. Defaults to False.
+    - subtour_elimination (str): How subtours are eliminated. Defaults to "mtz" for the directed
+      formulation and "lazy" for the symmetric one.
+        - "mtz": Add all Miller-Tucker-Zemlin constraints up front (directed formulation only).
+        - "lazy": Start from the degree constraints only. After each solve, find the subtours of the
+          integer solution with union-find, add the violated Dantzig-Fulkerson-Johnson (DFJ) subtour
+          cuts and re-solve, warm-started from the subtours patched into one tour when the solver
+          supports it. The DFJ cuts give a much tighter relaxation, so instances with 100-200 cities
+          become tractable.
+    - formulation (str): Decision variables of the model. Defaults to "directed".
+        - "directed": One binary x_ij per ordered pair of cities, with one outgoing and one incoming edge per city.
+        - "symmetric": One binary x_ij per undirected edge (i < j), with exactly two edges per city. This
+          halves the number of variables and assumes a symmetric distance matrix (the upper triangle is used).
+    - warm_start (list): Tour of cities (1-based index) to start from, e.g., [1, 3, 4, 2, 1] as returned by
+      the Nearest Neighbor or insertion heuristics. It is passed to the solver as the first incumbent (with
+      the MTZ u_i set to the position of city i on the tour) when the solver supports warm starts (e.g.
+      CBC, Gurobi or CPLEX, not GLPK). Defaults to None (cold start, or the Nearest Neighbor tour with lazy
+      subtour elimination).
+    - time_limit (float): Time limit in seconds for the whole solve. When it is reached, the best tour found
+      so far is reported together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the solver stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads, for solvers that support it (not GLPK). Defaults to None (solver default).
+
+    Returns:
+    - result (TSPResult): The best tour found as a list of edges, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], its total
+      distance, the best bound (None if the solver does not report it), the gap, the status and the build and
+      solve times. It unpacks like the tuple (tour, total_distance, bound, gap). Without a solution, the tour
+      and the distances are None.
     """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix).tolist()
+
+    if formulation not in ("directed", "symmetric"):
+        raise ValueError(f"Unknown formulation '{formulation}', expected 'directed' or 'symmetric'.")
+    if subtour_elimination is None:
+        subtour_elimination = "mtz" if formulation == "directed" else "lazy"
+    if subtour_elimination not in ("mtz", "lazy"):
+        raise ValueError(f"Unknown subtour elimination '{subtour_elimination}', expected 'mtz' or 'lazy'.")
+    if subtour_elimination == "mtz" and formulation == "symmetric":
+        raise ValueError("MTZ constraints need the directed formulation, use subtour_elimination='lazy'.")
+
+    build_start = time.perf_counter()
+    deadline = None if time_limit is None else build_start + time_limit
 
     # Get the number of cities
     n = len(distance_matrix)
@@ -35,72 +137,467 @@ def solve_tsp_with_pyomo(distance_matrix, show_route=True):
     # Sets for cities
     model.cities = RangeSet(1, n)
 
-    # Decision variables: binary variable x[i,j] to indicate if the route goes from city i to city j
-    model.x = Var(model.cities, model.cities, domain=Binary)
-
-    # Auxiliary variables for subtour elimination (MTZ formulation)
-    model.u = Var(model.cities, bounds=(0, n), domain=NonNegativeReals)
+    if formulation == "directed":
+        # Decision variables: binary variable x[i,j] to indicate if the route goes from city i to city j
+        model.x = Var(model.cities, model.cities, domain=Binary)
+        edges = [(i, j) for i in model.cities for j in model.cities if i != j]
+    else:
+        # Decision variables: binary variable x[i,j] (i < j) to indicate if the route uses the edge between i and j
+        edges = [(i, j) for i in model.cities for j in model.cities if i < j]
+        model.edges = Set(initialize=edges, dimen=2)
+        model.x = Var(model.edges, domain=Binary)
+    edge_set = set(edges)
 
     # Objective function: Minimize the total travel distance
     model.objective = Objective(
-        expr=sum(distance_matrix[i-1][j-1] * model.x[i, j] for i in model.cities for j in model.cities if i != j),
+        expr=sum(distance_matrix[i-1][j-1] * model.x[i, j] for i, j in edges),
         sense=minimize
     )
 
     # Constraints
-    # 1. Each city must have exactly one outgoing edge
-    model.outflow_constraints = ConstraintList()
-    for i in model.cities:
-        model.outflow_constraints.add(sum(model.x[i, j] for j in model.cities if i != j) == 1)
-
-    # 2. Each city must have exactly one incoming edge
-    model.inflow_constraints = ConstraintList()
-    for j in model.cities:
-        model.inflow_constraints.add(sum(model.x[i, j] for i in model.cities if i != j) == 1)
-
-    # 3. Subtour elimination constraints (MTZ constraints)
-    model.subtour_constraints = ConstraintList()
-    for i in range(2, n+1):
-        for j in range(2, n+1):
-            if i != j:
-                model.subtour_constraints.add(model.u[i] - model.u[j] + n * model.x[i, j] <= n - 1)
-
-    # Solve the model using an available solver
-    result = SolverFactory('glpk').solve(model)
-
-    # Check if an optimal solution was found
-    if result.solver.status == SolverStatus.ok and result.solver.termination_condition == TerminationCondition.optimal:
-        # Retrieve the optimal tour
-        tour = []
-        current_city = 1
-        visited_cities = {current_city}
-
-        while len(visited_cities) < n:
-            for j in model.cities:
-                if current_city != j and value(model.x[current_city, j]) == 1:
-                    tour.append((current_city, j))
-                    visited_cities.add(j)
-                    current_city = j
-                    break
-
-        # Add the last leg returning to the starting city
+    if formulation == "directed":
+        # 1. Each city must have exactly one outgoing edge
+        model.outflow_constraints = ConstraintList()
+        for i in model.cities:
+            model.outflow_constraints.add(sum(model.x[i, j] for j in model.cities if i != j) == 1)
+
+        # 2. Each city must have exactly one incoming edge
+        model.inflow_constraints = ConstraintList()
         for j in model.cities:
-            if current_city != j and value(model.x[current_city, j]) == 1:
-                tour.append((current_city, j))
+            model.inflow_constraints.add(sum(model.x[i, j] for i in model.cities if i != j) == 1)
+    else:
+        # 1-2. Each city must have exactly two incident edges
+        model.degree_constraints = ConstraintList()
+        for i in model.cities:
+            model.degree_constraints.add(sum(model.x[min(i, j), max(i, j)] for j in model.cities if i != j) == 2)
+
+    solver = SolverFactory('glpk')
+    warm_start_capable = solver.warm_start_capable()
+
+    # Best known tour, as the successor of every city
+    incumbent = None if warm_start is None else tour_successors(warm_start, n)
+
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
+    if subtour_elimination == "mtz":
+        # Auxiliary variables for subtour elimination (MTZ formulation)
+        model.u = Var(model.cities, bounds=(0, n), domain=NonNegativeReals)
+
+        # 3. Subtour elimination constraints (MTZ constraints)
+        model.subtour_constraints = ConstraintList()
+        for i in range(2, n+1):
+            for j in range(2, n+1):
+                if i != j:
+                    model.subtour_constraints.add(model.u[i] - model.u[j] + n * model.x[i, j] <= n - 1)
+
+        if incumbent is not None and warm_start_capable:
+            # Seed the incumbent tour, with u_i the position of city i on the tour starting from city 1
+            set_initial_tour(model.x, edges, incumbent, formulation)
+            current_city = 1
+            for position in range(n):
+                model.u[current_city].value = position
+                current_city = incumbent[current_city]
+
+        # Solve the model using an available solver, starting from the incumbent tour if possible
+        status, bound, gap = solve_with_limits(solver, model, time_left(deadline), mip_gap, threads,
+                                               warmstart=incumbent is not None and warm_start_capable)
+        if status in ("Optimal", "Feasible"):
+            successor = follow_edges([(i, j) for i, j in edges if value(model.x[i, j]) > 0.5], formulation)
+            total_distance = value(model.objective)
+    else:
+        # 3. Subtour elimination constraints (DFJ cuts), added only when violated. Every component S
+        #    of a solution must be left: at most |S| - 1 edges inside S
+        model.subtour_constraints = ConstraintList()
+
+        # Without a warm start, the nearest neighbor tour is the incumbent, so a run that is out of time
+        # before the first integer solution still returns a tour
+        if incumbent is None:
+            incumbent = nearest_neighbor_successors(distance_matrix)
+
+        # First rounds on the LP relaxation: cut the components of its support graph, and once it is
+        # connected, every set S with less than 2 units of flow across its boundary (minimum cuts).
+        # Each relaxation is valid for the full model, so its objective is a bound on the optimal tour
+        for var in model.x.values():
+            var.domain = UnitInterval
+        lp_bound = best_bound = solve_relaxation(solver, model, time_left(deadline))
+        while lp_bound is not None and time_left(deadline) != 0:
+            best_bound = lp_bound
+            support = [(i, j) for i, j in edges if value(model.x[i, j]) > 1e-6]
+            subtours = find_subtours(support, n)
+            if len(subtours) == 1:
+                weights = np.zeros((n, n))
+                for i, j in support:
+                    weights[i-1, j-1] += value(model.x[i, j])
+                    weights[j-1, i-1] += value(model.x[i, j])
+                subtours = [cities for cut_weight, cities in minimum_cut_phases(weights) if cut_weight < 2 - 1e-6]
+                if not subtours:
+                    break
+            for subtour in subtours:
+                model.subtour_constraints.add(sum(model.x[i, j] for i in subtour for j in subtour if (i, j) in edge_set) <= len(subtour) - 1)
+            lp_bound = solve_relaxation(solver, model, time_left(deadline))
+
+        # Integer rounds until the solution is a single tour. Every round solves a relaxation of the
+        # full model, so its bound stays valid for the best patched tour if the time runs out first
+        for var in model.x.values():
+            var.domain = Binary
+        status, subtours = "Not Solved", []
+        while time_left(deadline) != 0:
+            if warm_start_capable:
+                set_initial_tour(model.x, edges, incumbent, formulation)
+            status, bound, gap = solve_with_limits(solver, model, time_left(deadline), mip_gap, threads,
+                                                   warmstart=warm_start_capable)
+            if status not in ("Optimal", "Feasible"):
                 break
+            best_bound = bound
+            selected = [(i, j) for i, j in edges if value(model.x[i, j]) > 0.5]
+            subtours = find_subtours(selected, n)
+            if len(subtours) == 1:
+                break
+            for subtour in subtours:
+                model.subtour_constraints.add(sum(model.x[i, j] for i in subtour for j in subtour if (i, j) in edge_set) <= len(subtour) - 1)
+
+            # Warm start the next solve (when the solver supports it) from the subtours patched into a
+            # single tour, unless the incumbent tour is shorter
+            successor = patch_subtours(distance_matrix, follow_edges(selected, formulation), subtours)
+            if tour_length(distance_matrix, successor) < tour_length(distance_matrix, incumbent):
+                incumbent = successor
+            if status == "Feasible" and (mip_gap is None or gap is None or gap > mip_gap):
+                break  # Stopped on the time limit rather than the gap tolerance
+
+        if len(subtours) == 1 and (status == "Optimal" or value(model.objective) <= tour_length(distance_matrix, incumbent)):
+            successor = follow_edges(selected, formulation)
+            total_distance = value(model.objective)
+        else:
+            # Out of time before the solution became a single tour: fall back to the best tour found
+            successor, total_distance = incumbent, tour_length(distance_matrix, incumbent)
+            status, bound = "Feasible", best_bound
+            gap = None if bound is None else abs(total_distance - bound) / max(abs(total_distance), 1e-10)
+
+    solve_time = time.perf_counter() - solve_start
+
+    # Check if a solution was found
+    if status not in ("Optimal", "Feasible"):
+        return TSPResult(None, None, None, None, status, build_time, solve_time)
+
+    # Retrieve the optimal tour by starting from city 1 and following the path
+    tour = []
+    current_city = 1
+    for _ in range(n):
+        tour.append((current_city, successor[current_city]))
+        current_city = successor[current_city]
+
+    result = TSPResult(tour, total_distance, bound, gap, status, build_time, solve_time)
+
+    # Show the optimal route if show_route is set to True
+    if show_route:
+        plot_optimal_route_linear(tour, total_distance)
+
+    return result
+
+def print_result(result):
+    """
+    Prints a TSP result: the build and solve times, then the optimal tour, or the best tour found with its
+    bound and gap when the solver stopped early.
 
-        # Print results in the specified format
-        total_distance = value(model.objective)
-        print("Optimal Total Distance:", total_distance, "\n")
-        print("Optimal Tour:", tour, "\n")
-
-        # Show the optimal route if show_route is set to True
-        if show_route:
-            plot_optimal_route_linear(tour, total_distance)
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.tour is None:
+        print("No optimal solution found.")
+        return
 
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+        print("Optimal Tour:", result.tour, "\n")
     else:
-        print("No optimal solution found.")
+        # Stopped early: report the best tour found with its bound
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+        print("Best Tour Found:", result.tour, "\n")
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def solve_with_limits(solver, model, time_limit=None, mip_gap=None, threads=None, warmstart=False):
+    """
+    Solve a Pyomo model under an optional time limit and relative MIP gap, keeping the best solution
+    found when the solver stops early.
+
+    Parameters:
+    - solver: Solver created with SolverFactory.
+    - model (ConcreteModel): The model to solve, with a single active objective.
+    - time_limit (float): Time limit in seconds (rounded up to whole seconds). Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads, if the solver supports it. Defaults to None.
+    - warmstart (bool): Start from the current values of the variables. Defaults to False.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition
+      otherwise, e.g., "infeasible".
+    - bound (float): Best bound on the objective value (None if unknown).
+    - gap (float): Relative gap between the objective value and the bound (None if unknown).
+    """
+    if mip_gap is not None and solver.name in MIP_GAP_OPTIONS:
+        solver.options[MIP_GAP_OPTIONS[solver.name]] = mip_gap
+    if threads is not None and solver.name in THREADS_OPTIONS:
+        solver.options[THREADS_OPTIONS[solver.name]] = threads
+    options = {"warmstart": True} if warmstart else {}
+    if time_limit is not None:
+        options["timelimit"] = max(1, math.ceil(time_limit))
+
+    result = solver.solve(model, load_solutions=False, **options)
+    if len(result.solution) == 0 or result.solution(0).status not in (
+            SolutionStatus.optimal, SolutionStatus.feasible, SolutionStatus.stoppedByLimit, SolutionStatus.bestSoFar):
+        return str(result.solver.termination_condition), None, None
+    model.solutions.load_from(result)
+
+    objective = next(model.component_data_objects(Objective, active=True))
+    objective_value = value(objective)
+    optimal = result.solver.termination_condition == TerminationCondition.optimal
+    bound = result.problem.lower_bound if objective.sense == minimize else result.problem.upper_bound
+    if bound is None or not math.isfinite(bound):
+        bound = objective_value if optimal else None
+    elif objective.sense == maximize and bound < objective_value - 1e-6 * max(1.0, abs(objective_value)):
+        # Pyomo's CBC interface can report the bound of a maximization with the sign of CBC's internal minimization
+        bound = -bound if -bound >= objective_value else None
+    gap = None if bound is None else abs(objective_value - bound) / max(abs(objective_value), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal", but the solution is only known to be within the gap
+    if mip_gap is not None and (gap is None or gap > 1e-9):
+        optimal = False
+    return ("Optimal" if optimal else "Feasible"), bound, gap
+
+def solve_relaxation(solver, model, time_limit=None):
+    """
+    Solve a Pyomo model whose integer variables are relaxed, under an optional time limit.
+
+    Parameters:
+    - solver: Solver created with SolverFactory.
+    - model (ConcreteModel): The relaxed model to solve, with a single active objective.
+    - time_limit (float): Time limit in seconds (rounded up to whole seconds). Defaults to None (no limit).
+
+    Returns:
+    - objective (float): Optimal objective value of the relaxation, or None if it was not solved to
+      optimality (e.g., no time left).
+    """
+    if time_limit == 0:
+        return None
+    options = {} if time_limit is None else {"timelimit": max(1, math.ceil(time_limit))}
+    result = solver.solve(model, **options)
+    if result.solver.termination_condition != TerminationCondition.optimal:
         return None
+    return value(next(model.component_data_objects(Objective, active=True)))
+
+def time_left(deadline):
+    """Seconds left until the deadline (never negative), or None without a deadline."""
+    return None if deadline is None else max(deadline - time.perf_counter(), 0)
+
+def find_subtours(edges, n):
+    """
+    Split the cities into the connected components of the selected edges with union-find. For an
+    integer solution, these are its subtours.
+
+    Parameters:
+    - edges (iterable of tuples): Selected edges (i, j), e.g., [(1, 3), (3, 1), (2, 4), (4, 2)].
+    - n (int): Number of cities.
+
+    Returns:
+    - subtours (list of lists): Cities of every component, e.g., [[1, 3], [2, 4]].
+    """
+    union_find = UnionFind(range(1, n+1))
+    for i, j in edges:
+        union_find.union(i, j)
+
+    subtours = {}
+    for i in range(1, n+1):
+        subtours.setdefault(union_find.find(i), []).append(i)
+    return list(subtours.values())
+
+def minimum_cut_phases(weights):
+    """
+    Run the Stoer-Wagner minimum cut algorithm and return the cut of every phase.
+
+    Each phase orders the remaining (merged) cities by maximum adjacency; the last city separated
+    from the rest is a cut, after which the last two cities are merged. The lightest of these cuts
+    is a global minimum cut.
+
+    Parameters:
+    - weights (numpy array): Symmetric n x n matrix of edge weights.
+
+    Returns:
+    - cuts (list of tuples): (cut_weight, cities) for every phase, where cities (1-based) is the
+      smaller side of the cut.
+    """
+    n = len(weights)
+    weights = weights.copy()
+    groups = [[i + 1] for i in range(n)]
+    active = list(range(n))
+    cuts = []
+
+    while len(active) > 1:
+        sub_weights = weights[np.ix_(active, active)]
+        m = len(active)
+        added = np.zeros(m, dtype=bool)
+        connection = np.zeros(m)
+        previous = last = 0
+        for _ in range(m):
+            # Add the city most tightly connected to the cities added so far
+            candidate = int(np.argmax(np.where(added, -np.inf, connection)))
+            cut_weight = connection[candidate]
+            previous, last = last, candidate
+            added[candidate] = True
+            connection += sub_weights[candidate]
+
+        cities = groups[active[last]]
+        if 2 * len(cities) > n:
+            cities = sorted(set(range(1, n + 1)) - set(cities))
+        cuts.append((cut_weight, list(cities)))
+
+        # Merge the last city into the one added before it
+        a, b = active[previous], active[last]
+        weights[a] += weights[b]
+        weights[:, a] += weights[:, b]
+        weights[a, a] = 0
+        groups[a] = groups[a] + groups[b]
+        active.remove(b)
+    return cuts
+
+def follow_edges(edges, formulation):
+    """
+    Turn the selected edges of a solution into the next city of every city.
+
+    Parameters:
+    - edges (list of tuples): Selected edges (i, j), each city having one outgoing and one incoming
+      edge (directed) or two incident edges (symmetric).
+    - formulation (str): "directed" or "symmetric". Undirected cycles are followed from their lowest
+      city towards its lower-numbered neighbor.
+
+    Returns:
+    - successor (dict): Next city of every city, e.g., {1: 3, 3: 1, 2: 4, 4: 2}.
+    """
+    if formulation == "directed":
+        return dict(edges)
+
+    neighbors = {}
+    for i, j in edges:
+        neighbors.setdefault(i, []).append(j)
+        neighbors.setdefault(j, []).append(i)
+
+    successor = {}
+    for start in sorted(neighbors):
+        if start in successor:
+            continue
+        previous, current = start, min(neighbors[start])
+        successor[start] = current
+        while current != start:
+            following = neighbors[current][0] if neighbors[current][0] != previous else neighbors[current][1]
+            successor[current] = following
+            previous, current = current, following
+    return successor
+
+def patch_subtours(distance_matrix, successor, subtours):
+    """
+    Patch subtours into a single tour, joining each subtour to the main one with the cheapest exchange
+    of one edge (a, b) of the tour and one edge (c, d) of the subtour for (a, d) and (c, b).
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+    - successor (dict): Next city of every city (1 to n).
+    - subtours (list of lists): Cities of every subtour, as returned by find_subtours.
+
+    Returns:
+    - successor (dict): Next city of every city in the patched tour.
+    """
+    successor = dict(successor)
+    tour_cities = list(subtours[0])
+    for subtour in subtours[1:]:
+        _, a, c = min((distance_matrix[a-1][successor[c]-1] + distance_matrix[c-1][successor[a]-1]
+                       - distance_matrix[a-1][successor[a]-1] - distance_matrix[c-1][successor[c]-1], a, c)
+                      for a in tour_cities for c in subtour)
+        successor[a], successor[c] = successor[c], successor[a]
+        tour_cities += subtour
+    return successor
+
+def tour_successors(tour, n):
+    """
+    Convert a tour into the successor of every city.
+
+    Parameters:
+    - tour (list): Tour of cities (1-based index), e.g., [1, 3, 4, 2, 1]. The closing city may be omitted.
+    - n (int): Number of cities.
+
+    Returns:
+    - successor (dict): Next city of every city (1 to n) on the tour.
+    """
+    cities = list(tour)
+    if len(cities) > 1 and cities[0] == cities[-1]:
+        cities = cities[:-1]
+    if sorted(cities) != list(range(1, n+1)):
+        raise ValueError("The warm start tour must visit every city (1 to n) exactly once.")
+    return {city: cities[(t + 1) % n] for t, city in enumerate(cities)}
+
+def nearest_neighbor_successors(distance_matrix):
+    """
+    Build a tour with the Nearest Neighbor heuristic, starting from city 1.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+
+    Returns:
+    - successor (dict): Next city of every city (1 to n) on the tour.
+    """
+    distances = np.asarray(distance_matrix, dtype=float)
+    n = len(distances)
+    unvisited = np.ones(n, dtype=bool)
+    unvisited[0] = False
+    successor, current = {}, 0
+    for _ in range(n - 1):
+        following = int(np.argmin(np.where(unvisited, distances[current], np.inf)))
+        unvisited[following] = False
+        successor[current + 1], current = following + 1, following
+    successor[current + 1] = 1
+    return successor
+
+def tour_length(distance_matrix, successor):
+    """Total distance of the tour given by the successor of every city."""
+    return sum(distance_matrix[i-1][j-1] for i, j in successor.items())
+
+def set_initial_tour(x, edges, successor, formulation):
+    """
+    Set the values of the edge variables to a tour, for a warm-started solve.
+
+    Parameters:
+    - x (Var): Binary edge variables, indexed by (i, j).
+    - edges (list of tuples): Indices (i, j) of the edge variables in the model.
+    - successor (dict): Next city of every city on the tour.
+    - formulation (str): "directed" or "symmetric" (x_ij with i < j stands for both directions).
+    """
+    for i, j in edges:
+        x[i, j].value = 1 if successor[i] == j or (formulation == "symmetric" and successor[j] == i) else 0
 
 def plot_optimal_route_linear(optimal_tour, total_distance):
     """
@@ -110,6 +607,9 @@ def plot_optimal_route_linear(optimal_tour, total_distance):
     - optimal_tour (list of tuples): Optimal path, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)].
     - total_distance (float): Total distance of the optimal tour.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     # Extract the order of cities from the optimal tour
     ordered_cities = [optimal_tour[0][0]]  # Start with the first city in the tour
     for _, next_city in optimal_tour:
@@ -150,4 +650,5 @@ if __name__ == "__main__":
         [20, 25, 30, 0]
     ]
 
-    solve_tsp_with_pyomo(distance_matrix, show_route=True)
\ No newline at end of file
+    result = solve_tsp_with_pyomo(distance_matrix, show_route=True)
+    print_result(result)
\ No newline at end of file
@@ -0,0 +1,601 @@
+import numpy as np
+import math
+import time
+
+class TSPResult:
+    """
+    Result of a TSP solver. It unpacks like a tuple: tour, total_distance, bound, gap = result.
+
+    Attributes:
+    - tour (list of tuples): The best tour found as a list of edges, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)].
+    - total_distance (float): Total distance of the tour.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", or "Feasible" when the time limit stopped the search.
+    - build_time (float): Always 0, there is no model to build.
+    - solve_time (float): Time spent by the search in seconds.
+    - nodes (int): Number of branch and bound nodes explored.
+    - root_bound (float): Held-Karp bound at the root node.
+    """
+    __slots__ = ("tour", "total_distance", "bound", "gap", "status", "build_time", "solve_time", "nodes", "root_bound")
+
+    def __init__(self, tour, total_distance, bound, gap, status, build_time, solve_time, nodes, root_bound):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+        self.nodes = nodes
+        self.root_bound = root_bound
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f}, nodes={self.nodes!r})")
+
+def solve_tsp_with_branch_and_bound(distance_matrix, show_route=False, warm_start=None, time_limit=None,
+                                    root_iterations=None, node_iterations=30):
+    """
+    Solve the symmetric Traveling Salesman Problem (TSP) exactly with branch and bound on Held-Karp 1-tree bounds.
+
+    A 1-tree is a minimum spanning tree of the cities 2 to n plus the two shortest edges at city 1;
+    every tour is a 1-tree in which all cities have degree 2, so its length is a lower bound. With a
+    penalty pi_i per city, the edge lengths d(i, j) + pi_i + pi_j change every tour by the same
+    2 * sum(pi), so the bound w(pi) = 1-tree(d + pi) - 2 * sum(pi) stays valid for any pi. Subgradient
+    optimization raises pi at the cities of degree > 2 and lowers it at the leaves, which pushes the
+    1-tree towards a tour and usually brings the bound within 1% of the optimum (Held & Karp, 1970).
+
+    The search starts from the best Nearest Neighbor and Farthest Insertion tour, improved with 2-opt and
+    Or-opt, and once the root is bounded, from Nearest Neighbor tours on the penalized lengths as well.
+    Each node forces some edges into the tour and excludes others; it branches on a free 1-tree edge
+    at a city of degree > 2 (exclude it / force it). The search is depth-first, both children are
+    bounded right away and the one with the better bound is explored first, so good tours are found
+    early while the memory stays linear in the depth. A node is pruned once its bound reaches the
+    best tour, and a node whose 1-tree is a tour updates the best tour.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of symmetric distances between cities, or its upper
+      triangle as a condensed 1D array.
+    - show_route (bool): If True, displays a plot of the optimal route. Defaults to False.
+    - warm_start (list): Tour of cities (1-based index) to start from, e.g., [1, 3, 4, 2, 1]. It is used if it is
+      shorter than the heuristic tour. Defaults to None.
+    - time_limit (float): Time limit in seconds. When it is reached, the best tour found so far is reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - root_iterations (int): Subgradient iterations at the root. Defaults to None (max(100, 5 * n)).
+    - node_iterations (int): Subgradient iterations at every other node, warm-started from the penalties of
+      its parent. Defaults to 30.
+
+    Returns:
+    - result (TSPResult): The best tour found as a list of edges, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], its total
+      distance, the best bound, the gap, the status, the solve time and the search statistics. It unpacks
+      like the tuple (tour, total_distance, bound, gap).
+    """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix)
+    distances = np.asarray(distance_matrix, dtype=float)
+    n = len(distances)
+
+    solve_start = time.perf_counter()
+    deadline = None if time_limit is None else solve_start + time_limit
+
+    # Incumbent: the best constructive tour, improved with 2-opt and Or-opt
+    order = heuristic_tour(distances, deadline=deadline)
+    if warm_start is not None:
+        cities = list(warm_start)
+        if len(cities) > 1 and cities[0] == cities[-1]:
+            cities = cities[:-1]
+        if sorted(cities) != list(range(1, n+1)):
+            raise ValueError("The warm start tour must visit every city (1 to n) exactly once.")
+        if tour_length(distances, np.asarray(cities) - 1) < tour_length(distances, order):
+            order = np.asarray(cities) - 1
+    best_length = tour_length(distances, order)
+
+    # With integer distances, every bound can be rounded up
+    integral = bool(np.all(distances == np.round(distances)))
+    nodes = 0
+    root_bound = best_length
+    open_bounds = []
+
+    if n > 3:
+        if root_iterations is None:
+            root_iterations = max(100, 5 * n)
+
+        def evaluate(forced, excluded, penalties, iterations):
+            """Bound a node, updating the best tour if its 1-tree is a tour."""
+            nonlocal nodes, best_length, order
+            nodes += 1
+            bound, penalties, tree = held_karp_bound(distances, node_weights(distances, forced, excluded),
+                                                     penalties, best_length, iterations, integral, deadline)
+            if tree is not None and np.all(tree[2] == 2) and bound < best_length:
+                best_length, order = bound, tree_to_tour(tree)
+            return bound, penalties, tree
+
+        root_bound, penalties, tree = evaluate([], [], np.zeros(n), root_iterations)
+
+        # Lagrangian heuristic: the penalized lengths lead Nearest Neighbor along the edges of the 1-tree
+        if root_bound < best_length - 1e-9 and time_left(deadline) != 0:
+            candidate = heuristic_tour(distances, guide=distances + penalties[:, None] + penalties[None, :],
+                                       deadline=deadline)
+            if tour_length(distances, candidate) < best_length:
+                order, best_length = candidate, tour_length(distances, candidate)
+
+        # Depth-first search; every stack entry is (bound, forced edges, excluded edges, penalties, 1-tree)
+        stack = [(root_bound, [], [], penalties, tree)]
+        while stack:
+            bound, forced, excluded, penalties, tree = stack.pop()
+            if tree is None or bound >= best_length - 1e-9 or np.all(tree[2] == 2):
+                continue  # Infeasible, pruned, or solved by its 1-tree
+            if time_left(deadline) == 0:
+                # Nodes that the best tour prunes are closed, only the others stay open
+                open_bounds = [bound] + [entry[0] for entry in stack if entry[0] < best_length - 1e-9]
+                break
+
+            edge = branching_edge(distances, tree, forced, penalties)
+            children = []
+            for child_forced, child_excluded in ((forced, excluded + [edge]), (forced + [edge], excluded)):
+                child_bound, child_penalties, child_tree = evaluate(child_forced, child_excluded, penalties, node_iterations)
+                if child_tree is not None and child_bound < best_length - 1e-9:
+                    children.append((child_bound, child_forced, child_excluded, child_penalties, child_tree))
+
+            # The child with the better bound is popped first
+            children.sort(key=lambda child: child[0], reverse=True)
+            stack.extend(children)
+
+    solve_time = time.perf_counter() - solve_start
+
+    # Without open nodes the best tour is optimal; otherwise the smallest open bound holds, and a bound
+    # that reaches the best tour proves it optimal as well
+    bound = min([best_length] + open_bounds)
+    gap = abs(best_length - bound) / max(abs(best_length), 1e-10)
+    status = "Optimal" if bound >= best_length - 1e-9 else "Feasible"
+
+    tour = [(int(order[t]) + 1, int(order[(t + 1) % n]) + 1) for t in range(n)]
+    start = [i for i, _ in tour].index(1)
+    tour = tour[start:] + tour[:start]
+    total_distance = sum(distance_matrix[i-1][j-1] for i, j in tour)
+
+    result = TSPResult(tour, total_distance, bound, gap, status, 0.0, solve_time, nodes, root_bound)
+
+    # Show the Optimal Route if show_route is set to True
+    if show_route:
+        plot_optimal_route_linear(tour, total_distance)
+
+    return result
+
+def held_karp_bound(distances, weights, penalties, upper_bound, iterations, integral, deadline=None):
+    """
+    Maximize the Held-Karp bound w(pi) of a node with subgradient optimization.
+
+    Parameters:
+    - distances (numpy array): n x n matrix of distances between cities.
+    - weights (numpy array): Edge weights of the node from node_weights: forced edges are -inf and excluded
+      edges +inf, the others equal to distances.
+    - penalties (numpy array): Starting penalty pi of every city.
+    - upper_bound (float): Length of the best tour; the search stops once the bound reaches it.
+    - iterations (int): Maximum number of subgradient steps.
+    - integral (bool): Whether all distances are integers, so the bound can be rounded up.
+    - deadline (float): time.perf_counter() value after which no further step is taken. Defaults to None.
+
+    Returns:
+    - bound (float): Best bound found (inf if the node has no tour).
+    - penalties (numpy array): Penalties of the best bound.
+    - tree (tuple): (first, second, degree) of the best 1-tree: the end cities of its n edges and the
+      degree of every city, or None if the node has no tour.
+    """
+    best_bound, best_penalties, best_tree = -np.inf, penalties, None
+    step_scale, stall = 2.0, 0
+    patience = max(5, iterations // 10)
+
+    for _ in range(iterations):
+        tree = one_tree(weights + penalties[:, None] + penalties[None, :])
+        if tree is None:
+            return np.inf, penalties, None
+        first, second, degree = tree
+        bound = distances[first, second].sum() + penalties @ (degree - 2)
+        if integral:
+            bound = math.ceil(bound - 1e-6)
+
+        if bound > best_bound + 1e-9:
+            best_bound, best_penalties, best_tree = bound, penalties, tree
+            stall = 0
+        else:
+            stall += 1
+            if stall >= patience:
+                step_scale, stall = step_scale / 2, 0
+
+        subgradient = degree - 2
+        norm = subgradient @ subgradient
+        if norm == 0 or best_bound >= upper_bound - 1e-9 or step_scale < 1e-4 or time_left(deadline) == 0:
+            break  # The 1-tree is a tour, or the node is pruned, or the steps became too small, or out of time
+        step = step_scale * max(upper_bound - bound, 1e-9 * max(abs(upper_bound), 1)) / norm
+        penalties = penalties + step * subgradient
+
+    return best_bound, best_penalties, best_tree
+
+def one_tree(weights):
+    """
+    Build a minimum 1-tree: a minimum spanning tree of the cities 1 to n - 1 (0-based) plus the two
+    lightest edges at city 0.
+
+    Parameters:
+    - weights (numpy array): n x n matrix of edge weights, inf for edges that may not be used.
+
+    Returns:
+    - first, second (numpy arrays): End cities of the n edges of the 1-tree.
+    - degree (numpy array): Degree of every city in the 1-tree.
+    Returns None if no 1-tree exists.
+    """
+    n = len(weights)
+    parent = prim_mst(weights[1:, 1:], 0)
+    if np.count_nonzero(parent < 0) > 1:
+        return None  # Some city cannot be reached
+
+    closest = np.argpartition(weights[0, 1:], 1)[:2]
+    if np.any(weights[0, 1 + closest] == np.inf):
+        return None  # City 0 has fewer than two usable edges
+
+    children = np.flatnonzero(parent >= 0)
+    first = np.concatenate((children + 1, [0, 0]))
+    second = np.concatenate((parent[children] + 1, closest + 1))
+    degree = np.bincount(np.concatenate((first, second)), minlength=n)
+    return first, second, degree
+
+def prim_mst(distances, root=0):
+    """
+    Build a minimum spanning tree of the complete graph with Prim's algorithm.
+
+    This is the array form of the heap loop in solve_MST_with_prim: on a complete graph every city
+    outside the tree keeps its cheapest connection to the tree in an array, which is updated with one
+    row of distances per added city, so the tree is built in O(n^2) time and O(n) extra memory.
+    Infinite distances are never used, so cities that cannot be reached keep the parent -1.
+
+    Parameters:
+    - distances (numpy array): Distances between cities.
+    - root (int): The city the tree is grown from (0-based index). Defaults to 0.
+
+    Returns:
+    - parent (numpy array): Parent of every city in the tree rooted at root (0-based), -1 for the root.
+    """
+    n = len(distances)
+    parent = np.full(n, -1, dtype=np.intp)
+    cost = np.full(n, np.inf)  # Cheapest connection to the tree; infinite once a city is in it
+    in_tree = np.zeros(n, dtype=bool)
+
+    city = root
+    for _ in range(n - 1):
+        in_tree[city] = True
+        cost[city] = np.inf
+        row = distances[city]
+        closer = (row < cost) & ~in_tree
+        cost[closer] = row[closer]
+        parent[closer] = city
+        city = int(np.argmin(cost))
+    return parent
+
+def node_weights(distances, forced, excluded):
+    """
+    Edge weights of a branch and bound node, so that every 1-tree respects its branching decisions.
+
+    Excluded edges get an infinite weight and forced edges a weight of -inf, so the 1-tree always
+    contains them. Two more rules follow from the forced edges: a city with two forced edges can have
+    no other edge, and the edge joining the two ends of a path of two or more forced edges would close
+    a subtour, unless the path already visits every city.
+
+    Parameters:
+    - distances (numpy array): n x n matrix of distances between cities.
+    - forced, excluded (lists of tuples): Forced and excluded edges (i, j), 0-based.
+
+    Returns:
+    - weights (numpy array): n x n matrix of edge weights.
+    """
+    n = len(distances)
+    weights = distances.copy()
+    np.fill_diagonal(weights, np.inf)
+    for i, j in excluded:
+        weights[i, j] = weights[j, i] = np.inf
+
+    if forced:
+        neighbors = {}
+        for i, j in forced:
+            neighbors.setdefault(i, []).append(j)
+            neighbors.setdefault(j, []).append(i)
+        for city, adjacent in neighbors.items():
+            if len(adjacent) == 2:
+                weights[city, :] = weights[:, city] = np.inf
+        for i, j in forced:
+            weights[i, j] = weights[j, i] = -np.inf
+
+        # Follow every path of forced edges from one end to the other
+        for end in neighbors:
+            if len(neighbors[end]) != 1:
+                continue
+            previous, current, length = end, neighbors[end][0], 1
+            while len(neighbors[current]) == 2:
+                previous, current = current, neighbors[current][0] if neighbors[current][0] != previous else neighbors[current][1]
+                length += 1
+            if end < current and 1 < length < n - 1:
+                weights[end, current] = weights[current, end] = np.inf
+    return weights
+
+def branching_edge(distances, tree, forced, penalties):
+    """
+    Pick the edge to branch on: at the city of highest degree in the 1-tree, its free (not forced) 1-tree
+    edge with the largest penalized length, the one most likely to be left out of the optimal tour.
+    """
+    first, second, degree = tree
+    city = int(np.argmax(degree))
+    forced = set(forced)
+    candidates = [(distances[i, j] + penalties[i] + penalties[j], min(i, j), max(i, j))
+                  for i, j in zip(first.tolist(), second.tolist())
+                  if city in (i, j) and (min(i, j), max(i, j)) not in forced]
+    _, i, j = max(candidates)
+    return i, j
+
+def tree_to_tour(tree):
+    """Turn a 1-tree in which every city has degree 2 into the order of the cities on the tour."""
+    first, second, degree = tree
+    n = len(degree)
+    neighbors = [[] for _ in range(n)]
+    for i, j in zip(first.tolist(), second.tolist()):
+        neighbors[i].append(j)
+        neighbors[j].append(i)
+    order, previous = [0], -1
+    while len(order) < n:
+        current = order[-1]
+        following = neighbors[current][0] if neighbors[current][0] != previous else neighbors[current][1]
+        previous = current
+        order.append(following)
+    return np.array(order)
+
+def heuristic_tour(distances, guide=None, num_starts=10, deadline=None):
+    """
+    Find a good tour: Nearest Neighbor tours from several starting cities (and the Farthest Insertion
+    tour), each improved with 2-opt and Or-opt. Once the deadline has passed, no further tour is built
+    or improved, but the first one is always returned.
+
+    Parameters:
+    - distances (numpy array): n x n matrix of distances between cities.
+    - guide (numpy array): Lengths Nearest Neighbor is run on, e.g., the penalized lengths d(i, j) + pi_i + pi_j
+      of a 1-tree bound, which favor the edges of the 1-trees. Defaults to None (the distances themselves).
+    - num_starts (int): Number of starting cities, spread over all cities. Defaults to 10.
+    - deadline (float): time.perf_counter() value after which the search stops. Defaults to None (no limit).
+
+    Returns:
+    - order (numpy array): Cities of the best tour in the order visited (0-based).
+    """
+    n = len(distances)
+    if n <= 3:
+        return np.arange(n)
+
+    # Starting cities of the Nearest Neighbor tours; None stands for the Farthest Insertion tour
+    starts = np.unique(np.linspace(0, n - 1, min(n, num_starts)).astype(int)).tolist()
+    if guide is None:
+        starts.append(None)
+
+    best = None
+    for start in starts:
+        if best is not None and time_left(deadline) == 0:
+            break
+        if start is None:
+            tour = farthest_insertion_tour(distances)
+        else:
+            tour = nearest_neighbor_tour(distances if guide is None else guide, start)
+        tour = local_search(distances, tour, deadline)
+        if best is None or tour_length(distances, tour) < tour_length(distances, best):
+            best = tour
+    return best
+
+def nearest_neighbor_tour(distances, start):
+    """Nearest Neighbor tour from the starting city (0-based)."""
+    n = len(distances)
+    visited_mask = np.zeros(n)
+    order = [start]
+    visited_mask[start] = np.inf
+    for _ in range(n - 1):
+        next_city = int(np.argmin(distances[order[-1]] + visited_mask))
+        order.append(next_city)
+        visited_mask[next_city] = np.inf
+    return np.array(order)
+
+def farthest_insertion_tour(distances):
+    """Farthest Insertion tour: insert the city farthest from the tour where it adds the least length."""
+    n = len(distances)
+    order = [0]
+    in_tour = np.zeros(n, dtype=bool)
+    in_tour[0] = True
+    key = distances[0].copy()  # Distance from every city to the tour
+    for _ in range(n - 1):
+        city = int(np.argmax(np.where(in_tour, -np.inf, key)))
+        tails = np.array(order)
+        heads = np.roll(tails, -1)
+        position = int(np.argmin(distances[tails, city] + distances[city, heads] - distances[tails, heads]))
+        order.insert(position + 1, city)
+        in_tour[city] = True
+        np.minimum(key, distances[city], out=key)
+    return np.array(order)
+
+def local_search(distances, order, deadline=None):
+    """Improve a tour with 2-opt and Or-opt moves until neither finds an improvement or the deadline passes."""
+    order = np.array(order)
+    improved = True
+    while improved and time_left(deadline) != 0:
+        improved = two_opt(distances, order)
+        improved = or_opt(distances, order) or improved
+    return order
+
+def two_opt(distances, order):
+    """
+    Apply first-improvement 2-opt moves to the tour (in place): for every edge (a, b), the best edge
+    (c, d) to exchange it with is found with one vectorized pass over the tour.
+
+    Returns:
+    - improved (bool): Whether the tour changed.
+    """
+    n = len(order)
+    improved = False
+    for i in range(n - 2):
+        a, b = order[i], order[i + 1]
+        c = order[i + 2:]
+        d = np.roll(order, -1)[i + 2:]
+        delta = distances[a, c] + distances[b, d] - distances[a, b] - distances[c, d]
+        if i == 0:
+            delta[-1] = 0  # (a, b) and the closing edge share city a
+        j = int(np.argmin(delta))
+        if delta[j] < -1e-10:
+            order[i + 1:i + j + 3] = order[i + 1:i + j + 3][::-1]
+            improved = True
+    return improved
+
+def or_opt(distances, order):
+    """
+    Apply first-improvement Or-opt moves to the tour (in place): every segment of 1 to 3 cities is moved,
+    in either direction, to the edge where it adds the least length, if that is shorter.
+
+    Returns:
+    - improved (bool): Whether the tour changed.
+    """
+    n = len(order)
+    improved = False
+    for length in range(1, 4):
+        if n < length + 3:
+            break
+        for i in range(n):
+            # Rotate the segment to the front: segment, then the rest of the tour from nx to p
+            rotated = np.roll(order, -i)
+            segment, rest = rotated[:length], rotated[length:]
+            s1, s2, p, nx = segment[0], segment[-1], rest[-1], rest[0]
+            removal_gain = distances[p, s1] + distances[s2, nx] - distances[p, nx]
+
+            # Insert between consecutive cities x and y of the rest, in either direction
+            x, y = rest[:-1], rest[1:]
+            forward = distances[x, s1] + distances[s2, y] - distances[x, y]
+            backward = distances[x, s2] + distances[s1, y] - distances[x, y]
+            k_forward, k_backward = int(np.argmin(forward)), int(np.argmin(backward))
+            if forward[k_forward] <= backward[k_backward]:
+                k, cost = k_forward, forward[k_forward]
+            else:
+                k, cost, segment = k_backward, backward[k_backward], segment[::-1]
+            if cost - removal_gain < -1e-10:
+                order[:] = np.concatenate((rest[:k + 1], segment, rest[k + 1:]))
+                improved = True
+    return improved
+
+def time_left(deadline):
+    """Seconds left until the deadline (never negative), or None without a deadline."""
+    return None if deadline is None else max(deadline - time.perf_counter(), 0)
+
+def tour_length(distances, order):
+    """Total distance of the tour visiting the cities (0-based) in order."""
+    order = np.asarray(order)
+    return float(distances[order, np.roll(order, -1)].sum())
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def print_result(result):
+    """
+    Prints a TSP result: the solve time and search statistics, then the optimal tour, or the best tour
+    found with its bound and gap when the time limit stopped the search.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Solve Time:", f"{result.solve_time:.3f} s")
+    print("Nodes:", result.nodes, "|", f"{result.nodes / max(result.solve_time, 1e-9):.1f} nodes/s")
+    print("Root Bound:", result.root_bound, "\n")
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+        print("Optimal Tour:", result.tour)
+    else:
+        # Stopped early: report the best tour found with its bound
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+        print("Best Tour Found:", result.tour)
+    print("\n")
+
+def plot_optimal_route_linear(optimal_tour, total_distance):
+    """
+    Plots the optimal route in a line for the TSP.
+
+    Parameters:
+    - optimal_tour (list of tuples): Optimal path, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)].
+    - total_distance (float): Total distance of the optimal tour.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    # Extract the order of cities from the optimal tour
+    ordered_cities = [optimal_tour[0][0]]  # Start with the first city in the tour
+    for _, next_city in optimal_tour:
+        ordered_cities.append(next_city)
+
+    # Generate positions along a line for each city in the order of the optimal tour
+    x_coords = list(range(1, len(ordered_cities) + 1))
+    y_coords = [1] * len(ordered_cities)  # Set a constant y-coordinate for all cities to place them in a line
+
+    # Create a figure
+    plt.figure(figsize=(10, 2))
+    plt.title(f"Optimal TSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    # Plot each city in the order of the optimal tour
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    # Annotate each city with its index according to the ordered tour
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{ordered_cities[i]}', ha='center', color='darkred')
+
+    # Plot the route by drawing lines in the order of the optimal tour
+    for idx in range(len(ordered_cities) - 1):
+        plt.plot([x_coords[idx], x_coords[idx + 1]], [1, 1], color='green', linestyle='-', linewidth=2)
+
+    # Set plot limits and remove the y-axis for a clean linear view
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 15, 20],
+        [10, 0, 35, 25],
+        [15, 35, 0, 30],
+        [20, 25, 30, 0]
+    ]
+
+    result = solve_tsp_with_branch_and_bound(distance_matrix, show_route=True)
+    print_result(result)
+
+    # 60 random cities, with a time limit
+    points = np.random.default_rng(0).random((60, 2)) * 1000
+    distances = np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2)).round()
+    result = solve_tsp_with_branch_and_bound(distances, time_limit=120)
+    print_result(result)
@@ -7,46 +7,314 @@ Original file is located at
     https://colab.research.google.com/drive/1I4sYhx7VGDM1e0ZKVgFlv-JZvC-ZdR0p
 """
 
+import math
+import operator
+import time
+from collections import OrderedDict
+
 import numpy as np
-import matplotlib.pyplot as plt
 
-def solve_tsp_with_nearest_neighbor(distance_matrix, start=1, show_route=True):
+class TSPResult:
+    """
+    Result of a TSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+def solve_tsp_with_nearest_neighbor(distance_matrix, start=1, show_route=False):
     """
     Solve the TSP using the Nearest Neighbor heuristic.
 
+    The distance matrix is converted once to a contiguous float array. Visited cities are
+    masked out of the current row and the next city is picked with a single argmin, so ties
+    are broken towards the lowest city index. With a CoordinateDistances oracle, the next city
+    is found with a spatial grid instead, which is close to linear time for evenly spread cities.
+
     Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as
+      a condensed 1D array, or a CoordinateDistances oracle. float32 arrays are kept as float32.
     - start (int): The starting city (1-based index). Defaults to City 1.
-    - show_route (bool): Whether to display the route plot. Defaults to True.
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The tour, its total distance, the status and the solve time. It unpacks like the
+      tuple (tour, total_distance).
     """
-    # Convert to 1-based indexing for cities
-    n = len(distance_matrix)
-    unvisited = set(range(1, n + 1))  # Cities indexed from 1 to n
-    tour = [start]  # Start from the specified city
-    current_city = start
-    unvisited.remove(current_city)
-    total_distance = 0
+    solve_start = time.perf_counter()
+
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
 
-    while unvisited:
+    # With coordinates, the nearest unvisited city is found with a spatial grid instead of a row scan
+    grid = SpatialGrid(distances.points) if isinstance(distances, CoordinateDistances) else None
+
+    # Visited cities carry an infinite penalty so argmin never selects them
+    visited_mask = np.zeros(n)
+    row = np.empty(n)
+
+    current_city = start - 1  # 0-based index into the distance array
+    visited_mask[current_city] = np.inf
+    if grid is not None:
+        grid.remove(current_city)
+    tour = [start]
+    total_distance = 0.0
+
+    for _ in range(n - 1):
         # Find the nearest unvisited city
-        next_city = min(unvisited, key=lambda city: distance_matrix[current_city - 1][city - 1])
-        total_distance += distance_matrix[current_city - 1][next_city - 1]
-        tour.append(next_city)
-        unvisited.remove(next_city)
+        if grid is not None:
+            next_city, _ = grid.nearest(current_city)
+            grid.remove(next_city)
+        else:
+            np.add(distances[current_city], visited_mask, out=row)
+            next_city = int(np.argmin(row))
+            if visited_mask[next_city]:
+                # Every unvisited city is infinitely far away, take the lowest-indexed one
+                next_city = int(np.flatnonzero(visited_mask == 0)[0])
+
+        total_distance += distances.item(current_city, next_city)
+        tour.append(next_city + 1)
+        visited_mask[next_city] = np.inf
         current_city = next_city
 
     # Return to the starting city
-    total_distance += distance_matrix[current_city - 1][start - 1]
+    total_distance += distances.item(current_city, start - 1)
     tour.append(start)
+    total_distance = float(total_distance)
 
-    # Print results
-    print("Total Distance:", total_distance, "\n")
-    print("Tour:", tour, "\n")
+    result = TSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
 
     # Plot the route if show_route is True
     if show_route:
         plot_route_linear(tour, total_distance)
 
+    return result
+
+def as_distance_array(distance_matrix):
+    """
+    Convert a distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. A condensed 1D array (the upper triangle row by row, e.g., from
+    generate_distance_matrix(points, condensed=True)) is expanded to the full matrix first, and a
+    CoordinateDistances oracle is returned as it is.
+    """
+    if isinstance(distance_matrix, CoordinateDistances):
+        return distance_matrix  # Distances stay implicit and are computed from the coordinates
+    distances = np.asarray(distance_matrix)
+    if distances.ndim == 1:
+        distances = square_distance_matrix(distances)
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+class CoordinateDistances:
+    """
+    Euclidean distances computed on demand from city coordinates, used in place of a distance matrix.
+
+    Only the coordinates are stored, so memory stays O(n) where a matrix needs O(n^2), e.g., 80 GB
+    for 100,000 cities. It supports the indexing the heuristics use: whole rows (distances[i] and,
+    by symmetry, distances[:, j]), single distances (distances.item(i, j)) and element-wise distances
+    between index arrays (distances[rows, cols], broadcast like NumPy indexing, including np.ix_).
+    Each row takes a few vectorized flops per city. The tour itself never scans a row from coordinates,
+    since it walks a SpatialGrid, so the optional LRU cache of recent rows is off by default and only
+    helps code that reads the same rows again.
+
+    Parameters:
+    - points (2D list or numpy array): n x 2 array of city coordinates.
+    - cache_size (int): Maximum number of rows kept in the cache. Defaults to 0 (no cache).
+    - dtype (numpy dtype): Dtype of the returned rows and pair distances. np.float32 halves the memory
+      of cached rows. Defaults to np.float64.
+    """
+
+    def __init__(self, points, cache_size=0, dtype=np.float64):
+        self.points = np.ascontiguousarray(np.asarray(points, dtype=float).reshape(-1, 2))
+        self.x = self.points[:, 0].copy()
+        self.y = self.points[:, 1].copy()
+        self.xs, self.ys = self.x.tolist(), self.y.tolist()  # Python floats for scalar lookups
+        self.dtype = np.dtype(dtype)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def shape(self):
+        return len(self.x), len(self.x)
+
+    def item(self, i, j):
+        """Distance between cities i and j as a Python float."""
+        return math.hypot(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j])
+
+    def row(self, i):
+        """Distances from city i to every city, as a read-only array."""
+        row = self.cache.get(i)
+        if row is not None:
+            self.cache.move_to_end(i)
+            return row
+
+        row = self.x - self.xs[i]
+        row *= row
+        dy = self.y - self.ys[i]
+        dy *= dy
+        row += dy
+        row = np.sqrt(row, out=row).astype(self.dtype, copy=False)
+        row.flags.writeable = False  # Cached rows are shared between callers
+
+        if self.cache_size > 0:
+            self.cache[i] = row
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)  # Evict the least recently used row
+        return row
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            return self.row(operator.index(key))
+        rows, cols = key
+        if isinstance(rows, slice) and rows == slice(None):
+            return self.row(operator.index(cols))
+        if isinstance(cols, slice) and cols == slice(None):
+            return self.row(operator.index(rows))
+
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        dx = self.x[rows] - self.x[cols]
+        dy = self.y[rows] - self.y[cols]
+        distances = np.sqrt(dx * dx + dy * dy).astype(self.dtype, copy=False)
+        return distances[()] if distances.ndim == 0 else distances
+
+class SpatialGrid:
+    """
+    Uniform grid over city coordinates for nearest-neighbor queries among the cities that are left.
+
+    Cities are bucketed into square cells holding about two cities each. A query searches the rings
+    of cells around the query city, nearest first, and stops once no unsearched cell can hold a closer
+    city. Removing a city takes O(1), and the grid is rebuilt over the remaining cities whenever
+    three quarters of them are gone, so queries stay cheap until the last city.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    """
+
+    def __init__(self, points):
+        self.xs, self.ys = points[:, 0].tolist(), points[:, 1].tolist()
+        self.cell_of = [0] * len(points)
+        self.slot = [0] * len(points)
+        self.build(np.arange(len(points)), points)
+
+    def build(self, cities, points):
+        """Bucket the given cities (0-based) into a new grid sized for them."""
+        self.count = self.built_count = len(cities)
+        self.size = size = max(1, int(math.ceil(math.sqrt(len(cities) / 2))))
+        lower = points.min(axis=0) if len(points) else np.zeros(2)
+        extent = float((points.max(axis=0) - lower).max()) if len(points) else 0.0
+        self.lower_x, self.lower_y = float(lower[0]), float(lower[1])
+        self.width = max(extent, 1e-12) / size
+        cells = np.minimum(((points - lower) / self.width).astype(np.intp), size - 1)
+
+        self.cells = [[] for _ in range(size * size)]
+        for city, cell in zip(cities.tolist(), (cells[:, 0] * size + cells[:, 1]).tolist()):
+            self.cell_of[city] = cell
+            self.slot[city] = len(self.cells[cell])
+            self.cells[cell].append(city)
+
+    def remove(self, city):
+        """Remove a city from the grid."""
+        cell = self.cells[self.cell_of[city]]
+        last = cell.pop()
+        if last != city:
+            cell[self.slot[city]] = last
+            self.slot[last] = self.slot[city]
+        self.count -= 1
+        if 0 < self.count <= self.built_count // 4:
+            cities = np.array([city for cell in self.cells for city in cell], dtype=np.intp)
+            self.build(cities, np.column_stack((np.take(self.xs, cities), np.take(self.ys, cities))))
+
+    def nearest(self, city):
+        """
+        Find the remaining city nearest to the given city, breaking ties towards the lowest index.
+
+        Returns:
+        - nearest_city (int): The nearest remaining city (0-based), or -1 if no city is left.
+        - squared_distance (float): Its squared distance to the given city.
+        """
+        x, y = self.xs[city], self.ys[city]
+        xs, ys, cells, size, width = self.xs, self.ys, self.cells, self.size, self.width
+        cx = min(max(int((x - self.lower_x) / width), 0), size - 1)
+        cy = min(max(int((y - self.lower_y) / width), 0), size - 1)
+        last_ring = max(cx, cy, size - 1 - cx, size - 1 - cy)
+
+        best, best_squared = -1, math.inf
+        for r in range(last_ring + 1):
+            for ix in range(max(cx - r, 0), min(cx + r, size - 1) + 1):
+                # Whole column on the left and right edge of the ring, only its top and bottom cells in between
+                if ix == cx - r or ix == cx + r:
+                    iys = range(max(cy - r, 0), min(cy + r, size - 1) + 1)
+                else:
+                    iys = [iy for iy in (cy - r, cy + r) if 0 <= iy < size]
+                for iy in iys:
+                    for other in cells[ix * size + iy]:
+                        dx, dy = xs[other] - x, ys[other] - y
+                        squared = dx * dx + dy * dy
+                        if squared < best_squared or (squared == best_squared and other < best):
+                            best, best_squared = other, squared
+            # Cities outside rings 0..r are at least r cell widths away
+            if best >= 0 and best_squared < (r * width) ** 2:
+                break
+        return best, best_squared
+
+def print_result(result):
+    """
+    Prints the total distance and the tour of a TSP result.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
 def plot_route_linear(tour, total_distance):
     """
     Plots the route in a line for the TSP.
@@ -55,6 +323,9 @@ def plot_route_linear(tour, total_distance):
     - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
     - total_distance (float): Total distance of the tour.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     # Generate positions along a line for each city in the order of the tour
     x_coords = list(range(1, len(tour) + 1))
     y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
@@ -93,5 +364,10 @@ if __name__ == "__main__":
     ]
 
 
-    # Call the function to display the best route from multiple starting points
-    solve_tsp_with_nearest_neighbor(distance_matrix, start=1, show_route=True)
\ No newline at end of file
+    result = solve_tsp_with_nearest_neighbor(distance_matrix, start=1, show_route=True)
+    print_result(result)
+
+    # Large instance from coordinates, without a distance matrix
+    coordinates = np.random.default_rng(0).random((20000, 2)) * 1000
+    tour, total_distance = solve_tsp_with_nearest_neighbor(CoordinateDistances(coordinates), start=1, show_route=False)
+    print("Total Distance (20,000 cities):", total_distance, "\n")
\ No newline at end of file
@@ -1,80 +1,465 @@
+import math
+import operator
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing import shared_memory
+
 import numpy as np
-import matplotlib.pyplot as plt
 
-def solve_tsp_with_MSPNN(distance_matrix, show_route=True, show_other_routes=False):
+class TSPResult:
+    """
+    Result of a TSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The best tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    - other_routes (list of tuples): (start, tour, total_distance) of every starting city tried, sorted by
+      starting city, or None unless show_other_routes was set.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time", "other_routes")
+
+    def __init__(self, tour, total_distance, status, solve_time, other_routes=None):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+        self.other_routes = other_routes
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+def solve_tsp_with_MSPNN(distance_matrix, show_route=False, show_other_routes=False, parallel=False,
+                         max_workers=None, max_starts=None, time_limit=None, seed=None):
     """
     Solve the TSP using the Multiple-Starting Point Nearest Neighbor heuristic.
 
     Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
-    - show_route (bool): Whether to display the route plot for the best tour. Defaults to True.
-    - show_other_routes (bool): If True, display all routes and distances for each starting city. Defaults to False.
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as
+      a condensed 1D array, or a CoordinateDistances oracle. float32 arrays are kept as float32.
+    - show_route (bool): Whether to display the route plot for the best tour. Defaults to False.
+    - show_other_routes (bool): If True, keep the tour and distance of every starting city in
+      result.other_routes, so that print_result shows them. Defaults to False.
+    - parallel (bool): If True, spread the starting cities over a process pool that reads the distance
+      matrix from shared memory. Defaults to False.
+    - max_workers (int): Number of worker processes in parallel mode. Defaults to the number of CPUs.
+    - max_starts (int): If given and smaller than the number of cities, only this many starting cities
+      are sampled (without replacement). Defaults to None (every city is a starting point).
+    - time_limit (float): Time budget in seconds. Once it is hit no new starting cities are tried and
+      the best tour found so far is returned. Defaults to None (no limit).
+    - seed (int): Seed for sampling the starting cities when max_starts is used. Defaults to None.
+
+    Returns:
+    - result (TSPResult): The best tour, its total distance, the status and the solve time. It unpacks like
+      the tuple (best_tour, best_total_distance).
     """
-    n = len(distance_matrix)
-    best_tour = None
-    best_total_distance = float('inf')
-    all_tours = []
+    solve_start = time.perf_counter()
 
-    # Try starting from each city
-    for start in range(1, n + 1):
-        # Perform the nearest neighbor heuristic from this starting city
-        tour, total_distance = nearest_neighbor_tsp(distance_matrix, start)
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+    deadline = None if time_limit is None else time.time() + time_limit
 
-        # Store the tour and distance
-        all_tours.append((tour, total_distance))
+    # Choose the starting cities (1-based), optionally sampling a subset of them
+    starts = np.arange(1, n + 1)
+    if max_starts is not None and max_starts < n:
+        rng = np.random.default_rng(seed)
+        starts = np.sort(rng.choice(starts, size=max(max_starts, 1), replace=False))
+    starts = starts.tolist()
 
-        # Update the best tour if the current tour has a shorter distance
-        if total_distance < best_total_distance:
-            best_tour = tour
-            best_total_distance = total_distance
+    if parallel and len(starts) > 1:
+        all_tours = _run_starts_in_pool(distances, starts, max_workers, deadline)
+    else:
+        all_tours = _run_starts(distances, starts, deadline)
 
-    # Print the best results
-    print("Best Starting City Tour:")
-    print("Total Distance:", best_total_distance, "\n")
-    print("Tour:", best_tour, "\n")
+    # Pick the shortest tour, breaking ties towards the lowest starting city
+    best_start, best_tour, best_total_distance = min(all_tours, key=lambda result: (result[2], result[0]))
 
-    # Show all routes and distances if show_other_routes is True
-    if show_other_routes:
-        print("Other Routes and Distances:")
-        for idx, (tour, dist) in enumerate(all_tours, start=1):
-            print(f"Starting from City {idx}: Tour: {tour}, Total Distance: {dist}")
+    # Keep all routes and distances if show_other_routes is True
+    other_routes = sorted(all_tours) if show_other_routes else None
+    result = TSPResult(best_tour, best_total_distance, "Feasible", time.perf_counter() - solve_start, other_routes)
 
     # Plot the best route if show_route is True
     if show_route:
         plot_route_linear(best_tour, best_total_distance)
 
+    return result
+
 def nearest_neighbor_tsp(distance_matrix, start):
     """
     Perform the Nearest Neighbor heuristic starting from a specified city.
 
     Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as
+      a condensed 1D array, or a CoordinateDistances oracle. float32 arrays are kept as float32.
     - start (int): The starting city (1-based index).
 
     Returns:
     - tour (list): The tour of cities in the order visited.
     - total_distance (float): Total distance of the tour.
     """
-    n = len(distance_matrix)
-    unvisited = set(range(1, n + 1))
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+
+    # With coordinates, the nearest unvisited city is found with a spatial grid instead of a row scan
+    grid = SpatialGrid(distances.points) if isinstance(distances, CoordinateDistances) else None
+
+    # Visited cities carry an infinite penalty so argmin never selects them
+    visited_mask = np.zeros(n)
+    row = np.empty(n)
+
+    current_city = start - 1
+    visited_mask[current_city] = np.inf
+    if grid is not None:
+        grid.remove(current_city)
     tour = [start]
-    current_city = start
-    unvisited.remove(current_city)
-    total_distance = 0
+    total_distance = 0.0
 
-    while unvisited:
+    for _ in range(n - 1):
         # Find the nearest unvisited city
-        next_city = min(unvisited, key=lambda city: distance_matrix[current_city - 1][city - 1])
-        total_distance += distance_matrix[current_city - 1][next_city - 1]
-        tour.append(next_city)
-        unvisited.remove(next_city)
+        if grid is not None:
+            next_city, _ = grid.nearest(current_city)
+            grid.remove(next_city)
+        else:
+            np.add(distances[current_city], visited_mask, out=row)
+            next_city = int(np.argmin(row))
+            if visited_mask[next_city]:
+                # Every unvisited city is infinitely far away, take the lowest-indexed one
+                next_city = int(np.flatnonzero(visited_mask == 0)[0])
+
+        total_distance += distances.item(current_city, next_city)
+        tour.append(next_city + 1)
+        visited_mask[next_city] = np.inf
         current_city = next_city
 
     # Return to the starting city
-    total_distance += distance_matrix[current_city - 1][start - 1]
+    total_distance += distances.item(current_city, start - 1)
     tour.append(start)
 
-    return tour, total_distance
+    return tour, float(total_distance)
+
+def _run_starts(distances, starts, deadline=None):
+    """
+    Run the Nearest Neighbor heuristic from each starting city in turn.
+
+    Parameters:
+    - distances (numpy array or CoordinateDistances): Float matrix of distances between cities.
+    - starts (list of int): Starting cities (1-based index).
+    - deadline (float): Wall-clock time (time.time()) after which no new start is tried.
+      At least one start is always completed.
+
+    Returns:
+    - results (list of tuples): (start, tour, total_distance) for every completed start.
+    """
+    results = []
+    for start in starts:
+        if results and deadline is not None and time.time() >= deadline:
+            break
+        tour, total_distance = nearest_neighbor_tsp(distances, start)
+        results.append((start, tour, total_distance))
+    return results
+
+def _run_starts_in_pool(distances, starts, max_workers=None, deadline=None):
+    """
+    Run the Nearest Neighbor heuristic from each starting city on a process pool.
+
+    The distance matrix is copied once into a shared memory block that every worker maps
+    read-only, so tasks only carry their starting cities. A CoordinateDistances oracle is only
+    O(n) and is sent to every worker as it is. Once the deadline is hit, pending tasks are
+    cancelled and running ones stop before their next start.
+
+    Parameters:
+    - distances (numpy array or CoordinateDistances): Float matrix of distances between cities.
+    - starts (list of int): Starting cities (1-based index).
+    - max_workers (int): Number of worker processes. Defaults to the number of CPUs.
+    - deadline (float): Wall-clock time (time.time()) after which no new start is tried.
+      At least one start is always completed.
+
+    Returns:
+    - results (list of tuples): (start, tour, total_distance) for every completed start.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # Small chunks keep the pool busy and let a deadline cancel most of the remaining work
+    chunk_size = max(1, len(starts) // (max_workers * 4))
+    chunks = [starts[i:i + chunk_size] for i in range(0, len(starts), chunk_size)]
+
+    if isinstance(distances, CoordinateDistances):
+        shm = None
+        initializer, initargs = _set_worker_distances, (distances,)
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=max(distances.nbytes, 1))
+        np.ndarray(distances.shape, dtype=distances.dtype, buffer=shm.buf)[:] = distances
+        initializer, initargs = _attach_shared_distances, (shm.name, distances.shape, distances.dtype.str)
+
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs) as executor:
+            pending = {executor.submit(_run_starts_in_worker, chunk, deadline) for chunk in chunks}
+            while pending:
+                # Wait for the deadline, or without limit until the first result is in
+                timeout = None if deadline is None or not results else max(deadline - time.time(), 0)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results.extend(future.result())
+                if deadline is not None and time.time() >= deadline and results:
+                    # Time budget hit: drop queued chunks, keep what the running ones return
+                    for future in pending:
+                        future.cancel()
+                    for future in wait(pending).done:
+                        if not future.cancelled():
+                            results.extend(future.result())
+                    break
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    # A deadline shorter than the pool startup leaves every chunk empty, so the first start is run here
+    if not results:
+        results = _run_starts(distances, starts[:1])
+    return results
+
+# Shared distance matrix of the current worker process, set by _attach_shared_distances
+_worker_shm = None
+_worker_distances = None
+
+def _attach_shared_distances(shm_name, shape, dtype):
+    """Pool initializer: map the shared distance matrix into the worker process."""
+    global _worker_shm, _worker_distances
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_distances = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_worker_shm.buf)
+
+def _set_worker_distances(distances):
+    """Pool initializer: keep the CoordinateDistances oracle of the worker process."""
+    global _worker_distances
+    _worker_distances = distances
+
+def _run_starts_in_worker(starts, deadline):
+    """Pool task: run a chunk of starting cities against the shared distance matrix."""
+    if deadline is not None and time.time() >= deadline:
+        return []
+    return _run_starts(_worker_distances, starts, deadline)
+
+def as_distance_array(distance_matrix):
+    """
+    Convert a distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. A condensed 1D array (the upper triangle row by row, e.g., from
+    generate_distance_matrix(points, condensed=True)) is expanded to the full matrix first, and a
+    CoordinateDistances oracle is returned as it is.
+    """
+    if isinstance(distance_matrix, CoordinateDistances):
+        return distance_matrix  # Distances stay implicit and are computed from the coordinates
+    distances = np.asarray(distance_matrix)
+    if distances.ndim == 1:
+        distances = square_distance_matrix(distances)
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+class CoordinateDistances:
+    """
+    Euclidean distances computed on demand from city coordinates, used in place of a distance matrix.
+
+    Only the coordinates are stored, so memory stays O(n) where a matrix needs O(n^2), e.g., 80 GB
+    for 100,000 cities. It supports the indexing the heuristics use: whole rows (distances[i] and,
+    by symmetry, distances[:, j]), single distances (distances.item(i, j)) and element-wise distances
+    between index arrays (distances[rows, cols], broadcast like NumPy indexing, including np.ix_).
+    Each row takes a few vectorized flops per city. The starts do not scan rows from coordinates: every
+    start walks its own SpatialGrid, so there is no row work to share between them and the optional
+    LRU cache of recent rows is off by default.
+
+    Parameters:
+    - points (2D list or numpy array): n x 2 array of city coordinates.
+    - cache_size (int): Maximum number of rows kept in the cache. Defaults to 0 (no cache).
+    - dtype (numpy dtype): Dtype of the returned rows and pair distances. np.float32 halves the memory
+      of cached rows. Defaults to np.float64.
+    """
+
+    def __init__(self, points, cache_size=0, dtype=np.float64):
+        self.points = np.ascontiguousarray(np.asarray(points, dtype=float).reshape(-1, 2))
+        self.x = self.points[:, 0].copy()
+        self.y = self.points[:, 1].copy()
+        self.xs, self.ys = self.x.tolist(), self.y.tolist()  # Python floats for scalar lookups
+        self.dtype = np.dtype(dtype)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def shape(self):
+        return len(self.x), len(self.x)
+
+    def item(self, i, j):
+        """Distance between cities i and j as a Python float."""
+        return math.hypot(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j])
+
+    def row(self, i):
+        """Distances from city i to every city, as a read-only array."""
+        row = self.cache.get(i)
+        if row is not None:
+            self.cache.move_to_end(i)
+            return row
+
+        row = self.x - self.xs[i]
+        row *= row
+        dy = self.y - self.ys[i]
+        dy *= dy
+        row += dy
+        row = np.sqrt(row, out=row).astype(self.dtype, copy=False)
+        row.flags.writeable = False  # Cached rows are shared between callers
+
+        if self.cache_size > 0:
+            self.cache[i] = row
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)  # Evict the least recently used row
+        return row
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            return self.row(operator.index(key))
+        rows, cols = key
+        if isinstance(rows, slice) and rows == slice(None):
+            return self.row(operator.index(cols))
+        if isinstance(cols, slice) and cols == slice(None):
+            return self.row(operator.index(rows))
+
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        dx = self.x[rows] - self.x[cols]
+        dy = self.y[rows] - self.y[cols]
+        distances = np.sqrt(dx * dx + dy * dy).astype(self.dtype, copy=False)
+        return distances[()] if distances.ndim == 0 else distances
+
+class SpatialGrid:
+    """
+    Uniform grid over city coordinates for nearest-neighbor queries among the cities that are left.
+
+    Cities are bucketed into square cells holding about two cities each. A query searches the rings
+    of cells around the query city, nearest first, and stops once no unsearched cell can hold a closer
+    city. Removing a city takes O(1), and the grid is rebuilt over the remaining cities whenever
+    three quarters of them are gone, so queries stay cheap until the last city.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    """
+
+    def __init__(self, points):
+        self.xs, self.ys = points[:, 0].tolist(), points[:, 1].tolist()
+        self.cell_of = [0] * len(points)
+        self.slot = [0] * len(points)
+        self.build(np.arange(len(points)), points)
+
+    def build(self, cities, points):
+        """Bucket the given cities (0-based) into a new grid sized for them."""
+        self.count = self.built_count = len(cities)
+        self.size = size = max(1, int(math.ceil(math.sqrt(len(cities) / 2))))
+        lower = points.min(axis=0) if len(points) else np.zeros(2)
+        extent = float((points.max(axis=0) - lower).max()) if len(points) else 0.0
+        self.lower_x, self.lower_y = float(lower[0]), float(lower[1])
+        self.width = max(extent, 1e-12) / size
+        cells = np.minimum(((points - lower) / self.width).astype(np.intp), size - 1)
+
+        self.cells = [[] for _ in range(size * size)]
+        for city, cell in zip(cities.tolist(), (cells[:, 0] * size + cells[:, 1]).tolist()):
+            self.cell_of[city] = cell
+            self.slot[city] = len(self.cells[cell])
+            self.cells[cell].append(city)
+
+    def remove(self, city):
+        """Remove a city from the grid."""
+        cell = self.cells[self.cell_of[city]]
+        last = cell.pop()
+        if last != city:
+            cell[self.slot[city]] = last
+            self.slot[last] = self.slot[city]
+        self.count -= 1
+        if 0 < self.count <= self.built_count // 4:
+            cities = np.array([city for cell in self.cells for city in cell], dtype=np.intp)
+            self.build(cities, np.column_stack((np.take(self.xs, cities), np.take(self.ys, cities))))
+
+    def nearest(self, city):
+        """
+        Find the remaining city nearest to the given city, breaking ties towards the lowest index.
+
+        Returns:
+        - nearest_city (int): The nearest remaining city (0-based), or -1 if no city is left.
+        - squared_distance (float): Its squared distance to the given city.
+        """
+        x, y = self.xs[city], self.ys[city]
+        xs, ys, cells, size, width = self.xs, self.ys, self.cells, self.size, self.width
+        cx = min(max(int((x - self.lower_x) / width), 0), size - 1)
+        cy = min(max(int((y - self.lower_y) / width), 0), size - 1)
+        last_ring = max(cx, cy, size - 1 - cx, size - 1 - cy)
+
+        best, best_squared = -1, math.inf
+        for r in range(last_ring + 1):
+            for ix in range(max(cx - r, 0), min(cx + r, size - 1) + 1):
+                # Whole column on the left and right edge of the ring, only its top and bottom cells in between
+                if ix == cx - r or ix == cx + r:
+                    iys = range(max(cy - r, 0), min(cy + r, size - 1) + 1)
+                else:
+                    iys = [iy for iy in (cy - r, cy + r) if 0 <= iy < size]
+                for iy in iys:
+                    for other in cells[ix * size + iy]:
+                        dx, dy = xs[other] - x, ys[other] - y
+                        squared = dx * dx + dy * dy
+                        if squared < best_squared or (squared == best_squared and other < best):
+                            best, best_squared = other, squared
+            # Cities outside rings 0..r are at least r cell widths away
+            if best >= 0 and best_squared < (r * width) ** 2:
+                break
+        return best, best_squared
+
+def print_result(result):
+    """
+    Prints the best tour of a TSP result and, if they were kept, the tours of the other starting cities.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Best Starting City Tour:")
+    print("Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
+    if result.other_routes is not None:
+        print("Other Routes and Distances:")
+        for start, tour, dist in result.other_routes:
+            print(f"Starting from City {start}: Tour: {tour}, Total Distance: {dist}")
 
 def plot_route_linear(tour, total_distance):
     """
@@ -84,6 +469,9 @@ def plot_route_linear(tour, total_distance):
     - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
     - total_distance (float): Total distance of the tour.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     x_coords = list(range(1, len(tour) + 1))
     y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
 
@@ -115,4 +503,9 @@ if __name__ == "__main__":
     ]
 
     # Call the function to display the best route from multiple starting points
-    solve_tsp_with_MSPNN(distance_matrix, show_route=True, show_other_routes=True)
\ No newline at end of file
+    result = solve_tsp_with_MSPNN(distance_matrix, show_route=True, show_other_routes=True)
+    print_result(result)
+
+    # A time limit shorter than the pool startup still returns the tour of the first starting city
+    result = solve_tsp_with_MSPNN(distance_matrix, parallel=True, max_workers=2, time_limit=0)
+    print_result(result)
\ No newline at end of file
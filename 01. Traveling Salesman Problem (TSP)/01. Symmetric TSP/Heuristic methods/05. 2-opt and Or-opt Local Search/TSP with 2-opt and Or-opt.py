@@ -0,0 +1,478 @@
+import math
+import operator
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+class TSPResult:
+    """
+    Result of a TSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+def improve_tour_with_local_search(distance_matrix, tour, num_neighbors=10, use_or_opt=True, time_limit=None, show_route=False):
+    """
+    Improve a TSP tour with 2-opt and Or-opt local search.
+
+    The tour can come from any of the constructive heuristics (Nearest Neighbor, MSPNN, Nearest or
+    Farthest Insertion). Moves are only tried towards each city's k nearest neighbors, cities whose
+    surroundings did not change are skipped (don't-look bits), and the tour is stored as an array
+    whose segments are reversed in place, always on the shorter side of the cycle.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of symmetric distances between cities, or its upper triangle as
+      a condensed 1D array, or a CoordinateDistances oracle. float32 arrays are kept as float32.
+    - tour (list): Tour of cities (1-based index), e.g., [1, 3, 4, 2, 1]. The closing city may be omitted.
+    - num_neighbors (int): Number of nearest neighbors in each city's candidate list. Defaults to 10.
+    - use_or_opt (bool): If True, also move segments of 1 to 3 cities (Or-opt). Defaults to True.
+    - time_limit (float): Time limit in seconds. The best tour found so far is returned once it is hit.
+      Defaults to None (run until no improving move is left).
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The improved tour, its total distance, the status and the solve time. It unpacks
+      like the tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    deadline = None if time_limit is None else solve_start + time_limit
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+
+    # Work on the open cycle with 0-based cities
+    order = np.asarray(tour, dtype=np.intp) - 1
+    if len(order) > 1 and order[0] == order[-1]:
+        order = order[:-1]
+    start = int(order[0])
+
+    if n >= 5:
+        search = _LocalSearch(distances, order, num_neighbors)
+        search.run(use_or_opt, deadline)
+        order = search.order
+
+    # Rotate the tour back to its starting city and close it
+    order = np.roll(order, -int(np.flatnonzero(order == start)[0]))
+    tour = (order + 1).tolist() + [start + 1]
+    total_distance = sum(distances[order, np.roll(order, -1)].tolist())
+
+    result = TSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
+
+    # Plot the route if show_route is True
+    if show_route:
+        plot_route_linear(tour, total_distance)
+
+    return result
+
+def nearest_neighbor_lists(distances, num_neighbors):
+    """
+    Build the candidate list of every city: its k nearest other cities, closest first.
+
+    Parameters:
+    - distances (numpy array): Float matrix of distances between cities.
+    - num_neighbors (int): Number of neighbors per city.
+
+    Returns:
+    - neighbors (numpy array): n x k array of city indices (0-based).
+    """
+    n = len(distances)
+    k = max(1, min(num_neighbors, n - 1))
+    neighbors = np.empty((n, k), dtype=np.intp)
+
+    # Work in row blocks so the partition never needs a full n x n index array
+    block = max(1, 2 ** 22 // n)
+    for first in range(0, n, block):
+        rows = distances[first:first + block].copy()
+        rows[np.arange(len(rows)), np.arange(first, first + len(rows))] = np.inf  # Exclude the city itself
+        nearest = np.argpartition(rows, k - 1, axis=1)[:, :k]
+        nearest_distances = np.take_along_axis(rows, nearest, axis=1)
+        neighbors[first:first + block] = np.take_along_axis(nearest, np.argsort(nearest_distances, axis=1, kind="stable"), axis=1)
+    return neighbors
+
+def nearest_neighbor_lists_from_coordinates(points, num_neighbors):
+    """
+    Build the candidate set of every city from its coordinates with a uniform grid.
+
+    Cities are bucketed into cells holding about two cities each. For every cell, the cities of the
+    surrounding (2r + 1) x (2r + 1) block of cells are searched; r grows until the k-th nearest
+    neighbor is provably inside the block, so the result is exact.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    - num_neighbors (int): Number of neighbors per city.
+
+    Returns:
+    - neighbors (numpy array): n x k array of city indices (0-based).
+    """
+    n = len(points)
+    k = max(1, min(num_neighbors, n - 1))
+    neighbors = np.empty((n, k), dtype=np.intp)
+
+    # Grid with about two cities per cell
+    lower = points.min(axis=0)
+    extent = max(float((points.max(axis=0) - lower).max()), 1e-12)
+    size = max(1, int(math.ceil(math.sqrt(n / 2))))
+    width = extent / size
+    cells = np.minimum(((points - lower) / width).astype(np.intp), size - 1)
+    cell_ids = cells[:, 0] * size + cells[:, 1]
+
+    # Cities sorted by cell; each row of cells within a block is one contiguous slice
+    by_cell = np.argsort(cell_ids, kind="stable")
+    bounds = np.searchsorted(cell_ids[by_cell], np.arange(size * size + 1))
+
+    radius = max(1, int(math.ceil(math.sqrt(k / 2) / 2)) + 1)
+    for cell in np.flatnonzero(np.diff(bounds)).tolist():
+        members = by_cell[bounds[cell]:bounds[cell + 1]]
+        cx, cy = divmod(cell, size)
+        r = radius
+        while True:
+            low_y, high_y = max(cy - r, 0), min(cy + r, size - 1)
+            pool = np.concatenate([by_cell[bounds[x * size + low_y]:bounds[x * size + high_y + 1]]
+                                   for x in range(max(cx - r, 0), min(cx + r, size - 1) + 1)])
+            if len(pool) > k:
+                squared = ((points[members, None, :] - points[None, pool, :]) ** 2).sum(axis=2)
+                squared[pool[None, :] == members[:, None]] = np.inf  # Exclude the city itself
+                nearest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+                nearest_squared = np.take_along_axis(squared, nearest, axis=1)
+                covers_grid = r >= size
+                if covers_grid or nearest_squared.max() <= (r * width) ** 2:
+                    break
+            r *= 2
+        order = np.argsort(nearest_squared, axis=1, kind="stable")
+        neighbors[members] = pool[np.take_along_axis(nearest, order, axis=1)]
+    return neighbors
+
+class _LocalSearch:
+    """Array-based tour with the 2-opt and Or-opt moves used by improve_tour_with_local_search."""
+
+    def __init__(self, distances, order, num_neighbors):
+        self.distances = distances
+        self.dist = distances.item  # Fast scalar lookup: self.dist(i, j)
+        self.n = len(order)
+        self.order = np.array(order, dtype=np.intp)
+        self.pos = np.empty(self.n, dtype=np.intp)
+        self.pos[self.order] = np.arange(self.n)
+        if isinstance(distances, CoordinateDistances):
+            neighbors = nearest_neighbor_lists_from_coordinates(distances.points, num_neighbors)
+        else:
+            neighbors = nearest_neighbor_lists(distances, num_neighbors)
+        self.neighbors = neighbors.tolist()
+
+    def succ(self, city):
+        return int(self.order[(self.pos[city] + 1) % self.n])
+
+    def pred(self, city):
+        return int(self.order[self.pos[city] - 1])
+
+    def run(self, use_or_opt, deadline):
+        # Every city starts with its don't-look bit off (i.e. queued)
+        queue = deque(self.order.tolist())
+        queued = np.ones(self.n, dtype=bool)
+
+        while queue:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            city = queue.popleft()
+            queued[city] = False
+
+            touched = self.improve_2opt(city)
+            if touched is None and use_or_opt:
+                touched = self.improve_or_opt(city)
+
+            if touched is not None:
+                # Re-activate the endpoints of every changed edge, including this city
+                for other in touched:
+                    if not queued[other]:
+                        queued[other] = True
+                        queue.append(other)
+
+    def improve_2opt(self, a):
+        """Apply the first improving 2-opt move around city a, returning the touched cities."""
+        dist = self.dist
+        for forward in (True, False):
+            b = self.succ(a) if forward else self.pred(a)
+            d_ab = dist(a, b)
+            for c in self.neighbors[a]:
+                d_ac = dist(a, c)
+                if d_ac >= d_ab:
+                    break  # Neighbors are sorted, no closer city is left
+                d = self.succ(c) if forward else self.pred(c)
+                if c == b or d == a:
+                    continue
+                delta = d_ac + dist(b, d) - d_ab - dist(c, d)
+                if delta < -1e-10:
+                    self.make_2opt_move(a, b, c, d)
+                    return a, b, c, d
+        return None
+
+    def improve_or_opt(self, a):
+        """Apply the first improving Or-opt move of a segment starting at city a."""
+        dist = self.dist
+        s1 = s2 = a
+        for length in range(1, 4):
+            if length > 1:
+                s2 = self.succ(s2)
+            p, nx = self.pred(s1), self.succ(s2)
+            if length + 3 > self.n or nx == p:
+                break
+            removal_gain = dist(p, s1) + dist(s2, nx) - dist(p, nx)
+            if removal_gain <= 1e-10:
+                continue
+
+            segment = set(self.order[(self.pos[s1] + np.arange(length)) % self.n].tolist())
+            for end in (s1, s2):
+                for c in self.neighbors[end]:
+                    if dist(end, c) >= removal_gain:
+                        break
+                    if c in segment:
+                        continue
+                    # Insert between c and either of its tour neighbors, as an edge (x, y) with y = succ(x)
+                    for x, y in ((c, self.succ(c)), (self.pred(c), c)):
+                        if x in segment or y in segment or x == nx or y == p:
+                            continue
+                        d_xy = dist(x, y)
+                        forward = dist(x, s1) + dist(s2, y) - d_xy
+                        backward = dist(x, s2) + dist(s1, y) - d_xy
+                        if min(forward, backward) - removal_gain < -1e-10:
+                            self.make_or_opt_move(p, s1, s2, nx, x, y, reverse=backward < forward)
+                            return p, s1, s2, nx, x, y
+        return None
+
+    def make_2opt_move(self, a, b, c, d):
+        """
+        Replace edges (a, b) and (c, d) with (a, c) and (b, d), where b and d follow a and c
+        in the same tour direction.
+        """
+        if self.succ(a) == b:
+            self.reverse(self.pos[b], self.pos[c])
+        else:
+            self.reverse(self.pos[a], self.pos[d])
+
+    def make_or_opt_move(self, p, s1, s2, nx, x, y, reverse):
+        """
+        Move the segment s1..s2 (between p and nx) between x and y = succ(x), as a sequence of
+        2-opt moves. The segment ends up reversed (x, s2..s1, y) unless reverse is False.
+        """
+        self.make_2opt_move(p, s1, x, y)    # p x .. nx s2 .. s1 y
+        self.make_2opt_move(p, x, nx, s2)   # p nx .. x s2 .. s1 y
+        if not reverse and s1 != s2:
+            self.make_2opt_move(x, s2, s1, y)  # p nx .. x s1 .. s2 y
+
+    def reverse(self, i, j):
+        """Reverse the tour between positions i and j (inclusive, wrapping around)."""
+        n = self.n
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            # Reversing the complementary segment gives the same cycle and moves fewer cities
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        if i <= j:
+            segment = self.order[i:j + 1][::-1].copy()
+            self.order[i:j + 1] = segment
+            self.pos[segment] = np.arange(i, j + 1)
+        else:
+            positions = (i + np.arange(length)) % n
+            segment = self.order[positions[::-1]]
+            self.order[positions] = segment
+            self.pos[segment] = positions
+
+def as_distance_array(distance_matrix):
+    """
+    Convert a distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. A condensed 1D array (the upper triangle row by row, e.g., from
+    generate_distance_matrix(points, condensed=True)) is expanded to the full matrix first, and a
+    CoordinateDistances oracle is returned as it is.
+    """
+    if isinstance(distance_matrix, CoordinateDistances):
+        return distance_matrix  # Distances stay implicit and are computed from the coordinates
+    distances = np.asarray(distance_matrix)
+    if distances.ndim == 1:
+        distances = square_distance_matrix(distances)
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+class CoordinateDistances:
+    """
+    Euclidean distances computed on demand from city coordinates, used in place of a distance matrix.
+
+    Only the coordinates are stored, so memory stays O(n) where a matrix needs O(n^2), e.g., 80 GB
+    for 100,000 cities. It supports the indexing the heuristics use: whole rows (distances[i] and,
+    by symmetry, distances[:, j]), single distances (distances.item(i, j)) and element-wise distances
+    between index arrays (distances[rows, cols], broadcast like NumPy indexing, including np.ix_).
+    The local search only looks up single distances (one hypot each) and pairs along the tour, and its
+    candidate lists come from a spatial grid, so the optional LRU cache of recently computed rows is off
+    by default.
+
+    Parameters:
+    - points (2D list or numpy array): n x 2 array of city coordinates.
+    - cache_size (int): Maximum number of rows kept in the cache. Defaults to 0 (no cache).
+    - dtype (numpy dtype): Dtype of the returned rows and pair distances. np.float32 halves the memory
+      of cached rows. Defaults to np.float64.
+    """
+
+    def __init__(self, points, cache_size=0, dtype=np.float64):
+        self.points = np.ascontiguousarray(np.asarray(points, dtype=float).reshape(-1, 2))
+        self.x = self.points[:, 0].copy()
+        self.y = self.points[:, 1].copy()
+        self.xs, self.ys = self.x.tolist(), self.y.tolist()  # Python floats for scalar lookups
+        self.dtype = np.dtype(dtype)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def shape(self):
+        return len(self.x), len(self.x)
+
+    def item(self, i, j):
+        """Distance between cities i and j as a Python float."""
+        return math.hypot(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j])
+
+    def row(self, i):
+        """Distances from city i to every city, as a read-only array."""
+        row = self.cache.get(i)
+        if row is not None:
+            self.cache.move_to_end(i)
+            return row
+
+        row = self.x - self.xs[i]
+        row *= row
+        dy = self.y - self.ys[i]
+        dy *= dy
+        row += dy
+        row = np.sqrt(row, out=row).astype(self.dtype, copy=False)
+        row.flags.writeable = False  # Cached rows are shared between callers
+
+        if self.cache_size > 0:
+            self.cache[i] = row
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)  # Evict the least recently used row
+        return row
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            return self.row(operator.index(key))
+        rows, cols = key
+        if isinstance(rows, slice) and rows == slice(None):
+            return self.row(operator.index(cols))
+        if isinstance(cols, slice) and cols == slice(None):
+            return self.row(operator.index(rows))
+
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        dx = self.x[rows] - self.x[cols]
+        dy = self.y[rows] - self.y[cols]
+        distances = np.sqrt(dx * dx + dy * dy).astype(self.dtype, copy=False)
+        return distances[()] if distances.ndim == 0 else distances
+
+def print_result(result):
+    """
+    Prints the total distance and the tour of a TSP result.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
+def plot_route_linear(tour, total_distance):
+    """
+    Plots the route in a line for the TSP.
+
+    Parameters:
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    x_coords = list(range(1, len(tour) + 1))
+    y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
+
+    plt.figure(figsize=(10, 2))
+    plt.title(f"2-opt / Or-opt TSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{tour[i]}', ha='center', color='darkred')
+
+    for idx in range(len(tour) - 1):
+        plt.plot([x_coords[idx], x_coords[idx + 1]], [1, 1], color='green', linestyle='-', linewidth=2)
+
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 35, 25, 60],
+        [10, 0, 30, 55, 20],
+        [35, 30, 0, 45, 50],
+        [25, 55, 45, 0, 30],
+        [60, 20, 50, 30, 0]
+    ]
+
+    # Tour built by solve_tsp_with_nearest_neighbor(distance_matrix, start=1)
+    initial_tour = [1, 2, 5, 4, 3, 1]
+
+    result = improve_tour_with_local_search(distance_matrix, initial_tour, time_limit=10, show_route=True)
+    print_result(result)
+
+    # Large instance from coordinates, without a distance matrix
+    coordinates = np.random.default_rng(0).random((20000, 2)) * 1000
+    distances = CoordinateDistances(coordinates)
+    tour, total_distance = improve_tour_with_local_search(distances, list(range(1, 20001)), time_limit=60, show_route=False)
+    print("Total Distance (20,000 cities):", total_distance, "\n")
@@ -0,0 +1,730 @@
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+class TSPResult:
+    """
+    Result of a TSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+def solve_tsp_with_lin_kernighan(distance_matrix=None, coordinates=None, initial_tour=None, start=1, num_neighbors=8,
+                                 max_depth=50, use_or_opt=True, time_limit=None, show_route=False):
+    """
+    Solve the TSP with a Lin-Kernighan style local search (LKH-lite).
+
+    The search starts from a Nearest Neighbor tour (or any given tour) and applies variable-depth
+    Lin-Kernighan moves, built from sequential 2-opt steps so that depth 2 and 3 cover the sequential
+    3-opt moves, followed by Or-opt segment moves. Moves are restricted to candidate sets of nearest
+    neighbors and the tour is kept in a 2-level doubly linked list, so a reversal costs O(sqrt(n)).
+
+    Either a distance matrix or city coordinates must be given. With coordinates, Euclidean distances
+    are computed on demand and no n x n matrix is ever built, which makes 100k cities possible.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of symmetric distances between cities, or its upper triangle
+      as a condensed 1D array. float32 arrays are kept as float32. Defaults to None.
+    - coordinates (2D list or numpy array): n x 2 array of city coordinates, used instead of distance_matrix.
+      Defaults to None.
+    - initial_tour (list): Starting tour (1-based index), e.g., the tour returned by
+      solve_tsp_with_nearest_neighbor. Defaults to None (build the Nearest Neighbor tour from `start`).
+    - start (int): The starting city of the Nearest Neighbor tour (1-based index). Defaults to City 1.
+    - num_neighbors (int): Number of nearest neighbors in each city's candidate set. Defaults to 8.
+    - max_depth (int): Maximum number of steps of a single Lin-Kernighan move. Defaults to 50.
+    - use_or_opt (bool): If True, also move segments of 1 to 3 cities (Or-opt). Defaults to True.
+    - time_limit (float): Deadline in seconds, counted from the call. The best tour found so far is returned
+      once it is reached. Defaults to None (run until no improving move is left).
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The improved tour, its total distance, the status and the solve time. It unpacks
+      like the tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    deadline = None if time_limit is None else solve_start + time_limit
+
+    if coordinates is not None:
+        points = np.ascontiguousarray(coordinates, dtype=float)
+        n = len(points)
+        neighbors = nearest_neighbor_lists_from_coordinates(points, num_neighbors)
+        xs, ys = points[:, 0].tolist(), points[:, 1].tolist()
+        dist = lambda i, j: math.hypot(xs[i] - xs[j], ys[i] - ys[j])
+        if initial_tour is None:
+            initial_tour = nearest_neighbor_tour_from_coordinates(points, neighbors, start - 1)
+    elif distance_matrix is not None:
+        distances = as_distance_array(distance_matrix)
+        n = len(distances)
+        neighbors = nearest_neighbor_lists(distances, num_neighbors)
+        dist = distances.item
+        if initial_tour is None:
+            initial_tour = nearest_neighbor_tour(distances, start - 1)
+    else:
+        raise ValueError("Either distance_matrix or coordinates must be given.")
+
+    # Work on the open cycle with 0-based cities
+    order = np.asarray(initial_tour, dtype=np.intp) - 1
+    if len(order) > 1 and order[0] == order[-1]:
+        order = order[:-1]
+    first_city = int(order[0])
+
+    if n >= 5:
+        search = _LinKernighan(order.tolist(), neighbors.tolist(), dist, max_depth)
+        search.run(use_or_opt, deadline)
+        order = np.array(search.tour.to_list(first_city), dtype=np.intp)
+
+    # Rotate the tour back to its first city and close it
+    order = np.roll(order, -int(np.flatnonzero(order == first_city)[0]))
+    tour = (order + 1).tolist() + [first_city + 1]
+    following = np.roll(order, -1)
+    if coordinates is not None:
+        total_distance = float(np.hypot(*(points[order] - points[following]).T).sum())
+    else:
+        total_distance = sum(distances[order, following].tolist())
+
+    result = TSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
+
+    # Plot the route if show_route is True
+    if show_route:
+        if coordinates is not None:
+            plot_route(points, tour, total_distance)
+        else:
+            plot_route_linear(tour, total_distance)
+
+    return result
+
+def nearest_neighbor_tour(distances, start):
+    """
+    Build the Nearest Neighbor tour on a distance matrix, as solve_tsp_with_nearest_neighbor does.
+
+    Parameters:
+    - distances (numpy array): Float matrix of distances between cities.
+    - start (int): The starting city (0-based index).
+
+    Returns:
+    - tour (list): The open tour of cities (1-based index).
+    """
+    n = len(distances)
+    visited_mask = np.zeros(n)
+    row = np.empty(n)
+
+    current_city = start
+    visited_mask[current_city] = np.inf
+    tour = [start + 1]
+    for _ in range(n - 1):
+        np.add(distances[current_city], visited_mask, out=row)
+        next_city = int(np.argmin(row))
+        if visited_mask[next_city]:
+            next_city = int(np.flatnonzero(visited_mask == 0)[0])
+        tour.append(next_city + 1)
+        visited_mask[next_city] = np.inf
+        current_city = next_city
+    return tour
+
+def nearest_neighbor_tour_from_coordinates(points, neighbors, start):
+    """
+    Build the Nearest Neighbor tour from coordinates without a distance matrix.
+
+    The candidate set of the current city is checked first: its closest unvisited entry is the nearest
+    unvisited city overall. Only when all candidates are visited are the remaining cities scanned.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    - neighbors (numpy array): n x k array of nearest neighbors, closest first (0-based).
+    - start (int): The starting city (0-based index).
+
+    Returns:
+    - tour (list): The open tour of cities (1-based index).
+    """
+    n = len(points)
+    candidates = neighbors.tolist()
+    visited = [False] * n
+    visited_array = np.zeros(n, dtype=bool)
+    remaining = np.arange(n)
+
+    current_city = start
+    visited[current_city] = visited_array[current_city] = True
+    tour = [start + 1]
+    for _ in range(n - 1):
+        next_city = -1
+        for city in candidates[current_city]:
+            if not visited[city]:
+                next_city = city
+                break
+        if next_city < 0:
+            # Every candidate is visited, scan the cities that are left
+            remaining = remaining[~visited_array[remaining]]
+            squared = ((points[remaining] - points[current_city]) ** 2).sum(axis=1)
+            next_city = int(remaining[np.argmin(squared)])
+        tour.append(next_city + 1)
+        visited[next_city] = visited_array[next_city] = True
+        current_city = next_city
+    return tour
+
+def nearest_neighbor_lists(distances, num_neighbors):
+    """
+    Build the candidate set of every city: its k nearest other cities, closest first.
+
+    Parameters:
+    - distances (numpy array): Float matrix of distances between cities.
+    - num_neighbors (int): Number of neighbors per city.
+
+    Returns:
+    - neighbors (numpy array): n x k array of city indices (0-based).
+    """
+    n = len(distances)
+    k = max(1, min(num_neighbors, n - 1))
+    neighbors = np.empty((n, k), dtype=np.intp)
+
+    # Work in row blocks so the partition never needs a full n x n index array
+    block = max(1, 2 ** 22 // n)
+    for first in range(0, n, block):
+        rows = distances[first:first + block].copy()
+        rows[np.arange(len(rows)), np.arange(first, first + len(rows))] = np.inf  # Exclude the city itself
+        nearest = np.argpartition(rows, k - 1, axis=1)[:, :k]
+        nearest_distances = np.take_along_axis(rows, nearest, axis=1)
+        neighbors[first:first + block] = np.take_along_axis(nearest, np.argsort(nearest_distances, axis=1, kind="stable"), axis=1)
+    return neighbors
+
+def nearest_neighbor_lists_from_coordinates(points, num_neighbors):
+    """
+    Build the candidate set of every city from its coordinates with a uniform grid.
+
+    Cities are bucketed into cells holding about two cities each. For every cell, the cities of the
+    surrounding (2r + 1) x (2r + 1) block of cells are searched; r grows until the k-th nearest
+    neighbor is provably inside the block, so the result is exact.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    - num_neighbors (int): Number of neighbors per city.
+
+    Returns:
+    - neighbors (numpy array): n x k array of city indices (0-based).
+    """
+    n = len(points)
+    k = max(1, min(num_neighbors, n - 1))
+    neighbors = np.empty((n, k), dtype=np.intp)
+
+    # A single city has no other city to find, so the block search below would never end; like
+    # nearest_neighbor_lists, its only candidate is itself
+    if n <= k:
+        neighbors[:] = np.arange(n)[:, None]
+        return neighbors
+
+    # Grid with about two cities per cell
+    lower = points.min(axis=0)
+    extent = max(float((points.max(axis=0) - lower).max()), 1e-12)
+    size = max(1, int(math.ceil(math.sqrt(n / 2))))
+    width = extent / size
+    cells = np.minimum(((points - lower) / width).astype(np.intp), size - 1)
+    cell_ids = cells[:, 0] * size + cells[:, 1]
+
+    # Cities sorted by cell; each row of cells within a block is one contiguous slice
+    by_cell = np.argsort(cell_ids, kind="stable")
+    bounds = np.searchsorted(cell_ids[by_cell], np.arange(size * size + 1))
+
+    radius = max(1, int(math.ceil(math.sqrt(k / 2) / 2)) + 1)
+    for cell in np.flatnonzero(np.diff(bounds)).tolist():
+        members = by_cell[bounds[cell]:bounds[cell + 1]]
+        cx, cy = divmod(cell, size)
+        r = radius
+        while True:
+            low_y, high_y = max(cy - r, 0), min(cy + r, size - 1)
+            pool = np.concatenate([by_cell[bounds[x * size + low_y]:bounds[x * size + high_y + 1]]
+                                   for x in range(max(cx - r, 0), min(cx + r, size - 1) + 1)])
+            if len(pool) > k:
+                squared = ((points[members, None, :] - points[None, pool, :]) ** 2).sum(axis=2)
+                squared[pool[None, :] == members[:, None]] = np.inf  # Exclude the city itself
+                nearest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+                nearest_squared = np.take_along_axis(squared, nearest, axis=1)
+                covers_grid = r >= size
+                if covers_grid or nearest_squared.max() <= (r * width) ** 2:
+                    break
+            r *= 2
+        order = np.argsort(nearest_squared, axis=1, kind="stable")
+        neighbors[members] = pool[np.take_along_axis(nearest, order, axis=1)]
+    return neighbors
+
+class TwoLevelList:
+    """
+    Tour stored as a 2-level doubly linked list.
+
+    The tour is split into about sqrt(n) segments. Each segment holds its cities in an array, a
+    reversal bit and links to the previous and next segment. Reversing a path splits at most two
+    segments and then only flips the reversal bits and links of the segments in between, so every
+    operation costs O(sqrt(n)).
+    """
+
+    def __init__(self, order):
+        self.n = len(order)
+        self.group_size = max(8, int(math.sqrt(self.n)))
+        self.segment_of = [0] * self.n
+        self.index = [0] * self.n
+        self.build(order)
+
+    def build(self, order):
+        """(Re)build balanced segments from a list of cities in tour order."""
+        size = self.group_size
+        self.cities = [order[i:i + size] for i in range(0, self.n, size)]
+        m = len(self.cities)
+        self.reversed = [False] * m
+        self.next_segment = [(s + 1) % m for s in range(m)]
+        self.prev_segment = [(s - 1) % m for s in range(m)]
+        self.rank = list(range(m))
+        self.free = []
+        self.num_segments = m
+        for s, cities in enumerate(self.cities):
+            self.reindex(s)
+
+    def reindex(self, s):
+        segment_of, index = self.segment_of, self.index
+        for i, city in enumerate(self.cities[s]):
+            segment_of[city] = s
+            index[city] = i
+
+    def oriented(self, s):
+        return self.cities[s][::-1] if self.reversed[s] else self.cities[s]
+
+    def first(self, s):
+        return self.cities[s][-1] if self.reversed[s] else self.cities[s][0]
+
+    def last(self, s):
+        return self.cities[s][0] if self.reversed[s] else self.cities[s][-1]
+
+    def succ(self, city):
+        s = self.segment_of[city]
+        i = self.index[city]
+        if self.reversed[s]:
+            if i > 0:
+                return self.cities[s][i - 1]
+        elif i + 1 < len(self.cities[s]):
+            return self.cities[s][i + 1]
+        return self.first(self.next_segment[s])
+
+    def pred(self, city):
+        s = self.segment_of[city]
+        i = self.index[city]
+        if self.reversed[s]:
+            if i + 1 < len(self.cities[s]):
+                return self.cities[s][i + 1]
+        elif i > 0:
+            return self.cities[s][i - 1]
+        return self.last(self.prev_segment[s])
+
+    def to_list(self, start):
+        """Return the cities in tour order, beginning with the segment of `start`."""
+        order = []
+        s = first = self.segment_of[start]
+        while True:
+            order.extend(self.oriented(s))
+            s = self.next_segment[s]
+            if s == first:
+                return order
+
+    def renumber(self, s):
+        """Give consecutive ranks to the segments, starting with segment s."""
+        for r in range(self.num_segments):
+            self.rank[s] = r
+            s = self.next_segment[s]
+
+    def split_before(self, city):
+        """Split the segment of `city` so that `city` becomes the first city of a segment."""
+        s = self.segment_of[city]
+        if self.first(s) == city:
+            return
+        cities = self.oriented(s)
+        i = self.index[city] if not self.reversed[s] else len(cities) - 1 - self.index[city]
+
+        if self.free:
+            t = self.free.pop()
+            self.cities[t] = cities[i:]
+            self.reversed[t] = False
+        else:
+            t = len(self.cities)
+            self.cities.append(cities[i:])
+            self.reversed.append(False)
+            self.next_segment.append(0)
+            self.prev_segment.append(0)
+            self.rank.append(0)
+        self.cities[s] = cities[:i]
+        self.reversed[s] = False
+        self.reindex(s)
+        self.reindex(t)
+
+        # Link t right after s
+        following = self.next_segment[s]
+        self.next_segment[s], self.prev_segment[t] = t, s
+        self.next_segment[t], self.prev_segment[following] = following, t
+        self.num_segments += 1
+        self.renumber(s)
+
+    def merge_with_next(self, s):
+        """Merge segment s with the segment after it if both together are small enough."""
+        t = self.next_segment[s]
+        if t == s or len(self.cities[s]) + len(self.cities[t]) > self.group_size:
+            return
+        self.cities[s] = self.oriented(s) + self.oriented(t)
+        self.reversed[s] = False
+        self.reindex(s)
+        following = self.next_segment[t]
+        self.next_segment[s], self.prev_segment[following] = following, s
+        self.cities[t] = []
+        self.free.append(t)
+        self.num_segments -= 1
+        self.renumber(s)
+
+    def reverse_path(self, a, b):
+        """Reverse the path of the tour that goes from city a to city b (following succ)."""
+        if a == b or self.succ(b) == a:
+            return  # A single city or the whole tour: the cycle is unchanged
+
+        sa, sb = self.segment_of[a], self.segment_of[b]
+        m = self.num_segments
+        if 2 * ((self.rank[sb] - self.rank[sa]) % m) > m:
+            # Reversing the complementary path gives the same cycle and touches fewer segments
+            a, b = self.succ(b), self.pred(a)
+            sa, sb = self.segment_of[a], self.segment_of[b]
+
+        if sa == sb:
+            ia, ib = self.index[a], self.index[b]
+            if (ia <= ib) != self.reversed[sa]:
+                # The path lies inside one segment: reverse that part of its array
+                low, high = min(ia, ib), max(ia, ib)
+                cities = self.cities[sa]
+                cities[low:high + 1] = cities[low:high + 1][::-1]
+                for i in range(low, high + 1):
+                    self.index[cities[i]] = i
+                return
+
+        # Make the path start and end on segment boundaries
+        following = self.succ(b)
+        self.split_before(a)
+        self.split_before(following)
+        sa, sb = self.segment_of[a], self.segment_of[b]
+
+        before, after = self.prev_segment[sa], self.next_segment[sb]
+        path = [sa]
+        while path[-1] != sb:
+            path.append(self.next_segment[path[-1]])
+
+        # Flip every segment of the path and link them in the opposite order
+        first_rank = self.rank[sa]
+        for r, s in enumerate(reversed(path)):
+            self.reversed[s] = not self.reversed[s]
+            self.next_segment[s], self.prev_segment[s] = self.prev_segment[s], self.next_segment[s]
+            self.rank[s] = (first_rank + r) % self.num_segments
+        self.next_segment[before], self.prev_segment[sb] = sb, before
+        self.next_segment[sa], self.prev_segment[after] = after, sa
+
+        # Keep the segments balanced
+        for s in (before, sa, sb):
+            if self.cities[s]:
+                self.merge_with_next(s)
+        if self.num_segments > 4 * self.n // self.group_size + 4:
+            self.build(self.to_list(a))
+
+class _LinKernighan:
+    """Lin-Kernighan and Or-opt moves on a TwoLevelList, used by solve_tsp_with_lin_kernighan."""
+
+    def __init__(self, order, neighbors, dist, max_depth):
+        self.tour = TwoLevelList(order)
+        self.neighbors = neighbors
+        self.dist = dist
+        self.max_depth = max_depth
+        self.n = len(order)
+
+    def run(self, use_or_opt, deadline):
+        # Every city starts with its don't-look bit off (i.e. queued)
+        queue = deque(self.tour.to_list(0))
+        queued = [True] * self.n
+
+        while queue:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            city = queue.popleft()
+            queued[city] = False
+
+            touched = self.improve_lin_kernighan(city)
+            if touched is None and use_or_opt:
+                touched = self.improve_or_opt(city)
+
+            if touched is not None:
+                # Re-activate the endpoints of every changed edge, including this city
+                for other in touched:
+                    if not queued[other]:
+                        queued[other] = True
+                        queue.append(other)
+
+    def improve_lin_kernighan(self, t1):
+        """
+        Try a Lin-Kernighan move that removes an edge at t1, returning the touched cities.
+
+        Every step removes the edge (t1, t2), adds (t2, t3) and removes (t3, t4), where t4 is the
+        neighbor of t3 on the side of t2. This is a 2-opt move that leaves (t4, t1) as the closing
+        edge, and the next step breaks that closing edge again. The chain stops when the gain
+        criterion fails or at max_depth, and is rolled back to the step with the best closed tour.
+        All candidates for t3 are tried at the first step.
+        """
+        tour, dist = self.tour, self.dist
+        for t2_first in (tour.succ(t1), tour.pred(t1)):
+            for t3, t4 in self.step_candidates(t1, t2_first, dist(t1, t2_first), None):
+                t2 = t2_first
+                moves = []
+                touched = [t1, t2]
+                removed = {(min(t1, t2), max(t1, t2))}
+                added = set()
+                gain = dist(t1, t2)  # Removed minus added length, without the closing edge
+                best_improvement, best_length = 1e-10, 0
+                while True:
+                    gain += dist(t3, t4) - dist(t2, t3)
+                    removed.add((min(t3, t4), max(t3, t4)))
+                    added.add((min(t2, t3), max(t2, t3)))
+                    self.make_2opt_move(t2, t1, t3, t4)
+                    moves.append((t3, t2, t4, t1))  # The 2-opt move that undoes this step
+                    touched += (t3, t4)
+
+                    improvement = gain - dist(t4, t1)
+                    if improvement > best_improvement:
+                        best_improvement, best_length = improvement, len(moves)
+                    if len(moves) >= self.max_depth:
+                        break
+
+                    # The closing edge (t1, t4) becomes the next edge to remove
+                    t2 = t4
+                    steps = self.step_candidates(t1, t2, gain, (removed, added))
+                    if not steps:
+                        break
+                    t3, t4 = steps[0]
+
+                # Roll back to the best closed tour
+                for move in reversed(moves[best_length:]):
+                    self.make_2opt_move(*move)
+                if best_length:
+                    return touched[:2 * best_length + 2]
+        return None
+
+    def step_candidates(self, t1, t2, gain, tabu):
+        """
+        List the (t3, t4) choices after removing the edge (t1, t2) that satisfy the gain criterion,
+        best lookahead d(t3, t4) - d(t2, t3) first. Removed edges are not added back and added
+        edges are not removed again.
+        """
+        tour, dist = self.tour, self.dist
+        if tour.succ(t1) == t2:
+            after_t2, before = tour.succ(t2), tour.pred
+        else:
+            after_t2, before = tour.pred(t2), tour.succ
+
+        choices = []
+        for t3 in self.neighbors[t2]:
+            d23 = dist(t2, t3)
+            if d23 >= gain:
+                break  # Neighbors are sorted, the gain criterion fails from here on
+            if t3 == t1 or t3 == after_t2:
+                continue
+            t4 = before(t3)
+            if tabu is not None:
+                removed, added = tabu
+                if (min(t2, t3), max(t2, t3)) in removed or (min(t3, t4), max(t3, t4)) in added:
+                    continue
+            choices.append((dist(t3, t4) - d23, t3, t4))
+        choices.sort(reverse=True)
+        return [(t3, t4) for _, t3, t4 in choices]
+
+    def improve_or_opt(self, a):
+        """Apply the first improving Or-opt move of a segment starting at city a."""
+        tour, dist = self.tour, self.dist
+        s1 = s2 = a
+        segment = {a}
+        for length in range(1, 4):
+            if length > 1:
+                s2 = tour.succ(s2)
+                segment.add(s2)
+            p, nx = tour.pred(s1), tour.succ(s2)
+            if length + 3 > self.n or nx == p:
+                break
+            removal_gain = dist(p, s1) + dist(s2, nx) - dist(p, nx)
+            if removal_gain <= 1e-10:
+                continue
+
+            for end in (s1, s2):
+                for c in self.neighbors[end]:
+                    if dist(end, c) >= removal_gain:
+                        break
+                    if c in segment:
+                        continue
+                    # Insert between c and either of its tour neighbors, as an edge (x, y) with y = succ(x)
+                    for x, y in ((c, tour.succ(c)), (tour.pred(c), c)):
+                        if x in segment or y in segment or x == nx or y == p:
+                            continue
+                        d_xy = dist(x, y)
+                        forward = dist(x, s1) + dist(s2, y) - d_xy
+                        backward = dist(x, s2) + dist(s1, y) - d_xy
+                        if min(forward, backward) - removal_gain < -1e-10:
+                            self.make_or_opt_move(p, s1, s2, nx, x, y, reverse=backward < forward)
+                            return p, s1, s2, nx, x, y
+        return None
+
+    def make_2opt_move(self, a, b, c, d):
+        """
+        Replace edges (a, b) and (c, d) with (a, c) and (b, d), where b and d follow a and c
+        in the same tour direction.
+        """
+        if self.tour.succ(a) == b:
+            self.tour.reverse_path(b, c)
+        else:
+            self.tour.reverse_path(a, d)
+
+    def make_or_opt_move(self, p, s1, s2, nx, x, y, reverse):
+        """
+        Move the segment s1..s2 (between p and nx) between x and y = succ(x), as a sequence of
+        2-opt moves. The segment ends up reversed (x, s2..s1, y) unless reverse is False.
+        """
+        self.make_2opt_move(p, s1, x, y)    # p x .. nx s2 .. s1 y
+        self.make_2opt_move(p, x, nx, s2)   # p nx .. x s2 .. s1 y
+        if not reverse and s1 != s2:
+            self.make_2opt_move(x, s2, s1, y)  # p nx .. x s1 .. s2 y
+
+def as_distance_array(distance_matrix):
+    """
+    Convert a distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. A condensed 1D array (the upper triangle row by row, e.g., from
+    generate_distance_matrix(points, condensed=True)) is expanded to the full matrix first.
+    """
+    distances = np.asarray(distance_matrix)
+    if distances.ndim == 1:
+        distances = square_distance_matrix(distances)
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def print_result(result):
+    """
+    Prints the total distance and the tour of a TSP result.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
+def plot_route(points, tour, total_distance):
+    """
+    Plots the route on the plane for the TSP.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    route = points[np.asarray(tour) - 1]
+
+    plt.figure(figsize=(8, 8))
+    plt.title(f"Lin-Kernighan TSP Route\nTotal Distance: {total_distance}")
+    plt.plot(route[:, 0], route[:, 1], color='green', linestyle='-', linewidth=1, zorder=1)
+    plt.scatter(points[:, 0], points[:, 1], color='blue', s=10, zorder=5)
+    plt.axis('equal')
+    plt.show()
+
+def plot_route_linear(tour, total_distance):
+    """
+    Plots the route in a line for the TSP.
+
+    Parameters:
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    x_coords = list(range(1, len(tour) + 1))
+    y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
+
+    plt.figure(figsize=(10, 2))
+    plt.title(f"Lin-Kernighan TSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{tour[i]}', ha='center', color='darkred')
+
+    for idx in range(len(tour) - 1):
+        plt.plot([x_coords[idx], x_coords[idx + 1]], [1, 1], color='green', linestyle='-', linewidth=2)
+
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 35, 25, 60],
+        [10, 0, 30, 55, 20],
+        [35, 30, 0, 45, 50],
+        [25, 55, 45, 0, 30],
+        [60, 20, 50, 30, 0]
+    ]
+
+    # Seeded with the tour of solve_tsp_with_nearest_neighbor(distance_matrix, start=1)
+    result = solve_tsp_with_lin_kernighan(distance_matrix, initial_tour=[1, 2, 5, 4, 3, 1], time_limit=10, show_route=True)
+    print_result(result)
+
+    # Large instance from coordinates, without a distance matrix
+    rng = np.random.default_rng(0)
+    coordinates = rng.random((5000, 2)) * 1000
+    tour, total_distance = solve_tsp_with_lin_kernighan(coordinates=coordinates, time_limit=60, show_route=False)
+    print("Total Distance (5000 cities):", total_distance)
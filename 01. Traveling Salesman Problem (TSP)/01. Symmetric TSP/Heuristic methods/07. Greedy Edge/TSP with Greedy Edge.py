@@ -0,0 +1,446 @@
+import math
+import operator
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+class TSPResult:
+    """
+    Result of a TSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+def solve_tsp_with_greedy_edge(distance_matrix, start=1, num_neighbors=10, show_route=False):
+    """
+    Solve the TSP using the Greedy Edge heuristic.
+
+    Edges are scanned from shortest to longest and an edge is added to the tour whenever both of its
+    cities still have fewer than two tour edges and it does not close a cycle. This is Kruskal's
+    algorithm with a degree cap of two, using the same union-find structure to detect cycles. Only the
+    edges to each city's num_neighbors nearest cities are scanned; the path fragments that are left
+    are then joined nearest endpoint first.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of symmetric distances between cities, or its upper triangle as
+      a condensed 1D array, or a CoordinateDistances oracle. float32 arrays are kept as float32.
+    - start (int): The city the tour starts and ends at (1-based index). Defaults to City 1.
+    - num_neighbors (int): Number of nearest neighbors per city whose edges are scanned. Defaults to 10.
+      None scans every edge, which is the classic Greedy Edge heuristic but costs O(n^2 log n).
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The tour, its total distance, the status and the solve time. It unpacks like the
+      tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+
+    # Tour neighbors of every city (-1 while free) and the union-find over path fragments
+    links = [[-1, -1] for _ in range(n)]
+    union_find = UnionFind(n)
+
+    if n > 1:
+        tails, heads = candidate_edges(distances, num_neighbors)
+        lengths = distances[tails, heads]
+        order = np.lexsort((heads, tails, lengths))
+        tails, heads = tails[order].tolist(), heads[order].tolist()
+        added = 0
+        for city1, city2 in zip(tails, heads):
+            if links[city1][1] < 0 and links[city2][1] < 0 and union_find.union(city1, city2):
+                links[city1][links[city1][0] >= 0] = city2
+                links[city2][links[city2][0] >= 0] = city1
+                added += 1
+                if added == n - 1:
+                    break  # The fragments already form a single Hamiltonian path
+
+        _join_fragments(distances, links)
+
+    # Walk the Hamiltonian path from one of its ends, then rotate it to the starting city
+    order = np.empty(n, dtype=np.intp)
+    previous, current = -1, next(city for city in range(n) if links[city][1] < 0)
+    for position in range(n):
+        order[position] = current
+        following = links[current][0] if links[current][0] != previous else links[current][1]
+        previous, current = current, following
+    order = np.roll(order, -int(np.flatnonzero(order == start - 1)[0]))
+
+    tour = (order + 1).tolist() + [start]
+    total_distance = sum(distances[order, np.roll(order, -1)].tolist()) if n > 1 else 0.0
+
+    result = TSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
+
+    # Plot the route if show_route is True
+    if show_route:
+        plot_route_linear(tour, total_distance)
+
+    return result
+
+class UnionFind:
+    """Union-Find structure to manage connected components, over the cities 0 to n - 1."""
+
+    def __init__(self, n):
+        # Initialize each city as its own parent (self-loop) for disjoint sets
+        self.parent = list(range(n))
+
+    def find(self, node):
+        # Find the root of the node, halving the path on the way
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, node1, node2):
+        # Connect the roots of the two nodes; False if they were already in the same component
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 == root2:
+            return False
+        self.parent[root2] = root1
+        return True
+
+def candidate_edges(distances, num_neighbors):
+    """
+    Collect the edges scanned by the Greedy Edge heuristic.
+
+    Parameters:
+    - distances (numpy array or CoordinateDistances): Distances between cities.
+    - num_neighbors (int): Number of nearest neighbors per city, or None for every edge.
+
+    Returns:
+    - tails, heads (numpy arrays): The edges (tail < head), each listed once (0-based).
+    """
+    n = len(distances)
+    if num_neighbors is None or num_neighbors >= n - 1:
+        tails, heads = np.triu_indices(n, k=1)
+        return tails, heads
+
+    if isinstance(distances, CoordinateDistances):
+        neighbors = nearest_neighbor_lists_from_coordinates(distances.points, num_neighbors)
+    else:
+        neighbors = nearest_neighbor_lists(distances, num_neighbors)
+    tails = np.repeat(np.arange(n), neighbors.shape[1])
+    heads = neighbors.ravel()
+
+    # An edge found from both of its cities is kept once
+    edges = np.unique(np.minimum(tails, heads) * n + np.maximum(tails, heads))
+    return edges // n, edges % n
+
+def _join_fragments(distances, links):
+    """
+    Join the path fragments left by the greedy phase into one Hamiltonian path.
+
+    Starting from any fragment, the free end of the path is repeatedly linked to the nearest end of a
+    fragment that is not on the path yet.
+
+    Parameters:
+    - distances (numpy array or CoordinateDistances): Distances between cities.
+    - links (list): Tour neighbors of every city (-1 while free), updated in place.
+    """
+    # The two ends of every fragment; a city without tour edges is both ends of its own fragment
+    other_end = {}
+    for city in range(len(links)):
+        if links[city][1] < 0 and city not in other_end:
+            end = _path_end(links, city)
+            other_end[city], other_end[end] = end, city
+
+    head = next(iter(other_end))
+    tail = other_end[head]
+    ends = np.array([city for city in other_end if city != head and city != tail], dtype=np.intp)
+    position = {city: index for index, city in enumerate(ends.tolist())}
+    free = np.ones(len(ends), dtype=bool)
+
+    while free.any():
+        candidates = ends[free]
+        nearest = int(candidates[np.argmin(distances[tail, candidates])])
+        links[tail][links[tail][0] >= 0] = nearest
+        links[nearest][links[nearest][0] >= 0] = tail
+        tail = other_end[nearest]
+        free[position[nearest]] = free[position[tail]] = False
+
+def _path_end(links, city):
+    """Follow the path from one of its ends, city, and return the other end."""
+    previous, current = -1, city
+    while True:
+        following = links[current][0] if links[current][0] != previous else links[current][1]
+        if following < 0:
+            return current
+        previous, current = current, following
+
+def nearest_neighbor_lists(distances, num_neighbors):
+    """
+    Build the candidate list of every city: its k nearest other cities, closest first.
+
+    Parameters:
+    - distances (numpy array): Float matrix of distances between cities.
+    - num_neighbors (int): Number of neighbors per city.
+
+    Returns:
+    - neighbors (numpy array): n x k array of city indices (0-based).
+    """
+    n = len(distances)
+    k = max(1, min(num_neighbors, n - 1))
+    neighbors = np.empty((n, k), dtype=np.intp)
+
+    # Work in row blocks so the partition never needs a full n x n index array
+    block = max(1, 2 ** 22 // n)
+    for first in range(0, n, block):
+        rows = distances[first:first + block].copy()
+        rows[np.arange(len(rows)), np.arange(first, first + len(rows))] = np.inf  # Exclude the city itself
+        nearest = np.argpartition(rows, k - 1, axis=1)[:, :k]
+        nearest_distances = np.take_along_axis(rows, nearest, axis=1)
+        neighbors[first:first + block] = np.take_along_axis(nearest, np.argsort(nearest_distances, axis=1, kind="stable"), axis=1)
+    return neighbors
+
+def nearest_neighbor_lists_from_coordinates(points, num_neighbors):
+    """
+    Build the candidate set of every city from its coordinates with a uniform grid.
+
+    Cities are bucketed into cells holding about two cities each. For every cell, the cities of the
+    surrounding (2r + 1) x (2r + 1) block of cells are searched; r grows until the k-th nearest
+    neighbor is provably inside the block, so the result is exact.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    - num_neighbors (int): Number of neighbors per city.
+
+    Returns:
+    - neighbors (numpy array): n x k array of city indices (0-based).
+    """
+    n = len(points)
+    k = max(1, min(num_neighbors, n - 1))
+    neighbors = np.empty((n, k), dtype=np.intp)
+
+    # Grid with about two cities per cell
+    lower = points.min(axis=0)
+    extent = max(float((points.max(axis=0) - lower).max()), 1e-12)
+    size = max(1, int(math.ceil(math.sqrt(n / 2))))
+    width = extent / size
+    cells = np.minimum(((points - lower) / width).astype(np.intp), size - 1)
+    cell_ids = cells[:, 0] * size + cells[:, 1]
+
+    # Cities sorted by cell; each row of cells within a block is one contiguous slice
+    by_cell = np.argsort(cell_ids, kind="stable")
+    bounds = np.searchsorted(cell_ids[by_cell], np.arange(size * size + 1))
+
+    radius = max(1, int(math.ceil(math.sqrt(k / 2) / 2)) + 1)
+    for cell in np.flatnonzero(np.diff(bounds)).tolist():
+        members = by_cell[bounds[cell]:bounds[cell + 1]]
+        cx, cy = divmod(cell, size)
+        r = radius
+        while True:
+            low_y, high_y = max(cy - r, 0), min(cy + r, size - 1)
+            pool = np.concatenate([by_cell[bounds[x * size + low_y]:bounds[x * size + high_y + 1]]
+                                   for x in range(max(cx - r, 0), min(cx + r, size - 1) + 1)])
+            if len(pool) > k:
+                squared = ((points[members, None, :] - points[None, pool, :]) ** 2).sum(axis=2)
+                squared[pool[None, :] == members[:, None]] = np.inf  # Exclude the city itself
+                nearest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+                nearest_squared = np.take_along_axis(squared, nearest, axis=1)
+                covers_grid = r >= size
+                if covers_grid or nearest_squared.max() <= (r * width) ** 2:
+                    break
+            r *= 2
+        order = np.argsort(nearest_squared, axis=1, kind="stable")
+        neighbors[members] = pool[np.take_along_axis(nearest, order, axis=1)]
+    return neighbors
+
+def as_distance_array(distance_matrix):
+    """
+    Convert a distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. A condensed 1D array (the upper triangle row by row, e.g., from
+    generate_distance_matrix(points, condensed=True)) is expanded to the full matrix first, and a
+    CoordinateDistances oracle is returned as it is.
+    """
+    if isinstance(distance_matrix, CoordinateDistances):
+        return distance_matrix  # Distances stay implicit and are computed from the coordinates
+    distances = np.asarray(distance_matrix)
+    if distances.ndim == 1:
+        distances = square_distance_matrix(distances)
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+class CoordinateDistances:
+    """
+    Euclidean distances computed on demand from city coordinates, used in place of a distance matrix.
+
+    Only the coordinates are stored, so memory stays O(n) where a matrix needs O(n^2), e.g., 80 GB
+    for 100,000 cities. It supports the indexing the heuristics use: whole rows (distances[i] and,
+    by symmetry, distances[:, j]), single distances (distances.item(i, j)) and element-wise distances
+    between index arrays (distances[rows, cols], broadcast like NumPy indexing, including np.ix_).
+    Greedy Edge only needs the lengths of its candidate edges, which come from a spatial grid and are
+    computed pair by pair, so the optional LRU cache of recently computed rows is off by default.
+
+    Parameters:
+    - points (2D list or numpy array): n x 2 array of city coordinates.
+    - cache_size (int): Maximum number of rows kept in the cache. Defaults to 0 (no cache).
+    - dtype (numpy dtype): Dtype of the returned rows and pair distances. np.float32 halves the memory
+      of cached rows. Defaults to np.float64.
+    """
+
+    def __init__(self, points, cache_size=0, dtype=np.float64):
+        self.points = np.ascontiguousarray(np.asarray(points, dtype=float).reshape(-1, 2))
+        self.x = self.points[:, 0].copy()
+        self.y = self.points[:, 1].copy()
+        self.xs, self.ys = self.x.tolist(), self.y.tolist()  # Python floats for scalar lookups
+        self.dtype = np.dtype(dtype)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def shape(self):
+        return len(self.x), len(self.x)
+
+    def item(self, i, j):
+        """Distance between cities i and j as a Python float."""
+        return math.hypot(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j])
+
+    def row(self, i):
+        """Distances from city i to every city, as a read-only array."""
+        row = self.cache.get(i)
+        if row is not None:
+            self.cache.move_to_end(i)
+            return row
+
+        row = self.x - self.xs[i]
+        row *= row
+        dy = self.y - self.ys[i]
+        dy *= dy
+        row += dy
+        row = np.sqrt(row, out=row).astype(self.dtype, copy=False)
+        row.flags.writeable = False  # Cached rows are shared between callers
+
+        if self.cache_size > 0:
+            self.cache[i] = row
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)  # Evict the least recently used row
+        return row
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            return self.row(operator.index(key))
+        rows, cols = key
+        if isinstance(rows, slice) and rows == slice(None):
+            return self.row(operator.index(cols))
+        if isinstance(cols, slice) and cols == slice(None):
+            return self.row(operator.index(rows))
+
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        dx = self.x[rows] - self.x[cols]
+        dy = self.y[rows] - self.y[cols]
+        distances = np.sqrt(dx * dx + dy * dy).astype(self.dtype, copy=False)
+        return distances[()] if distances.ndim == 0 else distances
+
+def print_result(result):
+    """
+    Prints the total distance and the tour of a TSP result.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
+def plot_route_linear(tour, total_distance):
+    """
+    Plots the route in a line for the TSP.
+
+    Parameters:
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    x_coords = list(range(1, len(tour) + 1))
+    y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
+
+    plt.figure(figsize=(10, 2))
+    plt.title(f"Greedy Edge TSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{tour[i]}', ha='center', color='darkred')
+
+    for idx in range(len(tour) - 1):
+        plt.plot([x_coords[idx], x_coords[idx + 1]], [1, 1], color='green', linestyle='-', linewidth=2)
+
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 35, 25, 60],
+        [10, 0, 30, 55, 20],
+        [35, 30, 0, 45, 50],
+        [25, 55, 45, 0, 30],
+        [60, 20, 50, 30, 0]
+    ]
+
+    result = solve_tsp_with_greedy_edge(distance_matrix, start=1, show_route=True)
+    print_result(result)
+
+    # Large instance from coordinates, without a distance matrix
+    coordinates = np.random.default_rng(0).random((100000, 2)) * 1000
+    tour, total_distance = solve_tsp_with_greedy_edge(CoordinateDistances(coordinates), start=1, show_route=False)
+    print("Total Distance (100,000 cities):", total_distance, "\n")
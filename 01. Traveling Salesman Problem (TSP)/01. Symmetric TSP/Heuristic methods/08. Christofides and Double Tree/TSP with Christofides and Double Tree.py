@@ -0,0 +1,426 @@
+import math
+import operator
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+class TSPResult:
+    """
+    Result of a TSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+MATCHING_METHODS = ("greedy", "exact")
+
+def solve_tsp_with_double_tree(distance_matrix, start=1, show_route=False):
+    """
+    Solve the TSP using the Double Tree heuristic.
+
+    A minimum spanning tree is built with Prim's algorithm, every tree edge is doubled into an Euler
+    circuit, and cities that were already visited are skipped. Walking the doubled tree and skipping
+    repeats is the same as visiting the cities in depth-first preorder, which is what is done here.
+    For distances that satisfy the triangle inequality the tour is at most twice as long as optimal.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of symmetric distances between cities, or its upper triangle as
+      a condensed 1D array, or a CoordinateDistances oracle. float32 arrays are kept as float32.
+    - start (int): The city the tour starts and ends at (1-based index). Defaults to City 1.
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The tour, its total distance, the status and the solve time. It unpacks like the
+      tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+    parent = prim_mst(distances, root=start - 1)
+
+    # Depth-first preorder of the tree from the starting city
+    children = [[] for _ in range(n)]
+    for city, parent_city in enumerate(parent.tolist()):
+        if parent_city >= 0:
+            children[parent_city].append(city)
+    order = []
+    stack = [start - 1]
+    while stack:
+        city = stack.pop()
+        order.append(city)
+        stack.extend(reversed(children[city]))
+
+    return _finish_tour(distances, order, "Double Tree", show_route, solve_start)
+
+def solve_tsp_with_christofides(distance_matrix, start=1, matching="greedy", show_route=False):
+    """
+    Solve the TSP using the Christofides heuristic.
+
+    A minimum spanning tree is built with Prim's algorithm and its odd-degree cities are paired up by
+    a matching. Tree and matching edges together give every city an even degree, so they form an Euler
+    circuit, which is shortcut to a tour by skipping cities that were already visited. With an exact
+    minimum weight matching and distances that satisfy the triangle inequality, the tour is at most
+    1.5 times as long as optimal. The greedy matching (shortest pairs first) loses that guarantee but
+    is much faster and usually gives tours of similar length.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of symmetric distances between cities, or its upper triangle as
+      a condensed 1D array, or a CoordinateDistances oracle. float32 arrays are kept as float32.
+    - start (int): The city the tour starts and ends at (1-based index). Defaults to City 1.
+    - matching (str): "greedy" (default) or "exact" (minimum weight matching with networkx, O(k^3) for k
+      odd-degree cities; about a minute for 1,000 cities).
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The tour, its total distance, the status and the solve time. It unpacks like the
+      tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    if matching not in MATCHING_METHODS:
+        raise ValueError(f"Unknown matching {matching!r}, expected one of {MATCHING_METHODS}")
+
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+    parent = prim_mst(distances, root=start - 1)
+
+    # Tree edges, then a matching of the cities with an odd number of tree edges
+    tree = np.flatnonzero(parent >= 0)
+    edges = list(zip(tree.tolist(), parent[tree].tolist()))
+    degree = np.bincount(np.concatenate((tree, parent[tree])), minlength=n)
+    odd = np.flatnonzero(degree % 2 == 1)
+    if matching == "greedy":
+        edges += greedy_matching(distances, odd)
+    else:
+        edges += exact_matching(distances, odd)
+
+    # Shortcut the Euler circuit from the starting city: keep every city at its first visit
+    visited = np.zeros(n, dtype=bool)
+    order = []
+    for city in euler_circuit(n, edges, start - 1):
+        if not visited[city]:
+            visited[city] = True
+            order.append(city)
+
+    return _finish_tour(distances, order, "Christofides", show_route, solve_start)
+
+def prim_mst(distances, root=0):
+    """
+    Build a minimum spanning tree of the complete graph with Prim's algorithm.
+
+    This is the array form of the heap loop in solve_MST_with_prim: on a complete graph every city
+    outside the tree keeps its cheapest connection to the tree in an array, which is updated with one
+    row of distances per added city, so the tree is built in O(n^2) time and O(n) extra memory.
+
+    Parameters:
+    - distances (numpy array or CoordinateDistances): Distances between cities.
+    - root (int): The city the tree is grown from (0-based index). Defaults to 0.
+
+    Returns:
+    - parent (numpy array): Parent of every city in the tree rooted at root (0-based), -1 for the root.
+    """
+    n = len(distances)
+    parent = np.full(n, -1, dtype=np.intp)
+    cost = np.full(n, np.inf)  # Cheapest connection to the tree; infinite once a city is in it
+    in_tree = np.zeros(n, dtype=bool)
+
+    city = root
+    for _ in range(n - 1):
+        in_tree[city] = True
+        cost[city] = np.inf
+        row = distances[city]
+        closer = (row < cost) & ~in_tree
+        cost[closer] = row[closer]
+        parent[closer] = city
+        city = int(np.argmin(cost))
+    return parent
+
+def greedy_matching(distances, cities):
+    """
+    Pair up an even number of cities, shortest pairs first.
+
+    Parameters:
+    - distances (numpy array or CoordinateDistances): Distances between cities.
+    - cities (numpy array): The cities to match (0-based).
+
+    Returns:
+    - pairs (list of tuples): The matched pairs of cities.
+    """
+    k = len(cities)
+    first, second = np.triu_indices(k, k=1)
+    lengths = distances[cities[first], cities[second]]
+    matched = np.zeros(k, dtype=bool)
+    pairs = []
+    for pair in np.argsort(lengths, kind="stable").tolist():
+        i, j = first[pair], second[pair]
+        if not matched[i] and not matched[j]:
+            matched[i] = matched[j] = True
+            pairs.append((int(cities[i]), int(cities[j])))
+            if len(pairs) == k // 2:
+                break
+    return pairs
+
+def exact_matching(distances, cities):
+    """
+    Pair up an even number of cities with a minimum weight perfect matching (networkx).
+
+    Parameters:
+    - distances (numpy array or CoordinateDistances): Distances between cities.
+    - cities (numpy array): The cities to match (0-based).
+
+    Returns:
+    - pairs (list of tuples): The matched pairs of cities.
+    """
+    import networkx as nx  # Only needed for the exact matching
+
+    graph = nx.Graph()
+    first, second = np.triu_indices(len(cities), k=1)
+    lengths = distances[cities[first], cities[second]].tolist()
+    graph.add_weighted_edges_from(zip(cities[first].tolist(), cities[second].tolist(), lengths))
+    return [(int(city1), int(city2)) for city1, city2 in nx.min_weight_matching(graph)]
+
+def euler_circuit(n, edges, start):
+    """
+    Find an Euler circuit with Hierholzer's algorithm.
+
+    Parameters:
+    - n (int): Number of cities.
+    - edges (list of tuples): Edges of a connected multigraph in which every city has an even degree.
+    - start (int): The city the circuit starts at (0-based index).
+
+    Returns:
+    - circuit (list): Cities in the order of the circuit, starting and ending at start.
+    """
+    adjacency = [[] for _ in range(n)]
+    for edge, (city1, city2) in enumerate(edges):
+        adjacency[city1].append((city2, edge))
+        adjacency[city2].append((city1, edge))
+
+    used = [False] * len(edges)
+    next_edge = [0] * n  # Position of the first edge of each city that may still be unused
+    stack = [start]
+    circuit = []
+    while stack:
+        city = stack[-1]
+        edge_list = adjacency[city]
+        while next_edge[city] < len(edge_list) and used[edge_list[next_edge[city]][1]]:
+            next_edge[city] += 1
+        if next_edge[city] == len(edge_list):
+            circuit.append(stack.pop())
+        else:
+            other, edge = edge_list[next_edge[city]]
+            used[edge] = True
+            stack.append(other)
+    return circuit[::-1]
+
+def _finish_tour(distances, order, name, show_route, solve_start):
+    """Close the tour, compute its total distance, wrap it in a TSPResult and plot it."""
+    order = np.asarray(order, dtype=np.intp)
+    tour = (order + 1).tolist() + [int(order[0]) + 1]
+    total_distance = sum(distances[order, np.roll(order, -1)].tolist()) if len(order) > 1 else 0.0
+
+    result = TSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
+
+    # Plot the route if show_route is True
+    if show_route:
+        plot_route_linear(tour, total_distance, name)
+
+    return result
+
+def as_distance_array(distance_matrix):
+    """
+    Convert a distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. A condensed 1D array (the upper triangle row by row, e.g., from
+    generate_distance_matrix(points, condensed=True)) is expanded to the full matrix first, and a
+    CoordinateDistances oracle is returned as it is.
+    """
+    if isinstance(distance_matrix, CoordinateDistances):
+        return distance_matrix  # Distances stay implicit and are computed from the coordinates
+    distances = np.asarray(distance_matrix)
+    if distances.ndim == 1:
+        distances = square_distance_matrix(distances)
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+class CoordinateDistances:
+    """
+    Euclidean distances computed on demand from city coordinates, used in place of a distance matrix.
+
+    Only the coordinates are stored, so memory stays O(n) where a matrix needs O(n^2), e.g., 80 GB
+    for 100,000 cities. It supports the indexing the heuristics use: whole rows (distances[i] and,
+    by symmetry, distances[:, j]), single distances (distances.item(i, j)) and element-wise distances
+    between index arrays (distances[rows, cols], broadcast like NumPy indexing, including np.ix_).
+    Prim's spanning tree computes the row of every city exactly once, a few vectorized flops per city,
+    so the optional LRU cache of recent rows is off by default and only helps code that reads the same
+    rows again.
+
+    Parameters:
+    - points (2D list or numpy array): n x 2 array of city coordinates.
+    - cache_size (int): Maximum number of rows kept in the cache. Defaults to 0 (no cache).
+    - dtype (numpy dtype): Dtype of the returned rows and pair distances. np.float32 halves the memory
+      of cached rows. Defaults to np.float64.
+    """
+
+    def __init__(self, points, cache_size=0, dtype=np.float64):
+        self.points = np.ascontiguousarray(np.asarray(points, dtype=float).reshape(-1, 2))
+        self.x = self.points[:, 0].copy()
+        self.y = self.points[:, 1].copy()
+        self.xs, self.ys = self.x.tolist(), self.y.tolist()  # Python floats for scalar lookups
+        self.dtype = np.dtype(dtype)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def shape(self):
+        return len(self.x), len(self.x)
+
+    def item(self, i, j):
+        """Distance between cities i and j as a Python float."""
+        return math.hypot(self.xs[i] - self.xs[j], self.ys[i] - self.ys[j])
+
+    def row(self, i):
+        """Distances from city i to every city, as a read-only array."""
+        row = self.cache.get(i)
+        if row is not None:
+            self.cache.move_to_end(i)
+            return row
+
+        row = self.x - self.xs[i]
+        row *= row
+        dy = self.y - self.ys[i]
+        dy *= dy
+        row += dy
+        row = np.sqrt(row, out=row).astype(self.dtype, copy=False)
+        row.flags.writeable = False  # Cached rows are shared between callers
+
+        if self.cache_size > 0:
+            self.cache[i] = row
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)  # Evict the least recently used row
+        return row
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            return self.row(operator.index(key))
+        rows, cols = key
+        if isinstance(rows, slice) and rows == slice(None):
+            return self.row(operator.index(cols))
+        if isinstance(cols, slice) and cols == slice(None):
+            return self.row(operator.index(rows))
+
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        dx = self.x[rows] - self.x[cols]
+        dy = self.y[rows] - self.y[cols]
+        distances = np.sqrt(dx * dx + dy * dy).astype(self.dtype, copy=False)
+        return distances[()] if distances.ndim == 0 else distances
+
+def print_result(result, name=None):
+    """
+    Prints the total distance and the tour of a TSP result.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    - name (str): Name of the heuristic shown in front of the total distance, e.g., "Christofides". Defaults to None.
+    """
+    print(f"{name} Total Distance:" if name else "Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
+def plot_route_linear(tour, total_distance, name):
+    """
+    Plots the route in a line for the TSP.
+
+    Parameters:
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - name (str): Name of the heuristic, shown in the title.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    x_coords = list(range(1, len(tour) + 1))
+    y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
+
+    plt.figure(figsize=(10, 2))
+    plt.title(f"{name} TSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{tour[i]}', ha='center', color='darkred')
+
+    for idx in range(len(tour) - 1):
+        plt.plot([x_coords[idx], x_coords[idx + 1]], [1, 1], color='green', linestyle='-', linewidth=2)
+
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 35, 25, 60],
+        [10, 0, 30, 55, 20],
+        [35, 30, 0, 45, 50],
+        [25, 55, 45, 0, 30],
+        [60, 20, 50, 30, 0]
+    ]
+
+    result = solve_tsp_with_double_tree(distance_matrix, start=1, show_route=True)
+    print_result(result, "Double Tree")
+
+    result = solve_tsp_with_christofides(distance_matrix, start=1, matching="exact", show_route=True)
+    print_result(result, "Christofides")
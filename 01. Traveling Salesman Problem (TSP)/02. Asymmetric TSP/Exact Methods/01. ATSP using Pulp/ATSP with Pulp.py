@@ -0,0 +1,559 @@
+#!pip install pulp
+from pulp import *
+import numpy as np
+import os
+import re
+import tempfile
+import time
+
+class ATSPResult:
+    """
+    Result of an ATSP solver. It unpacks like a tuple: tour, total_distance, bound, gap = result.
+
+    Attributes:
+    - tour (list of tuples): The tour as a list of arcs, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], or None if no
+      solution was found.
+    - total_distance (float): Total distance of the tour.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the
+      time limit without a solution), or the solver status otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    - cuts (int): Number of subtour cuts added.
+    """
+    __slots__ = ("tour", "total_distance", "bound", "gap", "status", "build_time", "solve_time", "cuts")
+
+    def __init__(self, tour, total_distance, bound, gap, status, build_time, solve_time, cuts):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+        self.cuts = cuts
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"ATSPResult(total_distance={self.total_distance!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f}, cuts={self.cuts!r})")
+
+class UnionFind:
+    """Union-Find structure to manage connected components."""
+
+    def __init__(self, nodes):
+        # Initialize each node as its own parent (self-loop) for disjoint sets
+        self.parent = {node: node for node in nodes}
+
+    def find(self, node):
+        # Find the root of the node with path compression for efficiency
+        if self.parent[node] != node:
+            self.parent[node] = self.find(self.parent[node])  # Path compression
+        return self.parent[node]
+
+    def union(self, node1, node2):
+        # Connect the roots of the two nodes to unify their components
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 != root2:
+            self.parent[root2] = root1
+
+def solve_atsp_with_pulp(distance_matrix, show_route=False, show_model=False, warm_start=None, time_limit=None, mip_gap=None, threads=None,
+                         msg=False):
+    """
+    Solve the Asymmetric Traveling Salesman Problem (ATSP) using linear programming with PuLP.
+
+    The model has one binary x_ij per arc (i, j), with one outgoing and one incoming arc per city.
+    This assignment relaxation is much tighter for the ATSP than for the symmetric TSP, so subtours
+    are eliminated lazily: only the violated Dantzig-Fulkerson-Johnson (DFJ) cuts, at most |S| - 1
+    arcs inside every set of cities S, are added until the solution is a single tour.
+    - LP rounds: the components of the LP support graph are cut, and once it is connected, every set
+      S with less than 1 unit of flow leaving it. Inflow equals outflow for every S, so these are
+      the cuts of the symmetrized flow x_ij + x_ji with weight below 2 (Stoer-Wagner minimum cuts).
+    - Integer rounds: CBC solves the model, the subtours of its solution are cut with union-find and
+      the model is re-solved, warm-started from the subtours patched into one tour.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, where distance_matrix[i][j]
+      is the distance from city i + 1 to city j + 1.
+    - show_route (bool): If True, displays a plot of the optimal route after solving the ATSP. Defaults to False.
+    - show_model (bool): If True, prints the linear programming model used to solve the ATSP. Defaults to False.
+    - warm_start (list): Tour of cities (1-based index) to start from, e.g., [1, 3, 4, 2, 1] as returned by the
+      ATSP Nearest Neighbor, insertion or Or-opt and 3-opt heuristics. It is passed to CBC as the first
+      incumbent, so the search starts with an upper bound. Defaults to None (the Nearest Neighbor tour).
+    - time_limit (float): Time limit in seconds for the whole solve. When it is reached, the best tour found
+      so far is reported together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which CBC stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - msg (bool): Show the CBC log. Defaults to False.
+
+    Returns:
+    - result (ATSPResult): The best tour found as a list of arcs, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)], its total
+      distance, the best bound, the gap, the status, the build and solve times and the number of subtour
+      cuts. It unpacks like the tuple (tour, total_distance, bound, gap). Without a solution, the tour and
+      the distances are None.
+    """
+    distances = np.asarray(distance_matrix, dtype=float)
+    if distances.ndim != 2 or distances.shape[0] != distances.shape[1]:
+        raise ValueError("The ATSP needs the full square distance matrix.")
+
+    build_start = time.perf_counter()
+    deadline = None if time_limit is None else build_start + time_limit
+
+    # Get number of cities
+    n = len(distances)
+
+    # Initialize the problem
+    atsp = LpProblem("Asymmetric_Traveling_Salesman_Problem", LpMinimize)
+
+    # Create binary decision variables x_ij for each arc (i, j) between cities 1 to n
+    x = LpVariable.dicts("x", ((i, j) for i in range(1, n+1) for j in range(1, n+1) if i != j), cat='Binary')
+
+    # Column of every variable: its arc (i, j) in the coefficient arrays
+    variables = list(x.values())
+    arcs = np.array(list(x), dtype=int).reshape(-1, 2)
+    tails, heads = arcs[:, 0], arcs[:, 1]
+    columns = np.arange(len(arcs))
+    ones = np.ones(len(arcs), dtype=int)
+
+    # Objective function: Minimize the total travel distance
+    atsp += LpAffineExpression(zip(variables, distances[tails-1, heads-1].tolist())), "Total_Distance"
+
+    # Constraints
+    # 1. Each city must have exactly one outgoing arc
+    add_constraints_in_bulk(atsp, variables, tails - 1, columns, ones, LpConstraintEQ, 1,
+                            [f"Outflow_Constraint_{i}" for i in range(1, n+1)])
+
+    # 2. Each city must have exactly one incoming arc
+    add_constraints_in_bulk(atsp, variables, heads - 1, columns, ones, LpConstraintEQ, 1,
+                            [f"Inflow_Constraint_{j}" for j in range(1, n+1)])
+
+    # Best known tour, as the successor of every city. Without a warm start it is the nearest neighbor
+    # tour, so a run that is out of time before the first integer solution still returns a tour
+    incumbent = nearest_neighbor_successors(distances) if warm_start is None else tour_successors(warm_start, n)
+
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
+    # 3. Subtour elimination constraints (DFJ cuts), added only when violated
+    num_cuts = 0
+
+    def add_subtour_cuts(subtours):
+        nonlocal num_cuts
+        for subtour in subtours:
+            num_cuts += 1
+            atsp.addConstraint(lpSum(x[i, j] for i in subtour for j in subtour if i != j) <= len(subtour) - 1,
+                               f"Subtour_Cut_{num_cuts}")
+
+    # First rounds on the LP relaxation. Each relaxation is valid for the full model, so its objective
+    # is a bound on the optimal tour
+    lp_bound = best_bound = solve_relaxation(atsp, time_left(deadline))
+    while lp_bound is not None and time_left(deadline) != 0:
+        best_bound = lp_bound
+        support = [(i, j) for (i, j), var in x.items() if var.varValue > 1e-6]
+        subtours = find_subtours(support, n)
+        if len(subtours) == 1:
+            weights = np.zeros((n, n))
+            for i, j in support:
+                weights[i-1, j-1] += x[i, j].varValue
+                weights[j-1, i-1] += x[i, j].varValue
+            subtours = [cities for cut_weight, cities in minimum_cut_phases(weights) if cut_weight < 2 - 1e-6]
+            if not subtours:
+                break
+        add_subtour_cuts(subtours)
+        lp_bound = solve_relaxation(atsp, time_left(deadline))
+
+    # Integer rounds until the solution is a single tour. Every round solves a relaxation of the
+    # full model, so its bound stays valid for the best patched tour if the time runs out first
+    status, subtours = "Not Solved", []
+    set_initial_tour(x, incumbent)
+    while time_left(deadline) != 0:
+        status, bound, gap = solve_with_limits(atsp, time_left(deadline), mip_gap, threads, warm_start=True, msg=msg)
+        if status not in ("Optimal", "Feasible"):
+            break
+        best_bound = bound
+        selected = [(i, j) for (i, j), var in x.items() if var.varValue > 0.5]
+        subtours = find_subtours(selected, n)
+        if len(subtours) == 1:
+            break
+        add_subtour_cuts(subtours)
+
+        # Warm start the next solve from the subtours patched into a single tour, unless the
+        # incumbent tour is shorter
+        successor = patch_subtours(distances, dict(selected), subtours)
+        if tour_length(distances, successor) < tour_length(distances, incumbent):
+            incumbent = successor
+        set_initial_tour(x, incumbent)
+        if status == "Feasible" and (mip_gap is None or gap is None or gap > mip_gap):
+            break  # Stopped on the time limit rather than the gap tolerance
+
+    if len(subtours) == 1 and (status == "Optimal" or value(atsp.objective) <= tour_length(distances, incumbent)):
+        successor = dict(selected)
+        total_distance = value(atsp.objective)
+    else:
+        # Out of time before the solution became a single tour: fall back to the best tour found
+        successor, total_distance = incumbent, tour_length(distances, incumbent)
+        status, bound = "Feasible", best_bound
+        gap = None if bound is None else abs(total_distance - bound) / max(abs(total_distance), 1e-10)
+
+    solve_time = time.perf_counter() - solve_start
+
+    # Show the model summary if show_model is set to True
+    if show_model:
+        print("\nModel Summary:\n")
+        print(atsp)
+
+    if status not in ("Optimal", "Feasible"):
+        return ATSPResult(None, None, None, None, status, build_time, solve_time, num_cuts)
+
+    # Find the tour by starting from city 1 and following the path
+    tour = []
+    current_city = 1
+    for _ in range(n):
+        tour.append((current_city, successor[current_city]))
+        current_city = successor[current_city]
+
+    result = ATSPResult(tour, total_distance, bound, gap, status, build_time, solve_time, num_cuts)
+
+    # Show the Optimal Route if show_route is set to True
+    if show_route:
+        plot_optimal_route_linear(tour, total_distance)
+
+    return result
+
+def print_result(result):
+    """
+    Prints an ATSP result: the build and solve times and the number of subtour cuts, then the optimal tour,
+    or the best tour found with its bound and gap when the solver stopped early.
+
+    Parameters:
+    - result (ATSPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s")
+    print("Subtour Cuts:", result.cuts, "\n")
+    if result.tour is None:
+        print("No optimal solution found.")
+        return
+
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+        print("Optimal Tour:", result.tour)
+    else:
+        # Stopped early: report the best tour found with its bound
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+        print("Best Tour Found:", result.tour)
+    print("\n")
+
+def solve_with_limits(problem, time_limit=None, mip_gap=None, threads=None, warm_start=False, msg=True):
+    """
+    Solve a PuLP problem with CBC under an optional time limit and relative MIP gap, keeping the best
+    solution found when the solver stops early.
+
+    Parameters:
+    - problem (LpProblem): The problem to solve.
+    - time_limit (float): Time limit in seconds. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - warm_start (bool): Start from the initial values of the variables. Defaults to False.
+    - msg (bool): Show the solver log. Defaults to True.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the time
+      limit before any solution was found), or the PuLP status otherwise, e.g., "Infeasible".
+    - bound (float): Best bound on the objective value (None without a solution).
+    - gap (float): Relative gap between the objective value and the bound (None without a solution).
+    """
+    # CBC only reports the bound in its log, so the log goes to a temporary file when the search can stop early
+    log_path = None
+    if time_limit is not None or mip_gap is not None:
+        handle, log_path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+
+    solve_start = time.perf_counter()
+    problem.solve(PULP_CBC_CMD(msg=msg and log_path is None, timeLimit=time_limit, gapRel=mip_gap, threads=threads,
+                               warmStart=warm_start, logPath=log_path))
+
+    log = ""
+    if log_path is not None:
+        with open(log_path) as file:
+            log = file.read()
+        os.remove(log_path)
+        if msg:
+            print(log)
+
+    if problem.sol_status not in (LpSolutionOptimal, LpSolutionIntegerFeasible):
+        # Stopped on the time limit without an integer solution, PuLP reports whatever status the unfinished
+        # search left in the solution file, which can be "Infeasible" for a feasible problem
+        if "Stopped on time" in log or (time_limit is not None and time.perf_counter() - solve_start >= time_limit):
+            return "Time Limit", None, None
+        return LpStatus[problem.status], None, None
+
+    objective = value(problem.objective)
+    match = re.search(r"^(?:Lower|Upper) bound:\s+(\S+)", log, re.MULTILINE)
+    bound = float(match.group(1)) if match else objective
+    gap = abs(objective - bound) / max(abs(objective), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal" in CBC, but the solution is only known to be within the gap
+    optimal = problem.sol_status == LpSolutionOptimal and (mip_gap is None or gap <= 1e-9)
+    return ("Optimal" if optimal else "Feasible"), bound, gap
+
+def solve_relaxation(problem, time_limit=None):
+    """
+    Solve the LP relaxation of a PuLP problem with CBC under an optional time limit.
+
+    Parameters:
+    - problem (LpProblem): The problem to solve, with its integer variables relaxed.
+    - time_limit (float): Time limit in seconds. Defaults to None (no limit).
+
+    Returns:
+    - objective (float): Optimal objective value of the relaxation, or None if it was not solved to
+      optimality (e.g., no time left).
+    """
+    if time_limit == 0:
+        return None
+    problem.solve(PULP_CBC_CMD(msg=False, mip=False, timeLimit=time_limit))
+    return value(problem.objective) if problem.status == LpStatusOptimal else None
+
+def time_left(deadline):
+    """Seconds left until the deadline (never negative), or None without a deadline."""
+    return None if deadline is None else max(deadline - time.perf_counter(), 0)
+
+def add_constraints_in_bulk(problem, variables, rows, columns, coefficients, sense, rhs, names):
+    """
+    Add a block of linear constraints to a PuLP problem from NumPy coefficient arrays.
+
+    The block is given in coordinate form: term t adds coefficients[t] * variables[columns[t]] to
+    constraint rows[t]. The terms are grouped by constraint with a single stable sort and every
+    constraint is built directly from (variable, coefficient) pairs, instead of summing products
+    of variables and coefficients with lpSum.
+
+    Parameters:
+    - problem (LpProblem): The problem to add the constraints to.
+    - variables (list): Decision variables, indexed by the column numbers.
+    - rows (numpy array): Constraint (0-based, in the order of names) of every term.
+    - columns (numpy array): Variable of every term.
+    - coefficients (numpy array): Coefficient of every term.
+    - sense (int): LpConstraintEQ, LpConstraintLE or LpConstraintGE, shared by the whole block.
+    - rhs (number or list): Right-hand side of the constraints, one value for all or one per constraint.
+    - names (list): Name of every constraint.
+    """
+    if not isinstance(rhs, list):
+        rhs = [rhs] * len(names)
+
+    order = np.argsort(rows, kind="stable")
+    bounds = np.searchsorted(rows[order], np.arange(len(names) + 1)).tolist()
+    terms = list(zip([variables[c] for c in columns[order].tolist()], coefficients[order].tolist()))
+    for r, name in enumerate(names):
+        problem.addConstraint(LpConstraint(LpAffineExpression(terms[bounds[r]:bounds[r + 1]]), sense, name, rhs[r]))
+
+def find_subtours(arcs, n):
+    """
+    Split the cities into the connected components of the selected arcs with union-find. For an
+    integer solution, these are its subtours.
+
+    Parameters:
+    - arcs (iterable of tuples): Selected arcs (i, j), e.g., [(1, 3), (3, 1), (2, 4), (4, 2)].
+    - n (int): Number of cities.
+
+    Returns:
+    - subtours (list of lists): Cities of every component, e.g., [[1, 3], [2, 4]].
+    """
+    union_find = UnionFind(range(1, n+1))
+    for i, j in arcs:
+        union_find.union(i, j)
+
+    subtours = {}
+    for i in range(1, n+1):
+        subtours.setdefault(union_find.find(i), []).append(i)
+    return list(subtours.values())
+
+def minimum_cut_phases(weights):
+    """
+    Run the Stoer-Wagner minimum cut algorithm and return the cut of every phase.
+
+    Each phase orders the remaining (merged) cities by maximum adjacency; the last city separated
+    from the rest is a cut, after which the last two cities are merged. The lightest of these cuts
+    is a global minimum cut.
+
+    Parameters:
+    - weights (numpy array): Symmetric n x n matrix of edge weights.
+
+    Returns:
+    - cuts (list of tuples): (cut_weight, cities) for every phase, where cities (1-based) is the
+      smaller side of the cut.
+    """
+    n = len(weights)
+    weights = weights.copy()
+    groups = [[i + 1] for i in range(n)]
+    active = list(range(n))
+    cuts = []
+
+    while len(active) > 1:
+        sub_weights = weights[np.ix_(active, active)]
+        m = len(active)
+        added = np.zeros(m, dtype=bool)
+        connection = np.zeros(m)
+        previous = last = 0
+        for _ in range(m):
+            # Add the city most tightly connected to the cities added so far
+            candidate = int(np.argmax(np.where(added, -np.inf, connection)))
+            cut_weight = connection[candidate]
+            previous, last = last, candidate
+            added[candidate] = True
+            connection += sub_weights[candidate]
+
+        cities = groups[active[last]]
+        if 2 * len(cities) > n:
+            cities = sorted(set(range(1, n + 1)) - set(cities))
+        cuts.append((cut_weight, list(cities)))
+
+        # Merge the last city into the one added before it
+        a, b = active[previous], active[last]
+        weights[a] += weights[b]
+        weights[:, a] += weights[:, b]
+        weights[a, a] = 0
+        groups[a] = groups[a] + groups[b]
+        active.remove(b)
+    return cuts
+
+def patch_subtours(distance_matrix, successor, subtours):
+    """
+    Patch subtours into a single tour, joining each subtour to the main one with the cheapest exchange
+    of one arc (a, b) of the tour and one arc (c, d) of the subtour for (a, d) and (c, b).
+
+    Parameters:
+    - distance_matrix (numpy array): Matrix of distances between cities.
+    - successor (dict): Next city of every city (1 to n).
+    - subtours (list of lists): Cities of every subtour, as returned by find_subtours.
+
+    Returns:
+    - successor (dict): Next city of every city in the patched tour.
+    """
+    successor = dict(successor)
+    tour_cities = list(subtours[0])
+    for subtour in subtours[1:]:
+        _, a, c = min((distance_matrix[a-1][successor[c]-1] + distance_matrix[c-1][successor[a]-1]
+                       - distance_matrix[a-1][successor[a]-1] - distance_matrix[c-1][successor[c]-1], a, c)
+                      for a in tour_cities for c in subtour)
+        successor[a], successor[c] = successor[c], successor[a]
+        tour_cities += subtour
+    return successor
+
+def tour_successors(tour, n):
+    """
+    Convert a tour into the successor of every city.
+
+    Parameters:
+    - tour (list): Tour of cities (1-based index), e.g., [1, 3, 4, 2, 1]. The closing city may be omitted.
+    - n (int): Number of cities.
+
+    Returns:
+    - successor (dict): Next city of every city (1 to n) on the tour.
+    """
+    cities = list(tour)
+    if len(cities) > 1 and cities[0] == cities[-1]:
+        cities = cities[:-1]
+    if sorted(cities) != list(range(1, n+1)):
+        raise ValueError("The warm start tour must visit every city (1 to n) exactly once.")
+    return {city: cities[(t + 1) % n] for t, city in enumerate(cities)}
+
+def nearest_neighbor_successors(distances):
+    """
+    Build a tour with the Nearest Neighbor heuristic from city 1, always following the shortest arc
+    out of the current city to an unvisited one.
+
+    Parameters:
+    - distances (numpy array): Matrix of distances between cities.
+
+    Returns:
+    - successor (dict): Next city of every city (1 to n) on the tour.
+    """
+    n = len(distances)
+    unvisited = np.ones(n, dtype=bool)
+    unvisited[0] = False
+    successor, current = {}, 0
+    for _ in range(n - 1):
+        following = int(np.argmin(np.where(unvisited, distances[current], np.inf)))
+        unvisited[following] = False
+        successor[current + 1], current = following + 1, following
+    successor[current + 1] = 1
+    return successor
+
+def tour_length(distance_matrix, successor):
+    """Total distance of the tour given by the successor of every city."""
+    return sum(distance_matrix[i-1][j-1] for i, j in successor.items())
+
+def set_initial_tour(x, successor):
+    """
+    Set the initial values of the arc variables to a tour, for a warm-started solve.
+
+    Parameters:
+    - x (dict): Binary arc variables, keyed by (i, j).
+    - successor (dict): Next city of every city on the tour.
+    """
+    for (i, j), var in x.items():
+        var.setInitialValue(1 if successor[i] == j else 0)
+
+def plot_optimal_route_linear(optimal_tour, total_distance):
+    """
+    Plots the optimal route in a line for the ATSP.
+
+    Parameters:
+    - optimal_tour (list of tuples): Optimal path, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)].
+    - total_distance (float): Total distance of the optimal tour.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    # Extract the order of cities from the optimal tour
+    ordered_cities = [optimal_tour[0][0]]  # Start with the first city in the tour
+    for _, next_city in optimal_tour:
+        ordered_cities.append(next_city)
+
+    # Generate positions along a line for each city in the order of the optimal tour
+    x_coords = list(range(1, len(ordered_cities) + 1))
+    y_coords = [1] * len(ordered_cities)  # Set a constant y-coordinate for all cities to place them in a line
+
+    # Create a figure
+    plt.figure(figsize=(10, 2))
+    plt.title(f"Optimal ATSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    # Plot each city in the order of the optimal tour
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    # Annotate each city with its index according to the ordered tour
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{ordered_cities[i]}', ha='center', color='darkred')
+
+    # Arrows show the direction of travel
+    for idx in range(len(ordered_cities) - 1):
+        plt.annotate("", xy=(x_coords[idx + 1], 1), xytext=(x_coords[idx], 1),
+                     arrowprops=dict(arrowstyle="->", color='green', linewidth=2))
+
+    # Set plot limits and remove the y-axis for a clean linear view
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 40, 25, 60],
+        [25, 0, 30, 55, 20],
+        [15, 35, 0, 45, 50],
+        [30, 50, 10, 0, 30],
+        [60, 45, 50, 15, 0]
+    ]
+
+    result = solve_atsp_with_pulp(distance_matrix, show_route=True, show_model=False)
+    print_result(result)
+
+    # Warm-started from a heuristic tour, with a time limit
+    result = solve_atsp_with_pulp(distance_matrix, warm_start=[1, 2, 5, 4, 3, 1], time_limit=60)
+    print_result(result)
@@ -0,0 +1,271 @@
+import time
+
+import numpy as np
+
+class ATSPResult:
+    """
+    Result of an ATSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"ATSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+INSERTION_STRATEGIES = ("nearest", "farthest", "cheapest", "random")
+
+def solve_atsp_with_nearest_neighbor(distance_matrix, start=1, show_route=False):
+    """
+    Solve the Asymmetric TSP using the Nearest Neighbor heuristic.
+
+    From the current city, the tour always moves to the unvisited city with the shortest outgoing
+    distance d(current, next), i.e., the row of the current city is scanned, never its column.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, where distance_matrix[i][j]
+      is the distance from city i + 1 to city j + 1. float32 arrays are kept as float32.
+    - start (int): The starting city (1-based index). Defaults to City 1.
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (ATSPResult): The tour, its total distance, the status and the solve time. It unpacks like the
+      tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+
+    # Visited cities carry an infinite penalty so argmin never selects them
+    visited_mask = np.zeros(n)
+    row = np.empty(n)
+
+    current_city = start - 1
+    visited_mask[current_city] = np.inf
+    order = [current_city]
+    for _ in range(n - 1):
+        np.add(distances[current_city], visited_mask, out=row)
+        next_city = int(np.argmin(row))
+        if visited_mask[next_city]:
+            # Every unvisited city is infinitely far away, take the lowest-indexed one
+            next_city = int(np.flatnonzero(visited_mask == 0)[0])
+        order.append(next_city)
+        visited_mask[next_city] = np.inf
+        current_city = next_city
+
+    return _finish_tour(distances, order, "Nearest Neighbor", show_route, solve_start)
+
+def solve_atsp_with_insertion(distance_matrix, start=1, strategy="farthest", seed=None, show_route=False):
+    """
+    Solve the Asymmetric TSP using an insertion heuristic.
+
+    Starting from the starting city and a second city, one unvisited city is selected per step and
+    inserted into the directed cycle where it increases the length the least. Inserting city c into
+    the arc (t, h) costs d(t, c) + d(c, h) - d(t, h), with every distance taken in the direction of
+    travel, and every arc of the cycle (including the one back to the start) is a candidate. The
+    selection keys are updated incrementally, so the construction runs in O(n^2).
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, where distance_matrix[i][j]
+      is the distance from city i + 1 to city j + 1. float32 arrays are kept as float32.
+    - start (int): The starting city (1-based index). Defaults to City 1.
+    - strategy (str): How the next city is selected. Defaults to "farthest".
+        - "nearest": the unvisited city closest to the tour, in either direction.
+        - "farthest": the unvisited city whose distance to the tour, in either direction, is largest.
+        - "cheapest": the unvisited city with the smallest insertion cost.
+        - "random": a random unvisited city (see seed).
+    - seed (int): Seed for the "random" strategy. Defaults to None.
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (ATSPResult): The tour, its total distance, the status and the solve time. It unpacks like the
+      tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    if strategy not in INSERTION_STRATEGIES:
+        raise ValueError(f"Unknown insertion strategy {strategy!r}, expected one of {INSERTION_STRATEGIES}")
+
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+    first = start - 1
+
+    # Cities in the order of the directed cycle (0-based); only the first `size` entries are used
+    order = np.empty(n, dtype=np.intp)
+    order[0] = first
+    size = 1
+    in_tour = np.zeros(n, dtype=bool)
+    in_tour[first] = True
+
+    # Distance between every city and the tour, in whichever direction is shorter
+    key = np.minimum(distances[first], distances[:, first])
+    if strategy == "cheapest":
+        key = distances[first] + distances[:, first]  # Insertion cost into the loop (first, first)
+        best_tail = np.full(n, first, dtype=np.intp)  # Cheapest arc, identified by its tail city
+    rng = np.random.default_rng(seed)
+    random_order = rng.permutation(np.flatnonzero(~in_tour)) if strategy == "random" else None
+
+    for step in range(n - 1):
+        # Select the next city
+        if strategy == "nearest" or strategy == "cheapest":
+            next_city = int(np.argmin(np.where(in_tour, np.inf, key)))
+        elif strategy == "farthest":
+            next_city = int(np.argmax(np.where(in_tour, -np.inf, key)))
+        else:
+            next_city = int(random_order[step])
+
+        # Find the cheapest arc (tail, head) of the cycle to insert it into
+        tails = order[:size]
+        heads = np.roll(tails, -1)
+        if strategy == "cheapest":
+            position = int(np.flatnonzero(tails == best_tail[next_city])[0])
+        else:
+            increase = distances[tails, next_city] + distances[next_city, heads] - distances[tails, heads]
+            position = int(np.argmin(increase))
+        tail, head = int(order[position]), int(order[(position + 1) % size])
+
+        # Insert the city after the tail
+        order[position + 2:size + 1] = order[position + 1:size]
+        order[position + 1] = next_city
+        size += 1
+        in_tour[next_city] = True
+
+        # Update the selection keys with the newly inserted city
+        if strategy == "cheapest":
+            _update_cheapest_insertion(distances, order[:size], in_tour, key, best_tail, tail, next_city, head)
+        else:
+            np.minimum(key, np.minimum(distances[next_city], distances[:, next_city]), out=key)
+
+    return _finish_tour(distances, order.tolist(), f"{strategy.capitalize()} Insertion", show_route, solve_start)
+
+def _update_cheapest_insertion(distances, order, in_tour, cost, best_tail, tail, city, head):
+    """
+    Refresh the cheapest insertion cost of the unvisited cities after `city` was inserted into the
+    arc (tail, head). Only the two new arcs have to be checked, except for the cities whose cheapest
+    arc was (tail, head): that arc is gone, so their cost is recomputed over the whole cycle.
+    """
+    candidates = np.flatnonzero(~in_tour)
+    stale = candidates[best_tail[candidates] == tail]
+    fresh = candidates[best_tail[candidates] != tail]
+
+    # Compare with the two new arcs (tail, city) and (city, head)
+    for arc_tail, arc_head in ((tail, city), (city, head)):
+        arc_cost = distances[arc_tail, fresh] + distances[fresh, arc_head] - distances[arc_tail, arc_head]
+        improved = arc_cost < cost[fresh]
+        cost[fresh[improved]] = arc_cost[improved]
+        best_tail[fresh[improved]] = arc_tail
+
+    if len(stale):
+        tails = order
+        heads = np.roll(order, -1)
+        increase = (distances[np.ix_(tails, stale)] + distances[np.ix_(stale, heads)].T
+                    - distances[tails, heads][:, None])
+        best = np.argmin(increase, axis=0)
+        cost[stale] = increase[best, np.arange(len(stale))]
+        best_tail[stale] = tails[best]
+
+def _finish_tour(distances, order, name, show_route, solve_start):
+    """Close the tour, compute its total distance, wrap it in an ATSPResult and plot it."""
+    order = np.asarray(order, dtype=np.intp)
+    tour = (order + 1).tolist() + [int(order[0]) + 1]
+    total_distance = sum(distances[order, np.roll(order, -1)].tolist()) if len(order) > 1 else 0.0
+
+    result = ATSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
+
+    # Plot the route if show_route is True
+    if show_route:
+        plot_route_linear(tour, total_distance, name)
+
+    return result
+
+def as_distance_array(distance_matrix):
+    """
+    Convert an asymmetric distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. Condensed 1D arrays only hold symmetric distances and are rejected.
+    """
+    distances = np.asarray(distance_matrix)
+    if distances.ndim != 2 or distances.shape[0] != distances.shape[1]:
+        raise ValueError("The ATSP needs the full square distance matrix.")
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def print_result(result, name=None):
+    """
+    Prints the total distance and the tour of an ATSP result.
+
+    Parameters:
+    - result (ATSPResult): The result returned by the solver.
+    - name (str): Name of the heuristic shown in front of the total distance, e.g., "Nearest Neighbor". Defaults to None.
+    """
+    print(f"{name} Total Distance:" if name else "Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
+def plot_route_linear(tour, total_distance, name):
+    """
+    Plots the route in a line for the ATSP.
+
+    Parameters:
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - name (str): Name of the heuristic, shown in the title.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    x_coords = list(range(1, len(tour) + 1))
+    y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
+
+    plt.figure(figsize=(10, 2))
+    plt.title(f"{name} ATSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{tour[i]}', ha='center', color='darkred')
+
+    # Arrows show the direction of travel
+    for idx in range(len(tour) - 1):
+        plt.annotate("", xy=(x_coords[idx + 1], 1), xytext=(x_coords[idx], 1),
+                     arrowprops=dict(arrowstyle="->", color='green', linewidth=2))
+
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 40, 25, 60],
+        [25, 0, 30, 55, 20],
+        [15, 35, 0, 45, 50],
+        [30, 50, 10, 0, 30],
+        [60, 45, 50, 15, 0]
+    ]
+
+    result = solve_atsp_with_nearest_neighbor(distance_matrix, start=1, show_route=True)
+    print_result(result, "Nearest Neighbor")
+
+    for strategy in ("nearest", "farthest", "cheapest"):
+        result = solve_atsp_with_insertion(distance_matrix, start=1, strategy=strategy)
+        print_result(result, f"{strategy.capitalize()} Insertion")
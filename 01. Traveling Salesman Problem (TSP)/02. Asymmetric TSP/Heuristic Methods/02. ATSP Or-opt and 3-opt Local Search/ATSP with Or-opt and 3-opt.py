@@ -0,0 +1,315 @@
+import time
+from collections import deque
+
+import numpy as np
+
+class ATSPResult:
+    """
+    Result of an ATSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"ATSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+def improve_atsp_tour_with_local_search(distance_matrix, tour, num_neighbors=10, use_or_opt=True, time_limit=None, show_route=False):
+    """
+    Improve an Asymmetric TSP tour with Or-opt and 3-opt local search that never reverses a segment.
+
+    Reversing a segment (as 2-opt does) changes the length of every arc inside it when d(i, j) differs
+    from d(j, i), so only orientation-preserving moves are used:
+    - Or-opt: move a segment of 1 to 3 cities between two other consecutive cities, keeping its direction.
+    - Segment exchange (or-3opt): remove the arcs (a, b), (c, d) and (e, f) and reconnect the tour as
+      a -> d..e -> b..c -> f, i.e., swap the two consecutive segments b..c and d..e. It is the only
+      3-opt reconnection that keeps every segment's direction.
+
+    Moves are only tried towards each city's k nearest outgoing and incoming neighbors, cities whose
+    surroundings did not change are skipped (don't-look bits), and the tour is stored as an array in
+    which each exchange rewrites the two shortest of the three segments, so a move on a tour of a few
+    thousand cities only touches a handful of entries.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, where distance_matrix[i][j]
+      is the distance from city i + 1 to city j + 1. float32 arrays are kept as float32.
+    - tour (list): Tour of cities (1-based index), e.g., [1, 3, 4, 2, 1]. The closing city may be omitted.
+    - num_neighbors (int): Number of nearest neighbors in each city's candidate lists. Defaults to 10.
+    - use_or_opt (bool): If True, also move segments of 1 to 3 cities (Or-opt). Defaults to True.
+    - time_limit (float): Time limit in seconds. The best tour found so far is returned once it is hit.
+      Defaults to None (run until no improving move is left).
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (ATSPResult): The improved tour, its total distance, the status and the solve time. It unpacks
+      like the tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    deadline = None if time_limit is None else solve_start + time_limit
+    distances = as_distance_array(distance_matrix)
+    n = len(distances)
+
+    # Work on the open cycle with 0-based cities
+    order = np.asarray(tour, dtype=np.intp) - 1
+    if len(order) > 1 and order[0] == order[-1]:
+        order = order[:-1]
+    start = int(order[0])
+
+    if n >= 4:
+        search = _LocalSearch(distances, order, num_neighbors)
+        search.run(use_or_opt, deadline)
+        order = search.order
+
+    # Rotate the tour back to its starting city and close it
+    order = np.roll(order, -int(np.flatnonzero(order == start)[0]))
+    tour = (order + 1).tolist() + [start + 1]
+    total_distance = sum(distances[order, np.roll(order, -1)].tolist())
+
+    result = ATSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
+
+    # Plot the route if show_route is True
+    if show_route:
+        plot_route_linear(tour, total_distance)
+
+    return result
+
+def nearest_neighbor_lists(distances, num_neighbors):
+    """
+    Build the candidate list of every city: its k nearest other cities along its row, closest first.
+    Pass the transposed matrix to get the nearest incoming neighbors instead of the outgoing ones.
+
+    Parameters:
+    - distances (numpy array): Float matrix of distances between cities.
+    - num_neighbors (int): Number of neighbors per city.
+
+    Returns:
+    - neighbors (numpy array): n x k array of city indices (0-based).
+    """
+    n = len(distances)
+    k = max(1, min(num_neighbors, n - 1))
+    neighbors = np.empty((n, k), dtype=np.intp)
+
+    # Work in row blocks so the partition never needs a full n x n index array
+    block = max(1, 2 ** 22 // n)
+    for first in range(0, n, block):
+        rows = distances[first:first + block].copy()
+        rows[np.arange(len(rows)), np.arange(first, first + len(rows))] = np.inf  # Exclude the city itself
+        nearest = np.argpartition(rows, k - 1, axis=1)[:, :k]
+        nearest_distances = np.take_along_axis(rows, nearest, axis=1)
+        neighbors[first:first + block] = np.take_along_axis(nearest, np.argsort(nearest_distances, axis=1, kind="stable"), axis=1)
+    return neighbors
+
+class _LocalSearch:
+    """Array-based directed tour with the Or-opt and segment exchange moves used by improve_atsp_tour_with_local_search."""
+
+    def __init__(self, distances, order, num_neighbors):
+        self.distances = distances
+        self.dist = distances.item  # Fast scalar lookup: self.dist(i, j)
+        self.n = len(order)
+        self.order = np.array(order, dtype=np.intp)
+        self.pos = np.empty(self.n, dtype=np.intp)
+        self.pos[self.order] = np.arange(self.n)
+        self.out_neighbors = nearest_neighbor_lists(distances, num_neighbors).tolist()
+        self.in_neighbors = nearest_neighbor_lists(np.ascontiguousarray(distances.T), num_neighbors).tolist()
+
+    def succ(self, city):
+        return int(self.order[(self.pos[city] + 1) % self.n])
+
+    def pred(self, city):
+        return int(self.order[self.pos[city] - 1])
+
+    def offset(self, city, origin):
+        """Number of steps along the tour from origin to city."""
+        return int(self.pos[city] - self.pos[origin]) % self.n
+
+    def run(self, use_or_opt, deadline):
+        # Every city starts with its don't-look bit off (i.e. queued)
+        queue = deque(self.order.tolist())
+        queued = np.ones(self.n, dtype=bool)
+
+        while queue:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            city = queue.popleft()
+            queued[city] = False
+
+            touched = self.improve_3opt(city)
+            if touched is None and use_or_opt:
+                touched = self.improve_or_opt(city)
+
+            if touched is not None:
+                # Re-activate the endpoints of every changed arc, including this city
+                for other in touched:
+                    if not queued[other]:
+                        queued[other] = True
+                        queue.append(other)
+
+    def improve_3opt(self, a):
+        """
+        Apply the first improving segment exchange that replaces the arc (a, succ(a)), returning
+        the touched cities. The new arc (a, d) comes from a's outgoing candidates and the new arc
+        (e, b) from b's incoming candidates; the partial gains must stay positive.
+        """
+        dist = self.dist
+        b = self.succ(a)
+        d_ab = dist(a, b)
+        for d in self.out_neighbors[a]:
+            gain = d_ab - dist(a, d)
+            if gain <= 0:
+                break  # Neighbors are sorted, no closer city is left
+            if d == b:
+                continue
+            c = self.pred(d)
+            gain += dist(c, d)
+            limit = self.offset(a, d)  # e must lie on d..pred(a)
+            for e in self.in_neighbors[b]:
+                closing_gain = gain - dist(e, b)
+                if closing_gain <= 0:
+                    break
+                if self.offset(e, d) >= limit:
+                    continue
+                f = self.succ(e)
+                delta = dist(c, f) - dist(e, f) - closing_gain
+                if delta < -1e-10:
+                    self.exchange(b, c, e)
+                    return a, b, c, d, e, f
+        return None
+
+    def improve_or_opt(self, a):
+        """Apply the first improving Or-opt move of a segment starting at city a."""
+        dist = self.dist
+        s1 = s2 = a
+        for length in range(1, 4):
+            if length > 1:
+                s2 = self.succ(s2)
+            p, nx = self.pred(s1), self.succ(s2)
+            if length + 2 > self.n or nx == p:
+                break
+            removal_gain = dist(p, s1) + dist(s2, nx) - dist(p, nx)
+            if removal_gain <= 1e-10:
+                continue
+
+            # Insert between x and y = succ(x), where x precedes s1 or y follows s2 closely
+            candidates = [(x, self.succ(x)) for x in self.in_neighbors[s1] if dist(x, s1) < removal_gain]
+            candidates += [(self.pred(y), y) for y in self.out_neighbors[s2] if dist(s2, y) < removal_gain]
+            for x, y in candidates:
+                if self.offset(x, s1) < length or x == p:
+                    continue  # x inside the segment, or the segment's current place
+                if dist(x, s1) + dist(s2, y) - dist(x, y) - removal_gain < -1e-10:
+                    self.exchange(s1, s2, x)
+                    return p, s1, s2, nx, x, y
+        return None
+
+    def exchange(self, b, c, e):
+        """
+        Swap the consecutive segments b..c and succ(c)..e, keeping their direction: the tour
+        b..c d..e f..a becomes d..e b..c f..a. Since the tour is a cycle, this is the same as
+        swapping d..e with f..a or f..a with b..c, so the pair with the fewest cities is rewritten.
+        """
+        n = self.n
+        d, f = self.succ(c), self.succ(e)
+        len_b = self.offset(c, b) + 1
+        len_c = self.offset(e, d) + 1
+        len_d = n - len_b - len_c
+        first, len_x, len_y = min((len_b + len_c, b, len_b, len_c),
+                                  (len_c + len_d, d, len_c, len_d),
+                                  (len_d + len_b, f, len_d, len_b))[1:]
+        positions = (self.pos[first] + np.arange(len_x + len_y)) % n
+        cities = self.order[positions]
+        cities = np.concatenate((cities[len_x:], cities[:len_x]))
+        self.order[positions] = cities
+        self.pos[cities] = positions
+
+def as_distance_array(distance_matrix):
+    """
+    Convert an asymmetric distance matrix to a contiguous square NumPy array.
+
+    float32 matrices keep their dtype, so they take half the memory of float64; anything else becomes
+    float64. Condensed 1D arrays only hold symmetric distances and are rejected.
+    """
+    distances = np.asarray(distance_matrix)
+    if distances.ndim != 2 or distances.shape[0] != distances.shape[1]:
+        raise ValueError("The ATSP needs the full square distance matrix.")
+    if distances.dtype != np.float32:
+        distances = distances.astype(float, copy=False)
+    return np.ascontiguousarray(distances)
+
+def print_result(result):
+    """
+    Prints the total distance and the tour of an ATSP result.
+
+    Parameters:
+    - result (ATSPResult): The result returned by the solver.
+    """
+    print("Total Distance:", result.total_distance, "\n")
+    print("Tour:", result.tour, "\n")
+
+def plot_route_linear(tour, total_distance):
+    """
+    Plots the route in a line for the ATSP.
+
+    Parameters:
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    x_coords = list(range(1, len(tour) + 1))
+    y_coords = [1] * len(tour)  # Constant y-coordinate for a linear view
+
+    plt.figure(figsize=(10, 2))
+    plt.title(f"Or-opt and 3-opt ATSP Route (Linear View)\nTotal Distance: {total_distance}")
+
+    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
+
+    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
+        plt.text(x, y + 0.05, f'{tour[i]}', ha='center', color='darkred')
+
+    # Arrows show the direction of travel
+    for idx in range(len(tour) - 1):
+        plt.annotate("", xy=(x_coords[idx + 1], 1), xytext=(x_coords[idx], 1),
+                     arrowprops=dict(arrowstyle="->", color='green', linewidth=2))
+
+    plt.ylim(0.8, 1.2)
+    plt.xlabel("Cities")
+    plt.gca().get_yaxis().set_visible(False)
+    plt.gca().get_xaxis().set_visible(False)
+    plt.show()
+
+
+# Example usage
+if __name__ == "__main__":
+    distance_matrix = [
+        [0, 10, 40, 25, 60],
+        [25, 0, 30, 55, 20],
+        [15, 35, 0, 45, 50],
+        [30, 50, 10, 0, 30],
+        [60, 45, 50, 15, 0]
+    ]
+
+    # Improve a tour from any constructive heuristic, e.g., ATSP Nearest Neighbor
+    initial_tour = [1, 4, 3, 5, 2, 1]
+    result = improve_atsp_tour_with_local_search(distance_matrix, initial_tour, time_limit=10, show_route=True)
+    print_result(result)
+
+    # A few thousand cities with a float32 matrix
+    rng = np.random.default_rng(0)
+    distances = rng.random((3000, 3000), dtype=np.float32) * 1000
+    tour, total_distance = improve_atsp_tour_with_local_search(distances, list(range(1, 3001)), time_limit=60, show_route=False)
+    print("Total Distance (3,000 cities):", total_distance, "\n")
@@ -1,39 +1,128 @@
 #!pip install pulp
-import matplotlib.pyplot as plt
 from pulp import *
 import numpy as np
 import math
+import os
+import re
+import tempfile
+import time
+
+class TSPResult:
+    """
+    Result of a TSP solver. It unpacks like a tuple: tour, total_distance, bound, gap = result.
+
+    Attributes:
+    - tour (list of tuples): The tour with city labels, e.g., [('A', 'C'), ('C', 'D'), ('D', 'B'), ('B', 'A')], or
+      None if no solution was found.
+    - total_distance (float): Total distance of the tour.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the
+      time limit without a solution), or the solver status otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, tour, total_distance, bound, gap, status, build_time, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
 
 def euclidean_distance(point1, point2):
     """Calculate Euclidean distance between two points in 2D space."""
     return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
 
-def generate_distance_matrix(points):
-    """Generate a distance matrix for the given list of points."""
+def generate_distance_matrix(points, dtype=np.float64, condensed=False, block_size=1024):
+    """
+    Generate the Euclidean distance matrix for the given list of points.
+
+    The distances are computed with NumPy for a block of rows at a time, sized so that each block holds
+    about block_size x block_size distances, and every pair is computed only once. With condensed=True
+    only the upper triangle is stored, so 50,000 points take 5 GB in float32 instead of 20 GB for the
+    full float64 matrix.
+
+    Parameters:
+    - points (list of tuples or numpy array): (x, y) coordinates of the points.
+    - dtype (numpy dtype): np.float64 (default) or np.float32, which halves the memory.
+    - condensed (bool): If True, return the upper triangle (i < j) row by row as a 1D array of n(n-1)/2
+      distances, the layout of scipy.spatial.distance.pdist. Defaults to False (full n x n matrix).
+    - block_size (int): Tile size; each block of rows holds about block_size**2 distances. Defaults to 1024.
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix, or the condensed 1D array.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    x, y = points[:, 0].copy(), points[:, 1].copy()
     n = len(points)
-    distance_matrix = [[0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                distance_matrix[i][j] = euclidean_distance(points[i], points[j])
+    if condensed:
+        distance_matrix = np.empty(n * (n - 1) // 2, dtype=dtype)
+    else:
+        distance_matrix = np.zeros((n, n), dtype=dtype)
+
+    start = 0  # Position of row i's first entry in the condensed array
+    rows_per_block = max(1, block_size * block_size // max(n, 1))
+    for first in range(0, n, rows_per_block):
+        last = min(first + rows_per_block, n)
+        # Distances from the rows of this block to every point from the block on (upper triangle side),
+        # computed in place on two temporaries
+        block = np.subtract.outer(x[first:last], x[first:])
+        block *= block
+        dy = np.subtract.outer(y[first:last], y[first:])
+        dy *= dy
+        block += dy
+        block = np.sqrt(block, out=block).astype(dtype, copy=False)
+        if condensed:
+            for i in range(first, last):
+                distance_matrix[start:start + n - i - 1] = block[i - first, i - first + 1:]
+                start += n - i - 1
+        else:
+            distance_matrix[first:last, first:] = block
+            distance_matrix[first:, first:last] = block.T
     return distance_matrix
 
-def solve_euclidean_tsp_with_pulp(city_points, show_route=True, show_model=False):
+def solve_euclidean_tsp_with_pulp(city_points, show_route=False, show_model=False, warm_start=None,
+                                  time_limit=None, mip_gap=None, threads=None, msg=False):
     """
     Solve the Euclidean Traveling Salesman Problem (TSP) using linear programming with PuLP.
 
     Parameters:
     - city_points (dict): Dictionary of city labels and (x, y) coordinates, e.g., {'A': (0, 0), 'B': (2, 3)}.
-    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to True.
+    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to False.
     - show_model (bool): If True, prints the linear programming model used to solve the TSP. Defaults to False.
+    - warm_start (list): Tour of city labels to start from, e.g., ['A', 'C', 'D', 'B', 'A']. A tour of 1-based
+      indices from the heuristics (run on generate_distance_matrix(points)) converts with [labels[i-1] for i in tour].
+      It is passed to CBC as the first incumbent, so the search starts with an upper bound. Defaults to None.
+    - time_limit (float): Time limit in seconds. When it is reached, the best tour found so far is reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which CBC stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - msg (bool): Show the CBC log. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The best tour found with city labels, e.g., [('A', 'C'), ('C', 'D'), ('D', 'B'), ('B', 'A')],
+      its total distance, the best bound, the gap, the status and the build and solve times. It unpacks like
+      the tuple (labeled_tour, total_distance, bound, gap). Without a solution, the tour and the distances are None.
     """
+    build_start = time.perf_counter()
 
     # Extract points and labels
     labels = list(city_points.keys())
     points = list(city_points.values())
 
     # Generate distance matrix from points
-    distance_matrix = generate_distance_matrix(points)
+    distance_matrix = generate_distance_matrix(points).tolist()
 
     # Get number of cities
     n = len(distance_matrix)
@@ -65,11 +154,31 @@ def solve_euclidean_tsp_with_pulp(city_points, show_route=True, show_model=False
             if i != j:
                 tsp += u[i] - u[j] + n * x[i, j] <= n - 1, f"Subtour_Elimination_{i}_{j}"
 
+    if warm_start is not None:
+        # Seed the warm start tour, with u_i the position of city i on the tour starting from city 1
+        successor = tour_successors([labels.index(city) + 1 for city in warm_start], n)
+        for (i, j), var in x.items():
+            var.setInitialValue(1 if successor[i] == j else 0)
+        current_city = 1
+        for position in range(n):
+            u[current_city].setInitialValue(position)
+            current_city = successor[current_city]
+
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
     # Solve the problem
-    tsp.solve()
+    status, bound, gap = solve_with_limits(tsp, time_limit, mip_gap, threads, warm_start=warm_start is not None, msg=msg)
+
+    solve_time = time.perf_counter() - solve_start
+
+    # Show the model summary if show_model is set to True
+    if show_model:
+        print("\nModel Summary:\n")
+        print(tsp)
 
-    # Retrieve and print the solution
-    if tsp.status == LpStatusOptimal:
+    # Retrieve the solution
+    if status in ("Optimal", "Feasible"):
         # Find the tour by starting from city 1 and following the path
         tour = []
         current_city = 1
@@ -77,7 +186,7 @@ def solve_euclidean_tsp_with_pulp(city_points, show_route=True, show_model=False
 
         while len(visited_cities) < n:
             for j in range(1, n+1):
-                if current_city != j and value(x[current_city, j]) == 1:
+                if current_city != j and value(x[current_city, j]) > 0.5:
                     tour.append((current_city, j))
                     visited_cities.add(j)
                     current_city = j
@@ -85,31 +194,118 @@ def solve_euclidean_tsp_with_pulp(city_points, show_route=True, show_model=False
 
         # Add the last leg returning to the starting city
         for j in range(1, n+1):
-            if current_city != j and value(x[current_city, j]) == 1:
+            if current_city != j and value(x[current_city, j]) > 0.5:
                 tour.append((current_city, j))
                 break
 
         # Convert tour from numeric indices to city labels
         labeled_tour = [(labels[i - 1], labels[j - 1]) for i, j in tour]
 
-        # Print the results in the specified format
-        print("Optimal Total Distance:", value(tsp.objective), "\n")
-        print("Optimal Tour:", labeled_tour)
-
-        # Show the model summary if show_model is set to True
-        if show_model:
-            print("\nModel Summary:\n")
-            print(tsp)
-
-        print("\n")
+        total_distance = value(tsp.objective)
+        result = TSPResult(labeled_tour, total_distance, bound, gap, status, build_time, solve_time)
 
         # Show the Optimal Route if show_route is set to True
         if show_route:
-            plot_optimal_route(city_points, labeled_tour, value(tsp.objective))
+            plot_optimal_route(city_points, labeled_tour, total_distance)
+
+        return result
 
     else:
+        return TSPResult(None, None, None, None, status, build_time, solve_time)
+
+def print_result(result):
+    """
+    Prints a TSP result: the build and solve times, then the optimal tour, or the best tour found with its
+    bound and gap when the solver stopped early.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.tour is None:
         print("No optimal solution found.")
-        return None
+        return
+
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+        print("Optimal Tour:", result.tour)
+    else:
+        # Stopped early: report the best tour found with its bound
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+        print("Best Tour Found:", result.tour)
+    print("\n")
+
+def solve_with_limits(problem, time_limit=None, mip_gap=None, threads=None, warm_start=False, msg=True):
+    """
+    Solve a PuLP problem with CBC under an optional time limit and relative MIP gap, keeping the best
+    solution found when the solver stops early.
+
+    Parameters:
+    - problem (LpProblem): The problem to solve.
+    - time_limit (float): Time limit in seconds. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - warm_start (bool): Start from the initial values of the variables. Defaults to False.
+    - msg (bool): Show the solver log. Defaults to True.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the time
+      limit before any solution was found), or the PuLP status otherwise, e.g., "Infeasible".
+    - bound (float): Best bound on the objective value (None without a solution).
+    - gap (float): Relative gap between the objective value and the bound (None without a solution).
+    """
+    # CBC only reports the bound in its log, so the log goes to a temporary file when the search can stop early
+    log_path = None
+    if time_limit is not None or mip_gap is not None:
+        handle, log_path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+
+    solve_start = time.perf_counter()
+    problem.solve(PULP_CBC_CMD(msg=msg and log_path is None, timeLimit=time_limit, gapRel=mip_gap, threads=threads,
+                               warmStart=warm_start, logPath=log_path))
+
+    log = ""
+    if log_path is not None:
+        with open(log_path) as file:
+            log = file.read()
+        os.remove(log_path)
+        if msg:
+            print(log)
+
+    if problem.sol_status not in (LpSolutionOptimal, LpSolutionIntegerFeasible):
+        # Stopped on the time limit without an integer solution, PuLP reports whatever status the unfinished
+        # search left in the solution file, which can be "Infeasible" for a feasible problem
+        if "Stopped on time" in log or (time_limit is not None and time.perf_counter() - solve_start >= time_limit):
+            return "Time Limit", None, None
+        return LpStatus[problem.status], None, None
+
+    objective = value(problem.objective)
+    match = re.search(r"^(?:Lower|Upper) bound:\s+(\S+)", log, re.MULTILINE)
+    bound = float(match.group(1)) if match else objective
+    gap = abs(objective - bound) / max(abs(objective), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal" in CBC, but the solution is only known to be within the gap
+    optimal = problem.sol_status == LpSolutionOptimal and (mip_gap is None or gap <= 1e-9)
+    return ("Optimal" if optimal else "Feasible"), bound, gap
+
+def tour_successors(tour, n):
+    """
+    Convert a tour into the successor of every city.
+
+    Parameters:
+    - tour (list): Tour of cities (1-based index), e.g., [1, 3, 4, 2, 1]. The closing city may be omitted.
+    - n (int): Number of cities.
+
+    Returns:
+    - successor (dict): Next city of every city (1 to n) on the tour.
+    """
+    cities = list(tour)
+    if len(cities) > 1 and cities[0] == cities[-1]:
+        cities = cities[:-1]
+    if sorted(cities) != list(range(1, n+1)):
+        raise ValueError("The warm start tour must visit every city exactly once.")
+    return {city: cities[(t + 1) % n] for t, city in enumerate(cities)}
 
 def plot_optimal_route(city_points, optimal_tour, total_distance):
     """
@@ -120,6 +316,9 @@ def plot_optimal_route(city_points, optimal_tour, total_distance):
     - optimal_tour (list of tuples): Optimal path with labels, e.g., [('A', 'C'), ('C', 'D'), ('D', 'B'), ('B', 'A')].
     - total_distance (float): Total distance of the optimal tour.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     ordered_points = [city_points[optimal_tour[0][0]]]
     for _, next_city in optimal_tour:
         ordered_points.append(city_points[next_city])
@@ -145,4 +344,5 @@ def plot_optimal_route(city_points, optimal_tour, total_distance):
 # Example usage
 if __name__ == "__main__":
     city_points = {'A': (0, 0), 'B': (2, 3), 'C': (5, 4), 'D': (6, 1), 'E': (4,2), 'F': (4,1)}
-    solve_euclidean_tsp_with_pulp(city_points, show_route=True, show_model=False)
\ No newline at end of file
+    result = solve_euclidean_tsp_with_pulp(city_points, show_route=True, show_model=False)
+    print_result(result)
\ No newline at end of file
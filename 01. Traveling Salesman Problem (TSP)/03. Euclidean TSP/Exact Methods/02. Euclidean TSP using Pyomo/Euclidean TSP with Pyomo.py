@@ -1,40 +1,126 @@
 #!pip install pyomo
 #!apt-get install -y -qq glpk-utils
-import matplotlib.pyplot as plt
 from pyomo.environ import *
+from pyomo.opt import SolutionStatus
 import numpy as np
 import math
+import time
+
+# Names of the relative MIP gap and thread count options of the supported solvers
+MIP_GAP_OPTIONS = {"glpk": "mipgap", "cbc": "ratioGap", "gurobi": "MIPGap"}
+THREADS_OPTIONS = {"cbc": "threads", "gurobi": "Threads"}
+
+class TSPResult:
+    """
+    Result of a TSP solver. It unpacks like a tuple: tour, total_distance, bound, gap = result.
+
+    Attributes:
+    - tour (list of tuples): The tour with city labels, e.g., [('A', 'C'), ('C', 'D'), ('D', 'B'), ('B', 'A')], or
+      None if no solution was found.
+    - total_distance (float): Total distance of the tour.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the solver status otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, tour, total_distance, bound, gap, status, build_time, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
 
 def euclidean_distance(point1, point2):
     """Calculate Euclidean distance between two points in 2D space."""
     return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
 
-def generate_distance_matrix(points):
-    """Generate a distance matrix for the given list of points."""
+def generate_distance_matrix(points, dtype=np.float64, condensed=False, block_size=1024):
+    """
+    Generate the Euclidean distance matrix for the given list of points.
+
+    The distances are computed with NumPy for a block of rows at a time, sized so that each block holds
+    about block_size x block_size distances, and every pair is computed only once. With condensed=True
+    only the upper triangle is stored, so 50,000 points take 5 GB in float32 instead of 20 GB for the
+    full float64 matrix.
+
+    Parameters:
+    - points (list of tuples or numpy array): (x, y) coordinates of the points.
+    - dtype (numpy dtype): np.float64 (default) or np.float32, which halves the memory.
+    - condensed (bool): If True, return the upper triangle (i < j) row by row as a 1D array of n(n-1)/2
+      distances, the layout of scipy.spatial.distance.pdist. Defaults to False (full n x n matrix).
+    - block_size (int): Tile size; each block of rows holds about block_size**2 distances. Defaults to 1024.
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix, or the condensed 1D array.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    x, y = points[:, 0].copy(), points[:, 1].copy()
     n = len(points)
-    distance_matrix = [[0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                distance_matrix[i][j] = euclidean_distance(points[i], points[j])
+    if condensed:
+        distance_matrix = np.empty(n * (n - 1) // 2, dtype=dtype)
+    else:
+        distance_matrix = np.zeros((n, n), dtype=dtype)
+
+    start = 0  # Position of row i's first entry in the condensed array
+    rows_per_block = max(1, block_size * block_size // max(n, 1))
+    for first in range(0, n, rows_per_block):
+        last = min(first + rows_per_block, n)
+        # Distances from the rows of this block to every point from the block on (upper triangle side),
+        # computed in place on two temporaries
+        block = np.subtract.outer(x[first:last], x[first:])
+        block *= block
+        dy = np.subtract.outer(y[first:last], y[first:])
+        dy *= dy
+        block += dy
+        block = np.sqrt(block, out=block).astype(dtype, copy=False)
+        if condensed:
+            for i in range(first, last):
+                distance_matrix[start:start + n - i - 1] = block[i - first, i - first + 1:]
+                start += n - i - 1
+        else:
+            distance_matrix[first:last, first:] = block
+            distance_matrix[first:, first:last] = block.T
     return distance_matrix
 
-def solve_euclidean_tsp_with_pyomo(city_points, show_route=True):
+def solve_euclidean_tsp_with_pyomo(city_points, show_route=False, time_limit=None, mip_gap=None, threads=None):
     """
     Solve the Euclidean Traveling Salesman Problem (TSP) using linear programming with Pyomo.
 
     Parameters:
     - city_points (dict): Dictionary of city labels and (x, y) coordinates, e.g., {'A': (0, 0), 'B': (2, 3)}.
-    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to True.
+    - show_route (bool): If True, displays a plot of the optimal route after solving the TSP. Defaults to False.
     - show_model (bool): If True, prints the linear programming model used to solve the TSP. Defaults to False.
+    - time_limit (float): Time limit in seconds. When it is reached, the best tour found so far is reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the solver stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads, for solvers that support it (not GLPK). Defaults to None (solver default).
+
+    Returns:
+    - result (TSPResult): The best tour found with city labels, e.g., [('A', 'C'), ('C', 'D'), ('D', 'B'), ('B', 'A')],
+      its total distance, the best bound (None if the solver does not report it), the gap, the status and the
+      build and solve times. It unpacks like the tuple (labeled_tour, total_distance, bound, gap). Without a
+      solution, the tour and the distances are None.
     """
+    build_start = time.perf_counter()
 
     # Extract points and labels
     labels = list(city_points.keys())
     points = list(city_points.values())
 
     # Generate distance matrix from points
-    distance_matrix = generate_distance_matrix(points)
+    distance_matrix = generate_distance_matrix(points).tolist()
     n = len(distance_matrix)
 
     # Create Pyomo model
@@ -71,11 +157,16 @@ def solve_euclidean_tsp_with_pyomo(city_points, show_route=True):
             if i != j:
                 model.subtour.add(model.u[i] - model.u[j] + n * model.x[i, j] <= n - 1)
 
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
     # Solve the model
-    result = SolverFactory('glpk').solve(model)
+    status, bound, gap = solve_with_limits(SolverFactory('glpk'), model, time_limit, mip_gap, threads)
 
-    # Retrieve and print the solution
-    if result.solver.status == SolverStatus.ok and result.solver.termination_condition == TerminationCondition.optimal:
+    solve_time = time.perf_counter() - solve_start
+
+    # Retrieve the solution
+    if status in ("Optimal", "Feasible"):
         # Find the tour by starting from city 1 and following the path
         tour = []
         current_city = 1
@@ -83,7 +174,7 @@ def solve_euclidean_tsp_with_pyomo(city_points, show_route=True):
 
         while len(visited_cities) < n:
             for j in range(1, n+1):
-                if current_city != j and model.x[current_city, j].value == 1:
+                if current_city != j and value(model.x[current_city, j]) > 0.5:
                     tour.append((current_city, j))
                     visited_cities.add(j)
                     current_city = j
@@ -91,24 +182,95 @@ def solve_euclidean_tsp_with_pyomo(city_points, show_route=True):
 
         # Add the last leg returning to the starting city
         for j in range(1, n+1):
-            if current_city != j and model.x[current_city, j].value == 1:
+            if current_city != j and value(model.x[current_city, j]) > 0.5:
                 tour.append((current_city, j))
                 break
 
         # Convert tour from numeric indices to city labels
         labeled_tour = [(labels[i - 1], labels[j - 1]) for i, j in tour]
 
-        # Print the results in the specified format
-        print("Optimal Total Distance:", model.objective(), "\n")
-        print("Optimal Tour:", labeled_tour)
+        total_distance = model.objective()
+        result = TSPResult(labeled_tour, total_distance, bound, gap, status, build_time, solve_time)
 
         # Show the Optimal Route if show_route is set to True
         if show_route:
-            plot_optimal_route(city_points, labeled_tour, model.objective())
+            plot_optimal_route(city_points, labeled_tour, total_distance)
+
+        return result
 
     else:
+        return TSPResult(None, None, None, None, status, build_time, solve_time)
+
+def print_result(result):
+    """
+    Prints a TSP result: the build and solve times, then the optimal tour, or the best tour found with its
+    bound and gap when the solver stopped early.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.tour is None:
         print("No optimal solution found.")
-        return None
+        return
+
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+        print("Optimal Tour:", result.tour)
+    else:
+        # Stopped early: report the best tour found with its bound
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+        print("Best Tour Found:", result.tour)
+
+def solve_with_limits(solver, model, time_limit=None, mip_gap=None, threads=None, warmstart=False):
+    """
+    Solve a Pyomo model under an optional time limit and relative MIP gap, keeping the best solution
+    found when the solver stops early.
+
+    Parameters:
+    - solver: Solver created with SolverFactory.
+    - model (ConcreteModel): The model to solve, with a single active objective.
+    - time_limit (float): Time limit in seconds (rounded up to whole seconds). Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads, if the solver supports it. Defaults to None.
+    - warmstart (bool): Start from the current values of the variables. Defaults to False.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition
+      otherwise, e.g., "infeasible".
+    - bound (float): Best bound on the objective value (None if unknown).
+    - gap (float): Relative gap between the objective value and the bound (None if unknown).
+    """
+    if mip_gap is not None and solver.name in MIP_GAP_OPTIONS:
+        solver.options[MIP_GAP_OPTIONS[solver.name]] = mip_gap
+    if threads is not None and solver.name in THREADS_OPTIONS:
+        solver.options[THREADS_OPTIONS[solver.name]] = threads
+    options = {"warmstart": True} if warmstart else {}
+    if time_limit is not None:
+        options["timelimit"] = max(1, math.ceil(time_limit))
+
+    result = solver.solve(model, load_solutions=False, **options)
+    if len(result.solution) == 0 or result.solution(0).status not in (
+            SolutionStatus.optimal, SolutionStatus.feasible, SolutionStatus.stoppedByLimit, SolutionStatus.bestSoFar):
+        return str(result.solver.termination_condition), None, None
+    model.solutions.load_from(result)
+
+    objective = next(model.component_data_objects(Objective, active=True))
+    objective_value = value(objective)
+    optimal = result.solver.termination_condition == TerminationCondition.optimal
+    bound = result.problem.lower_bound if objective.sense == minimize else result.problem.upper_bound
+    if bound is None or not math.isfinite(bound):
+        bound = objective_value if optimal else None
+    elif objective.sense == maximize and bound < objective_value - 1e-6 * max(1.0, abs(objective_value)):
+        # Pyomo's CBC interface can report the bound of a maximization with the sign of CBC's internal minimization
+        bound = -bound if -bound >= objective_value else None
+    gap = None if bound is None else abs(objective_value - bound) / max(abs(objective_value), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal", but the solution is only known to be within the gap
+    if mip_gap is not None and (gap is None or gap > 1e-9):
+        optimal = False
+    return ("Optimal" if optimal else "Feasible"), bound, gap
 
 def plot_optimal_route(city_points, optimal_tour, total_distance):
     """
@@ -119,6 +281,9 @@ def plot_optimal_route(city_points, optimal_tour, total_distance):
     - optimal_tour (list of tuples): Optimal path with labels, e.g., [('A', 'C'), ('C', 'D'), ('D', 'B'), ('B', 'A')].
     - total_distance (float): Total distance of the optimal tour.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     ordered_points = [city_points[optimal_tour[0][0]]]
     for _, next_city in optimal_tour:
         ordered_points.append(city_points[next_city])
@@ -144,4 +309,5 @@ def plot_optimal_route(city_points, optimal_tour, total_distance):
 # Example usage
 if __name__ == "__main__":
     city_points = {'A': (0, 0), 'B': (2, 3), 'C': (5, 4), 'D': (6, 1), 'E': (4,2), 'F': (4,1)}
-    solve_euclidean_tsp_with_pyomo(city_points, show_route=True)
\ No newline at end of file
+    result = solve_euclidean_tsp_with_pyomo(city_points, show_route=True)
+    print_result(result)
\ No newline at end of file
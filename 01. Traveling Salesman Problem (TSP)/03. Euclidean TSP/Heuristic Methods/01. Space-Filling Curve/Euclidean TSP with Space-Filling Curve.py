@@ -0,0 +1,194 @@
+import time
+
+import numpy as np
+
+class TSPResult:
+    """
+    Result of a TSP heuristic. It unpacks like a tuple: tour, total_distance = result.
+
+    Attributes:
+    - tour (list): The tour of cities in the order visited, (1-based index), e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - status (str): "Feasible", since a heuristic tour is not necessarily optimal.
+    - solve_time (float): Time spent by the heuristic in seconds.
+    """
+    __slots__ = ("tour", "total_distance", "status", "solve_time")
+
+    def __init__(self, tour, total_distance, status, solve_time):
+        self.tour = tour
+        self.total_distance = total_distance
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.tour, self.total_distance))
+
+    def __repr__(self):
+        return (f"TSPResult(total_distance={self.total_distance!r}, cities={max(len(self.tour) - 1, 0)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f})")
+
+SPACE_FILLING_CURVES = ("hilbert", "morton")
+
+def solve_euclidean_tsp_with_space_filling_curve(city_points, curve="hilbert", order=16, start=1, show_route=False):
+    """
+    Build a Euclidean TSP tour by visiting the cities in the order of a space-filling curve.
+
+    The coordinates are scaled onto a 2^order x 2^order grid, every city gets the index of its grid
+    cell along the curve, and the cities are sorted by that index. Cities that are close on the curve
+    are close in the plane, so the tour has no long jumps. Everything is vectorized with NumPy and the
+    sort dominates, so the construction runs in O(n log n) without any distance matrix: one million
+    cities take about a second. On uniformly random cities the Hilbert tour is about 40% longer than
+    optimal (the Morton tour about twice as long), so it is meant as a starting tour for local search
+    or as a warm start for the exact solvers.
+
+    Parameters:
+    - city_points (dict or numpy array): Dictionary of city labels and (x, y) coordinates, e.g.,
+      {'A': (0, 0), 'B': (2, 3)}, or an n x 2 array of coordinates. Cities are numbered 1 to n in this order.
+    - curve (str): "hilbert" (default) or "morton" (Z-order, cheaper to compute but with longer jumps).
+    - order (int): Bits per coordinate of the grid, from 1 to 31. Defaults to 16.
+    - start (int): The city the tour starts and ends at (1-based index). Defaults to City 1.
+    - show_route (bool): Whether to display the route plot. Defaults to False.
+
+    Returns:
+    - result (TSPResult): The tour (1-based index), its total distance, the status and the solve time. It
+      unpacks like the tuple (tour, total_distance).
+    """
+    solve_start = time.perf_counter()
+
+    if curve not in SPACE_FILLING_CURVES:
+        raise ValueError(f"Unknown space-filling curve {curve!r}, expected one of {SPACE_FILLING_CURVES}")
+    if not 1 <= order <= 31:
+        raise ValueError("order must be between 1 and 31.")
+
+    if isinstance(city_points, dict):
+        city_points = list(city_points.values())
+    points = np.asarray(city_points, dtype=float).reshape(-1, 2)
+    n = len(points)
+    if n == 0:
+        return TSPResult([], 0.0, "Feasible", time.perf_counter() - solve_start)
+
+    # Scale both axes by the same factor onto the integer grid
+    lower = points.min(axis=0)
+    extent = max(float((points.max(axis=0) - lower).max()), 1e-12)
+    side = 1 << order
+    cells = np.minimum(((points - lower) * (side / extent)).astype(np.int64), side - 1)
+
+    if curve == "hilbert":
+        index = hilbert_index(cells[:, 0], cells[:, 1], order)
+    else:
+        index = morton_index(cells[:, 0], cells[:, 1])
+
+    # Visit the cities along the curve, starting from the requested city
+    visit_order = np.argsort(index, kind="stable")
+    visit_order = np.roll(visit_order, -int(np.flatnonzero(visit_order == start - 1)[0]))
+    following = np.roll(visit_order, -1)
+    total_distance = float(np.sqrt(((points[visit_order] - points[following]) ** 2).sum(axis=1)).sum())
+    tour = (visit_order + 1).tolist() + [start]
+
+    result = TSPResult(tour, total_distance, "Feasible", time.perf_counter() - solve_start)
+
+    # Plot the route if show_route is True
+    if show_route:
+        plot_route(points, tour, total_distance, curve)
+
+    return result
+
+def hilbert_index(x, y, order):
+    """
+    Compute the position of grid cells along the Hilbert curve.
+
+    Parameters:
+    - x, y (numpy arrays): Integer cell coordinates between 0 and 2^order - 1.
+    - order (int): Bits per coordinate of the grid.
+
+    Returns:
+    - index (numpy array): Position of every cell along the curve (int64).
+    """
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    side = 1 << order
+    index = np.zeros(len(x), dtype=np.int64)
+
+    # From the most significant bit down: add the quadrant's offset, then rotate into its frame
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        index += s * s * ((3 * rx) ^ ry)
+
+        flip = rx & ~ry
+        x = np.where(flip, side - 1 - x, x)
+        y = np.where(flip, side - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return index
+
+def morton_index(x, y):
+    """
+    Compute the position of grid cells along the Morton (Z-order) curve by interleaving their bits.
+
+    Parameters:
+    - x, y (numpy arrays): Integer cell coordinates below 2^31.
+
+    Returns:
+    - index (numpy array): Position of every cell along the curve (int64).
+    """
+    return _spread_bits(x) | (_spread_bits(y) << 1)
+
+def _spread_bits(values):
+    """Insert a zero bit after each of the 31 low bits: b2 b1 b0 -> 0 b2 0 b1 0 b0."""
+    values = np.array(values, dtype=np.int64)
+    values = (values | (values << 16)) & 0x0000FFFF0000FFFF
+    values = (values | (values << 8)) & 0x00FF00FF00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F0F0F0F0F
+    values = (values | (values << 2)) & 0x3333333333333333
+    values = (values | (values << 1)) & 0x5555555555555555
+    return values
+
+def print_result(result, labels=None):
+    """
+    Prints the tour and the total distance of a TSP result.
+
+    Parameters:
+    - result (TSPResult): The result returned by the solver.
+    - labels (list): City labels in the order of the input, e.g., list(city_points). Defaults to None (city numbers).
+    """
+    tour = result.tour if labels is None else [labels[city - 1] for city in result.tour]
+    print("Tour:", tour, "\n")
+    print("Total Distance:", result.total_distance, "\n")
+
+def plot_route(points, tour, total_distance, curve):
+    """
+    Plots the route on the plane for the TSP.
+
+    Parameters:
+    - points (numpy array): n x 2 array of city coordinates.
+    - tour (list): The sequence of cities in the order visited, e.g., [1, 3, 4, 2, 1].
+    - total_distance (float): Total distance of the tour.
+    - curve (str): Name of the space-filling curve, shown in the title.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    route = points[np.asarray(tour) - 1]
+
+    plt.figure(figsize=(8, 8))
+    plt.title(f"{curve.capitalize()} Curve TSP Route\nTotal Distance: {total_distance:.2f}")
+    plt.plot(route[:, 0], route[:, 1], color='green', linestyle='-', linewidth=1, zorder=1)
+    plt.scatter(points[:, 0], points[:, 1], color='blue', s=10, zorder=5)
+    plt.xlabel("X Coordinate")
+    plt.ylabel("Y Coordinate")
+    plt.axis('equal')
+    plt.show()
+
+
+# Example usage
+if __name__ == "__main__":
+    city_points = {'A': (0, 0), 'B': (2, 3), 'C': (5, 4), 'D': (6, 1), 'E': (4,2), 'F': (4,1)}
+    result = solve_euclidean_tsp_with_space_filling_curve(city_points, show_route=True)
+    print_result(result, labels=list(city_points))
+
+    # Starting tour for a large instance, without a distance matrix
+    coordinates = np.random.default_rng(0).random((1000000, 2)) * 1000
+    tour, total_distance = solve_euclidean_tsp_with_space_filling_curve(coordinates, show_route=False)
+    print("Total Distance (1,000,000 cities):", total_distance, "\n")
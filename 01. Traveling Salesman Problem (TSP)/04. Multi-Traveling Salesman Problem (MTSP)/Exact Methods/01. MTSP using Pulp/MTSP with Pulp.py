@@ -1,164 +1,81 @@
 #! pip install pulp
 from pulp import *
-import matplotlib.pyplot as plt
 import numpy as np
+import math
+import os
+import re
+import tempfile
+import time
 
-def solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route=True, show_model=False):
+class MTSPResult:
     """
-    Solve the Multi-Traveling Salesman Problem (Multi-TSP) using linear programming with PuLP.
-
-    Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
-    - num_salesmen (int): Number of salesmen available.
-    - depot (int): Starting city for all salesmen (default is 1, indexed from 1).
-    - show_route (bool): If True, displays a plot of the optimal routes. Defaults to True.
-    - show_model (bool): If True, prints the linear programming model used to solve the TSP. Defaults to False.
+    Result of a Multi-TSP solver. It unpacks like a tuple: routes, total_distance, bound, gap = result.
+
+    Attributes:
+    - routes (dict): Route of every salesman as a list of (i, j) tuples, keyed by salesman (1-based), or None if no
+      solution was found.
+    - total_distance (float): Total distance of all routes.
+    - route_distances (dict): Distance of every salesman's route, keyed by salesman.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the
+      time limit without a solution), or the solver status otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
     """
-    n = len(distance_matrix)
-    tsp = LpProblem("Multi_Traveling_Salesman_Problem", LpMinimize)
-
-    # Create binary decision variables x_ij_k for each pair of cities and each salesman
-    x = LpVariable.dicts("x", ((i, j, k) for i in range(1, n+1) for j in range(1, n+1) for k in range(1, num_salesmen+1) if i != j), cat='Binary')
-
-    # Create auxiliary variables u_i for subtour elimination (used for MTZ constraints)
-    u = LpVariable.dicts("u", (i for i in range(1, n+1)), lowBound=0, upBound=n, cat='Continuous')
-
-    # Objective function: Minimize the total travel distance
-    tsp += lpSum(distance_matrix[i-1][j-1] * x[i, j, k] for i in range(1, n+1) for j in range(1, n+1) for k in range(1, num_salesmen+1) if i != j), "Total_Distance"
-
-    # Constraints
-    # 1. Each city (except the depot) must be visited exactly once by any salesman
-    for j in range(1, n+1):
-        if j != depot:
-            tsp += lpSum(x[i, j, k] for i in range(1, n+1) for k in range(1, num_salesmen+1) if i != j) == 1, f"Visit_Constraint_{j}"
-
-    # 2. Each salesman starts from the depot
-    for k in range(1, num_salesmen+1):
-        tsp += lpSum(x[depot, j, k] for j in range(1, n+1) if depot != j) == 1, f"Start_Constraint_Salesman_{k}"
-
-    # 3. Each salesman ends at the depot
-    for k in range(1, num_salesmen+1):
-        tsp += lpSum(x[i, depot, k] for i in range(1, n+1) if depot != i) == 1, f"End_Constraint_Salesman_{k}"
-
-    # 4. Flow conservation for each city (if a salesman enters a city, they must leave it)
-    for k in range(1, num_salesmen+1):
-        for j in range(1, n+1):
-            if j != depot:
-                tsp += lpSum(x[i, j, k] for i in range(1, n+1) if i != j) == lpSum(x[j, m, k] for m in range(1, n+1) if j != m), f"Flow_Constraint_{j}_Salesman_{k}"
-
-    # 5. Subtour elimination constraints (MTZ constraints)
-    for i in range(2, n+1):
-        for j in range(2, n+1):
-            if i != j:
-                tsp += u[i] - u[j] + n * lpSum(x[i, j, k] for k in range(1, num_salesmen+1)) <= n - 1, f"Subtour_Elimination_{i}_{j}"
-
-    # Solve the problem
-    tsp.solve()
-
-    # Retrieve and print the solution
-    if tsp.status == LpStatusOptimal:
-        routes = {k: [] for k in range(1, num_salesmen+1)}
-        total_distances = {k: 0 for k in range(1, num_salesmen+1)}
-
-        for k in range(1, num_salesmen+1):
-            current_city = depot
-            while True:
-                for j in range(1, n+1):
-                    if current_city != j and value(x[current_city, j, k]) == 1:
-                        routes[k].append((current_city, j))
-                        total_distances[k] += distance_matrix[current_city-1][j-1]  # Add distance for this segment
-                        current_city = j
-                        break
-                if current_city == depot:
-                    break
-
-        print("Optimal Total Distance:", value(tsp.objective), "\n")
-        for k, route in routes.items():
-            print(f"Salesman {k} Route:", route)
-            print(f"Salesman {k} Specific Distance: {total_distances[k]}")
-
-        if show_model:
-            print("\nModel Summary:\n")
-            print(tsp)
-
-        if show_route:
-            for k, route in routes.items():
-                plot_optimal_route_linear(route, total_distances[k], salesman_id=k)
-
-    else:
-        print("No optimal solution found.")
-
-
-def plot_optimal_route_linear(optimal_tour, total_distance, salesman_id=1):
-    """
-    Plots the optimal route in a line for a single salesman's TSP.
-
-    Parameters:
-    - optimal_tour (list of tuples): Optimal path, e.g., [(1, 3), (3, 4), (4, 2), (2, 1)].
-    - total_distance (float): Total distance of the optimal tour for this specific salesman.
-    - salesman_id (int): Identifier for the salesman.
-    """
-    # Extract the order of cities from the optimal tour
-    ordered_cities = [optimal_tour[0][0]]  # Start with the first city in the tour
-    for _, next_city in optimal_tour:
-        ordered_cities.append(next_city)
-
-    # Generate positions along a line for each city in the order of the optimal tour
-    x_coords = list(range(1, len(ordered_cities) + 1))
-    y_coords = [1] * len(ordered_cities)  # Set a constant y-coordinate for all cities to place them in a line
-
-    # Create a figure
-    plt.figure(figsize=(10, 2))
-    plt.title(f"Optimal Route for Salesman {salesman_id}\nSpecific Distance: {total_distance:.1f}")
-
-    # Plot each city in the order of the optimal tour
-    plt.scatter(x_coords, y_coords, color='blue', s=100, zorder=5)
-
-    # Annotate each city with its index according to the ordered tour
-    for i, (x, y) in enumerate(zip(x_coords, y_coords)):
-        plt.text(x, y + 0.05, f'{ordered_cities[i]}', ha='center', color='darkred')
-
-    # Plot the route by drawing lines in the order of the optimal tour
-    for idx in range(len(ordered_cities) - 1):
-        plt.plot([x_coords[idx], x_coords[idx + 1]], [1, 1], color='green', linestyle='-', linewidth=2)
-
-    # Set plot limits and remove the y-axis for a clean linear view
-    plt.ylim(0.8, 1.2)
-    plt.xlabel("Cities")
-    plt.gca().get_yaxis().set_visible(False)
-    plt.gca().get_xaxis().set_visible(False)
-    plt.show()
-
-
-# Example usage
-if __name__ == "__main__":
-    distance_matrix = [
-        [0, 29, 20, 21, 16, 31],
-        [29, 0, 15, 29, 28, 40],
-        [20, 15, 0, 15, 14, 25],
-        [21, 29, 15, 0, 25, 35],
-        [16, 28, 14, 25, 0, 30],
-        [31, 40, 25, 35, 30, 0]
-    ]
-    num_salesmen = 3
-    solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route=True, show_model=False)
-
-#! pip install pulp
-from pulp import *
-import matplotlib.pyplot as plt
-import numpy as np
-
-def solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route=True, show_model=False):
+    __slots__ = ("routes", "total_distance", "route_distances", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, routes, total_distance, route_distances, bound, gap, status, build_time, solve_time):
+        self.routes = routes
+        self.total_distance = total_distance
+        self.route_distances = route_distances
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.routes, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"MTSPResult(total_distance={self.total_distance!r}, routes={self.routes!r}, bound={self.bound!r}, "
+                f"gap={self.gap!r}, status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
+
+def solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route=False, show_model=False, warm_start=None,
+                              time_limit=None, mip_gap=None, threads=None, msg=False):
     """
     Solve the Multi-Traveling Salesman Problem (Multi-TSP) using linear programming with PuLP.
 
     Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as a
+      condensed 1D array.
     - num_salesmen (int): Number of salesmen available.
     - depot (int): Starting city for all salesmen (default is 1, indexed from 1).
-    - show_route (bool): If True, displays a plot of the optimal routes. Defaults to True.
+    - show_route (bool): If True, displays a plot of the optimal routes. Defaults to False.
     - show_model (bool): If True, prints the linear programming model used to solve the TSP. Defaults to False.
+    - warm_start (list of lists): One route per salesman (1-based index) to start from, each starting and ending
+      at the depot, e.g., [[1, 3, 1], [1, 2, 5, 1], [1, 4, 6, 1]]. It is passed to CBC as the first incumbent (with
+      the MTZ u_i set to the position of city i on its route), so the search starts with an upper bound.
+      Defaults to None (cold start).
+    - time_limit (float): Time limit in seconds for CBC. When it is reached, the best routes found so far are
+      reported together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which CBC stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - msg (bool): Show the CBC log. Defaults to False.
+
+    Returns:
+    - result (MTSPResult): The route of every salesman as a list of (i, j) tuples, keyed by salesman, the total
+      distance, the distance of every route, the best bound, the gap, the status and the build and solve times.
+      It unpacks like the tuple (routes, total_distance, bound, gap). Without a solution, the routes and the
+      distances are None.
     """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix).tolist()
+
+    build_start = time.perf_counter()
+
     # Number of cities in the problem
     n = len(distance_matrix)
 
@@ -178,44 +95,84 @@ def solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route
     # u[i] helps eliminate subtours by maintaining the sequence of visits
     u = LpVariable.dicts("u", (i for i in range(1, n+1)), lowBound=0, upBound=n, cat='Continuous')
 
+    # Column of every variable x[i, j, k] in the coefficient arrays
+    variables = list(x.values())
+    arcs = np.array(list(x), dtype=int).reshape(-1, 3)
+    first, second, salesman = arcs[:, 0], arcs[:, 1], arcs[:, 2]
+    columns = np.arange(len(arcs))
+    ones = np.ones(len(arcs), dtype=int)
+
+    # Row of every city except the depot in the per-city constraints
+    cities = [j for j in range(1, n+1) if j != depot]
+    city_row = np.zeros(n+1, dtype=int)
+    city_row[cities] = np.arange(len(cities))
+
     # Define the objective function: Minimize total travel distance
-    tsp += lpSum(distance_matrix[i-1][j-1] * x[i, j, k]
-                 for i in range(1, n+1)
-                 for j in range(1, n+1)
-                 for k in range(1, num_salesmen+1) if i != j), "Total_Distance"
+    tsp += LpAffineExpression(zip(variables, np.asarray(distance_matrix)[first-1, second-1].tolist())), "Total_Distance"
 
     # Constraints
     # 1. Each city (except the depot) must be visited exactly once by one salesman
-    for j in range(1, n+1):
-        if j != depot:
-            tsp += lpSum(x[i, j, k] for i in range(1, n+1)
-                                       for k in range(1, num_salesmen+1) if i != j) == 1, f"Visit_Constraint_{j}"
+    into_city = second != depot
+    add_constraints_in_bulk(tsp, variables, city_row[second[into_city]], columns[into_city], ones[into_city],
+                            LpConstraintEQ, 1, [f"Visit_Constraint_{j}" for j in cities])
 
     # 2. Each salesman must leave the depot exactly once
-    for k in range(1, num_salesmen+1):
-        tsp += lpSum(x[depot, j, k] for j in range(1, n+1) if depot != j) == 1, f"Start_Constraint_Salesman_{k}"
+    from_depot = first == depot
+    add_constraints_in_bulk(tsp, variables, salesman[from_depot] - 1, columns[from_depot], ones[from_depot],
+                            LpConstraintEQ, 1, [f"Start_Constraint_Salesman_{k}" for k in range(1, num_salesmen+1)])
 
     # 3. Each salesman must return to the depot exactly once
-    for k in range(1, num_salesmen+1):
-        tsp += lpSum(x[i, depot, k] for i in range(1, n+1) if depot != i) == 1, f"End_Constraint_Salesman_{k}"
+    into_depot = second == depot
+    add_constraints_in_bulk(tsp, variables, salesman[into_depot] - 1, columns[into_depot], ones[into_depot],
+                            LpConstraintEQ, 1, [f"End_Constraint_Salesman_{k}" for k in range(1, num_salesmen+1)])
+
+    # 4. Flow conservation: If a salesman enters a city, they must leave it (inflow - outflow == 0)
+    from_city = ~from_depot
+    add_constraints_in_bulk(tsp, variables,
+                            np.concatenate([(salesman[into_city] - 1) * len(cities) + city_row[second[into_city]],
+                                            (salesman[from_city] - 1) * len(cities) + city_row[first[from_city]]]),
+                            np.concatenate([columns[into_city], columns[from_city]]),
+                            np.concatenate([ones[into_city], -ones[from_city]]),
+                            LpConstraintEQ, 0,
+                            [f"Flow_Constraint_{j}_Salesman_{k}" for k in range(1, num_salesmen+1) for j in cities])
+
+    # 5. Subtour elimination constraints (Miller-Tucker-Zemlin (MTZ) formulation):
+    #    u_i - u_j + n * sum_k x[i, j, k] <= n - 1 for i, j >= 2, with one row per pair (i, j)
+    pairs = [(i, j) for i in range(2, n+1) for j in range(2, n+1) if i != j]
+    pair_i, pair_j = np.array(pairs, dtype=int).reshape(-1, 2).T
+    pair_row = lambda i, j: (i - 2) * (n - 2) + j - 2 - (j > i)
+    between = (first >= 2) & (second >= 2)
+    u_columns = len(variables) - 1  # Column of u_i is u_columns + i
+    add_constraints_in_bulk(tsp, variables + list(u.values()),
+                            np.concatenate([pair_row(pair_i, pair_j), pair_row(pair_i, pair_j),
+                                            pair_row(first[between], second[between])]),
+                            np.concatenate([u_columns + pair_i, u_columns + pair_j, columns[between]]),
+                            np.concatenate([np.ones(len(pairs), dtype=int), -np.ones(len(pairs), dtype=int), n * ones[between]]),
+                            LpConstraintLE, n - 1, [f"Subtour_Elimination_{i}_{j}" for i, j in pairs])
+
+    if warm_start is not None:
+        # Seed the warm start routes: x[i, j, k] = 1 on the route of salesman k and u_i is the position of city i on its route
+        route_arcs, positions = routes_to_arcs(warm_start, n, num_salesmen, depot)
+        for key, var in x.items():
+            var.setInitialValue(1 if key in route_arcs else 0)
+        for i, var in u.items():
+            var.setInitialValue(positions.get(i, 0))
+
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
 
-    # 4. Flow conservation: If a salesman enters a city, they must leave it
-    for k in range(1, num_salesmen+1):
-        for j in range(1, n+1):
-            if j != depot:
-                tsp += lpSum(x[i, j, k] for i in range(1, n+1) if i != j) == lpSum(x[j, m, k] for m in range(1, n+1) if j != m), f"Flow_Constraint_{j}_Salesman_{k}"
+    # Solve the problem
+    status, bound, gap = solve_with_limits(tsp, time_limit, mip_gap, threads, warm_start=warm_start is not None, msg=msg)
 
-    # 5. Subtour elimination constraints (Miller-Tucker-Zemlin (MTZ) formulation)
-    for i in range(2, n+1):
-        for j in range(2, n+1):
-            if i != j:
-                tsp += u[i] - u[j] + n * lpSum(x[i, j, k] for k in range(1, num_salesmen+1)) <= n - 1, f"Subtour_Elimination_{i}_{j}"
+    solve_time = time.perf_counter() - solve_start
 
-    # Solve the problem
-    tsp.solve()
+    # Optionally print the full model (for debugging or analysis)
+    if show_model:
+        print("\nModel Summary:\n")
+        print(tsp)
 
-    # Retrieve and print the solution if it's optimal
-    if tsp.status == LpStatusOptimal:
+    # Retrieve the solution if it's optimal, or the best one found if the search stopped early
+    if status in ("Optimal", "Feasible"):
         # Dictionary to store the route for each salesman
         routes = {k: [] for k in range(1, num_salesmen+1)}
         # Dictionary to store the total distance for each salesman
@@ -226,7 +183,7 @@ def solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route
             current_city = depot  # Start at the depot
             while True:
                 for j in range(1, n+1):
-                    if current_city != j and value(x[current_city, j, k]) == 1:
+                    if current_city != j and value(x[current_city, j, k]) > 0.5:
                         routes[k].append((current_city, j))  # Add the route segment
                         total_distances[k] += distance_matrix[current_city-1][j-1]  # Add the distance for this segment
                         current_city = j  # Move to the next city
@@ -234,25 +191,183 @@ def solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route
                 if current_city == depot:  # Stop when we return to the depot
                     break
 
-        # Print the results
-        print("Optimal Total Distance:", value(tsp.objective), "\n")
-        for k, route in routes.items():
-            print(f"Salesman {k} Route:", route)
-            print(f"Salesman {k} Specific Distance: {total_distances[k]}")
-
-        # Optionally print the full model (for debugging or analysis)
-        if show_model:
-            print("\nModel Summary:\n")
-            print(tsp)
+        result = MTSPResult(routes, value(tsp.objective), total_distances, bound, gap, status, build_time, solve_time)
 
         # Optionally plot the routes for visualization
         if show_route:
-            for k, route in routes.items():
-                plot_optimal_route_linear(route, total_distances[k], salesman_id=k)
+            plot_optimal_routes(result)
+
+        return result
 
     else:
-        # Print an error message if no optimal solution is found
+        return MTSPResult(None, None, None, None, None, status, build_time, solve_time)
+
+
+def print_result(result):
+    """
+    Prints a Multi-TSP result: the build and solve times, the total distance (with the bound and gap when
+    not optimal) and the route and distance of every salesman.
+
+    Parameters:
+    - result (MTSPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.routes is None:
         print("No optimal solution found.")
+        return
+
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+    else:
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    for k, route in result.routes.items():
+        print(f"Salesman {k} Route:", route)
+        print(f"Salesman {k} Specific Distance: {result.route_distances[k]}")
+
+def plot_optimal_routes(result):
+    """
+    Plots the route of every salesman of a Multi-TSP result in a line.
+
+    Parameters:
+    - result (MTSPResult): The result returned by the solver.
+    """
+    for k, route in result.routes.items():
+        plot_optimal_route_linear(route, result.route_distances[k], salesman_id=k)
+
+def add_constraints_in_bulk(problem, variables, rows, columns, coefficients, sense, rhs, names):
+    """
+    Add a block of linear constraints to a PuLP problem from NumPy coefficient arrays.
+
+    The block is given in coordinate form: term t adds coefficients[t] * variables[columns[t]] to
+    constraint rows[t]. The terms are grouped by constraint with a single stable sort and every
+    constraint is built directly from (variable, coefficient) pairs, instead of summing products
+    of variables and coefficients with lpSum.
+
+    Parameters:
+    - problem (LpProblem): The problem to add the constraints to.
+    - variables (list): Decision variables, indexed by the column numbers.
+    - rows (numpy array): Constraint (0-based, in the order of names) of every term.
+    - columns (numpy array): Variable of every term.
+    - coefficients (numpy array): Coefficient of every term.
+    - sense (int): LpConstraintEQ, LpConstraintLE or LpConstraintGE, shared by the whole block.
+    - rhs (number or list): Right-hand side of the constraints, one value for all or one per constraint.
+    - names (list): Name of every constraint.
+    """
+    if not isinstance(rhs, list):
+        rhs = [rhs] * len(names)
+
+    order = np.argsort(rows, kind="stable")
+    bounds = np.searchsorted(rows[order], np.arange(len(names) + 1)).tolist()
+    terms = list(zip([variables[c] for c in columns[order].tolist()], coefficients[order].tolist()))
+    for r, name in enumerate(names):
+        problem.addConstraint(LpConstraint(LpAffineExpression(terms[bounds[r]:bounds[r + 1]]), sense, name, rhs[r]))
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def solve_with_limits(problem, time_limit=None, mip_gap=None, threads=None, warm_start=False, msg=True):
+    """
+    Solve a PuLP problem with CBC under an optional time limit and relative MIP gap, keeping the best
+    solution found when the solver stops early.
+
+    Parameters:
+    - problem (LpProblem): The problem to solve.
+    - time_limit (float): Time limit in seconds. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - warm_start (bool): Start from the initial values of the variables. Defaults to False.
+    - msg (bool): Show the solver log. Defaults to True.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the time
+      limit before any solution was found), or the PuLP status otherwise, e.g., "Infeasible".
+    - bound (float): Best bound on the objective value (None without a solution).
+    - gap (float): Relative gap between the objective value and the bound (None without a solution).
+    """
+    # CBC only reports the bound in its log, so the log goes to a temporary file when the search can stop early
+    log_path = None
+    if time_limit is not None or mip_gap is not None:
+        handle, log_path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+
+    solve_start = time.perf_counter()
+    problem.solve(PULP_CBC_CMD(msg=msg and log_path is None, timeLimit=time_limit, gapRel=mip_gap, threads=threads,
+                               warmStart=warm_start, logPath=log_path))
+
+    log = ""
+    if log_path is not None:
+        with open(log_path) as file:
+            log = file.read()
+        os.remove(log_path)
+        if msg:
+            print(log)
+
+    if problem.sol_status not in (LpSolutionOptimal, LpSolutionIntegerFeasible):
+        # Stopped on the time limit without an integer solution, PuLP reports whatever status the unfinished
+        # search left in the solution file, which can be "Infeasible" for a feasible problem
+        if "Stopped on time" in log or (time_limit is not None and time.perf_counter() - solve_start >= time_limit):
+            return "Time Limit", None, None
+        return LpStatus[problem.status], None, None
+
+    objective = value(problem.objective)
+    match = re.search(r"^(?:Lower|Upper) bound:\s+(\S+)", log, re.MULTILINE)
+    bound = float(match.group(1)) if match else objective
+    gap = abs(objective - bound) / max(abs(objective), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal" in CBC, but the solution is only known to be within the gap
+    optimal = problem.sol_status == LpSolutionOptimal and (mip_gap is None or gap <= 1e-9)
+    return ("Optimal" if optimal else "Feasible"), bound, gap
+
+def routes_to_arcs(routes, n, num_salesmen, depot):
+    """
+    Convert warm start routes into the arcs used by every salesman.
+
+    Parameters:
+    - routes (list of lists): One route per salesman (1-based index), starting and ending at the depot.
+    - n (int): Number of cities.
+    - num_salesmen (int): Number of salesmen.
+    - depot (int): Depot city.
+
+    Returns:
+    - route_arcs (set): Arcs (i, j, k) where salesman k travels from city i to city j.
+    - positions (dict): Position of every city on its route (1 for the first city after the depot).
+    """
+    if len(routes) != num_salesmen:
+        raise ValueError(f"The warm start needs one route per salesman ({num_salesmen}), got {len(routes)}.")
+    route_arcs = set()
+    positions = {}
+    for k, route in enumerate(routes, 1):
+        if len(route) < 3 or route[0] != depot or route[-1] != depot:
+            raise ValueError("Every warm start route must visit at least one city and start and end at the depot.")
+        route_arcs.update((i, j, k) for i, j in zip(route, route[1:]))
+        for position, city in enumerate(route[1:-1], 1):
+            positions[city] = position
+    if sorted(city for route in routes for city in route[1:-1]) != [j for j in range(1, n+1) if j != depot]:
+        raise ValueError("The warm start routes must visit every city except the depot exactly once.")
+    return route_arcs, positions
 
 
 def plot_optimal_route_linear(optimal_tour, total_distance, salesman_id=1):
@@ -264,6 +379,9 @@ def plot_optimal_route_linear(optimal_tour, total_distance, salesman_id=1):
     - total_distance (float): Total distance of the optimal tour for this specific salesman.
     - salesman_id (int): Identifier for the salesman.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     # Extract the order of cities from the optimal tour
     ordered_cities = [optimal_tour[0][0]]  # Start with the first city in the tour
     for _, next_city in optimal_tour:
@@ -307,4 +425,5 @@ if __name__ == "__main__":
         [31, 40, 25, 35, 30, 0]
     ]
     num_salesmen = 3
-    solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route=True, show_model=False)
\ No newline at end of file
+    result = solve_multi_tsp_with_pulp(distance_matrix, num_salesmen, depot=1, show_route=True, show_model=False)
+    print_result(result)
\ No newline at end of file
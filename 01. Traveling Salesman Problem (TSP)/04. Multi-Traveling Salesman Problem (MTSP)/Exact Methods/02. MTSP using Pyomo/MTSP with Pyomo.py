@@ -10,19 +10,77 @@ Original file is located at
 #!pip install pyomo
 #!apt-get install -y -qq glpk-utils
 from pyomo.environ import *
-import matplotlib.pyplot as plt
+from pyomo.opt import SolutionStatus
 import numpy as np
+import math
+import time
 
-def solve_multi_tsp_with_pyomo(distance_matrix, num_salesmen, depot=1, show_route=True):
+# Names of the relative MIP gap and thread count options of the supported solvers
+MIP_GAP_OPTIONS = {"glpk": "mipgap", "cbc": "ratioGap", "gurobi": "MIPGap"}
+THREADS_OPTIONS = {"cbc": "threads", "gurobi": "Threads"}
+
+class MTSPResult:
+    """
+    Result of a Multi-TSP solver. It unpacks like a tuple: routes, total_distance, bound, gap = result.
+
+    Attributes:
+    - routes (dict): Route of every salesman as a list of (i, j) tuples, keyed by salesman (1-based), or None if no
+      solution was found.
+    - total_distance (float): Total distance of all routes.
+    - route_distances (dict): Distance of every salesman's route, keyed by salesman.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the solver status otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("routes", "total_distance", "route_distances", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, routes, total_distance, route_distances, bound, gap, status, build_time, solve_time):
+        self.routes = routes
+        self.total_distance = total_distance
+        self.route_distances = route_distances
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.routes, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"MTSPResult(total_distance={self.total_distance!r}, routes={self.routes!r}, bound={self.bound!r}, "
+                f"gap={self.gap!r}, status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
+
+def solve_multi_tsp_with_pyomo(distance_matrix, num_salesmen, depot=1, show_route=False, time_limit=None, mip_gap=None,
+                               threads=None):
     """
     Solve the Multi-Traveling Salesman Problem (MTSP) using Pyomo.
 
     Parameters:
-    - distance_matrix (2D list or numpy array): Matrix of distances between cities.
+    - distance_matrix (2D list or numpy array): Matrix of distances between cities, or its upper triangle as a
+      condensed 1D array.
     - num_salesmen (int): Number of salesmen available.
     - depot (int): Starting city for all salesmen (default is 1, indexed from 1).
-    - show_route (bool): If True, displays a plot of the optimal routes. Defaults to True.
+    - show_route (bool): If True, displays a plot of the optimal routes. Defaults to False.
+    - time_limit (float): Time limit in seconds. When it is reached, the best routes found so far are reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the solver stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads, for solvers that support it (not GLPK). Defaults to None (solver default).
+
+    Returns:
+    - result (MTSPResult): The route of every salesman as a list of (i, j) tuples, keyed by salesman, the total
+      distance, the distance of every route, the best bound (None if the solver does not report it), the gap,
+      the status and the build and solve times. It unpacks like the tuple (routes, total_distance, bound, gap).
+      Without a solution, the routes and the distances are None.
     """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix).tolist()
+
+    build_start = time.perf_counter()
+
     # Number of cities
     n = len(distance_matrix)
 
@@ -82,10 +140,16 @@ def solve_multi_tsp_with_pyomo(distance_matrix, num_salesmen, depot=1, show_rout
             return Constraint.Skip
     model.SubtourEliminationConstraint = Constraint(model.CITIES, model.CITIES, rule=subtour_elimination_constraint)
 
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
     # Solve the model
-    result = SolverFactory('glpk').solve(model)
+    status, bound, gap = solve_with_limits(SolverFactory('glpk'), model, time_limit, mip_gap, threads)
+    solve_time = time.perf_counter() - solve_start
+    if status not in ("Optimal", "Feasible"):
+        return MTSPResult(None, None, None, None, None, status, build_time, solve_time)
 
-    # Extract and display the results
+    # Extract the routes
     routes = {k: [] for k in model.SALESMEN}
     total_distances = {k: 0 for k in model.SALESMEN}
 
@@ -93,7 +157,7 @@ def solve_multi_tsp_with_pyomo(distance_matrix, num_salesmen, depot=1, show_rout
         current_city = depot
         while True:
             for j in model.CITIES:
-                if current_city != j and model.x[current_city, j, k].value == 1:
+                if current_city != j and value(model.x[current_city, j, k]) > 0.5:
                     routes[k].append((current_city, j))
                     total_distances[k] += distance_matrix[current_city-1][j-1]
                     current_city = j
@@ -101,16 +165,121 @@ def solve_multi_tsp_with_pyomo(distance_matrix, num_salesmen, depot=1, show_rout
             if current_city == depot:
                 break
 
-    # Print the results
-    print("Optimal Total Distance:", sum(total_distances[k] for k in model.SALESMEN), "\n")
-    for k in model.SALESMEN:
-        print(f"Salesman {k} Route: {routes[k]}")
-        print(f"Salesman {k} Specific Distance: {total_distances[k]}")
+    total_distance = sum(total_distances[k] for k in model.SALESMEN)
+    result = MTSPResult(routes, total_distance, total_distances, bound, gap, status, build_time, solve_time)
 
     # Plot the routes if enabled
     if show_route:
-        for k, route in routes.items():
-            plot_optimal_route_linear(route, total_distances[k], salesman_id=k)
+        plot_optimal_routes(result)
+
+    return result
+
+
+def print_result(result):
+    """
+    Prints a Multi-TSP result: the build and solve times, the total distance (with the bound and gap when
+    not optimal) and the route and distance of every salesman.
+
+    Parameters:
+    - result (MTSPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.routes is None:
+        print("No optimal solution found.")
+        return
+
+    if result.status == "Optimal":
+        print("Optimal Total Distance:", result.total_distance, "\n")
+    else:
+        print("Best Total Distance Found:", result.total_distance, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    for k, route in result.routes.items():
+        print(f"Salesman {k} Route:", route)
+        print(f"Salesman {k} Specific Distance: {result.route_distances[k]}")
+
+def plot_optimal_routes(result):
+    """
+    Plots the route of every salesman of a Multi-TSP result in a line.
+
+    Parameters:
+    - result (MTSPResult): The result returned by the solver.
+    """
+    for k, route in result.routes.items():
+        plot_optimal_route_linear(route, result.route_distances[k], salesman_id=k)
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def solve_with_limits(solver, model, time_limit=None, mip_gap=None, threads=None, warmstart=False):
+    """
+    Solve a Pyomo model under an optional time limit and relative MIP gap, keeping the best solution
+    found when the solver stops early.
+
+    Parameters:
+    - solver: Solver created with SolverFactory.
+    - model (ConcreteModel): The model to solve, with a single active objective.
+    - time_limit (float): Time limit in seconds (rounded up to whole seconds). Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads, if the solver supports it. Defaults to None.
+    - warmstart (bool): Start from the current values of the variables. Defaults to False.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition
+      otherwise, e.g., "infeasible".
+    - bound (float): Best bound on the objective value (None if unknown).
+    - gap (float): Relative gap between the objective value and the bound (None if unknown).
+    """
+    if mip_gap is not None and solver.name in MIP_GAP_OPTIONS:
+        solver.options[MIP_GAP_OPTIONS[solver.name]] = mip_gap
+    if threads is not None and solver.name in THREADS_OPTIONS:
+        solver.options[THREADS_OPTIONS[solver.name]] = threads
+    options = {"warmstart": True} if warmstart else {}
+    if time_limit is not None:
+        options["timelimit"] = max(1, math.ceil(time_limit))
+
+    result = solver.solve(model, load_solutions=False, **options)
+    if len(result.solution) == 0 or result.solution(0).status not in (
+            SolutionStatus.optimal, SolutionStatus.feasible, SolutionStatus.stoppedByLimit, SolutionStatus.bestSoFar):
+        return str(result.solver.termination_condition), None, None
+    model.solutions.load_from(result)
+
+    objective = next(model.component_data_objects(Objective, active=True))
+    objective_value = value(objective)
+    optimal = result.solver.termination_condition == TerminationCondition.optimal
+    bound = result.problem.lower_bound if objective.sense == minimize else result.problem.upper_bound
+    if bound is None or not math.isfinite(bound):
+        bound = objective_value if optimal else None
+    elif objective.sense == maximize and bound < objective_value - 1e-6 * max(1.0, abs(objective_value)):
+        # Pyomo's CBC interface can report the bound of a maximization with the sign of CBC's internal minimization
+        bound = -bound if -bound >= objective_value else None
+    gap = None if bound is None else abs(objective_value - bound) / max(abs(objective_value), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal", but the solution is only known to be within the gap
+    if mip_gap is not None and (gap is None or gap > 1e-9):
+        optimal = False
+    return ("Optimal" if optimal else "Feasible"), bound, gap
 
 
 def plot_optimal_route_linear(optimal_tour, total_distance, salesman_id=1):
@@ -122,6 +291,9 @@ def plot_optimal_route_linear(optimal_tour, total_distance, salesman_id=1):
     - total_distance (float): Total distance of the optimal tour for this specific salesman.
     - salesman_id (int): Identifier for the salesman.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     # Extract the order of cities from the optimal tour
     ordered_cities = [optimal_tour[0][0]]  # Start with the first city in the tour
     for _, next_city in optimal_tour:
@@ -165,4 +337,5 @@ if __name__ == "__main__":
         [31, 40, 25, 35, 30, 0]
     ]
     num_salesmen = 3
-    solve_multi_tsp_with_pyomo(distance_matrix, num_salesmen, depot=1, show_route=True)
\ No newline at end of file
+    result = solve_multi_tsp_with_pyomo(distance_matrix, num_salesmen, depot=1, show_route=True)
+    print_result(result)
\ No newline at end of file
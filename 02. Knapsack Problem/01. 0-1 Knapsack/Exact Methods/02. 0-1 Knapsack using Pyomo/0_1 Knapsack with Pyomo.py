@@ -9,23 +9,83 @@ Original file is located at
 
 # !pip install pyomo
 # !apt-get install -y -qq glpk-utils
-import matplotlib.pyplot as plt
 from pyomo.environ import *
+from pyomo.opt import SolutionStatus
+import numpy as np
+import math
+import time
 
-def solve_0_1knapsack_with_pyomo(values, weights, max_weight, show_plot=True):
+# Instances with integer weights and at most this many items x capacities are solved with dynamic programming
+DP_MAX_CELLS = 50_000_000
+
+# Names of the relative MIP gap and thread count options of the supported solvers
+MIP_GAP_OPTIONS = {"glpk": "mipgap", "cbc": "ratioGap", "gurobi": "MIPGap"}
+THREADS_OPTIONS = {"cbc": "threads", "gurobi": "Threads"}
+
+class KnapsackResult:
+    """
+    Result of a knapsack solver. It unpacks like a tuple: selected_items, total_value, bound, gap = result.
+
+    Attributes:
+    - selected_items (list of int): Selected items (indexed from 1), or None if no solution was found.
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - bound (float): Best upper bound on the optimal total value (None if the solver does not report it).
+    - gap (float): Relative gap between total_value and bound (0 when optimal, None if unknown).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition otherwise.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "bound", "gap", "status", "solve_time")
+
+    def __init__(self, selected_items, total_value, total_weight, bound, gap, status, solve_time):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"selected_items={self.selected_items!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+def solve_0_1knapsack_with_pyomo(values, weights, max_weight, show_plot=False, time_limit=None, mip_gap=None, threads=None, dp_max_cells=DP_MAX_CELLS):
     """
-    Solve the 0/1 Knapsack Problem using Pyomo and plot the results.
+    Solve the 0/1 Knapsack Problem using Pyomo.
 
     Parameters:
     - values (list of floats): List of item values.
     - weights (list of floats): List of item weights.
     - max_weight (float): Maximum weight capacity of the knapsack.
-    - show_plot (bool): If True, displays a bar plot of selected and unselected items.
-    """
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+    - time_limit (float): Time limit in seconds. When it is reached, the best selection found so far is reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the solver stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads, for solvers that support it (not GLPK). Defaults to None (solver default).
+    - dp_max_cells (int): Instances with non-negative integer weights and at most this many items x capacities
+      are solved in process with dynamic programming, which takes milliseconds where building the model and
+      starting the MIP solver takes far longer. The other options are then ignored, except show_plot. Set it to 0 to
+      always use the MIP solver. Defaults to DP_MAX_CELLS (50 million).
 
+    Returns:
+    - result (KnapsackResult): The selected items, their total value and weight, the bound, the gap, the
+      status and the solve time. It unpacks like the tuple (selected_items, total_value, bound, gap).
+    """
     # Get the number of items
     n = len(values)
 
+    # Integer weights with a moderate capacity are solved exactly without building a model
+    capacity = dynamic_programming_capacity(weights, max_weight)
+    if capacity is not None and n * (capacity + 1) <= dp_max_cells:
+        return solve_0_1knapsack_with_dynamic_programming(values, weights, max_weight, show_plot)
+
+    solve_start = time.perf_counter()
+
     # Initialize the model
     model = ConcreteModel()
 
@@ -47,23 +107,197 @@ def solve_0_1knapsack_with_pyomo(values, weights, max_weight, show_plot=True):
 
     # Solve the model using the GLPK solver (ensure GLPK is installed)
     solver = SolverFactory('glpk')
-    result = solver.solve(model)
+    status, bound, gap = solve_with_limits(solver, model, time_limit, mip_gap, threads)
 
-    # Retrieve and print the solution
-    if result.solver.status == SolverStatus.ok and result.solver.termination_condition == TerminationCondition.optimal:
-        selected_items = [i for i in model.item_set if value(model.x[i]) == 1]
-        total_value = value(model.obj)
-        total_weight = sum(model.item_weights[i] * value(model.x[i]) for i in model.item_set)
+    # Retrieve the solution
+    if status not in ("Optimal", "Feasible"):
+        return KnapsackResult(None, None, None, None, None, status, time.perf_counter() - solve_start)
 
-        print("Optimal Total Value:", total_value, "\n")
-        print("Total Weight of Selected Items:", total_weight, "\n")
-        print("Selected Items:", [i for i in selected_items], "\n")  # Indexes starting from 1
+    selected_items = [i for i in model.item_set if value(model.x[i]) > 0.5]  # Indexes starting from 1
+    total_value = value(model.obj)
+    total_weight = sum(model.item_weights[i] for i in selected_items)
+    result = KnapsackResult(selected_items, total_value, total_weight, bound, gap, status, time.perf_counter() - solve_start)
 
-        # Plot the results if show_plot is set to True
-        if show_plot:
-            plot_knapsack_solution(values, weights, selected_items)
-    else:
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(values, weights, selected_items)
+
+    return result
+
+def solve_0_1knapsack_with_dynamic_programming(values, weights, max_weight, show_plot=False):
+    """
+    Solve the 0/1 Knapsack Problem exactly with dynamic programming over the capacities.
+
+    best[c] is the highest total value of the items seen so far with a total weight of at most c. Item i
+    with weight w and value v updates every capacity at once:
+
+        best[c] = max(best[c], best[c - w] + v)    for c = w, ..., W
+
+    The table is a single NumPy array of W + 1 values that is overwritten item by item. Whether item i
+    improved capacity c is kept as one bit, so the decision table takes n(W + 1) bits. It takes O(nW)
+    time, so instances with integer weights and a moderate capacity are solved in milliseconds, without
+    building a model or starting a solver.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of ints): List of item weights, non-negative integers (integral floats are accepted).
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+
+    Returns:
+    - result (KnapsackResult): The selected items, their total value and weight, the bound (equal to the total
+      value), the gap (always 0), the status and the solve time. It unpacks like the tuple
+      (selected_items, total_value, bound, gap).
+    """
+    capacity = dynamic_programming_capacity(weights, max_weight)
+    if capacity is None:
+        raise ValueError("Dynamic programming needs non-negative integer weights and a non-negative capacity.")
+
+    solve_start = time.perf_counter()
+    selected = knapsack_dynamic_programming(values, weights, capacity)
+
+    selected_items = [i + 1 for i in selected]  # Indexes starting from 1
+    total_value = sum(values[i] for i in selected)
+    total_weight = sum(weights[i] for i in selected)
+    result = KnapsackResult(selected_items, total_value, total_weight, total_value, 0.0, "Optimal",
+                            time.perf_counter() - solve_start)
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(values, weights, selected_items)
+
+    return result
+
+def knapsack_dynamic_programming(values, weights, capacity):
+    """
+    Find an optimal selection with the dynamic program over a rolling NumPy array of capacities.
+
+    The decisions of item i are packed with np.packbits into row i of a uint8 table, so the table takes
+    n * ceil((capacity + 1) / 8) bytes. The selection is read back from the last item to the first,
+    starting at the full capacity.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of ints): List of item weights, non-negative integers.
+    - capacity (int): Capacity of the knapsack.
+
+    Returns:
+    - selected (list of int): Indices of the selected items (0-based), in increasing order.
+    """
+    n = len(values)
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights).astype(np.int64)
+
+    best = np.zeros(capacity + 1)
+    improved = np.zeros(capacity + 1, dtype=bool)  # Decisions of the current item, before packing
+    decisions = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+
+    for i in range(n):
+        w, v = int(weights[i]), values[i]
+        # Items heavier than the knapsack and items without value are never selected
+        if w > capacity or v <= 0:
+            continue
+        # The right-hand side is a new array, so every capacity sees best from before item i
+        candidates = best[:capacity + 1 - w] + v
+        np.greater(candidates, best[w:], out=improved[w:])
+        np.maximum(best[w:], candidates, out=best[w:])
+        decisions[i] = np.packbits(improved)
+        improved[w:] = False
+
+    # Walk back from the full capacity: item i is selected where it improved the remaining capacity
+    selected = []
+    c = capacity
+    for i in range(n - 1, -1, -1):
+        if decisions[i, c >> 3] >> (7 - (c & 7)) & 1:
+            selected.append(i)
+            c -= int(weights[i])
+    return selected[::-1]
+
+def dynamic_programming_capacity(weights, max_weight):
+    """
+    Return the capacity to use in the dynamic program, or None if the weights are not integral.
+
+    Parameters:
+    - weights (list of floats): List of item weights.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+
+    Returns:
+    - capacity (int): max_weight rounded down, or None if a weight is negative or not an integer, or if
+      max_weight is negative.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if max_weight < 0 or (weights < 0).any() or (weights != np.floor(weights)).any():
+        return None
+    # A capacity above the total weight is never binding
+    return int(min(np.floor(max_weight), weights.sum()))
+
+def print_result(result):
+    """
+    Prints a knapsack result: the total value (with the bound and gap when not optimal), the total weight
+    and the selected items.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    if result.selected_items is None:
         print("No optimal solution found.")
+        return
+
+    if result.status == "Optimal":
+        print("Optimal Total Value:", result.total_value, "\n")
+    else:
+        print("Best Total Value Found:", result.total_value, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items:", result.selected_items, "\n")
+
+def solve_with_limits(solver, model, time_limit=None, mip_gap=None, threads=None, warmstart=False):
+    """
+    Solve a Pyomo model under an optional time limit and relative MIP gap, keeping the best solution
+    found when the solver stops early.
+
+    Parameters:
+    - solver: Solver created with SolverFactory.
+    - model (ConcreteModel): The model to solve, with a single active objective.
+    - time_limit (float): Time limit in seconds (rounded up to whole seconds). Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads, if the solver supports it. Defaults to None.
+    - warmstart (bool): Start from the current values of the variables. Defaults to False.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition
+      otherwise, e.g., "infeasible".
+    - bound (float): Best bound on the objective value (None if unknown).
+    - gap (float): Relative gap between the objective value and the bound (None if unknown).
+    """
+    if mip_gap is not None and solver.name in MIP_GAP_OPTIONS:
+        solver.options[MIP_GAP_OPTIONS[solver.name]] = mip_gap
+    if threads is not None and solver.name in THREADS_OPTIONS:
+        solver.options[THREADS_OPTIONS[solver.name]] = threads
+    options = {"warmstart": True} if warmstart else {}
+    if time_limit is not None:
+        options["timelimit"] = max(1, math.ceil(time_limit))
+
+    result = solver.solve(model, load_solutions=False, **options)
+    if len(result.solution) == 0 or result.solution(0).status not in (
+            SolutionStatus.optimal, SolutionStatus.feasible, SolutionStatus.stoppedByLimit, SolutionStatus.bestSoFar):
+        return str(result.solver.termination_condition), None, None
+    model.solutions.load_from(result)
+
+    objective = next(model.component_data_objects(Objective, active=True))
+    objective_value = value(objective)
+    optimal = result.solver.termination_condition == TerminationCondition.optimal
+    bound = result.problem.lower_bound if objective.sense == minimize else result.problem.upper_bound
+    if bound is None or not math.isfinite(bound):
+        bound = objective_value if optimal else None
+    elif objective.sense == maximize and bound < objective_value - 1e-6 * max(1.0, abs(objective_value)):
+        # Pyomo's CBC interface can report the bound of a maximization with the sign of CBC's internal minimization
+        bound = -bound if -bound >= objective_value else None
+    gap = None if bound is None else abs(objective_value - bound) / max(abs(objective_value), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal", but the solution is only known to be within the gap
+    if mip_gap is not None and (gap is None or gap > 1e-9):
+        optimal = False
+    return ("Optimal" if optimal else "Feasible"), bound, gap
 
 def plot_knapsack_solution(values, weights, selected_items):
     """
@@ -72,8 +306,11 @@ def plot_knapsack_solution(values, weights, selected_items):
     Parameters:
     - values (list of floats): List of item values.
     - weights (list of floats): List of item weights.
-    - selected_items (list of int): Indices of selected items.
+    - selected_items (list of int): Indices of selected items (indexed from 1).
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     n = len(values)
     item_indices = list(range(1, n + 1))  # Start items from index 1
 
@@ -105,4 +342,5 @@ if __name__ == "__main__":
     weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
     max_weight = 100
 
-    solve_0_1knapsack_with_pyomo(values, weights, max_weight, show_plot=True)
\ No newline at end of file
+    result = solve_0_1knapsack_with_pyomo(values, weights, max_weight, show_plot=True)
+    print_result(result)
@@ -0,0 +1,210 @@
+import numpy as np
+import time
+
+# Largest decision table (items x capacities) the dynamic program is meant for: 2 billion bits take 250 MB
+DP_MAX_CELLS = 2_000_000_000
+
+class KnapsackResult:
+    """
+    Result of a knapsack solver. It unpacks like a tuple: selected_items, total_value, bound, gap = result.
+
+    Attributes:
+    - selected_items (list of int): Selected items (indexed from 1).
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - bound (float): Best upper bound on the optimal total value.
+    - gap (float): Relative gap between total_value and bound (0 when optimal).
+    - status (str): "Optimal".
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "bound", "gap", "status", "solve_time")
+
+    def __init__(self, selected_items, total_value, total_weight, bound, gap, status, solve_time):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"selected_items={self.selected_items!r}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+def solve_0_1knapsack_with_dynamic_programming(values, weights, max_weight, show_plot=False):
+    """
+    Solve the 0/1 Knapsack Problem exactly with dynamic programming over the capacities.
+
+    best[c] is the highest total value of the items seen so far with a total weight of at most c. Item i
+    with weight w and value v updates every capacity at once:
+
+        best[c] = max(best[c], best[c - w] + v)    for c = w, ..., W
+
+    The table is a single NumPy array of W + 1 values that is overwritten item by item. Whether item i
+    improved capacity c is kept as one bit, so the decision table takes n(W + 1) bits. It takes O(nW)
+    time, so instances with integer weights and a moderate capacity are solved in milliseconds, without
+    building a model or starting a solver.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of ints): List of item weights, non-negative integers (integral floats are accepted).
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+
+    Returns:
+    - result (KnapsackResult): The selected items, their total value and weight, the bound (equal to the total
+      value), the gap (always 0), the status and the solve time. It unpacks like the tuple
+      (selected_items, total_value, bound, gap).
+    """
+    capacity = dynamic_programming_capacity(weights, max_weight)
+    if capacity is None:
+        raise ValueError("Dynamic programming needs non-negative integer weights and a non-negative capacity.")
+    if len(values) * (capacity + 1) > DP_MAX_CELLS:
+        raise ValueError(f"Dynamic programming needs O(nW) time and memory, use it for at most {DP_MAX_CELLS} items x capacities.")
+
+    solve_start = time.perf_counter()
+    selected = knapsack_dynamic_programming(values, weights, capacity)
+
+    selected_items = [i + 1 for i in selected]  # Indexes starting from 1
+    total_value = sum(values[i] for i in selected)
+    total_weight = sum(weights[i] for i in selected)
+    result = KnapsackResult(selected_items, total_value, total_weight, total_value, 0.0, "Optimal",
+                            time.perf_counter() - solve_start)
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(values, weights, selected_items)
+
+    return result
+
+def knapsack_dynamic_programming(values, weights, capacity):
+    """
+    Find an optimal selection with the dynamic program over a rolling NumPy array of capacities.
+
+    The decisions of item i are packed with np.packbits into row i of a uint8 table, so the table takes
+    n * ceil((capacity + 1) / 8) bytes. The selection is read back from the last item to the first,
+    starting at the full capacity.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of ints): List of item weights, non-negative integers.
+    - capacity (int): Capacity of the knapsack.
+
+    Returns:
+    - selected (list of int): Indices of the selected items (0-based), in increasing order.
+    """
+    n = len(values)
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights).astype(np.int64)
+
+    best = np.zeros(capacity + 1)
+    improved = np.zeros(capacity + 1, dtype=bool)  # Decisions of the current item, before packing
+    decisions = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+
+    for i in range(n):
+        w, v = int(weights[i]), values[i]
+        # Items heavier than the knapsack and items without value are never selected
+        if w > capacity or v <= 0:
+            continue
+        # The right-hand side is a new array, so every capacity sees best from before item i
+        candidates = best[:capacity + 1 - w] + v
+        np.greater(candidates, best[w:], out=improved[w:])
+        np.maximum(best[w:], candidates, out=best[w:])
+        decisions[i] = np.packbits(improved)
+        improved[w:] = False
+
+    # Walk back from the full capacity: item i is selected where it improved the remaining capacity
+    selected = []
+    c = capacity
+    for i in range(n - 1, -1, -1):
+        if decisions[i, c >> 3] >> (7 - (c & 7)) & 1:
+            selected.append(i)
+            c -= int(weights[i])
+    return selected[::-1]
+
+def dynamic_programming_capacity(weights, max_weight):
+    """
+    Return the capacity to use in the dynamic program, or None if the weights are not integral.
+
+    Parameters:
+    - weights (list of floats): List of item weights.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+
+    Returns:
+    - capacity (int): max_weight rounded down, or None if a weight is negative or not an integer, or if
+      max_weight is negative.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if max_weight < 0 or (weights < 0).any() or (weights != np.floor(weights)).any():
+        return None
+    # A capacity above the total weight is never binding
+    return int(min(np.floor(max_weight), weights.sum()))
+
+def print_result(result):
+    """
+    Prints a knapsack result: the total value, the total weight and the selected items.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    print("Optimal Total Value:", result.total_value, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items:", result.selected_items, "\n")
+
+def plot_knapsack_solution(values, weights, selected_items):
+    """
+    Plots the selected and unselected items in the knapsack problem, showing value-to-weight ratios.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights.
+    - selected_items (list of int): Indices of selected items (indexed from 1).
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    n = len(values)
+    item_indices = list(range(1, n + 1))  # Start items from index 1
+
+    # Calculate value-to-weight ratios
+    ratios = [values[i] / weights[i] for i in range(n)]
+
+    # Define colors for selected vs. unselected items
+    colors = ['#afd30b' if (i + 1) in selected_items else '#d30b32' for i in range(n)]
+
+    # Create the bar plot
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Plot the value-to-weight ratio
+    ax.bar(item_indices, ratios, color=colors)
+    ax.set_xticks(item_indices)  # Ensure x-axis has sequential indices (1, 2, 3, ...)
+    ax.set_xlabel("Item Index")
+    ax.set_ylabel("Value-to-Weight Ratio", color='black')
+    ax.set_title("Knapsack Solution: Value-to-Weight Ratios (Green = Selected, Red = Unselected)")
+
+    # Display value and weight on each bar
+    for i in range(n):
+        ax.text(item_indices[i], ratios[i] + 0.1, f"V:{values[i]} W:{weights[i]}", ha='center', fontsize=8)
+
+    plt.show()
+
+# Example usage
+if __name__ == "__main__":
+    values = [100, 280, 120, 300, 450, 130, 150, 200, 240, 160]
+    weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
+    max_weight = 100
+
+    result = solve_0_1knapsack_with_dynamic_programming(values, weights, max_weight, show_plot=True)
+    print_result(result)
+
+    # Large instance: 2,000 items and a capacity of 100,000
+    rng = np.random.default_rng(0)
+    weights = rng.integers(1, 1000, 2000).tolist()
+    values = (np.array(weights) + rng.integers(1, 100, 2000)).tolist()
+    result = solve_0_1knapsack_with_dynamic_programming(values, weights, 100000)
+    print("Optimal Total Value (2,000 items):", result.total_value, "| Solve Time:", f"{result.solve_time:.3f} s", "\n")
@@ -0,0 +1,403 @@
+import numpy as np
+import bisect
+import math
+import time
+
+class KnapsackResult:
+    """
+    Result of a knapsack solver. It unpacks like a tuple: selected_items, total_value, bound, gap = result.
+
+    Attributes:
+    - selected_items (list of int): Selected items (indexed from 1).
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - bound (float): Best upper bound on the optimal total value.
+    - gap (float): Relative gap between total_value and bound (0 when optimal).
+    - status (str): "Optimal", or "Feasible" when the node or time limit stopped the search.
+    - solve_time (float): Time spent by the search in seconds.
+    - nodes (int): Number of branch and bound nodes explored.
+    - root_bound (float): Martello-Toth bound at the root node.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "bound", "gap", "status", "solve_time", "nodes",
+                 "root_bound")
+
+    def __init__(self, selected_items, total_value, total_weight, bound, gap, status, solve_time, nodes, root_bound):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.solve_time = solve_time
+        self.nodes = nodes
+        self.root_bound = root_bound
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"items={len(self.selected_items)}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f}, nodes={self.nodes!r})")
+
+def solve_0_1knapsack_with_branch_and_bound(values, weights, max_weight, show_plot=False, time_limit=None, node_limit=None):
+    """
+    Solve the 0/1 Knapsack Problem exactly with depth-first branch and bound on Martello-Toth bounds.
+
+    The items are sorted once by decreasing value-to-weight ratio. The fractional greedy then gives
+    the critical item s, the first one that does not fit, and the Dantzig bound: the items before s
+    plus the fitting fraction of s. The Martello-Toth bound is the larger of the two Dantzig-style
+    bounds with s excluded (the rest filled at the ratio of item s + 1) and with s included (room made
+    at the ratio of item s - 1), which never exceeds the Dantzig bound. With prefix sums of the sorted
+    weights and values, s is found by binary search, so every bound takes O(log n) time.
+
+    Before the search, every item whose opposite decision cannot beat the greedy solution is fixed
+    (Martello & Toth, 1990); of 10^6 uncorrelated items, only a few thousand stay free. The search then
+    follows Horowitz & Sahni: it takes the longest run of items that fits, skips the item that does
+    not, and backtracks by dropping the last item taken. A node is pruned once its bound cannot beat
+    the best solution. The weights may be real numbers, so it also handles instances where dynamic
+    programming over the capacities is not possible.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights, non-negative.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+    - time_limit (float): Time limit in seconds. When it is reached, the best selection found so far is reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - node_limit (int): Maximum number of nodes to explore, reported like the time limit. Defaults to None (no limit).
+
+    Returns:
+    - result (KnapsackResult): The selected items, their total value and weight, the best bound, the gap, the
+      status, the solve time and the search statistics. It unpacks like the tuple
+      (selected_items, total_value, bound, gap).
+    """
+    item_values = np.asarray(values, dtype=float)
+    item_weights = np.asarray(weights, dtype=float)
+    if np.any(item_weights < 0):
+        raise ValueError("Branch and bound needs non-negative weights.")
+
+    solve_start = time.perf_counter()
+    deadline = None if time_limit is None else solve_start + time_limit
+
+    # Items without weight are always taken; items without value or heavier than the knapsack never are
+    always = np.flatnonzero((item_weights == 0) & (item_values > 0))
+    candidates = np.flatnonzero((item_weights > 0) & (item_weights <= max_weight) & (item_values > 0))
+
+    # Sort the candidates once by decreasing value-to-weight ratio
+    order = candidates[np.argsort(-(item_values[candidates] / item_weights[candidates]), kind="stable")]
+
+    # With integer values, every bound can be rounded down
+    integral = bool(np.all(item_values[order] == np.round(item_values[order])))
+    selected, best_value, bound, root_bound, nodes = branch_and_bound(item_values[order], item_weights[order],
+                                                                      max_weight, integral, deadline, node_limit)
+    solve_time = time.perf_counter() - solve_start
+
+    chosen = np.sort(np.concatenate((always, order[selected]))).tolist()
+    selected_items = [i + 1 for i in chosen]  # Indexes starting from 1
+    total_value = sum(values[i] for i in chosen)
+    total_weight = sum(weights[i] for i in chosen)
+
+    # Without open nodes the best selection is optimal; otherwise the largest open bound holds
+    offset = float(item_values[always].sum())
+    bound, root_bound = bound + offset, root_bound + offset
+    gap = abs(bound - total_value) / max(abs(total_value), 1e-10)
+    status = "Optimal" if bound <= best_value + offset else "Feasible"
+
+    result = KnapsackResult(selected_items, total_value, total_weight, bound, gap, status, solve_time, nodes, root_bound)
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(values, weights, selected_items)
+
+    return result
+
+def branch_and_bound(values, weights, capacity, integral, deadline=None, node_limit=None):
+    """
+    Maximize the total value of items sorted by decreasing value-to-weight ratio with reduction and
+    depth-first branch and bound.
+
+    Parameters:
+    - values, weights (numpy arrays): Positive values and weights, sorted by decreasing value-to-weight ratio,
+      every weight at most capacity.
+    - capacity (float): Capacity of the knapsack.
+    - integral (bool): Whether all values are integers, so every bound can be rounded down.
+    - deadline (float): time.perf_counter() value at which the search stops. Defaults to None (no limit).
+    - node_limit (int): Maximum number of nodes to explore. Defaults to None (no limit).
+
+    Returns:
+    - selected (numpy array): Positions of the selected items in the sorted order.
+    - best_value (float): Total value of the selected items.
+    - bound (float): Upper bound on the optimal total value (equal to best_value when the search finished).
+    - root_bound (float): Martello-Toth bound of the whole problem.
+    - nodes (int): Number of nodes explored.
+    """
+    n = len(values)
+    weight_sums = np.concatenate(([0.0], np.cumsum(weights)))
+    value_sums = np.concatenate(([0.0], np.cumsum(values)))
+
+    # Fractional greedy: the items before the critical item fit
+    critical, greedy_value, root_bound = martello_toth_bound(values, weights, value_sums, weight_sums, 0, capacity)
+    if critical == n:
+        return np.arange(n), greedy_value, greedy_value, greedy_value, 0
+
+    # Incumbent: the greedy run, then every later item that still fits
+    take = np.zeros(n, dtype=bool)
+    take[:critical] = True
+    room = capacity - weight_sums[critical]
+    for j in (critical + 1 + np.flatnonzero(weights[critical + 1:] <= room)).tolist():
+        if weights[j] <= room:
+            take[j] = True
+            room -= weights[j]
+    best_value = float(values[take].sum())
+
+    # A node can only lead to a better selection if its bound exceeds the best value by this margin
+    tolerance = 1e-9 * max(1.0, float(value_sums[-1]))
+    margin = 1 - tolerance if integral else tolerance
+    root_bound = math.floor(root_bound + tolerance) if integral else root_bound
+
+    fixed_one, fixed_zero = reduce_items(values, weights, value_sums, weight_sums, capacity, critical, best_value + margin)
+    free = np.flatnonzero(~(fixed_one | fixed_zero))
+
+    # Depth-first search over the free items, with the fixed items taken out of the capacity
+    free_values, free_weights = values[free], weights[free]
+    free_capacity = capacity - float(weights[fixed_one].sum())
+    offset = float(values[fixed_one].sum())
+    free_weight_sums = np.concatenate(([0.0], np.cumsum(free_weights)))
+    free_value_sums = np.concatenate(([0.0], np.cumsum(free_values)))
+    lightest = np.minimum.accumulate(free_weights[::-1])[::-1].tolist() + [math.inf]  # Lightest item from here on
+
+    v, w = free_values.tolist(), free_weights.tolist()
+    vs, ws = free_value_sums.tolist(), free_weight_sums.tolist()
+    m = len(free)
+    best_free, best_runs = best_value - offset, None
+
+    # Every stack entry (start, end, capacity, value) is a run of taken items, with the capacity and value before it
+    stack = []
+    p, c, z = 0, free_capacity, 0.0
+    nodes = 0
+    finished = False
+    while True:
+        if (node_limit is not None and nodes >= node_limit) or (deadline is not None and time.perf_counter() >= deadline):
+            break
+        nodes += 1
+
+        backtrack = True
+        if lightest[p] <= c:
+            s, run_value, node_bound = martello_toth_bound(v, w, vs, ws, p, c)
+            if s == m:
+                # Every remaining item fits
+                if z + run_value > best_free + tolerance:
+                    best_free, best_runs = z + run_value, [entry[:2] for entry in stack] + [(p, m)]
+            elif z + node_bound > best_free + margin:
+                if z + run_value > best_free + tolerance:
+                    best_free, best_runs = z + run_value, [entry[:2] for entry in stack] + [(p, s)]
+                # Take the run p, ..., s - 1 and skip the critical item s
+                if s > p:
+                    stack.append((p, s, c, z))
+                    c -= ws[s] - ws[p]
+                    z += run_value
+                p = s + 1
+                backtrack = False
+        elif z > best_free + tolerance:
+            # Nothing fits anymore
+            best_free, best_runs = z, [entry[:2] for entry in stack]
+
+        if backtrack:
+            if not stack:
+                finished = True
+                break
+            # Drop the last item of the last run and continue after it
+            start, end, run_capacity, run_total = stack[-1]
+            j = end - 1
+            if j == start:
+                stack.pop()
+            else:
+                stack[-1] = (start, j, run_capacity, run_total)
+            c = run_capacity - (ws[j] - ws[start])
+            z = run_total + (vs[j] - vs[start])
+            p = j + 1
+
+    if best_runs is not None:
+        take = fixed_one.copy()
+        for start, end in best_runs:
+            take[free[start:end]] = True
+        best_value = float(values[take].sum())
+
+    bound = best_value
+    if not finished:
+        # The open nodes: the current one, and every item of a run that has not been dropped yet
+        starts, capacities, totals = [p], [c], [z]
+        for start, end, run_capacity, run_total in stack:
+            dropped = np.arange(start, end)
+            starts.append(dropped + 1)
+            capacities.append(run_capacity - (free_weight_sums[dropped] - free_weight_sums[start]))
+            totals.append(run_total + (free_value_sums[dropped] - free_value_sums[start]))
+        open_bounds = offset + dantzig_bounds(free_values, free_weights, free_value_sums, free_weight_sums,
+                                              np.hstack(starts), np.hstack(capacities), np.hstack(totals))
+        if integral:
+            open_bounds = np.floor(open_bounds + tolerance)
+        bound = max(best_value, float(open_bounds.max()))
+
+    return np.flatnonzero(take), best_value, bound, root_bound, nodes
+
+def martello_toth_bound(values, weights, value_sums, weight_sums, start, capacity):
+    """
+    Bound the total value of the items start, start + 1, ... for the given capacity.
+
+    Parameters:
+    - values, weights (lists or numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (lists or numpy arrays): Their prefix sums, starting with 0.
+    - start (int): First item that may be taken.
+    - capacity (float): Remaining capacity.
+
+    Returns:
+    - critical (int): The first item from start on that does not fit after the ones before it (n if all fit).
+    - run_value (float): Total value of the items start, ..., critical - 1.
+    - bound (float): Martello-Toth upper bound (run_value if all items fit).
+    """
+    n = len(values)
+    critical = bisect.bisect_right(weight_sums, weight_sums[start] + capacity) - 1
+    run_value = value_sums[critical] - value_sums[start]
+    if critical >= n:
+        return n, run_value, run_value
+
+    room = capacity - (weight_sums[critical] - weight_sums[start])
+    # Critical item excluded: the room is filled at the ratio of the next item
+    bound = run_value + (room * values[critical + 1] / weights[critical + 1] if critical + 1 < n else 0)
+    # Critical item included: the missing room is freed at the ratio of the item before it
+    if critical > start:
+        included = run_value + values[critical] - (weights[critical] - room) * values[critical - 1] / weights[critical - 1]
+        bound = max(bound, included)
+    return critical, run_value, bound
+
+def dantzig_bounds(values, weights, value_sums, weight_sums, starts, capacities, totals):
+    """
+    Vectorized Dantzig bounds (the fractional greedy) of many nodes.
+
+    Parameters:
+    - values, weights (numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (numpy arrays): Their prefix sums, starting with 0.
+    - starts (numpy array): First item that may be taken at every node.
+    - capacities (numpy array): Remaining capacity at every node.
+    - totals (numpy array): Value already taken at every node.
+
+    Returns:
+    - bounds (numpy array): Upper bound of every node.
+    """
+    n = len(values)
+    critical = np.searchsorted(weight_sums, weight_sums[starts] + capacities, side="right") - 1
+    room = capacities - (weight_sums[critical] - weight_sums[starts])
+    last = np.minimum(critical, n - 1)
+    fraction = np.where(critical < n, room / weights[last], 0.0)
+    return totals + value_sums[critical] - value_sums[starts] + fraction * values[last]
+
+def reduce_items(values, weights, value_sums, weight_sums, capacity, critical, threshold):
+    """
+    Fix the items whose opposite decision cannot lead to a total value above threshold (Martello & Toth).
+
+    An item before the critical item is fixed to 1 if the Dantzig bound without it is at most threshold,
+    and an item after it to 0 if the Dantzig bound with it is. The critical item stays free.
+
+    Parameters:
+    - values, weights (numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (numpy arrays): Their prefix sums, starting with 0.
+    - capacity (float): Capacity of the knapsack.
+    - critical (int): The critical item of the fractional greedy.
+    - threshold (float): Best value found plus the improvement margin.
+
+    Returns:
+    - fixed_one, fixed_zero (numpy arrays): Boolean masks of the items fixed to 1 and to 0.
+    """
+    n = len(values)
+    ratios = values / weights
+    fixed_one = np.zeros(n, dtype=bool)
+    fixed_zero = np.zeros(n, dtype=bool)
+
+    # Item j < critical left out: the items after it move up into its weight
+    before = np.arange(critical)
+    stop = np.searchsorted(weight_sums, capacity + weights[before], side="right") - 1
+    room = capacity + weights[before] - weight_sums[stop]
+    without = value_sums[stop] - values[before] + np.where(stop < n, room * ratios[np.minimum(stop, n - 1)], 0.0)
+    fixed_one[before] = without <= threshold
+
+    # Item j > critical taken: the greedy run is cut short to make room for it
+    after = np.arange(critical + 1, n)
+    stop = np.searchsorted(weight_sums, capacity - weights[after], side="right") - 1
+    room = capacity - weights[after] - weight_sums[stop]
+    with_item = values[after] + value_sums[stop] + room * ratios[stop]
+    fixed_zero[after] = with_item <= threshold
+    return fixed_one, fixed_zero
+
+def print_result(result):
+    """
+    Prints a knapsack result: the solve time and search statistics, then the optimal selection, or the
+    best selection found with its bound and gap when a limit stopped the search.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    print("Solve Time:", f"{result.solve_time:.3f} s")
+    print("Nodes:", result.nodes, "|", f"{result.nodes / max(result.solve_time, 1e-9):.1f} nodes/s")
+    print("Root Bound:", result.root_bound, "\n")
+    if result.status == "Optimal":
+        print("Optimal Total Value:", result.total_value, "\n")
+    else:
+        print("Best Total Value Found:", result.total_value, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items:", result.selected_items, "\n")
+
+def plot_knapsack_solution(values, weights, selected_items):
+    """
+    Plots the selected and unselected items in the knapsack problem, showing value-to-weight ratios.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights.
+    - selected_items (list of int): Indices of selected items (indexed from 1).
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    n = len(values)
+    item_indices = list(range(1, n + 1))  # Start items from index 1
+
+    # Calculate value-to-weight ratios
+    ratios = [values[i] / weights[i] for i in range(n)]
+
+    # Define colors for selected vs. unselected items
+    colors = ['#afd30b' if (i + 1) in selected_items else '#d30b32' for i in range(n)]
+
+    # Create the bar plot
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Plot the value-to-weight ratio
+    ax.bar(item_indices, ratios, color=colors)
+    ax.set_xticks(item_indices)  # Ensure x-axis has sequential indices (1, 2, 3, ...)
+    ax.set_xlabel("Item Index")
+    ax.set_ylabel("Value-to-Weight Ratio", color='black')
+    ax.set_title("Knapsack Solution: Value-to-Weight Ratios (Green = Selected, Red = Unselected)")
+
+    # Display value and weight on each bar
+    for i in range(n):
+        ax.text(item_indices[i], ratios[i] + 0.1, f"V:{values[i]} W:{weights[i]}", ha='center', fontsize=8)
+
+    plt.show()
+
+# Example usage
+if __name__ == "__main__":
+    values = [100, 280, 120, 300, 450, 130, 150, 200, 240, 160]
+    weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
+    max_weight = 100
+
+    result = solve_0_1knapsack_with_branch_and_bound(values, weights, max_weight, show_plot=True)
+    print_result(result)
+
+    # Large instance: 1,000,000 items with real-valued weights
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 1000, 1000000)
+    values = weights + rng.uniform(0, 100, 1000000)
+    result = solve_0_1knapsack_with_branch_and_bound(values, weights, weights.sum() / 2, time_limit=60)
+    print("Total Value (1,000,000 items):", result.total_value, "| Status:", result.status, "| Nodes:", result.nodes,
+          "| Solve Time:", f"{result.solve_time:.3f} s", "\n")
@@ -0,0 +1,540 @@
+import numpy as np
+import bisect
+import math
+import time
+
+# Number of items on each side of the break item in the first core
+CORE_SIZE = 100
+
+# Node budget of the first core, which only has to provide a good selection for the reduction
+FIRST_CORE_NODES = 1000
+
+class KnapsackResult:
+    """
+    Result of a knapsack solver. It unpacks like a tuple: selected_items, total_value, bound, gap = result.
+
+    Attributes:
+    - selected_items (list of int): Selected items (indexed from 1).
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - bound (float): Best upper bound on the optimal total value.
+    - gap (float): Relative gap between total_value and bound (0 when optimal).
+    - status (str): "Optimal", or "Feasible" when the node or time limit stopped the search.
+    - solve_time (float): Time spent by the solver in seconds.
+    - nodes (int): Number of branch and bound nodes explored in the core.
+    - root_bound (float): Dantzig bound of the whole problem (the optimum of the fractional knapsack).
+    - core_items (int): Number of items in the final core.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "bound", "gap", "status", "solve_time", "nodes",
+                 "root_bound", "core_items")
+
+    def __init__(self, selected_items, total_value, total_weight, bound, gap, status, solve_time, nodes, root_bound,
+                 core_items):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.solve_time = solve_time
+        self.nodes = nodes
+        self.root_bound = root_bound
+        self.core_items = core_items
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"items={len(self.selected_items)}, bound={self.bound!r}, gap={self.gap!r}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.3f}, nodes={self.nodes!r}, "
+                f"core_items={self.core_items!r})")
+
+def solve_0_1knapsack_with_core(values, weights, max_weight, show_plot=False, time_limit=None, node_limit=None,
+                                core_size=CORE_SIZE):
+    """
+    Solve the 0/1 Knapsack Problem exactly with an expanding core around the break item (Balas & Zemel, 1980;
+    Pisinger, 1995).
+
+    In an optimal solution, the items with a much higher value-to-weight ratio than the break item (the
+    first item the fractional greedy cannot take entirely) are almost always taken, and the items with a
+    much lower ratio almost never are. Only the core, the items with ratios close to the break item, needs
+    to be decided. So no item is sorted outside the core:
+
+    1. The break item is found with a weighted quickselect: np.argpartition splits the items at the median
+       ratio, and only the half that contains the break item is split again, in O(n) time overall.
+    2. The first core holds core_size items on each side of the break item. The items above it are
+       fixed in the knapsack and the items below it are left out. The core is sorted and searched with
+       depth-first branch and bound on Martello-Toth bounds, for at most FIRST_CORE_NODES nodes.
+    3. Forcing item j against the fractional optimum costs at least |v_j - r w_j|, with r the ratio of
+       the break item (Dembo & Hammer, 1980). Every item outside the core whose bound, the Dantzig bound
+       minus this cost, still exceeds the best value joins the core, and the core is solved exactly.
+       The items left outside cannot be part of a better selection, so the best selection is optimal.
+
+    A small core alone is hard to solve with real-valued weights: it lacks the many small items that fill
+    the knapsack up in the full problem. The expanded core has them, and it usually holds a few hundred of
+    10^5-10^6 uncorrelated items.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights, non-negative.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+    - time_limit (float): Time limit in seconds. When it is reached, the best selection found so far is reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - node_limit (int): Maximum number of nodes to explore, reported like the time limit. Defaults to None (no limit).
+    - core_size (int): Number of items on each side of the break item in the first core. Defaults to
+      CORE_SIZE (100).
+
+    Returns:
+    - result (KnapsackResult): The selected items, their total value and weight, the best bound, the gap, the
+      status, the solve time and the search statistics. It unpacks like the tuple
+      (selected_items, total_value, bound, gap).
+    """
+    item_values = np.asarray(values, dtype=float)
+    item_weights = np.asarray(weights, dtype=float)
+    if np.any(item_weights < 0):
+        raise ValueError("The core algorithm needs non-negative weights.")
+
+    solve_start = time.perf_counter()
+    deadline = None if time_limit is None else solve_start + time_limit
+
+    # Items without weight are always taken; items without value or heavier than the knapsack never are
+    always = np.flatnonzero((item_weights == 0) & (item_values > 0))
+    candidates = np.flatnonzero((item_weights > 0) & (item_weights <= max_weight) & (item_values > 0))
+    v, w = item_values[candidates], item_weights[candidates]
+    ratios = v / w
+
+    # With integer values, every bound can be rounded down
+    integral = bool(np.all(v == np.round(v)))
+    tolerance = 1e-9 * max(1.0, float(v.sum()))
+    margin = 1 - tolerance if integral else tolerance
+
+    above, critical, room = break_item(ratios, w, max_weight)
+    take = np.zeros(len(candidates), dtype=bool)
+    nodes, core_items, finished = 0, 0, True
+
+    if critical < 0:
+        # Every item fits
+        take[:] = True
+        best_value = root_bound = bound = float(v.sum())
+    else:
+        break_ratio = ratios[critical]
+        fractional_value = float(v[above].sum() + room * break_ratio)
+        root_bound = math.floor(fractional_value + tolerance) if integral else fractional_value
+
+        # First core: the core_size items on each side of the break item
+        below = np.ones(len(candidates), dtype=bool)
+        below[above] = False
+        below[critical] = False
+        below = np.flatnonzero(below)
+        in_core = np.zeros(len(candidates), dtype=bool)
+        in_core[critical] = True
+        in_core[lowest(ratios, above, core_size)] = True
+        in_core[lowest(-ratios, below, core_size)] = True
+        fixed_one = np.zeros(len(candidates), dtype=bool)
+        fixed_one[above] = True
+        fixed_one &= ~in_core
+
+        # Dembo-Hammer bound of every item forced against the fractional optimum
+        forced_bounds = fractional_value - np.abs(v - break_ratio * w)
+
+        best_value = -math.inf
+        budget = FIRST_CORE_NODES
+        while True:
+            # Solve the core, sorted by decreasing ratio, with the fixed items taken out of the capacity
+            capacity = max_weight - float(w[fixed_one].sum())
+            core = np.flatnonzero(in_core)
+            core = core[w[core] <= capacity]
+            core = core[np.argsort(-ratios[core], kind="stable")]
+            limit = budget if node_limit is None else max(min(budget or node_limit, node_limit - nodes), 0)
+            selected, core_value, core_bound, _, core_nodes = branch_and_bound(v[core], w[core], capacity, integral,
+                                                                               deadline, limit, tolerance)
+            nodes += core_nodes
+            core_items = len(core)
+            fixed_value = float(v[fixed_one].sum())
+            if core_value + fixed_value > best_value:
+                take = fixed_one.copy()
+                take[core[selected]] = True
+                best_value = core_value + fixed_value
+            finished = core_bound <= core_value
+
+            # Items outside the core whose forced bound could still beat the best value join it
+            joining = ~in_core & (forced_bounds > best_value + margin)
+            if not joining.any() and (finished or budget is None):
+                break
+            if (node_limit is not None and nodes >= node_limit) or (deadline is not None and time.perf_counter() >= deadline):
+                finished = False
+                break
+            in_core |= joining
+            fixed_one &= ~in_core
+            budget = None
+
+        bound = best_value
+        if not finished:
+            # A better selection either keeps every decision outside the core or forces one of them
+            bound = core_bound + fixed_value
+            if not in_core.all():
+                bound = max(bound, float(forced_bounds[~in_core].max()))
+                if integral:
+                    bound = math.floor(bound + tolerance)
+            bound = max(bound, best_value)
+    solve_time = time.perf_counter() - solve_start
+
+    chosen = np.sort(np.concatenate((always, candidates[take])))
+    selected_items = (chosen + 1).tolist()  # Indexes starting from 1
+    total_value = float(item_values[chosen].sum())
+    total_weight = float(item_weights[chosen].sum())
+
+    offset = float(item_values[always].sum())
+    bound, root_bound = bound + offset, root_bound + offset
+    gap = abs(bound - total_value) / max(abs(total_value), 1e-10)
+    status = "Optimal" if bound <= best_value + offset else "Feasible"
+
+    result = KnapsackResult(selected_items, total_value, total_weight, bound, gap, status, solve_time, nodes,
+                            root_bound, core_items)
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(values, weights, selected_items)
+
+    return result
+
+def break_item(ratios, weights, capacity):
+    """
+    Find the break item of the fractional greedy with a weighted quickselect instead of a full sort.
+
+    np.argpartition splits the remaining items at their median ratio. If the upper half does not fit
+    in the remaining capacity, the break item is in it; otherwise the upper half is taken and the
+    search continues in the lower half. Every round halves the items, so it takes O(n) time.
+
+    Parameters:
+    - ratios (numpy array): Value-to-weight ratio of every item.
+    - weights (numpy array): Weight of every item.
+    - capacity (float): Capacity of the knapsack.
+
+    Returns:
+    - above (numpy array): Items the greedy takes entirely (in no particular order).
+    - critical (int): The break item, or -1 if every item fits.
+    - room (float): Capacity left for the break item.
+    """
+    remaining = np.arange(len(ratios))
+    taken = [remaining[:0]]
+    while len(remaining) > 0:
+        k = len(remaining) // 2
+        split = remaining[np.argpartition(-ratios[remaining], k)]
+        upper, pivot = split[:k], split[k]
+        upper_weight = float(weights[upper].sum())
+        if upper_weight > capacity:
+            remaining = upper
+            continue
+        taken.append(upper)
+        capacity -= upper_weight
+        if weights[pivot] > capacity:
+            return np.concatenate(taken), int(pivot), capacity
+        taken.append(split[k:k + 1])
+        capacity -= weights[pivot]
+        remaining = split[k + 1:]
+    return np.concatenate(taken), -1, capacity
+
+def lowest(keys, items, count):
+    """
+    Return the count items with the lowest keys (all items if there are fewer), with np.argpartition.
+    """
+    if count >= len(items):
+        return items
+    if count <= 0:
+        return items[:0]
+    return items[np.argpartition(keys[items], count - 1)[:count]]
+
+def branch_and_bound(values, weights, capacity, integral, deadline=None, node_limit=None, tolerance=None):
+    """
+    Maximize the total value of items sorted by decreasing value-to-weight ratio with reduction and
+    depth-first branch and bound.
+
+    Parameters:
+    - values, weights (numpy arrays): Positive values and weights, sorted by decreasing value-to-weight ratio,
+      every weight at most capacity.
+    - capacity (float): Capacity of the knapsack.
+    - integral (bool): Whether all values are integers, so every bound can be rounded down.
+    - deadline (float): time.perf_counter() value at which the search stops. Defaults to None (no limit).
+    - node_limit (int): Maximum number of nodes to explore. Defaults to None (no limit).
+    - tolerance (float): Improvements up to this amount are ignored. Defaults to None (1e-9 times the total value).
+
+    Returns:
+    - selected (numpy array): Positions of the selected items in the sorted order.
+    - best_value (float): Total value of the selected items.
+    - bound (float): Upper bound on the optimal total value (equal to best_value when the search finished).
+    - root_bound (float): Martello-Toth bound of the whole problem.
+    - nodes (int): Number of nodes explored.
+    """
+    n = len(values)
+    weight_sums = np.concatenate(([0.0], np.cumsum(weights)))
+    value_sums = np.concatenate(([0.0], np.cumsum(values)))
+
+    # Fractional greedy: the items before the critical item fit
+    critical, greedy_value, root_bound = martello_toth_bound(values, weights, value_sums, weight_sums, 0, capacity)
+    if critical == n:
+        return np.arange(n), greedy_value, greedy_value, greedy_value, 0
+
+    # Incumbent: the greedy run, then every later item that still fits
+    take = np.zeros(n, dtype=bool)
+    take[:critical] = True
+    room = capacity - weight_sums[critical]
+    for j in (critical + 1 + np.flatnonzero(weights[critical + 1:] <= room)).tolist():
+        if weights[j] <= room:
+            take[j] = True
+            room -= weights[j]
+    best_value = float(values[take].sum())
+
+    # A node can only lead to a better selection if its bound exceeds the best value by this margin
+    if tolerance is None:
+        tolerance = 1e-9 * max(1.0, float(value_sums[-1]))
+    margin = 1 - tolerance if integral else tolerance
+    root_bound = math.floor(root_bound + tolerance) if integral else root_bound
+
+    fixed_one, fixed_zero = reduce_items(values, weights, value_sums, weight_sums, capacity, critical, best_value + margin)
+    free = np.flatnonzero(~(fixed_one | fixed_zero))
+
+    # Depth-first search over the free items, with the fixed items taken out of the capacity
+    free_values, free_weights = values[free], weights[free]
+    free_capacity = capacity - float(weights[fixed_one].sum())
+    offset = float(values[fixed_one].sum())
+    free_weight_sums = np.concatenate(([0.0], np.cumsum(free_weights)))
+    free_value_sums = np.concatenate(([0.0], np.cumsum(free_values)))
+    lightest = np.minimum.accumulate(free_weights[::-1])[::-1].tolist() + [math.inf]  # Lightest item from here on
+
+    v, w = free_values.tolist(), free_weights.tolist()
+    vs, ws = free_value_sums.tolist(), free_weight_sums.tolist()
+    m = len(free)
+    best_free, best_runs = best_value - offset, None
+
+    # Every stack entry (start, end, capacity, value) is a run of taken items, with the capacity and value before it
+    stack = []
+    p, c, z = 0, free_capacity, 0.0
+    nodes = 0
+    finished = False
+    while True:
+        if (node_limit is not None and nodes >= node_limit) or (deadline is not None and time.perf_counter() >= deadline):
+            break
+        nodes += 1
+
+        backtrack = True
+        if lightest[p] <= c:
+            s, run_value, node_bound = martello_toth_bound(v, w, vs, ws, p, c)
+            if s == m:
+                # Every remaining item fits
+                if z + run_value > best_free + tolerance:
+                    best_free, best_runs = z + run_value, [entry[:2] for entry in stack] + [(p, m)]
+            elif z + node_bound > best_free + margin:
+                if z + run_value > best_free + tolerance:
+                    best_free, best_runs = z + run_value, [entry[:2] for entry in stack] + [(p, s)]
+                # Take the run p, ..., s - 1 and skip the critical item s
+                if s > p:
+                    stack.append((p, s, c, z))
+                    c -= ws[s] - ws[p]
+                    z += run_value
+                p = s + 1
+                backtrack = False
+        elif z > best_free + tolerance:
+            # Nothing fits anymore
+            best_free, best_runs = z, [entry[:2] for entry in stack]
+
+        if backtrack:
+            if not stack:
+                finished = True
+                break
+            # Drop the last item of the last run and continue after it
+            start, end, run_capacity, run_total = stack[-1]
+            j = end - 1
+            if j == start:
+                stack.pop()
+            else:
+                stack[-1] = (start, j, run_capacity, run_total)
+            c = run_capacity - (ws[j] - ws[start])
+            z = run_total + (vs[j] - vs[start])
+            p = j + 1
+
+    if best_runs is not None:
+        take = fixed_one.copy()
+        for start, end in best_runs:
+            take[free[start:end]] = True
+        best_value = float(values[take].sum())
+
+    bound = best_value
+    if not finished:
+        # The open nodes: the current one, and every item of a run that has not been dropped yet
+        starts, capacities, totals = [p], [c], [z]
+        for start, end, run_capacity, run_total in stack:
+            dropped = np.arange(start, end)
+            starts.append(dropped + 1)
+            capacities.append(run_capacity - (free_weight_sums[dropped] - free_weight_sums[start]))
+            totals.append(run_total + (free_value_sums[dropped] - free_value_sums[start]))
+        open_bounds = offset + dantzig_bounds(free_values, free_weights, free_value_sums, free_weight_sums,
+                                              np.hstack(starts), np.hstack(capacities), np.hstack(totals))
+        if integral:
+            open_bounds = np.floor(open_bounds + tolerance)
+        bound = max(best_value, float(open_bounds.max()))
+
+    return np.flatnonzero(take), best_value, bound, root_bound, nodes
+
+def martello_toth_bound(values, weights, value_sums, weight_sums, start, capacity):
+    """
+    Bound the total value of the items start, start + 1, ... for the given capacity.
+
+    Parameters:
+    - values, weights (lists or numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (lists or numpy arrays): Their prefix sums, starting with 0.
+    - start (int): First item that may be taken.
+    - capacity (float): Remaining capacity.
+
+    Returns:
+    - critical (int): The first item from start on that does not fit after the ones before it (n if all fit).
+    - run_value (float): Total value of the items start, ..., critical - 1.
+    - bound (float): Martello-Toth upper bound (run_value if all items fit).
+    """
+    n = len(values)
+    critical = bisect.bisect_right(weight_sums, weight_sums[start] + capacity) - 1
+    run_value = value_sums[critical] - value_sums[start]
+    if critical >= n:
+        return n, run_value, run_value
+
+    room = capacity - (weight_sums[critical] - weight_sums[start])
+    # Critical item excluded: the room is filled at the ratio of the next item
+    bound = run_value + (room * values[critical + 1] / weights[critical + 1] if critical + 1 < n else 0)
+    # Critical item included: the missing room is freed at the ratio of the item before it
+    if critical > start:
+        included = run_value + values[critical] - (weights[critical] - room) * values[critical - 1] / weights[critical - 1]
+        bound = max(bound, included)
+    return critical, run_value, bound
+
+def dantzig_bounds(values, weights, value_sums, weight_sums, starts, capacities, totals):
+    """
+    Vectorized Dantzig bounds (the fractional greedy) of many nodes.
+
+    Parameters:
+    - values, weights (numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (numpy arrays): Their prefix sums, starting with 0.
+    - starts (numpy array): First item that may be taken at every node.
+    - capacities (numpy array): Remaining capacity at every node.
+    - totals (numpy array): Value already taken at every node.
+
+    Returns:
+    - bounds (numpy array): Upper bound of every node.
+    """
+    n = len(values)
+    critical = np.searchsorted(weight_sums, weight_sums[starts] + capacities, side="right") - 1
+    room = capacities - (weight_sums[critical] - weight_sums[starts])
+    last = np.minimum(critical, n - 1)
+    fraction = np.where(critical < n, room / weights[last], 0.0)
+    return totals + value_sums[critical] - value_sums[starts] + fraction * values[last]
+
+def reduce_items(values, weights, value_sums, weight_sums, capacity, critical, threshold):
+    """
+    Fix the items whose opposite decision cannot lead to a total value above threshold (Martello & Toth).
+
+    An item before the critical item is fixed to 1 if the Dantzig bound without it is at most threshold,
+    and an item after it to 0 if the Dantzig bound with it is. The critical item stays free.
+
+    Parameters:
+    - values, weights (numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (numpy arrays): Their prefix sums, starting with 0.
+    - capacity (float): Capacity of the knapsack.
+    - critical (int): The critical item of the fractional greedy.
+    - threshold (float): Best value found plus the improvement margin.
+
+    Returns:
+    - fixed_one, fixed_zero (numpy arrays): Boolean masks of the items fixed to 1 and to 0.
+    """
+    n = len(values)
+    ratios = values / weights
+    fixed_one = np.zeros(n, dtype=bool)
+    fixed_zero = np.zeros(n, dtype=bool)
+
+    # Item j < critical left out: the items after it move up into its weight
+    before = np.arange(critical)
+    stop = np.searchsorted(weight_sums, capacity + weights[before], side="right") - 1
+    room = capacity + weights[before] - weight_sums[stop]
+    without = value_sums[stop] - values[before] + np.where(stop < n, room * ratios[np.minimum(stop, n - 1)], 0.0)
+    fixed_one[before] = without <= threshold
+
+    # Item j > critical taken: the greedy run is cut short to make room for it
+    after = np.arange(critical + 1, n)
+    stop = np.searchsorted(weight_sums, capacity - weights[after], side="right") - 1
+    room = capacity - weights[after] - weight_sums[stop]
+    with_item = values[after] + value_sums[stop] + room * ratios[stop]
+    fixed_zero[after] = with_item <= threshold
+    return fixed_one, fixed_zero
+
+def print_result(result):
+    """
+    Prints a knapsack result: the solve time and search statistics, then the optimal selection, or the
+    best selection found with its bound and gap when a limit stopped the search.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    print("Solve Time:", f"{result.solve_time:.3f} s")
+    print("Core Items:", result.core_items, "| Nodes:", result.nodes)
+    print("Root Bound:", result.root_bound, "\n")
+    if result.status == "Optimal":
+        print("Optimal Total Value:", result.total_value, "\n")
+    else:
+        print("Best Total Value Found:", result.total_value, "\n")
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items:", result.selected_items, "\n")
+
+def plot_knapsack_solution(values, weights, selected_items):
+    """
+    Plots the selected and unselected items in the knapsack problem, showing value-to-weight ratios.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights.
+    - selected_items (list of int): Indices of selected items (indexed from 1).
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    n = len(values)
+    item_indices = list(range(1, n + 1))  # Start items from index 1
+
+    # Calculate value-to-weight ratios
+    ratios = [values[i] / weights[i] for i in range(n)]
+
+    # Define colors for selected vs. unselected items
+    colors = ['#afd30b' if (i + 1) in selected_items else '#d30b32' for i in range(n)]
+
+    # Create the bar plot
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Plot the value-to-weight ratio
+    ax.bar(item_indices, ratios, color=colors)
+    ax.set_xticks(item_indices)  # Ensure x-axis has sequential indices (1, 2, 3, ...)
+    ax.set_xlabel("Item Index")
+    ax.set_ylabel("Value-to-Weight Ratio", color='black')
+    ax.set_title("Knapsack Solution: Value-to-Weight Ratios (Green = Selected, Red = Unselected)")
+
+    # Display value and weight on each bar
+    for i in range(n):
+        ax.text(item_indices[i], ratios[i] + 0.1, f"V:{values[i]} W:{weights[i]}", ha='center', fontsize=8)
+
+    plt.show()
+
+# Example usage
+if __name__ == "__main__":
+    values = [100, 280, 120, 300, 450, 130, 150, 200, 240, 160]
+    weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
+    max_weight = 100
+
+    result = solve_0_1knapsack_with_core(values, weights, max_weight, show_plot=True)
+    print_result(result)
+
+    # Large instance: 5,000,000 items with real-valued weights
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 1000, 5000000)
+    values = rng.uniform(1, 1000, 5000000)
+    result = solve_0_1knapsack_with_core(values, weights, weights.sum() / 2, time_limit=60)
+    print("Total Value (5,000,000 items):", result.total_value, "| Status:", result.status, "| Core Items:",
+          result.core_items, "| Solve Time:", f"{result.solve_time:.3f} s", "\n")
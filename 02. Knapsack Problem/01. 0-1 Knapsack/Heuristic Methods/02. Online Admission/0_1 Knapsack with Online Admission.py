@@ -0,0 +1,626 @@
+import numpy as np
+import bisect
+import heapq
+import math
+import time
+
+# Rejected and evicted items kept for refilling and re-optimization; beyond twice this many, the worst are dropped
+MAX_CANDIDATES = 10000
+
+# Nodes of a single re-optimization; with the limit, the better of the search and the current selection is kept
+REOPTIMIZE_NODES = 100000
+
+class KnapsackResult:
+    """
+    Result of a knapsack solver. It unpacks like a tuple: selected_items, total_value = result.
+
+    Attributes:
+    - selected_items (list of int): Selected items (indexed from 1, in the order they arrived).
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - status (str): "Optimal" right after a re-optimization that finished (optimal among the items still kept),
+      otherwise "Feasible".
+    - solve_time (float): Time spent by the algorithm in seconds.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "status", "solve_time")
+
+    def __init__(self, selected_items, total_value, total_weight, status, solve_time):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"items={len(self.selected_items)}, status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+class OnlineKnapsack:
+    """
+    0/1 knapsack over a feed of items that arrive and leave over time.
+
+    Like solve_0_1knapsack_with_greedy, it prefers items with a high value-to-weight ratio. The selected
+    items are kept in a min-heap by ratio, so the threshold, the lowest ratio in the knapsack, is always
+    at the top. An arriving item is admitted if it fits. Otherwise, if its ratio is above the threshold,
+    the selected items with the lowest ratios are evicted to make room for it, provided they are worth
+    less than the new item. An item with a ratio at or below the threshold that does not fit is rejected
+    in O(1), and every other decision takes O(log n) time per item moved.
+
+    Rejected and evicted items become candidates, kept in a max-heap by ratio. When a selected item is
+    removed, the best candidates refill the freed capacity. Only the max_candidates best candidates are
+    kept, so the memory is bounded by the selected items plus 2 * max_candidates. Every reoptimize_every
+    arrivals, or when reoptimize is called, the selected items and the candidates are solved exactly with
+    branch and bound, which also recovers the items a ratio rule gets wrong.
+
+    Attributes:
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - arrived (int): Number of items added so far; item i is the i-th item added (indexed from 1).
+    """
+
+    def __init__(self, max_weight, max_candidates=MAX_CANDIDATES, reoptimize_every=None,
+                 node_limit=REOPTIMIZE_NODES, time_limit=None):
+        """
+        Parameters:
+        - max_weight (float): Maximum weight capacity of the knapsack.
+        - max_candidates (int): Number of rejected items kept for refilling and re-optimization. Defaults to
+          MAX_CANDIDATES (10,000).
+        - reoptimize_every (int): Re-optimize exactly after every reoptimize_every items added. Defaults to None
+          (only when reoptimize is called).
+        - node_limit (int): Maximum number of branch and bound nodes of a re-optimization. Defaults to
+          REOPTIMIZE_NODES (100,000); None for no limit.
+        - time_limit (float): Time limit of a re-optimization in seconds. Defaults to None (no limit).
+        """
+        self.max_weight = max_weight
+        self.max_candidates = max_candidates
+        self.reoptimize_every = reoptimize_every
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+
+        self.items = {}  # Item -> (value, weight) of the selected items and the candidates
+        self.selected = set()
+        self.candidates = set()
+        self.selected_heap = []  # (ratio, item), lowest ratio first
+        self.candidate_heap = []  # (-ratio, item), highest ratio first
+        self.candidate_floor = -math.inf  # Lowest ratio kept by the last trim of the candidates
+        self.total_value = 0.0
+        self.total_weight = 0.0
+        self.arrived = 0
+        self.status = "Feasible"
+        self.solve_time = 0.0
+
+    @property
+    def threshold(self):
+        """Lowest value-to-weight ratio in the knapsack (0 when it is empty)."""
+        heap = self.selected_heap
+        # Entries of removed items are only dropped when they reach the top
+        while heap and heap[0][1] not in self.selected:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else 0.0
+
+    def add(self, value, weight):
+        """
+        Add an arriving item and decide whether it enters the knapsack.
+
+        Parameters:
+        - value (float): Value of the item.
+        - weight (float): Weight of the item, non-negative.
+
+        Returns:
+        - item (int): Number of the item (indexed from 1, in the order of arrival), used to remove it.
+        - admitted (bool): Whether the item is in the knapsack.
+        """
+        if weight < 0:
+            raise ValueError("The weights must be non-negative.")
+        start = time.perf_counter()
+        self.arrived += 1
+        item = self.arrived
+
+        # Items without value or heavier than the knapsack are never selected
+        admitted = False
+        if value > 0 and weight <= self.max_weight:
+            self.items[item] = (value, weight)
+            ratio = value / weight if weight > 0 else math.inf
+            if self.total_weight + weight <= self.max_weight:
+                self._select(item, ratio)
+                admitted = True
+            elif ratio > self.threshold and self._make_room(value, weight, ratio):
+                self._select(item, ratio)
+                admitted = True
+            else:
+                self._add_candidate(item, ratio)
+        self.status = "Feasible"
+        self.solve_time += time.perf_counter() - start
+
+        if self.reoptimize_every and self.arrived % self.reoptimize_every == 0:
+            self.reoptimize()
+        return item, admitted
+
+    def remove(self, item):
+        """
+        Remove an item that left the feed. If it was selected, the best candidates refill its capacity.
+
+        Parameters:
+        - item (int): Number of the item returned by add.
+
+        Returns:
+        - removed (bool): Whether the item was in the knapsack.
+        """
+        start = time.perf_counter()
+        removed = item in self.selected
+        if removed:
+            value, weight = self.items.pop(item)
+            self.selected.remove(item)
+            self.total_value -= value
+            self.total_weight -= weight
+            if not self.selected:
+                self.total_value = self.total_weight = 0.0  # Clear the rounding errors
+            self._refill()
+            self.status = "Feasible"
+        elif item in self.candidates:
+            self.items.pop(item)
+            self.candidates.remove(item)
+
+        # Rebuild a heap once most of its entries belong to removed items
+        if len(self.selected_heap) > 2 * len(self.selected) + 16:
+            self.selected_heap = [entry for entry in self.selected_heap if entry[1] in self.selected]
+            heapq.heapify(self.selected_heap)
+        self.solve_time += time.perf_counter() - start
+        return removed
+
+    def reoptimize(self):
+        """
+        Solve the 0/1 knapsack over the selected items and the candidates exactly with branch and bound,
+        and keep the best selection as the selected items.
+
+        Returns:
+        - result (KnapsackResult): The selection after the re-optimization.
+        """
+        start = time.perf_counter()
+        kept = np.array(sorted(self.items), dtype=np.int64)
+        item_values = np.array([self.items[i][0] for i in kept.tolist()], dtype=float)
+        item_weights = np.array([self.items[i][1] for i in kept.tolist()], dtype=float)
+        deadline = None if self.time_limit is None else start + self.time_limit
+
+        # Items without weight are always taken; the others are sorted by decreasing value-to-weight ratio
+        always = np.flatnonzero(item_weights == 0)
+        positive = np.flatnonzero(item_weights > 0)
+        order = positive[np.argsort(-(item_values[positive] / item_weights[positive]), kind="stable")]
+        integral = bool(np.all(item_values[order] == np.round(item_values[order])))
+        selected, best_value, bound, _, _ = branch_and_bound(item_values[order], item_weights[order], self.max_weight,
+                                                             integral, deadline, self.node_limit)
+        finished = bound <= best_value
+        best_value += float(item_values[always].sum())
+
+        # A search stopped by a limit may end below the current selection
+        if finished or best_value > self.total_value:
+            chosen = np.concatenate((always, order[selected]))
+            self.selected = set(kept[chosen].tolist())
+            self.candidates = set(self.items) - self.selected
+            self.total_value = float(item_values[chosen].sum())
+            self.total_weight = float(item_weights[chosen].sum())
+            self.selected_heap = [(self._ratio(i), i) for i in self.selected]
+            self.candidate_heap = [(-self._ratio(i), i) for i in self.candidates]
+            heapq.heapify(self.selected_heap)
+            heapq.heapify(self.candidate_heap)
+            self._trim_candidates()
+            if finished:
+                self.status = "Optimal"
+        self.solve_time += time.perf_counter() - start
+        return self.result()
+
+    def result(self):
+        """
+        Returns:
+        - result (KnapsackResult): The current selection, its total value and weight, the status and the time
+          spent on all decisions so far.
+        """
+        selected_items = sorted(self.selected)
+        total_value = sum(self.items[i][0] for i in selected_items)
+        total_weight = sum(self.items[i][1] for i in selected_items)
+        return KnapsackResult(selected_items, total_value, total_weight, self.status, self.solve_time)
+
+    def __len__(self):
+        """Number of items kept: the selected items and the candidates."""
+        return len(self.items)
+
+    def _ratio(self, item):
+        value, weight = self.items[item]
+        return value / weight if weight > 0 else math.inf
+
+    def _select(self, item, ratio):
+        value, weight = self.items[item]
+        self.selected.add(item)
+        heapq.heappush(self.selected_heap, (ratio, item))
+        self.total_value += value
+        self.total_weight += weight
+
+    def _add_candidate(self, item, ratio):
+        # While the candidates are full, all of them are at or above the last cut, so an item below it would be trimmed
+        if ratio < self.candidate_floor and len(self.candidates) >= self.max_candidates:
+            del self.items[item]
+            return
+        self.candidates.add(item)
+        heapq.heappush(self.candidate_heap, (-ratio, item))
+        if len(self.candidate_heap) > 2 * self.max_candidates:
+            self._trim_candidates()
+
+    def _trim_candidates(self):
+        """Keep only the max_candidates candidates with the highest ratios."""
+        live = [entry for entry in self.candidate_heap if entry[1] in self.candidates]
+        if len(live) > self.max_candidates:
+            live.sort()
+            for _, item in live[self.max_candidates:]:
+                self.candidates.remove(item)
+                del self.items[item]
+            live = live[:self.max_candidates]
+            self.candidate_floor = -live[-1][0] if live else math.inf
+        heapq.heapify(live)
+        self.candidate_heap = live
+
+    def _make_room(self, value, weight, ratio):
+        """
+        Evict the selected items with the lowest ratios, all below ratio, until weight fits. Nothing is evicted
+        unless enough room is found and the evicted items are worth less than value.
+
+        Returns:
+        - evicted (bool): Whether the room was made.
+        """
+        heap = self.selected_heap
+        evicted, freed, lost = [], 0.0, 0.0
+        while heap and self.total_weight - freed + weight > self.max_weight:
+            entry = heapq.heappop(heap)
+            if entry[1] not in self.selected:
+                continue
+            if entry[0] >= ratio:
+                heapq.heappush(heap, entry)
+                break
+            evicted.append(entry)
+            freed += self.items[entry[1]][1]
+            lost += self.items[entry[1]][0]
+
+        if self.total_weight - freed + weight > self.max_weight or lost >= value:
+            for entry in evicted:
+                heapq.heappush(heap, entry)
+            return False
+
+        for item_ratio, item in evicted:
+            self.selected.remove(item)
+            self._add_candidate(item, item_ratio)
+        self.total_value -= lost
+        self.total_weight -= freed
+        return True
+
+    def _refill(self):
+        """Admit the best candidates while they fit, stopping at the first one that does not."""
+        heap = self.candidate_heap
+        while heap:
+            negative_ratio, item = heap[0]
+            if item not in self.candidates:
+                heapq.heappop(heap)
+                continue
+            if self.total_weight + self.items[item][1] > self.max_weight:
+                break
+            heapq.heappop(heap)
+            self.candidates.remove(item)
+            self._select(item, -negative_ratio)
+
+def solve_0_1knapsack_online(values, weights, max_weight, show_plot=False, max_candidates=MAX_CANDIDATES,
+                             reoptimize_every=None):
+    """
+    Solve the 0/1 Knapsack Problem by feeding the items one by one to an OnlineKnapsack, in the given order.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights, non-negative.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+    - max_candidates (int): Number of rejected items kept. Defaults to MAX_CANDIDATES (10,000).
+    - reoptimize_every (int): Re-optimize exactly after every reoptimize_every items. Defaults to None (never).
+
+    Returns:
+    - result (KnapsackResult): The selected items, their total value and weight, the status and the solve time.
+    """
+    knapsack = OnlineKnapsack(max_weight, max_candidates, reoptimize_every)
+    for value, weight in zip(values, weights):
+        knapsack.add(value, weight)
+    result = knapsack.result()
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(values, weights, result.selected_items)
+
+    return result
+
+def branch_and_bound(values, weights, capacity, integral, deadline=None, node_limit=None):
+    """
+    Maximize the total value of items sorted by decreasing value-to-weight ratio with reduction and
+    depth-first branch and bound.
+
+    Parameters:
+    - values, weights (numpy arrays): Positive values and weights, sorted by decreasing value-to-weight ratio,
+      every weight at most capacity.
+    - capacity (float): Capacity of the knapsack.
+    - integral (bool): Whether all values are integers, so every bound can be rounded down.
+    - deadline (float): time.perf_counter() value at which the search stops. Defaults to None (no limit).
+    - node_limit (int): Maximum number of nodes to explore. Defaults to None (no limit).
+
+    Returns:
+    - selected (numpy array): Positions of the selected items in the sorted order.
+    - best_value (float): Total value of the selected items.
+    - bound (float): Upper bound on the optimal total value (equal to best_value when the search finished).
+    - root_bound (float): Martello-Toth bound of the whole problem.
+    - nodes (int): Number of nodes explored.
+    """
+    n = len(values)
+    weight_sums = np.concatenate(([0.0], np.cumsum(weights)))
+    value_sums = np.concatenate(([0.0], np.cumsum(values)))
+
+    # Fractional greedy: the items before the critical item fit
+    critical, greedy_value, root_bound = martello_toth_bound(values, weights, value_sums, weight_sums, 0, capacity)
+    if critical == n:
+        return np.arange(n), greedy_value, greedy_value, greedy_value, 0
+
+    # Incumbent: the greedy run, then every later item that still fits
+    take = np.zeros(n, dtype=bool)
+    take[:critical] = True
+    room = capacity - weight_sums[critical]
+    for j in (critical + 1 + np.flatnonzero(weights[critical + 1:] <= room)).tolist():
+        if weights[j] <= room:
+            take[j] = True
+            room -= weights[j]
+    best_value = float(values[take].sum())
+
+    # A node can only lead to a better selection if its bound exceeds the best value by this margin
+    tolerance = 1e-9 * max(1.0, float(value_sums[-1]))
+    margin = 1 - tolerance if integral else tolerance
+    root_bound = math.floor(root_bound + tolerance) if integral else root_bound
+
+    fixed_one, fixed_zero = reduce_items(values, weights, value_sums, weight_sums, capacity, critical, best_value + margin)
+    free = np.flatnonzero(~(fixed_one | fixed_zero))
+
+    # Depth-first search over the free items, with the fixed items taken out of the capacity
+    free_values, free_weights = values[free], weights[free]
+    free_capacity = capacity - float(weights[fixed_one].sum())
+    offset = float(values[fixed_one].sum())
+    free_weight_sums = np.concatenate(([0.0], np.cumsum(free_weights)))
+    free_value_sums = np.concatenate(([0.0], np.cumsum(free_values)))
+    lightest = np.minimum.accumulate(free_weights[::-1])[::-1].tolist() + [math.inf]  # Lightest item from here on
+
+    v, w = free_values.tolist(), free_weights.tolist()
+    vs, ws = free_value_sums.tolist(), free_weight_sums.tolist()
+    m = len(free)
+    best_free, best_runs = best_value - offset, None
+
+    # Every stack entry (start, end, capacity, value) is a run of taken items, with the capacity and value before it
+    stack = []
+    p, c, z = 0, free_capacity, 0.0
+    nodes = 0
+    finished = False
+    while True:
+        if (node_limit is not None and nodes >= node_limit) or (deadline is not None and time.perf_counter() >= deadline):
+            break
+        nodes += 1
+
+        backtrack = True
+        if lightest[p] <= c:
+            s, run_value, node_bound = martello_toth_bound(v, w, vs, ws, p, c)
+            if s == m:
+                # Every remaining item fits
+                if z + run_value > best_free + tolerance:
+                    best_free, best_runs = z + run_value, [entry[:2] for entry in stack] + [(p, m)]
+            elif z + node_bound > best_free + margin:
+                if z + run_value > best_free + tolerance:
+                    best_free, best_runs = z + run_value, [entry[:2] for entry in stack] + [(p, s)]
+                # Take the run p, ..., s - 1 and skip the critical item s
+                if s > p:
+                    stack.append((p, s, c, z))
+                    c -= ws[s] - ws[p]
+                    z += run_value
+                p = s + 1
+                backtrack = False
+        elif z > best_free + tolerance:
+            # Nothing fits anymore
+            best_free, best_runs = z, [entry[:2] for entry in stack]
+
+        if backtrack:
+            if not stack:
+                finished = True
+                break
+            # Drop the last item of the last run and continue after it
+            start, end, run_capacity, run_total = stack[-1]
+            j = end - 1
+            if j == start:
+                stack.pop()
+            else:
+                stack[-1] = (start, j, run_capacity, run_total)
+            c = run_capacity - (ws[j] - ws[start])
+            z = run_total + (vs[j] - vs[start])
+            p = j + 1
+
+    if best_runs is not None:
+        take = fixed_one.copy()
+        for start, end in best_runs:
+            take[free[start:end]] = True
+        best_value = float(values[take].sum())
+
+    bound = best_value
+    if not finished:
+        # The open nodes: the current one, and every item of a run that has not been dropped yet
+        starts, capacities, totals = [p], [c], [z]
+        for start, end, run_capacity, run_total in stack:
+            dropped = np.arange(start, end)
+            starts.append(dropped + 1)
+            capacities.append(run_capacity - (free_weight_sums[dropped] - free_weight_sums[start]))
+            totals.append(run_total + (free_value_sums[dropped] - free_value_sums[start]))
+        open_bounds = offset + dantzig_bounds(free_values, free_weights, free_value_sums, free_weight_sums,
+                                              np.hstack(starts), np.hstack(capacities), np.hstack(totals))
+        if integral:
+            open_bounds = np.floor(open_bounds + tolerance)
+        bound = max(best_value, float(open_bounds.max()))
+
+    return np.flatnonzero(take), best_value, bound, root_bound, nodes
+
+def martello_toth_bound(values, weights, value_sums, weight_sums, start, capacity):
+    """
+    Bound the total value of the items start, start + 1, ... for the given capacity.
+
+    Parameters:
+    - values, weights (lists or numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (lists or numpy arrays): Their prefix sums, starting with 0.
+    - start (int): First item that may be taken.
+    - capacity (float): Remaining capacity.
+
+    Returns:
+    - critical (int): The first item from start on that does not fit after the ones before it (n if all fit).
+    - run_value (float): Total value of the items start, ..., critical - 1.
+    - bound (float): Martello-Toth upper bound (run_value if all items fit).
+    """
+    n = len(values)
+    critical = bisect.bisect_right(weight_sums, weight_sums[start] + capacity) - 1
+    run_value = value_sums[critical] - value_sums[start]
+    if critical >= n:
+        return n, run_value, run_value
+
+    room = capacity - (weight_sums[critical] - weight_sums[start])
+    # Critical item excluded: the room is filled at the ratio of the next item
+    bound = run_value + (room * values[critical + 1] / weights[critical + 1] if critical + 1 < n else 0)
+    # Critical item included: the missing room is freed at the ratio of the item before it
+    if critical > start:
+        included = run_value + values[critical] - (weights[critical] - room) * values[critical - 1] / weights[critical - 1]
+        bound = max(bound, included)
+    return critical, run_value, bound
+
+def dantzig_bounds(values, weights, value_sums, weight_sums, starts, capacities, totals):
+    """
+    Vectorized Dantzig bounds (the fractional greedy) of many nodes.
+
+    Parameters:
+    - values, weights (numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (numpy arrays): Their prefix sums, starting with 0.
+    - starts (numpy array): First item that may be taken at every node.
+    - capacities (numpy array): Remaining capacity at every node.
+    - totals (numpy array): Value already taken at every node.
+
+    Returns:
+    - bounds (numpy array): Upper bound of every node.
+    """
+    n = len(values)
+    critical = np.searchsorted(weight_sums, weight_sums[starts] + capacities, side="right") - 1
+    room = capacities - (weight_sums[critical] - weight_sums[starts])
+    last = np.minimum(critical, n - 1)
+    fraction = np.where(critical < n, room / weights[last], 0.0)
+    return totals + value_sums[critical] - value_sums[starts] + fraction * values[last]
+
+def reduce_items(values, weights, value_sums, weight_sums, capacity, critical, threshold):
+    """
+    Fix the items whose opposite decision cannot lead to a total value above threshold (Martello & Toth).
+
+    An item before the critical item is fixed to 1 if the Dantzig bound without it is at most threshold,
+    and an item after it to 0 if the Dantzig bound with it is. The critical item stays free.
+
+    Parameters:
+    - values, weights (numpy arrays): Values and weights sorted by decreasing value-to-weight ratio.
+    - value_sums, weight_sums (numpy arrays): Their prefix sums, starting with 0.
+    - capacity (float): Capacity of the knapsack.
+    - critical (int): The critical item of the fractional greedy.
+    - threshold (float): Best value found plus the improvement margin.
+
+    Returns:
+    - fixed_one, fixed_zero (numpy arrays): Boolean masks of the items fixed to 1 and to 0.
+    """
+    n = len(values)
+    ratios = values / weights
+    fixed_one = np.zeros(n, dtype=bool)
+    fixed_zero = np.zeros(n, dtype=bool)
+
+    # Item j < critical left out: the items after it move up into its weight
+    before = np.arange(critical)
+    stop = np.searchsorted(weight_sums, capacity + weights[before], side="right") - 1
+    room = capacity + weights[before] - weight_sums[stop]
+    without = value_sums[stop] - values[before] + np.where(stop < n, room * ratios[np.minimum(stop, n - 1)], 0.0)
+    fixed_one[before] = without <= threshold
+
+    # Item j > critical taken: the greedy run is cut short to make room for it
+    after = np.arange(critical + 1, n)
+    stop = np.searchsorted(weight_sums, capacity - weights[after], side="right") - 1
+    room = capacity - weights[after] - weight_sums[stop]
+    with_item = values[after] + value_sums[stop] + room * ratios[stop]
+    fixed_zero[after] = with_item <= threshold
+    return fixed_one, fixed_zero
+
+def print_result(result):
+    """
+    Prints a knapsack result: the total value, the total weight and the selected items.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    print("Total Value of Selected Items:", result.total_value, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items:", result.selected_items, "\n")
+
+def plot_knapsack_solution(values, weights, selected_items):
+    """
+    Plots the selected and unselected items in the knapsack problem, showing value-to-weight ratios.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights.
+    - selected_items (list of int): Indices of selected items.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    n = len(values)
+    item_indices = list(range(1, n + 1))  # Start items from index 1
+
+    # Calculate value-to-weight ratios
+    ratios = [values[i] / weights[i] for i in range(n)]
+
+    # Define colors for selected vs. unselected items
+    colors = ['#afd30b' if (i + 1) in selected_items else '#d30b32' for i in range(n)]
+
+    # Create the bar plot
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Plot the value-to-weight ratio
+    ax.bar(item_indices, ratios, color=colors)
+    ax.set_xticks(item_indices)  # Ensure x-axis has sequential indices (1, 2, 3, ...)
+    ax.set_xlabel("Item Index")
+    ax.set_ylabel("Value-to-Weight Ratio", color='black')
+    ax.set_title("Knapsack Solution: Value-to-Weight Ratios (Green = Selected, Red = Unselected)")
+
+    # Display value and weight on each bar
+    for i in range(n):
+        ax.text(item_indices[i], ratios[i] + 0.1, f"V:{values[i]} W:{weights[i]}", ha='center', fontsize=8)
+
+    plt.show()
+
+# Example usage
+if __name__ == "__main__":
+    values = [100, 280, 120, 300, 450, 130, 150, 200, 240, 160]
+    weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
+    max_weight = 100
+
+    result = solve_0_1knapsack_online(values, weights, max_weight, show_plot=True)
+    print_result(result)
+
+    # Feed of 1,000,000 items, each leaving the feed 50,000 arrivals later, re-optimized every 100,000 arrivals
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 100, 1000000).tolist()
+    values = (np.array(weights) * rng.uniform(0.5, 1.5, 1000000)).tolist()
+    knapsack = OnlineKnapsack(max_weight=10000, reoptimize_every=100000)
+    admitted = 0
+    for i in range(len(values)):
+        admitted += knapsack.add(values[i], weights[i])[1]
+        if i >= 50000:
+            knapsack.remove(i - 50000 + 1)
+    result = knapsack.reoptimize()
+    print("Admitted Items:", admitted, "| Items Kept:", len(knapsack), "| Threshold Ratio:", f"{knapsack.threshold:.4f}", "\n")
+    print("Total Value (1,000,000 items):", result.total_value, "| Status:", result.status,
+          "| Solve Time:", f"{result.solve_time:.3f} s", "\n")
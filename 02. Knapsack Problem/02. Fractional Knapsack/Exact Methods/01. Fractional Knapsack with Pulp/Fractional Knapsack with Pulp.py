@@ -1,17 +1,50 @@
-import matplotlib.pyplot as plt
 from pulp import *
+import time
 
-def solve_fractional_knapsack_with_pulp(values, weights, max_weight, show_model=False, show_plot=True):
+class KnapsackResult:
     """
-    Solve the Fractional Knapsack Problem using linear programming with PuLP and plot the results.
+    Result of a fractional knapsack solver. It unpacks like a tuple: selected_items, total_value = result.
+
+    Attributes:
+    - selected_items (list of tuples): (Index, Fraction) of the selected items (indexed from 1), or None if no solution was found.
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - status (str): "Optimal", or the PuLP status otherwise, e.g., "Infeasible".
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "status", "solve_time")
+
+    def __init__(self, selected_items, total_value, total_weight, status, solve_time):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"selected_items={self.selected_items!r}, status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+def solve_fractional_knapsack_with_pulp(values, weights, max_weight, show_model=False, show_plot=False, msg=False):
+    """
+    Solve the Fractional Knapsack Problem using linear programming with PuLP.
 
     Parameters:
     - values (list of floats): List of item values.
     - weights (list of floats): List of item weights.
     - max_weight (float): Maximum weight capacity of the knapsack.
     - show_model (bool): If True, prints the linear programming model used to solve the knapsack problem.
-    - show_plot (bool): If True, displays a bar plot of value-to-weight ratios.
+    - show_plot (bool): If True, displays a bar plot of value-to-weight ratios. Defaults to False.
+    - msg (bool): Show the CBC log. Defaults to False.
+
+    Returns:
+    - result (KnapsackResult): The selected items with their fractions, their total value and weight, the
+      status and the solve time.
     """
+    solve_start = time.perf_counter()
 
     # Get the number of items
     n = len(values)
@@ -29,28 +62,42 @@ def solve_fractional_knapsack_with_pulp(values, weights, max_weight, show_model=
     knapsack += lpSum(weights[i] * x[i] for i in range(n)) <= max_weight, "Weight_Constraint"
 
     # Solve the problem
-    knapsack.solve()
-
-    # Retrieve and print the solution
-    if knapsack.status == LpStatusOptimal:
-        total_value = value(knapsack.objective)
-        total_weight = sum(weights[i] * value(x[i]) for i in range(n))
-        selected_items = [(i + 1, value(x[i])) for i in range(n) if value(x[i]) > 0]  # Include fractions
-
-        print("Optimal Total Value:", total_value, "\n")
-        print("Total Weight of Selected Items:", total_weight, "\n")
-        print("Selected Items (Index, Fraction):", selected_items, "\n")  # Indexes starting from 1
-
-        # Show the model summary if show_model is set to True
-        if show_model:
-            print("\nModel Summary:\n")
-            print(knapsack)
-
-        # Plot the results if show_plot is set to True
-        if show_plot:
-            plot_knapsack_solution(values, weights, selected_items)
-    else:
+    knapsack.solve(PULP_CBC_CMD(msg=msg))
+
+    # Show the model summary if show_model is set to True
+    if show_model:
+        print("\nModel Summary:\n")
+        print(knapsack)
+
+    # Retrieve the solution
+    if knapsack.status != LpStatusOptimal:
+        return KnapsackResult(None, None, None, LpStatus[knapsack.status], time.perf_counter() - solve_start)
+
+    total_value = value(knapsack.objective)
+    total_weight = sum(weights[i] * value(x[i]) for i in range(n))
+    selected_items = [(i + 1, value(x[i])) for i in range(n) if value(x[i]) > 0]  # Include fractions, indexes starting from 1
+    result = KnapsackResult(selected_items, total_value, total_weight, "Optimal", time.perf_counter() - solve_start)
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(values, weights, selected_items)
+
+    return result
+
+def print_result(result):
+    """
+    Prints a fractional knapsack result: the total value, the total weight and the selected fractions.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    if result.selected_items is None:
         print("No optimal solution found.")
+        return
+
+    print("Optimal Total Value:", result.total_value, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items (Index, Fraction):", result.selected_items, "\n")
 
 def plot_knapsack_solution(values, weights, selected_items):
     """
@@ -61,6 +108,9 @@ def plot_knapsack_solution(values, weights, selected_items):
     - weights (list of floats): List of item weights.
     - selected_items (list of tuples): (Index, Fraction) of selected items.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     n = len(values)
     item_indices = list(range(1, n + 1))  # Start items from index 1
 
@@ -96,4 +146,5 @@ if __name__ == "__main__":
     weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
     max_weight = 100
 
-    solve_fractional_knapsack_with_pulp(values, weights, max_weight, show_model=True, show_plot=True)
\ No newline at end of file
+    result = solve_fractional_knapsack_with_pulp(values, weights, max_weight, show_model=True, show_plot=True)
+    print_result(result)
@@ -1,17 +1,49 @@
-import matplotlib.pyplot as plt
 from pyomo.environ import *
+import time
 
-def solve_fractional_knapsack_with_pyomo(item_values, item_weights, max_weight, show_plot=True):
+class KnapsackResult:
     """
-    Solve the Fractional Knapsack Problem using linear programming with Pyomo and plot the results.
+    Result of a fractional knapsack solver. It unpacks like a tuple: selected_items, total_value = result.
+
+    Attributes:
+    - selected_items (list of tuples): (Index, Fraction) of the selected items (indexed from 1), or None if no solution was found.
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - status (str): "Optimal", or the termination condition otherwise, e.g., "infeasible".
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "status", "solve_time")
+
+    def __init__(self, selected_items, total_value, total_weight, status, solve_time):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"selected_items={self.selected_items!r}, status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+def solve_fractional_knapsack_with_pyomo(item_values, item_weights, max_weight, show_plot=False):
+    """
+    Solve the Fractional Knapsack Problem using linear programming with Pyomo.
 
     Parameters:
     - item_values (list of floats): List of item values.
     - item_weights (list of floats): List of item weights.
     - max_weight (float): Maximum weight capacity of the knapsack.
     - show_model (bool): If True, prints the linear programming model used to solve the knapsack problem.
-    - show_plot (bool): If True, displays a bar plot of value-to-weight ratios.
+    - show_plot (bool): If True, displays a bar plot of value-to-weight ratios. Defaults to False.
+
+    Returns:
+    - result (KnapsackResult): The selected items with their fractions, their total value and weight, the
+      status and the solve time.
     """
+    solve_start = time.perf_counter()
 
     # Get the number of items
     n = len(item_values)
@@ -37,23 +69,38 @@ def solve_fractional_knapsack_with_pyomo(item_values, item_weights, max_weight,
     model.weight_constraint = Constraint(expr=sum(model.item_weights[i] * model.x[i] for i in model.I) <= model.max_weight)
 
     # Solve the problem
-    result = SolverFactory('glpk').solve(model)
+    solver_result = SolverFactory('glpk').solve(model)
 
     # Check if the solution is optimal
-    if result.solver.termination_condition == TerminationCondition.optimal:
-        total_value = model.obj()
-        total_weight = sum(model.item_weights[i] * model.x[i].value for i in model.I)
-        selected_items = [(i, model.x[i].value) for i in model.I if model.x[i].value > 0]  # Include fractions
-
-        print("Optimal Total Value:", total_value, "\n")
-        print("Total Weight of Selected Items:", total_weight, "\n")
-        print("Selected Items (Index, Fraction):", selected_items, "\n")  # Indexes starting from 1
-
-        # Plot the results if show_plot is set to True
-        if show_plot:
-            plot_knapsack_solution(item_values, item_weights, selected_items)
-    else:
+    termination = solver_result.solver.termination_condition
+    if termination != TerminationCondition.optimal:
+        return KnapsackResult(None, None, None, str(termination), time.perf_counter() - solve_start)
+
+    total_value = model.obj()
+    total_weight = sum(model.item_weights[i] * model.x[i].value for i in model.I)
+    selected_items = [(i, model.x[i].value) for i in model.I if model.x[i].value > 0]  # Include fractions, indexes starting from 1
+    result = KnapsackResult(selected_items, total_value, total_weight, "Optimal", time.perf_counter() - solve_start)
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_knapsack_solution(item_values, item_weights, selected_items)
+
+    return result
+
+def print_result(result):
+    """
+    Prints a fractional knapsack result: the total value, the total weight and the selected fractions.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    if result.selected_items is None:
         print("No optimal solution found.")
+        return
+
+    print("Optimal Total Value:", result.total_value, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items (Index, Fraction):", result.selected_items, "\n")
 
 def plot_knapsack_solution(values, weights, selected_items):
     """
@@ -64,6 +111,9 @@ def plot_knapsack_solution(values, weights, selected_items):
     - weights (list of floats): List of item weights.
     - selected_items (list of tuples): (Index, Fraction) of selected items.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     n = len(values)
     item_indices = list(range(1, n + 1))  # Start items from index 1
 
@@ -99,4 +149,5 @@ if __name__ == "__main__":
     weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
     max_weight = 100
 
-    solve_fractional_knapsack_with_pyomo(values, weights, max_weight, show_plot=True)
\ No newline at end of file
+    result = solve_fractional_knapsack_with_pyomo(values, weights, max_weight, show_plot=True)
+    print_result(result)
@@ -1,15 +1,49 @@
-import matplotlib.pyplot as plt
+import time
 
-def solve_fractional_knapsack_with_greedy(values, weights, max_weight, show_plot=True):
+class KnapsackResult:
     """
-    Solve the Fractional Knapsack Problem using a greedy algorithm and plot the results.
+    Result of a fractional knapsack solver. It unpacks like a tuple: selected_items, total_value = result.
+
+    Attributes:
+    - selected_items (list of tuples): (Index, Fraction) of the selected items (indexed from 1).
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - status (str): "Optimal": taking items by decreasing value-to-weight ratio is optimal for the
+      fractional problem.
+    - solve_time (float): Time spent by the algorithm in seconds.
+    """
+    __slots__ = ("selected_items", "total_value", "total_weight", "status", "solve_time")
+
+    def __init__(self, selected_items, total_value, total_weight, status, solve_time):
+        self.selected_items = selected_items
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"selected_items={self.selected_items!r}, status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+def solve_fractional_knapsack_with_greedy(values, weights, max_weight, show_plot=False):
+    """
+    Solve the Fractional Knapsack Problem using a greedy algorithm.
 
     Parameters:
     - values (list of floats): List of item values.
     - weights (list of floats): List of item weights.
     - max_weight (float): Maximum weight capacity of the knapsack.
-    - show_plot (bool): If True, displays a bar plot of selected and unselected items.
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+
+    Returns:
+    - result (KnapsackResult): The selected items with their fractions, their total value and weight, the
+      status and the solve time.
     """
+    solve_start = time.perf_counter()
+
     # Calculate the value-to-weight ratios and sort items by this ratio in descending order
     items = sorted(
         [(i, values[i], weights[i], values[i] / weights[i]) for i in range(len(values))],
@@ -21,12 +55,6 @@ def solve_fractional_knapsack_with_greedy(values, weights, max_weight, show_plot
     total_weight = 0
     selected_items = []
 
-    # Print item ratios
-    print("Item | Value | Weight | Value-to-Weight Ratio")
-    print("-----------------------------------------------")
-    for i, value, weight, ratio in items:
-        print(f"{i+1:>4} | {value:>5} | {weight:>6} | {ratio:.2f}")
-
     # Select items based on greedy criteria, allowing fractional selections
     for i, value, weight, ratio in items:
         if total_weight + weight <= max_weight:
@@ -42,14 +70,36 @@ def solve_fractional_knapsack_with_greedy(values, weights, max_weight, show_plot
             total_weight += weight * fraction
             break  # Knapsack is full
 
-    print("\nTotal Value of Selected Items:", total_value, "\n")
-    print("Total Weight of Selected Items:", total_weight, "\n")
-    print("Selected Items (with fraction):", selected_items, "\n")
+    result = KnapsackResult(selected_items, total_value, total_weight, "Optimal", time.perf_counter() - solve_start)
 
     # Plot the results if show_plot is set to True
     if show_plot:
         plot_fractional_knapsack_solution(values, weights, selected_items)
 
+    return result
+
+def print_result(result, values=None, weights=None):
+    """
+    Prints a fractional knapsack result, preceded by the table of value-to-weight ratios when the items are given.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    - values (list of floats): List of item values. Defaults to None (no table).
+    - weights (list of floats): List of item weights. Defaults to None (no table).
+    """
+    if values is not None and weights is not None:
+        items = sorted(((i, values[i], weights[i], values[i] / weights[i]) for i in range(len(values))),
+                       key=lambda x: x[3], reverse=True)
+        print("Item | Value | Weight | Value-to-Weight Ratio")
+        print("-----------------------------------------------")
+        for i, value, weight, ratio in items:
+            print(f"{i+1:>4} | {value:>5} | {weight:>6} | {ratio:.2f}")
+        print()
+
+    print("Total Value of Selected Items:", result.total_value, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items (with fraction):", result.selected_items, "\n")
+
 def plot_fractional_knapsack_solution(values, weights, selected_items):
     """
     Plots the selected and unselected items in the fractional knapsack problem, showing value-to-weight ratios.
@@ -59,6 +109,9 @@ def plot_fractional_knapsack_solution(values, weights, selected_items):
     - weights (list of floats): List of item weights.
     - selected_items (list of tuples): Indices of selected items and their fraction selected.
     """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
     n = len(values)
     item_indices = list(range(1, n + 1))  # Start items from index 1
 
@@ -94,4 +147,5 @@ if __name__ == "__main__":
     weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
     max_weight = 100
 
-    solve_fractional_knapsack_with_greedy(values, weights, max_weight, show_plot=True)
\ No newline at end of file
+    result = solve_fractional_knapsack_with_greedy(values, weights, max_weight, show_plot=True)
+    print_result(result, values, weights)
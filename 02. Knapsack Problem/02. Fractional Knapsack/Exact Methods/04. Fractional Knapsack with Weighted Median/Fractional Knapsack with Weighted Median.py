@@ -0,0 +1,361 @@
+import numpy as np
+import time
+
+# Items sampled per round to estimate the ratio of the critical item
+SAMPLE_SIZE = 100_000
+
+# Once this few items are left, they are sorted
+EXACT_SIZE = 50_000
+
+class KnapsackResult:
+    """
+    Result of a fractional knapsack solver. It unpacks like a tuple: selected_items, total_value = result.
+
+    Attributes:
+    - items (numpy array): Selected items (indexed from 1), in increasing order.
+    - fractions (numpy array): Fraction taken of every selected item: 1.0, except for the critical item.
+    - total_value (float): Total value of the selected items.
+    - total_weight (float): Total weight of the selected items.
+    - critical_item (int): The item that is only partly taken (indexed from 1), or None if every item fits.
+    - status (str): "Optimal": taking items by decreasing value-to-weight ratio is optimal for the
+      fractional problem.
+    - solve_time (float): Time spent by the algorithm in seconds.
+    """
+    __slots__ = ("items", "fractions", "total_value", "total_weight", "critical_item", "status", "solve_time")
+
+    def __init__(self, items, fractions, total_value, total_weight, critical_item, status, solve_time):
+        self.items = items
+        self.fractions = fractions
+        self.total_value = total_value
+        self.total_weight = total_weight
+        self.critical_item = critical_item
+        self.status = status
+        self.solve_time = solve_time
+
+    @property
+    def selected_items(self):
+        """(Index, Fraction) of the selected items (indexed from 1), in increasing order of the index."""
+        return list(zip(self.items.tolist(), self.fractions.tolist()))
+
+    def __iter__(self):
+        return iter((self.selected_items, self.total_value))
+
+    def __repr__(self):
+        return (f"KnapsackResult(total_value={self.total_value!r}, total_weight={self.total_weight!r}, "
+                f"items={len(self.items)}, critical_item={self.critical_item!r}, status={self.status!r}, "
+                f"solve_time={self.solve_time:.6f})")
+
+def solve_fractional_knapsack_with_weighted_median(values, weights, max_weight, show_plot=False):
+    """
+    Solve the Fractional Knapsack Problem in expected O(n) time, without sorting the items.
+
+    The greedy algorithm takes the items by decreasing value-to-weight ratio until the critical item,
+    the first one that does not fit, and takes the fitting fraction of it. Only the critical item has
+    to be found: every item with a higher ratio is taken entirely, every item with a lower ratio is
+    left out. It is found with a weighted selection. A random sample estimates the ratio at which the
+    sampled weights fill the knapsack, and two ratios around it split the items into three groups with
+    one vectorized pass. Only the group that holds the critical item is kept, and the rest of the
+    capacity is adjusted. Every round shrinks the items to a small fraction, and once few are left they
+    are sorted. Items with equal ratios are taken in the order of their index, like
+    solve_fractional_knapsack_with_greedy, so the selection is the same.
+
+    Parameters:
+    - values (list or numpy array of floats): List of item values.
+    - weights (list or numpy array of floats): List of item weights, non-negative.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - show_plot (bool): If True, displays a bar plot of selected and unselected items. Defaults to False.
+
+    Returns:
+    - result (KnapsackResult): The selected items with their fractions, their total value and weight, the
+      critical item, the status and the solve time. It unpacks like the tuple (selected_items, total_value).
+    """
+    solve_start = time.perf_counter()
+
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    ratios = item_ratios(values, weights)
+    full, critical = fractional_selection(ratios, weights, max_weight)
+    result = knapsack_result(np.arange(len(values)), values, weights, full, critical, max_weight, solve_start)
+
+    # Plot the results if show_plot is set to True
+    if show_plot:
+        plot_fractional_knapsack_solution(values, weights, result.selected_items)
+
+    return result
+
+def solve_fractional_knapsack_in_chunks(chunks, max_weight):
+    """
+    Solve the Fractional Knapsack Problem over items that arrive in chunks, e.g., read from a file.
+
+    Only the items that can still be selected are kept. After every chunk, the critical item of the
+    kept items and the new chunk is found with fractional_selection. Every item with a lower ratio is
+    dropped: later items can only push the critical ratio up, so it is never selected. The memory thus
+    stays proportional to the number of items in the knapsack plus one chunk, and the result is the
+    same as solving all items at once.
+
+    Parameters:
+    - chunks (iterable): (values, weights) pairs of lists or numpy arrays, one per chunk. The items are
+      indexed from 1 across all chunks, in the order they arrive.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+
+    Returns:
+    - result (KnapsackResult): The selected items with their fractions, their total value and weight, the
+      critical item, the status and the solve time. It unpacks like the tuple (selected_items, total_value).
+    """
+    solve_start = time.perf_counter()
+
+    kept_items = np.zeros(0, dtype=np.int64)
+    kept_values, kept_weights, kept_ratios = np.zeros(0), np.zeros(0), np.zeros(0)
+    full, critical = np.zeros(0, dtype=bool), -1
+    offset = 0
+
+    for chunk_values, chunk_weights in chunks:
+        chunk_values = np.asarray(chunk_values, dtype=float)
+        chunk_weights = np.asarray(chunk_weights, dtype=float)
+        chunk_ratios = item_ratios(chunk_values, chunk_weights)
+        chunk_items = np.arange(offset, offset + len(chunk_values))
+        offset += len(chunk_values)
+
+        # Items below the current critical ratio can never be selected
+        if critical >= 0:
+            useful = np.flatnonzero(chunk_ratios >= kept_ratios[critical])
+            chunk_items, chunk_values = chunk_items[useful], chunk_values[useful]
+            chunk_weights, chunk_ratios = chunk_weights[useful], chunk_ratios[useful]
+
+        # The kept items come first, so the positions stay in the order of the item indices
+        kept_items = np.concatenate((kept_items, chunk_items))
+        kept_values = np.concatenate((kept_values, chunk_values))
+        kept_weights = np.concatenate((kept_weights, chunk_weights))
+        kept_ratios = np.concatenate((kept_ratios, chunk_ratios))
+        full, critical = fractional_selection(kept_ratios, kept_weights, max_weight)
+
+        # Keep the items taken entirely and the critical item
+        keep = full.copy()
+        if critical >= 0:
+            keep[critical] = True
+            critical = int(np.count_nonzero(keep[:critical]))
+        keep = np.flatnonzero(keep)
+        kept_items, kept_values = kept_items[keep], kept_values[keep]
+        kept_weights, kept_ratios = kept_weights[keep], kept_ratios[keep]
+        full = full[keep]
+
+    return knapsack_result(kept_items, kept_values, kept_weights, full, critical, max_weight, solve_start)
+
+def item_ratios(values, weights):
+    """
+    Value-to-weight ratio of every item: inf for items with a positive value and no weight, and -inf for
+    items without a positive value, which are never selected.
+
+    Parameters:
+    - values (numpy array): Item values.
+    - weights (numpy array): Item weights.
+
+    Returns:
+    - ratios (numpy array): Value-to-weight ratio of every item.
+    """
+    if np.any(weights < 0):
+        raise ValueError("The weights must be non-negative.")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = values / weights
+    ratios[~(values > 0)] = -np.inf
+    return ratios
+
+def fractional_selection(ratios, weights, capacity):
+    """
+    Find the items the fractional greedy takes entirely and its critical item.
+
+    Parameters:
+    - ratios (numpy array): Value-to-weight ratio of every item, from item_ratios.
+    - weights (numpy array): Weight of every item.
+    - capacity (float): Capacity of the knapsack.
+
+    Returns:
+    - full (numpy array): Boolean mask of the items taken entirely.
+    - critical (int): Position of the critical item, or -1 if every item with a positive value fits.
+    """
+    critical = critical_item(ratios, weights, capacity)
+    if critical < 0 or ratios[critical] == -np.inf:
+        return ratios > -np.inf, -1
+
+    # Higher ratios are taken, and so are equal ratios that come before the critical item
+    critical_ratio = ratios[critical]
+    full = ratios > critical_ratio
+    full[np.flatnonzero(ratios[:critical] == critical_ratio)] = True
+    return full, critical
+
+def critical_item(ratios, weights, capacity):
+    """
+    Find the critical item of the fractional greedy with a weighted selection in expected O(n) time.
+
+    Every round estimates the ratio of the critical item from a random sample: the sampled items are
+    sorted, their cumulative weight is scaled up to all items, and the ratios where it crosses the
+    capacity, a few standard deviations before and after, are the bounds of a band. One vectorized
+    pass splits the items into the ratios above the band, in it and below it. The weight above tells
+    which group holds the critical item; only that group is kept, with the capacity reduced by the
+    weight of the groups before it. Once few items are left, they are sorted by decreasing ratio
+    (ties in the order of their position) and the cumulative weight gives the critical item.
+
+    Parameters:
+    - ratios (numpy array): Value-to-weight ratio of every item.
+    - weights (numpy array): Weight of every item.
+    - capacity (float): Capacity of the knapsack.
+
+    Returns:
+    - critical (int): Position of the critical item, or -1 if every item fits.
+    """
+    rng = np.random.default_rng(0)
+    positions = None  # Positions of the remaining items; None while all items remain
+    exact = False
+
+    while True:
+        n = len(ratios)
+        if n <= EXACT_SIZE or exact:
+            # Masks keep the positions in increasing order, so a stable sort takes equal ratios by position
+            order = np.argsort(-ratios, kind="stable")
+            fitting = int(np.searchsorted(np.cumsum(weights[order]), capacity, side="right"))
+            if fitting == n:
+                return -1
+            critical = int(order[fitting])
+            return critical if positions is None else int(positions[critical])
+
+        # Estimate the rank of the critical item among the sampled ratios
+        size = min(SAMPLE_SIZE, n // 4)
+        sample = rng.integers(0, n, size)
+        sample = sample[np.argsort(-ratios[sample])]
+        sample_ratios = ratios[sample]
+        reached = np.cumsum(weights[sample]) * (n / size)
+        rank = int(np.searchsorted(reached, capacity))
+        spread = 3 * int(np.sqrt(size)) + 1
+        upper = sample_ratios[rank - spread] if rank - spread >= 0 else np.inf
+        lower = sample_ratios[rank + spread] if rank + spread < size else -np.inf
+
+        above = ratios > upper
+        above_weight = float(weights @ above)
+        if above_weight > capacity:
+            keep = above
+        else:
+            band = (ratios >= lower) & ~above
+            band_weight = float(weights @ band)
+            if above_weight + band_weight > capacity:
+                keep = band
+                capacity -= above_weight
+            else:
+                keep = ratios < lower
+                capacity -= above_weight + band_weight
+                if not keep.any():
+                    return -1
+
+        kept = np.flatnonzero(keep)
+        # With many equal ratios the band may not shrink; the remaining items are then sorted
+        exact = len(kept) == n
+        positions = kept if positions is None else positions[kept]
+        ratios, weights = ratios[kept], weights[kept]
+
+def knapsack_result(items, values, weights, full, critical, max_weight, solve_start):
+    """
+    Build the result from the items taken entirely and the critical item.
+
+    Parameters:
+    - items (numpy array): Index (0-based) of every item.
+    - values, weights (numpy arrays): Value and weight of every item.
+    - full (numpy array): Boolean mask of the items taken entirely.
+    - critical (int): Position of the critical item, or -1 if every item fits.
+    - max_weight (float): Maximum weight capacity of the knapsack.
+    - solve_start (float): time.perf_counter() value when the solver started.
+
+    Returns:
+    - result (KnapsackResult): The result of the solver.
+    """
+    # Integer positions and dot products are much faster than boolean indexing on millions of items
+    selected = items[np.flatnonzero(full)] + 1  # Indexes starting from 1
+    fractions = np.ones(len(selected))
+    total_value = float(values @ full)
+    total_weight = float(weights @ full)
+    critical_item = None
+
+    if critical >= 0:
+        # Take the fraction of the critical item that fits
+        fraction = min(max((max_weight - total_weight) / weights[critical], 0.0), 1.0)
+        critical_item = int(items[critical]) + 1
+        at = int(np.searchsorted(selected, critical_item))
+        selected = np.insert(selected, at, critical_item)
+        fractions = np.insert(fractions, at, fraction)
+        total_value += values[critical] * fraction
+        total_weight += weights[critical] * fraction
+
+    return KnapsackResult(selected, fractions, total_value, total_weight, critical_item, "Optimal",
+                          time.perf_counter() - solve_start)
+
+def print_result(result):
+    """
+    Prints a fractional knapsack result: the total value, the total weight and the selected items.
+
+    Parameters:
+    - result (KnapsackResult): The result returned by the solver.
+    """
+    print("Total Value of Selected Items:", result.total_value, "\n")
+    print("Total Weight of Selected Items:", result.total_weight, "\n")
+    print("Selected Items (with fraction):", result.selected_items, "\n")
+
+def plot_fractional_knapsack_solution(values, weights, selected_items):
+    """
+    Plots the selected and unselected items in the fractional knapsack problem, showing value-to-weight ratios.
+
+    Parameters:
+    - values (list of floats): List of item values.
+    - weights (list of floats): List of item weights.
+    - selected_items (list of tuples): Indices of selected items and their fraction selected.
+    """
+    # matplotlib is only imported when a plot is requested
+    import matplotlib.pyplot as plt
+
+    n = len(values)
+    item_indices = list(range(1, n + 1))  # Start items from index 1
+
+    # Calculate value-to-weight ratios
+    ratios = [values[i] / weights[i] for i in range(n)]
+
+    # Define colors for selected vs. unselected items, with transparency for fractions
+    colors = ['#afd30b' if any(i + 1 == item[0] for item in selected_items) else '#d30b32' for i in range(n)]
+    alphas = [next((item[1] for item in selected_items if item[0] == i + 1), 1.0) for i in range(n)]
+
+    # Create the bar plot
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Plot the value-to-weight ratio with transparency for fractional selections
+    bars = ax.bar(item_indices, ratios, color=colors)
+    for bar, alpha in zip(bars, alphas):
+        bar.set_alpha(alpha)
+
+    ax.set_xticks(item_indices)  # Ensure x-axis has sequential indices (1, 2, 3, ...)
+    ax.set_xlabel("Item Index")
+    ax.set_ylabel("Value-to-Weight Ratio", color='black')
+    ax.set_title("Fractional Knapsack Solution: Value-to-Weight Ratios (Green = Selected, Red = Unselected)")
+
+    # Display value and weight on each bar
+    for i in range(n):
+        ax.text(item_indices[i], ratios[i] + 0.1, f"V:{values[i]} W:{weights[i]}", ha='center', fontsize=8)
+
+    plt.show()
+
+# Example usage
+if __name__ == "__main__":
+    values = [100, 280, 120, 300, 450, 130, 150, 200, 240, 160]
+    weights = [10, 40, 20, 50, 60, 15, 25, 30, 45, 35]
+    max_weight = 100
+
+    result = solve_fractional_knapsack_with_weighted_median(values, weights, max_weight, show_plot=True)
+    print_result(result)
+
+    # Large instance: 10,000,000 items
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 1000, 10000000)
+    values = rng.uniform(1, 1000, 10000000)
+    max_weight = weights.sum() / 2
+    result = solve_fractional_knapsack_with_weighted_median(values, weights, max_weight)
+    print("Total Value (10,000,000 items):", result.total_value, "| Solve Time:", f"{result.solve_time:.3f} s", "\n")
+
+    # The same items in chunks of 1,000,000
+    chunks = ((values[start:start + 1000000], weights[start:start + 1000000]) for start in range(0, 10000000, 1000000))
+    result = solve_fractional_knapsack_in_chunks(chunks, max_weight)
+    print("Total Value (in chunks):", result.total_value, "| Solve Time:", f"{result.solve_time:.3f} s", "\n")
@@ -1,19 +1,51 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import time
 import heapq
 
-def solve_MST_with_prim(nodes, edges):
+class MSTResult:
+    """
+    Result of an MST solver. It unpacks like a tuple: mst_edges, total_weight = result.
+
+    Attributes:
+    - mst_edges (list of tuples): Edges of the MST as (node1, node2, weight).
+    - total_weight (float): Total weight of the MST.
+    - status (str): "Optimal", or "Disconnected" if the graph has no spanning tree (mst_edges then only
+      spans the component of the first node).
+    - solve_time (float): Time spent by the algorithm in seconds.
+    """
+    __slots__ = ("mst_edges", "total_weight", "status", "solve_time")
+
+    def __init__(self, mst_edges, total_weight, status, solve_time):
+        self.mst_edges = mst_edges
+        self.total_weight = total_weight
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.mst_edges, self.total_weight))
+
+    def __repr__(self):
+        return (f"MSTResult(total_weight={self.total_weight!r}, edges={len(self.mst_edges)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+def solve_MST_with_prim(nodes, edges, show_plot=False):
     """
     Solves the MST problem using Prim's algorithm.
 
     Parameters:
     - nodes (list of ints): List of node identifiers.
     - edges (dict): Dictionary with (node1, node2) tuples as keys and weights as values.
+    - show_plot (bool): If True, plots the graph with the MST highlighted. Defaults to False.
+
+    Returns:
+    - result (MSTResult): The MST edges, total weight, status and solve time.
     """
-    # Create a graph from edges for easier management
-    G = nx.Graph()
-    G.add_nodes_from(nodes)
-    G.add_weighted_edges_from(((node1, node2, weight) for (node1, node2), weight in edges.items()))
+    solve_start = time.perf_counter()
+
+    # Create an adjacency list for the graph (undirected)
+    graph = {node: [] for node in nodes}
+    for (node1, node2), weight in edges.items():
+        graph[node1].append((node2, weight))
+        graph[node2].append((node1, weight))
 
     # Initialize variables for Prim's algorithm
     mst_edges = []  # List to store edges in the MST
@@ -26,8 +58,8 @@ def solve_MST_with_prim(nodes, edges):
     visited.add(start_node)
 
     # Add edges from the start node to the min-heap
-    for neighbor, weight in G[start_node].items():
-        heapq.heappush(min_heap, (weight['weight'], start_node, neighbor))
+    for neighbor, weight in graph[start_node]:
+        heapq.heappush(min_heap, (weight, start_node, neighbor))
 
     # Main loop for Prim's algorithm
     while min_heap:
@@ -38,24 +70,37 @@ def solve_MST_with_prim(nodes, edges):
             total_weight += weight  # Update total weight
 
             # Add edges from the new node to the min-heap
-            for neighbor, edge_weight in G[node2].items():
+            for neighbor, edge_weight in graph[node2]:
                 if neighbor not in visited:
-                    heapq.heappush(min_heap, (edge_weight['weight'], node2, neighbor))
+                    heapq.heappush(min_heap, (edge_weight, node2, neighbor))
 
             # Stop if we have enough edges for an MST
             if len(mst_edges) == len(nodes) - 1:
                 break
 
-    # Display the total weight and selected edges in the MST
-    print("Optimal Total Weight:", total_weight, "\n")
+    status = "Optimal" if len(mst_edges) == len(nodes) - 1 else "Disconnected"
+    result = MSTResult(mst_edges, total_weight, status, time.perf_counter() - solve_start)
+
+    # Plot the MST if show_plot is True
+    if show_plot:
+        plot_mst(nodes, edges, mst_edges)
+
+    return result
+
+
+def print_result(result):
+    """
+    Prints the total weight and the selected edges of an MST result.
+
+    Parameters:
+    - result (MSTResult): The result returned by the solver.
+    """
+    print("Optimal Total Weight:" if result.status == "Optimal" else "Total Weight (graph is disconnected):", result.total_weight, "\n")
     print("Selected Edges in MST:")
-    for edge in mst_edges:
+    for edge in result.mst_edges:
         print(f"Edge: ({edge[0]}, {edge[1]}), Weight: {edge[2]}")
     print("\n")
 
-    # Plot the MST for visual understanding
-    plot_mst(nodes, edges, mst_edges)
-
 
 def plot_mst(nodes, edges, mst_edges):
     """
@@ -66,6 +111,10 @@ def plot_mst(nodes, edges, mst_edges):
     - edges (dict): All edges with weights.
     - mst_edges (list): MST edges as (node1, node2, weight).
     """
+    # Plotting libraries are only imported when a plot is requested
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     # Set figure size for better visibility
     plt.figure(figsize=(10, 6))  # Adjust width and height as needed
 
@@ -114,4 +163,6 @@ if __name__ == "__main__":
         (4, 6): 3
     }
 
-    solve_MST_with_prim(nodes, edges)
\ No newline at end of file
+    result = solve_MST_with_prim(nodes, edges)
+    print_result(result)
+    plot_mst(nodes, edges, result.mst_edges)
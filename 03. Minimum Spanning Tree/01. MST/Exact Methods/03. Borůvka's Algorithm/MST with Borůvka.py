@@ -1,5 +1,31 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import time
+
+class MSTResult:
+    """
+    Result of an MST solver. It unpacks like a tuple: mst_edges, total_weight = result.
+
+    Attributes:
+    - mst_edges (list of tuples): Edges of the MST as (node1, node2, weight).
+    - total_weight (float): Total weight of the MST.
+    - status (str): "Optimal", or "Disconnected" if the graph has no spanning tree (mst_edges is then a
+      minimum spanning forest).
+    - solve_time (float): Time spent by the algorithm in seconds.
+    """
+    __slots__ = ("mst_edges", "total_weight", "status", "solve_time")
+
+    def __init__(self, mst_edges, total_weight, status, solve_time):
+        self.mst_edges = mst_edges
+        self.total_weight = total_weight
+        self.status = status
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.mst_edges, self.total_weight))
+
+    def __repr__(self):
+        return (f"MSTResult(total_weight={self.total_weight!r}, edges={len(self.mst_edges)}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.6f})")
+
 
 class UnionFind:
     """Union-Find structure to manage connected components."""
@@ -22,14 +48,19 @@ class UnionFind:
             self.parent[root2] = root1  # Merge component of root2 into root1
 
 
-def solve_MST_with_boruvka(nodes, edges):
+def solve_MST_with_boruvka(nodes, edges, show_plot=False):
     """
     Solves the MST problem using Borůvka's algorithm.
 
     Parameters:
     - nodes (list of ints): List of node identifiers.
     - edges (dict): Dictionary with (node1, node2) tuples as keys and weights as values.
+    - show_plot (bool): If True, plots the graph with the MST highlighted. Defaults to False.
+
+    Returns:
+    - result (MSTResult): The MST edges, total weight, status and solve time.
     """
+    solve_start = time.perf_counter()
     union_find = UnionFind(nodes)  # Initialize Union-Find structure
     mst_edges = []  # List to store edges in the MST
     total_weight = 0  # Accumulate total MST weight
@@ -51,6 +82,10 @@ def solve_MST_with_boruvka(nodes, edges):
                 if root2 not in min_edges or min_edges[root2][1] > weight:
                     min_edges[root2] = ((node1, node2), weight)
 
+        # No edge leaves any component: the graph is disconnected
+        if not min_edges:
+            break
+
         # Add the minimum edges to the MST
         for edge, weight in min_edges.values():
             node1, node2 = edge
@@ -60,16 +95,29 @@ def solve_MST_with_boruvka(nodes, edges):
                 union_find.union(node1, node2)  # Merge components
                 num_components -= 1  # Decrease the component count
 
-    # Display the total weight and selected edges in MST
-    print("Optimal Total Weight:", total_weight, "\n")
+    status = "Optimal" if len(mst_edges) == len(nodes) - 1 else "Disconnected"
+    result = MSTResult(mst_edges, total_weight, status, time.perf_counter() - solve_start)
+
+    # Plot the MST if show_plot is True
+    if show_plot:
+        plot_mst(nodes, edges, mst_edges)
+
+    return result
+
+
+def print_result(result):
+    """
+    Prints the total weight and the selected edges of an MST result.
+
+    Parameters:
+    - result (MSTResult): The result returned by the solver.
+    """
+    print("Optimal Total Weight:" if result.status == "Optimal" else "Total Weight (graph is disconnected):", result.total_weight, "\n")
     print("Selected Edges in MST:")
-    for edge in mst_edges:
+    for edge in result.mst_edges:
         print(f"Edge: ({edge[0]}, {edge[1]}), Weight: {edge[2]}")
     print("\n")
 
-    # Plot the MST for visual understanding
-    plot_mst(nodes, edges, mst_edges)
-
 
 def plot_mst(nodes, edges, mst_edges):
     """
@@ -80,6 +128,10 @@ def plot_mst(nodes, edges, mst_edges):
     - edges (dict): All edges with weights.
     - mst_edges (list): MST edges as (node1, node2, weight).
     """
+    # Plotting libraries are only imported when a plot is requested
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     # Set figure size for better visibility
     plt.figure(figsize=(10, 6))  # Adjust width and height as needed
 
@@ -128,4 +180,6 @@ if __name__ == "__main__":
         (4, 6): 3
     }
 
-    solve_MST_with_boruvka(nodes, edges)
\ No newline at end of file
+    result = solve_MST_with_boruvka(nodes, edges)
+    print_result(result)
+    plot_mst(nodes, edges, result.mst_edges)
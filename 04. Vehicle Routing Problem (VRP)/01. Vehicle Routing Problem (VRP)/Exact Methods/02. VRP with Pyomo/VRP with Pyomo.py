@@ -10,10 +10,77 @@ Original file is located at
 #!pip install pyomo
 #!apt-get install -y -qq glpk-utils
 from pyomo.environ import *
-import matplotlib.pyplot as plt
-import networkx as nx
+from pyomo.opt import SolutionStatus
+import numpy as np
+import math
+import time
+
+# Names of the relative MIP gap and thread count options of the supported solvers
+MIP_GAP_OPTIONS = {"glpk": "mipgap", "cbc": "ratioGap", "gurobi": "MIPGap"}
+THREADS_OPTIONS = {"cbc": "threads", "gurobi": "Threads"}
+
+class VRPResult:
+    """
+    Result of a VRP solver. It unpacks like a tuple: routes, total_distance, bound, gap = result.
+
+    Attributes:
+    - routes (dict): Route of every vehicle as a list of locations (0-based), keyed by vehicle (1-based), or
+      None if no solution was found.
+    - total_distance (float): Total distance of all routes.
+    - route_distances (dict): Distance of every vehicle's route, keyed by vehicle.
+    - bound (float): Best lower bound on the optimal total distance (None if the solver does not report it).
+    - gap (float): Relative gap between total_distance and bound (0 when optimal, None if unknown).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("routes", "total_distance", "route_distances", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, routes, total_distance, route_distances, bound, gap, status, build_time, solve_time):
+        self.routes = routes
+        self.total_distance = total_distance
+        self.route_distances = route_distances
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.routes, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"VRPResult(total_distance={self.total_distance!r}, routes={self.routes!r}, bound={self.bound!r}, "
+                f"gap={self.gap!r}, status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
+
+def solve_VRP_with_pyomo(distance_matrix, demand, num_vehicles, depot=0, show_model=False, show_plot=False,
+                         time_limit=None, mip_gap=None, threads=None):
+    """
+    Solve the Vehicle Routing Problem (VRP) using Pyomo.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between locations (0-based index), or its
+      upper triangle as a condensed 1D array.
+    - demand (list): Demand of every location (not used in the VRP).
+    - num_vehicles (int): Number of vehicles.
+    - depot (int): Depot location. Defaults to 0.
+    - show_model (bool): If True, prints the Pyomo model. Defaults to False.
+    - show_plot (bool): If True, plots the routes. Defaults to False.
+    - time_limit (float): Time limit in seconds. When it is reached, the best routes found so far are reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the solver stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads, for solvers that support it (not GLPK). Defaults to None (solver default).
+
+    Returns:
+    - result (VRPResult): The routes, their total and per-vehicle distances, the bound, the gap, the status and
+      the build and solve times. It unpacks like the tuple (routes, total_distance, bound, gap).
+    """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix).tolist()
+
+    build_start = time.perf_counter()
 
-def solve_VRP_with_pyomo(distance_matrix, demand, num_vehicles, depot=0, show_model=False, show_plot=True):
     num_locations = len(distance_matrix)
     locations = range(num_locations)
 
@@ -62,48 +129,151 @@ def solve_VRP_with_pyomo(distance_matrix, demand, num_vehicles, depot=0, show_mo
         return sum(model.x[i, model.depot, k] for i in model.Locations if i != model.depot) == 1
     vrp_model.end_constraint = Constraint(vrp_model.Vehicles, rule=end_constraint)
 
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
     # Solve the model
-    SolverFactory('glpk').solve(vrp_model)
+    status, bound, gap = solve_with_limits(SolverFactory('glpk'), vrp_model, time_limit, mip_gap, threads)
+
+    solve_time = time.perf_counter() - solve_start
 
     # Show model details if requested
     if show_model:
         vrp_model.pprint()
 
-    # Retrieve and print the solution
-    if vrp_model.obj() is not None:
-        print("Total Distance:", vrp_model.obj(), "\n")
-
-        # Extract the solution routes for each vehicle
-        routes = {k: [] for k in vrp_model.Vehicles}
-        distances = {k: 0 for k in vrp_model.Vehicles}  # Store total distance for each vehicle
-
-        # Build the routes based on the x variable values
-        for k in vrp_model.Vehicles:
-            route = [depot]
-            total_distance = 0
-            current_location = vrp_model.depot
-            while True:
-                next_location = next((j for j in vrp_model.Locations if j != current_location and vrp_model.x[current_location, j, k].value == 1), None)
-                if next_location is None or next_location == vrp_model.depot:
-                    break
-                route.append(next_location - 1)  # Adjust for original 0-indexed list
-                total_distance += distance_matrix[current_location - 1][next_location - 1]
-                current_location = next_location
-            route.append(depot)
-            total_distance += distance_matrix[current_location - 1][depot]  # Add return to depot
-            routes[k] = route
-            distances[k] = total_distance
-            print(f"Route for vehicle {k}: {route}")
-            print(f"Total Distance for vehicle {k}: {total_distance}")
-
-        # Plot the routes if requested
-        if show_plot:
-            print("\n")
-            plot_vrp_solution(distance_matrix, routes)
-    else:
+    # Retrieve the solution
+    if status not in ("Optimal", "Feasible"):
+        return VRPResult(None, None, None, None, None, status, build_time, solve_time)
+
+    # Extract the solution routes for each vehicle
+    routes = {k: [] for k in vrp_model.Vehicles}
+    distances = {k: 0 for k in vrp_model.Vehicles}  # Store total distance for each vehicle
+
+    # Build the routes based on the x variable values
+    for k in vrp_model.Vehicles:
+        route = [depot]
+        total_distance = 0
+        current_location = vrp_model.depot
+        while True:
+            next_location = next((j for j in vrp_model.Locations if j != current_location and vrp_model.x[current_location, j, k].value == 1), None)
+            if next_location is None or next_location == vrp_model.depot:
+                break
+            route.append(next_location - 1)  # Adjust for original 0-indexed list
+            total_distance += distance_matrix[current_location - 1][next_location - 1]
+            current_location = next_location
+        route.append(depot)
+        total_distance += distance_matrix[current_location - 1][depot]  # Add return to depot
+        routes[k] = route
+        distances[k] = total_distance
+
+    result = VRPResult(routes, vrp_model.obj(), distances, bound, gap, status, build_time, solve_time)
+
+    # Plot the routes if requested
+    if show_plot:
+        plot_vrp_solution(distance_matrix, routes)
+
+    return result
+
+def print_result(result):
+    """
+    Prints a VRP result: the build and solve times, the total distance (with the bound and gap when not
+    optimal) and the route and distance of every vehicle.
+
+    Parameters:
+    - result (VRPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.routes is None:
         print("No optimal solution found.")
+        return
+
+    print("Total Distance:", result.total_distance, "\n")
+    if result.status == "Feasible":
+        # Stopped early: the routes below are the best found, not necessarily optimal
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    for k, route in result.routes.items():
+        print(f"Route for vehicle {k}: {route}")
+        print(f"Total Distance for vehicle {k}: {result.route_distances[k]}")
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def solve_with_limits(solver, model, time_limit=None, mip_gap=None, threads=None, warmstart=False):
+    """
+    Solve a Pyomo model under an optional time limit and relative MIP gap, keeping the best solution
+    found when the solver stops early.
+
+    Parameters:
+    - solver: Solver created with SolverFactory.
+    - model (ConcreteModel): The model to solve, with a single active objective.
+    - time_limit (float): Time limit in seconds (rounded up to whole seconds). Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads, if the solver supports it. Defaults to None.
+    - warmstart (bool): Start from the current values of the variables. Defaults to False.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition
+      otherwise, e.g., "infeasible".
+    - bound (float): Best bound on the objective value (None if unknown).
+    - gap (float): Relative gap between the objective value and the bound (None if unknown).
+    """
+    if mip_gap is not None and solver.name in MIP_GAP_OPTIONS:
+        solver.options[MIP_GAP_OPTIONS[solver.name]] = mip_gap
+    if threads is not None and solver.name in THREADS_OPTIONS:
+        solver.options[THREADS_OPTIONS[solver.name]] = threads
+    options = {"warmstart": True} if warmstart else {}
+    if time_limit is not None:
+        options["timelimit"] = max(1, math.ceil(time_limit))
+
+    result = solver.solve(model, load_solutions=False, **options)
+    if len(result.solution) == 0 or result.solution(0).status not in (
+            SolutionStatus.optimal, SolutionStatus.feasible, SolutionStatus.stoppedByLimit, SolutionStatus.bestSoFar):
+        return str(result.solver.termination_condition), None, None
+    model.solutions.load_from(result)
+
+    objective = next(model.component_data_objects(Objective, active=True))
+    objective_value = value(objective)
+    optimal = result.solver.termination_condition == TerminationCondition.optimal
+    bound = result.problem.lower_bound if objective.sense == minimize else result.problem.upper_bound
+    if bound is None or not math.isfinite(bound):
+        bound = objective_value if optimal else None
+    elif objective.sense == maximize and bound < objective_value - 1e-6 * max(1.0, abs(objective_value)):
+        # Pyomo's CBC interface can report the bound of a maximization with the sign of CBC's internal minimization
+        bound = -bound if -bound >= objective_value else None
+    gap = None if bound is None else abs(objective_value - bound) / max(abs(objective_value), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal", but the solution is only known to be within the gap
+    if mip_gap is not None and (gap is None or gap > 1e-9):
+        optimal = False
+    return ("Optimal" if optimal else "Feasible"), bound, gap
 
 def plot_vrp_solution(distance_matrix, routes):
+    # Plotting libraries are only imported when a plot is requested
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.Graph()
     num_locations = len(distance_matrix)
 
@@ -136,4 +306,5 @@ if __name__ == "__main__":
     demand = [0, 10, 20, 30, 40]  # 0 demand for the depot (not used in VRP)
     num_vehicles = 2
 
-    solve_VRP_with_pyomo(distance_matrix, demand, num_vehicles, show_model=False, show_plot=True)
\ No newline at end of file
+    result = solve_VRP_with_pyomo(distance_matrix, demand, num_vehicles, show_model=False, show_plot=True)
+    print_result(result)
@@ -1,9 +1,79 @@
 # !pip install pulp
 from pulp import *
-import matplotlib.pyplot as plt
-import networkx as nx
+import numpy as np
+import math
+import os
+import re
+import tempfile
+import time
+
+class CVRPResult:
+    """
+    Result of a CVRP solver. It unpacks like a tuple: routes, total_distance, bound, gap = result.
+
+    Attributes:
+    - routes (dict): Route of every vehicle as a list of locations, keyed by vehicle (0-based), or None if no
+      solution was found.
+    - total_distance (float): Total distance of all routes.
+    - route_distances (dict): Distance of every vehicle's route, keyed by vehicle.
+    - bound (float): Best lower bound on the optimal total distance.
+    - gap (float): Relative gap between total_distance and bound (0 when optimal).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the
+      time limit without a solution), or the PuLP status otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("routes", "total_distance", "route_distances", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, routes, total_distance, route_distances, bound, gap, status, build_time, solve_time):
+        self.routes = routes
+        self.total_distance = total_distance
+        self.route_distances = route_distances
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.routes, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"CVRPResult(total_distance={self.total_distance!r}, routes={self.routes!r}, bound={self.bound!r}, "
+                f"gap={self.gap!r}, status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
+
+def solve_CVRP_with_pulp(distance_matrix, demand, vehicle_capacity, num_vehicles, depot=0, show_model=False, show_plot=False, warm_start=None,
+                         time_limit=None, mip_gap=None, threads=None, msg=False):
+    """
+    Solve the Capacitated Vehicle Routing Problem (CVRP) using linear programming with PuLP.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between locations (0-based index), or its
+      upper triangle as a condensed 1D array.
+    - demand (list): Demand of every location (0 for the depot).
+    - vehicle_capacity (int): Capacity of every vehicle.
+    - num_vehicles (int): Number of vehicles.
+    - depot (int): Depot location. Defaults to 0.
+    - show_model (bool): If True, prints the linear programming model. Defaults to False.
+    - show_plot (bool): If True, plots the routes. Defaults to False.
+    - warm_start (list of lists): One route per vehicle to start from, e.g., [[0, 1, 4, 0], [0, 3, 2, 0]].
+      Defaults to None (cold start).
+    - time_limit (float): Time limit in seconds for CBC. When it is reached, the best routes found so far are
+      reported together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which CBC stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - msg (bool): Show the CBC log. Defaults to False.
+
+    Returns:
+    - result (CVRPResult): The routes, their total and per-vehicle distances, the bound, the gap, the status and
+      the build and solve times. It unpacks like the tuple (routes, total_distance, bound, gap).
+    """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix).tolist()
+
+    build_start = time.perf_counter()
 
-def solve_CVRP_with_pulp(distance_matrix, demand, vehicle_capacity, num_vehicles, depot=0, show_model=False, show_plot=True):
     num_locations = len(distance_matrix)
     locations = range(num_locations)
 
@@ -16,83 +86,282 @@ def solve_CVRP_with_pulp(distance_matrix, demand, vehicle_capacity, num_vehicles
     # Auxiliary variables to avoid sub-tours
     u = LpVariable.dicts("u", (i for i in locations if i != depot), lowBound=0, upBound=vehicle_capacity, cat="Continuous")
 
+    # Column of every variable x[i, j, k] in the coefficient arrays; only arcs with i != j enter the model
+    variables = list(x.values())
+    arcs = np.array(list(x), dtype=int).reshape(-1, 3)
+    first, second, vehicle = arcs[:, 0], arcs[:, 1], arcs[:, 2]
+    columns = np.arange(len(arcs))
+    ones = np.ones(len(arcs), dtype=int)
+    arc = first != second
+
+    # Row of every customer (location except the depot) in the per-customer constraints
+    customers = [j for j in locations if j != depot]
+    customer_row = np.zeros(num_locations, dtype=int)
+    customer_row[customers] = np.arange(len(customers))
+
     # Objective function: minimize the total travel distance
-    cvrp_model += lpSum(distance_matrix[i][j] * x[i, j, k] for i in locations for j in locations if i != j for k in range(num_vehicles)), "Total_Distance"
+    cvrp_model += LpAffineExpression(zip([variables[c] for c in columns[arc].tolist()],
+                                          np.asarray(distance_matrix)[first[arc], second[arc]].tolist())), "Total_Distance"
 
     # Constraints
 
     # 1. Each customer is visited exactly once by one vehicle
-    for j in locations:
-        if j != depot:
-            cvrp_model += lpSum(x[i, j, k] for i in locations if i != j for k in range(num_vehicles)) == 1, f"Visit_{j}"
+    into_customer = arc & (second != depot)
+    add_constraints_in_bulk(cvrp_model, variables, customer_row[second[into_customer]], columns[into_customer], ones[into_customer],
+                            LpConstraintEQ, 1, [f"Visit_{j}" for j in customers])
 
-    # 2. Flow conservation for each vehicle: if a vehicle arrives at a location, it must leave that location
-    for k in range(num_vehicles):
-        for i in locations:
-            if i != depot:
-                cvrp_model += lpSum(x[i, j, k] for j in locations if i != j) == lpSum(x[j, i, k] for j in locations if i != j), f"Flow_{i}_{k}"
+    # 2. Flow conservation for each vehicle: if a vehicle arrives at a location, it must leave that location (outflow - inflow == 0)
+    from_customer = arc & (first != depot)
+    add_constraints_in_bulk(cvrp_model, variables,
+                            np.concatenate([vehicle[from_customer] * len(customers) + customer_row[first[from_customer]],
+                                            vehicle[into_customer] * len(customers) + customer_row[second[into_customer]]]),
+                            np.concatenate([columns[from_customer], columns[into_customer]]),
+                            np.concatenate([ones[from_customer], -ones[into_customer]]),
+                            LpConstraintEQ, 0, [f"Flow_{i}_{k}" for k in range(num_vehicles) for i in customers])
 
     # 3. Vehicle capacity constraint
-    for k in range(num_vehicles):
-        cvrp_model += lpSum(demand[j] * x[i, j, k] for i in locations for j in locations if i != j and j != depot) <= vehicle_capacity, f"Capacity_{k}"
+    add_constraints_in_bulk(cvrp_model, variables, vehicle[into_customer], columns[into_customer],
+                            np.asarray(demand)[second[into_customer]], LpConstraintLE, vehicle_capacity,
+                            [f"Capacity_{k}" for k in range(num_vehicles)])
 
-    # 4. Depot start and end constraint for each vehicle
-    for k in range(num_vehicles):
-        cvrp_model += lpSum(x[depot, j, k] for j in locations if j != depot) == 1, f"Start_{k}"
-        cvrp_model += lpSum(x[i, depot, k] for i in locations if i != depot) == 1, f"End_{k}"
+    # 4. Depot start and end constraint for each vehicle (rows Start_k and End_k alternate)
+    from_depot, into_depot = arc & (first == depot), arc & (second == depot)
+    add_constraints_in_bulk(cvrp_model, variables, np.concatenate([2 * vehicle[from_depot], 2 * vehicle[into_depot] + 1]),
+                            np.concatenate([columns[from_depot], columns[into_depot]]),
+                            np.concatenate([ones[from_depot], ones[into_depot]]),
+                            LpConstraintEQ, 1, [name for k in range(num_vehicles) for name in (f"Start_{k}", f"End_{k}")])
+
+    # 5. Subtour elimination constraints: u_i - u_j + Q * x[i, j, k] <= Q - demand_j, one row per arc between customers
+    between = from_customer & into_customer
+    rows = np.arange(np.count_nonzero(between))
+    u_columns = len(variables) + customer_row  # Column of u_i is u_columns[i]
+    add_constraints_in_bulk(cvrp_model, variables + list(u.values()), np.concatenate([rows, rows, rows]),
+                            np.concatenate([u_columns[first[between]], u_columns[second[between]], columns[between]]),
+                            np.concatenate([ones[between], -ones[between], vehicle_capacity * ones[between]]),
+                            LpConstraintLE, (vehicle_capacity - np.asarray(demand)[second[between]]).tolist(),
+                            [f"Subtour_{i}_{j}_{k}" for i, j, k in arcs[between].tolist()])
 
-    # 5. Subtour elimination constraints
-    for i in locations:
-        if i != depot:
-            for j in locations:
-                if i != j and j != depot:
-                    for k in range(num_vehicles):
-                        cvrp_model += u[i] - u[j] + vehicle_capacity * x[i, j, k] <= vehicle_capacity - demand[j], f"Subtour_{i}_{j}_{k}"
+    # Warm start: one route per vehicle (0-based, from and back to the depot), e.g. [[0, 1, 4, 0], [0, 3, 2, 0]].
+    # x[i, j, k] = 1 on the route of vehicle k and u_i is the load of the vehicle after serving location i
+    if warm_start is not None:
+        route_arcs, loads = routes_to_arcs(warm_start, demand, vehicle_capacity, num_vehicles, depot)
+        for key, var in x.items():
+            var.setInitialValue(1 if key in route_arcs else 0)
+        for i, var in u.items():
+            var.setInitialValue(loads[i])
 
-    # Solve the model
-    cvrp_model.solve()
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
+    # Solve the model, starting from the warm start routes if given
+    status, bound, gap = solve_with_limits(cvrp_model, time_limit, mip_gap, threads, warm_start=warm_start is not None, msg=msg)
+
+    solve_time = time.perf_counter() - solve_start
 
     # Show model details if requested
     if show_model:
         print("\nModel Summary:\n")
         print(cvrp_model)
 
-    # Retrieve and print the solution
-    if cvrp_model.status == LpStatusOptimal:
-        print("Total Distance:", value(cvrp_model.objective), "\n")
-
-        # Extract the solution routes for each vehicle
-        routes = {k: [] for k in range(num_vehicles)}
-        distances = {k: 0 for k in range(num_vehicles)}  # Store total distance for each vehicle
-        edges = {(i, j, k): value(x[i, j, k]) for i in locations for j in locations for k in range(num_vehicles)}
-
-        # Build the routes based on the edges where x[i, j, k] == 1
-        for k in range(num_vehicles):
-            route = [depot]
-            total_distance = 0
-            current_location = depot
-            while True:
-                next_location = next((j for (i, j, k_) in edges if i == current_location and edges[(i, j, k)] == 1), None)
-                if next_location is None or next_location == depot:
-                    break
-                route.append(next_location)
-                total_distance += distance_matrix[current_location][next_location]
-                current_location = next_location
-            route.append(depot)
-            total_distance += distance_matrix[current_location][depot]  # Add return to depot
-            routes[k] = route
-            distances[k] = total_distance
-            print(f"Route for vehicle {k + 1}: {route}")
-            print(f"Total Distance for vehicle {k + 1}: {total_distance}")
-
-        # Plot the routes if requested
-        if show_plot:
-          print("\n")
-          plot_cvrp_solution(distance_matrix, routes)
-    else:
+    # Retrieve the solution
+    if status not in ("Optimal", "Feasible"):
+        return CVRPResult(None, None, None, None, None, status, build_time, solve_time)
+
+    # Extract the solution routes for each vehicle
+    routes = {k: [] for k in range(num_vehicles)}
+    distances = {k: 0 for k in range(num_vehicles)}  # Store total distance for each vehicle
+    edges = {(i, j, k): value(x[i, j, k]) for i in locations for j in locations for k in range(num_vehicles)}
+
+    # Build the routes based on the edges where x[i, j, k] == 1
+    for k in range(num_vehicles):
+        route = [depot]
+        total_distance = 0
+        current_location = depot
+        while True:
+            next_location = next((j for (i, j, k_) in edges if i == current_location and edges[(i, j, k)] == 1), None)
+            if next_location is None or next_location == depot:
+                break
+            route.append(next_location)
+            total_distance += distance_matrix[current_location][next_location]
+            current_location = next_location
+        route.append(depot)
+        total_distance += distance_matrix[current_location][depot]  # Add return to depot
+        routes[k] = route
+        distances[k] = total_distance
+
+    result = CVRPResult(routes, value(cvrp_model.objective), distances, bound, gap, status, build_time, solve_time)
+
+    # Plot the routes if requested
+    if show_plot:
+        plot_cvrp_solution(distance_matrix, routes)
+
+    return result
+
+def print_result(result):
+    """
+    Prints a CVRP result: the build and solve times, the total distance (with the bound and gap when not
+    optimal) and the route and distance of every vehicle.
+
+    Parameters:
+    - result (CVRPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.routes is None:
         print("No optimal solution found.")
+        return
+
+    print("Total Distance:", result.total_distance, "\n")
+    if result.status == "Feasible":
+        # Stopped early: the routes below are the best found, not necessarily optimal
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    for k, route in result.routes.items():
+        print(f"Route for vehicle {k + 1}: {route}")
+        print(f"Total Distance for vehicle {k + 1}: {result.route_distances[k]}")
+
+def add_constraints_in_bulk(problem, variables, rows, columns, coefficients, sense, rhs, names):
+    """
+    Add a block of linear constraints to a PuLP problem from NumPy coefficient arrays.
+
+    The block is given in coordinate form: term t adds coefficients[t] * variables[columns[t]] to
+    constraint rows[t]. The terms are grouped by constraint with a single stable sort and every
+    constraint is built directly from (variable, coefficient) pairs, instead of summing products
+    of variables and coefficients with lpSum.
+
+    Parameters:
+    - problem (LpProblem): The problem to add the constraints to.
+    - variables (list): Decision variables, indexed by the column numbers.
+    - rows (numpy array): Constraint (0-based, in the order of names) of every term.
+    - columns (numpy array): Variable of every term.
+    - coefficients (numpy array): Coefficient of every term.
+    - sense (int): LpConstraintEQ, LpConstraintLE or LpConstraintGE, shared by the whole block.
+    - rhs (number or list): Right-hand side of the constraints, one value for all or one per constraint.
+    - names (list): Name of every constraint.
+    """
+    if not isinstance(rhs, list):
+        rhs = [rhs] * len(names)
+
+    order = np.argsort(rows, kind="stable")
+    bounds = np.searchsorted(rows[order], np.arange(len(names) + 1)).tolist()
+    terms = list(zip([variables[c] for c in columns[order].tolist()], coefficients[order].tolist()))
+    for r, name in enumerate(names):
+        problem.addConstraint(LpConstraint(LpAffineExpression(terms[bounds[r]:bounds[r + 1]]), sense, name, rhs[r]))
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def solve_with_limits(problem, time_limit=None, mip_gap=None, threads=None, warm_start=False, msg=True):
+    """
+    Solve a PuLP problem with CBC under an optional time limit and relative MIP gap, keeping the best
+    solution found when the solver stops early.
+
+    Parameters:
+    - problem (LpProblem): The problem to solve.
+    - time_limit (float): Time limit in seconds. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads used by CBC. Defaults to None (CBC default).
+    - warm_start (bool): Start from the initial values of the variables. Defaults to False.
+    - msg (bool): Show the solver log. Defaults to True.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), "Time Limit" (stopped on the time
+      limit before any solution was found), or the PuLP status otherwise, e.g., "Infeasible".
+    - bound (float): Best bound on the objective value (None without a solution).
+    - gap (float): Relative gap between the objective value and the bound (None without a solution).
+    """
+    # CBC only reports the bound in its log, so the log goes to a temporary file when the search can stop early
+    log_path = None
+    if time_limit is not None or mip_gap is not None:
+        handle, log_path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+
+    solve_start = time.perf_counter()
+    problem.solve(PULP_CBC_CMD(msg=msg and log_path is None, timeLimit=time_limit, gapRel=mip_gap, threads=threads,
+                               warmStart=warm_start, logPath=log_path))
+
+    log = ""
+    if log_path is not None:
+        with open(log_path) as file:
+            log = file.read()
+        os.remove(log_path)
+        if msg:
+            print(log)
+
+    if problem.sol_status not in (LpSolutionOptimal, LpSolutionIntegerFeasible):
+        # Stopped on the time limit without an integer solution, PuLP reports whatever status the unfinished
+        # search left in the solution file, which can be "Infeasible" for a feasible problem
+        if "Stopped on time" in log or (time_limit is not None and time.perf_counter() - solve_start >= time_limit):
+            return "Time Limit", None, None
+        return LpStatus[problem.status], None, None
+
+    objective = value(problem.objective)
+    match = re.search(r"^(?:Lower|Upper) bound:\s+(\S+)", log, re.MULTILINE)
+    bound = float(match.group(1)) if match else objective
+    gap = abs(objective - bound) / max(abs(objective), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal" in CBC, but the solution is only known to be within the gap
+    optimal = problem.sol_status == LpSolutionOptimal and (mip_gap is None or gap <= 1e-9)
+    return ("Optimal" if optimal else "Feasible"), bound, gap
+
+def routes_to_arcs(routes, demand, vehicle_capacity, num_vehicles, depot):
+    """
+    Convert warm start routes into the arcs used by every vehicle and the load after every location.
+
+    Parameters:
+    - routes (list of lists): One route per vehicle (0-based), starting and ending at the depot.
+    - demand (list): Demand of every location.
+    - vehicle_capacity (int): Capacity of every vehicle.
+    - num_vehicles (int): Number of vehicles.
+    - depot (int): Depot location.
+
+    Returns:
+    - route_arcs (set): Arcs (i, j, k) where vehicle k travels from location i to location j.
+    - loads (dict): Load of the vehicle after serving every customer.
+    """
+    if len(routes) != num_vehicles:
+        raise ValueError(f"The warm start needs one route per vehicle ({num_vehicles}), got {len(routes)}.")
+    route_arcs = set()
+    loads = {}
+    for k, route in enumerate(routes):
+        if len(route) < 3 or route[0] != depot or route[-1] != depot:
+            raise ValueError("Every warm start route must serve at least one customer and start and end at the depot.")
+        route_arcs.update((i, j, k) for i, j in zip(route, route[1:]))
+        load = 0
+        for j in route[1:-1]:
+            load += demand[j]
+            loads[j] = load
+        if load > vehicle_capacity:
+            raise ValueError(f"Warm start route {route} exceeds the vehicle capacity.")
+    if sorted(loads) != [j for j in range(len(demand)) if j != depot] or sum(len(route) - 2 for route in routes) != len(loads):
+        raise ValueError("The warm start routes must serve every customer exactly once.")
+    return route_arcs, loads
 
 def plot_cvrp_solution(distance_matrix, routes):
+    # Plotting libraries are only imported when a plot is requested
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.Graph()
     num_locations = len(distance_matrix)
 
@@ -126,4 +395,5 @@ if __name__ == "__main__":
   vehicle_capacity = 50
   num_vehicles = 2
 
-  solve_CVRP_with_pulp(distance_matrix, demand, vehicle_capacity, num_vehicles, show_model=False, show_plot=True)
\ No newline at end of file
+  result = solve_CVRP_with_pulp(distance_matrix, demand, vehicle_capacity, num_vehicles, show_model=False, show_plot=True)
+  print_result(result)
@@ -1,11 +1,78 @@
 # !pip install pyomo
 # !apt-get install -y -qq glpk-utils
 from pyomo.environ import *
-import matplotlib.pyplot as plt
-import networkx as nx
+from pyomo.opt import SolutionStatus
+import numpy as np
 import random
+import math
+import time
+
+# Names of the relative MIP gap and thread count options of the supported solvers
+MIP_GAP_OPTIONS = {"glpk": "mipgap", "cbc": "ratioGap", "gurobi": "MIPGap"}
+THREADS_OPTIONS = {"cbc": "threads", "gurobi": "Threads"}
+
+class CVRPResult:
+    """
+    Result of a CVRP solver. It unpacks like a tuple: routes, total_distance, bound, gap = result.
+
+    Attributes:
+    - routes (dict): Route of every vehicle as a list of locations, keyed by vehicle (0-based), or None if no
+      solution was found.
+    - total_distance (float): Total distance of all routes.
+    - route_distances (dict): Distance of every vehicle's route, keyed by vehicle.
+    - bound (float): Best lower bound on the optimal total distance (None if the solver does not report it).
+    - gap (float): Relative gap between total_distance and bound (0 when optimal, None if unknown).
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition otherwise.
+    - build_time (float): Time spent building the model in seconds.
+    - solve_time (float): Time spent by the solver in seconds.
+    """
+    __slots__ = ("routes", "total_distance", "route_distances", "bound", "gap", "status", "build_time", "solve_time")
+
+    def __init__(self, routes, total_distance, route_distances, bound, gap, status, build_time, solve_time):
+        self.routes = routes
+        self.total_distance = total_distance
+        self.route_distances = route_distances
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+        self.build_time = build_time
+        self.solve_time = solve_time
+
+    def __iter__(self):
+        return iter((self.routes, self.total_distance, self.bound, self.gap))
+
+    def __repr__(self):
+        return (f"CVRPResult(total_distance={self.total_distance!r}, routes={self.routes!r}, bound={self.bound!r}, "
+                f"gap={self.gap!r}, status={self.status!r}, build_time={self.build_time:.3f}, solve_time={self.solve_time:.3f})")
+
+def solve_CVRP_with_pyomo(distance_matrix, demand, vehicle_capacity, num_vehicles, depot=0, show_plot=False,
+                          time_limit=None, mip_gap=None, threads=None):
+    """
+    Solve the Capacitated Vehicle Routing Problem (CVRP) using Pyomo.
+
+    Parameters:
+    - distance_matrix (2D list or numpy array): Matrix of distances between locations (0-based index), or its
+      upper triangle as a condensed 1D array.
+    - demand (list): Demand of every location (0 for the depot).
+    - vehicle_capacity (int): Capacity of every vehicle.
+    - num_vehicles (int): Number of vehicles.
+    - depot (int): Depot location. Defaults to 0.
+    - show_plot (bool): If True, plots the routes. Defaults to False.
+    - time_limit (float): Time limit in seconds. When it is reached, the best routes found so far are reported
+      together with the best bound and the gap. Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the solver stops, e.g., 0.01 for 1%. Defaults to None (solve to optimality).
+    - threads (int): Number of threads, for solvers that support it (not GLPK). Defaults to None (solver default).
+
+    Returns:
+    - result (CVRPResult): The routes, their total and per-vehicle distances, the bound, the gap, the status and
+      the build and solve times. It unpacks like the tuple (routes, total_distance, bound, gap).
+    """
+    # A condensed distance array (the upper triangle) is expanded to the full matrix first
+    if np.ndim(distance_matrix) == 1:
+        distance_matrix = square_distance_matrix(distance_matrix).tolist()
+
+    build_start = time.perf_counter()
 
-def solve_CVRP_with_pyomo(distance_matrix, demand, vehicle_capacity, num_vehicles, depot=0, show_plot=True):
     num_locations = len(distance_matrix)
     locations = range(num_locations)
 
@@ -68,16 +135,22 @@ def solve_CVRP_with_pyomo(distance_matrix, demand, vehicle_capacity, num_vehicle
         return Constraint.Skip
     model.subtour_constraint = Constraint(model.Pairs, model.Vehicles, rule=subtour_constraint)
 
+    build_time = time.perf_counter() - build_start
+    solve_start = time.perf_counter()
+
     # Solve the model
-    SolverFactory('glpk').solve(model) # Ensure you have GLPK installed, or use a different solver like 'cbc' or 'gurobi'
+    # Ensure you have GLPK installed, or use a different solver like 'cbc' or 'gurobi'
+    status, bound, gap = solve_with_limits(SolverFactory('glpk'), model, time_limit, mip_gap, threads)
+    solve_time = time.perf_counter() - solve_start
+    if status not in ("Optimal", "Feasible"):
+        return CVRPResult(None, None, None, None, None, status, build_time, solve_time)
 
-    # Retrieve and print the solution
+    # Retrieve the solution
     routes = {k: [] for k in range(num_vehicles)}
     distances = {k: 0 for k in range(num_vehicles)}
 
-    # Print the overall total distance using the objective value
+    # The overall total distance is the objective value
     total_distance = value(model.objective)
-    print(f"Total Distance: {total_distance}", "\n")
 
     for k in model.Vehicles:
         route = [depot]
@@ -94,14 +167,115 @@ def solve_CVRP_with_pyomo(distance_matrix, demand, vehicle_capacity, num_vehicle
         total_distance_vehicle += distance_matrix[current_location][depot]
         routes[k] = route
         distances[k] = total_distance_vehicle
-        print(f"Route for vehicle {k + 1}: {route}")
-        print(f"Total Distance for vehicle {k + 1}: {total_distance_vehicle}")
+
+    result = CVRPResult(routes, total_distance, distances, bound, gap, status, build_time, solve_time)
 
     # Plot the routes if requested
     if show_plot:
         plot_cvrp_solution(distance_matrix, routes)
 
+    return result
+
+def print_result(result):
+    """
+    Prints a CVRP result: the build and solve times, the total distance (with the bound and gap when not
+    optimal) and the route and distance of every vehicle.
+
+    Parameters:
+    - result (CVRPResult): The result returned by the solver.
+    """
+    print("Model Build Time:", f"{result.build_time:.3f} s")
+    print("Solve Time:", f"{result.solve_time:.3f} s", "\n")
+    if result.routes is None:
+        print("No optimal solution found.")
+        return
+
+    print("Total Distance:", result.total_distance, "\n")
+    if result.status == "Feasible":
+        # Stopped early: the routes below are the best found, not necessarily optimal
+        print("Best Bound:", result.bound, "| Gap:", result.gap, "\n")
+    for k, route in result.routes.items():
+        print(f"Route for vehicle {k + 1}: {route}")
+        print(f"Total Distance for vehicle {k + 1}: {result.route_distances[k]}")
+
+def square_distance_matrix(condensed):
+    """
+    Expand a condensed distance array into the full symmetric matrix.
+
+    Parameters:
+    - condensed (1D list or numpy array): The n(n-1)/2 distances d(i, j) for i < j, row by row, as returned
+      by generate_distance_matrix(points, condensed=True).
+
+    Returns:
+    - distance_matrix (numpy array): n x n matrix with a zero diagonal, in the dtype of condensed.
+    """
+    condensed = np.asarray(condensed)
+    n = (1 + math.isqrt(1 + 8 * len(condensed))) // 2
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError("A condensed distance array must hold n(n-1)/2 distances.")
+
+    distance_matrix = np.zeros((n, n), dtype=condensed.dtype)
+    start = 0
+    for i in range(n - 1):
+        row = condensed[start:start + n - i - 1]
+        distance_matrix[i, i + 1:] = row
+        distance_matrix[i + 1:, i] = row
+        start += n - i - 1
+    return distance_matrix
+
+def solve_with_limits(solver, model, time_limit=None, mip_gap=None, threads=None, warmstart=False):
+    """
+    Solve a Pyomo model under an optional time limit and relative MIP gap, keeping the best solution
+    found when the solver stops early.
+
+    Parameters:
+    - solver: Solver created with SolverFactory.
+    - model (ConcreteModel): The model to solve, with a single active objective.
+    - time_limit (float): Time limit in seconds (rounded up to whole seconds). Defaults to None (no limit).
+    - mip_gap (float): Relative gap at which the search stops, e.g., 0.01 for 1%. Defaults to None.
+    - threads (int): Number of threads, if the solver supports it. Defaults to None.
+    - warmstart (bool): Start from the current values of the variables. Defaults to False.
+
+    Returns:
+    - status (str): "Optimal", "Feasible" (stopped early with a solution), or the termination condition
+      otherwise, e.g., "infeasible".
+    - bound (float): Best bound on the objective value (None if unknown).
+    - gap (float): Relative gap between the objective value and the bound (None if unknown).
+    """
+    if mip_gap is not None and solver.name in MIP_GAP_OPTIONS:
+        solver.options[MIP_GAP_OPTIONS[solver.name]] = mip_gap
+    if threads is not None and solver.name in THREADS_OPTIONS:
+        solver.options[THREADS_OPTIONS[solver.name]] = threads
+    options = {"warmstart": True} if warmstart else {}
+    if time_limit is not None:
+        options["timelimit"] = max(1, math.ceil(time_limit))
+
+    result = solver.solve(model, load_solutions=False, **options)
+    if len(result.solution) == 0 or result.solution(0).status not in (
+            SolutionStatus.optimal, SolutionStatus.feasible, SolutionStatus.stoppedByLimit, SolutionStatus.bestSoFar):
+        return str(result.solver.termination_condition), None, None
+    model.solutions.load_from(result)
+
+    objective = next(model.component_data_objects(Objective, active=True))
+    objective_value = value(objective)
+    optimal = result.solver.termination_condition == TerminationCondition.optimal
+    bound = result.problem.lower_bound if objective.sense == minimize else result.problem.upper_bound
+    if bound is None or not math.isfinite(bound):
+        bound = objective_value if optimal else None
+    elif objective.sense == maximize and bound < objective_value - 1e-6 * max(1.0, abs(objective_value)):
+        # Pyomo's CBC interface can report the bound of a maximization with the sign of CBC's internal minimization
+        bound = -bound if -bound >= objective_value else None
+    gap = None if bound is None else abs(objective_value - bound) / max(abs(objective_value), 1e-10)
+    # A search stopped by the gap tolerance ends as "optimal", but the solution is only known to be within the gap
+    if mip_gap is not None and (gap is None or gap > 1e-9):
+        optimal = False
+    return ("Optimal" if optimal else "Feasible"), bound, gap
+
 def plot_cvrp_solution(distance_matrix, routes):
+    # Plotting libraries are only imported when a plot is requested
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.Graph()
     num_locations = len(distance_matrix)
 
@@ -135,4 +309,5 @@ if __name__ == "__main__":
   vehicle_capacity = 50
   num_vehicles = 2
 
-  solve_CVRP_with_pyomo(distance_matrix, demand, vehicle_capacity, num_vehicles, show_plot=True)
\ No newline at end of file
+  result = solve_CVRP_with_pyomo(distance_matrix, demand, vehicle_capacity, num_vehicles, show_plot=True)
+  print_result(result)
@@ -1,9 +1,32 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 import heapq
+import time
 
+class ShortestPathResult:
+    """
+    Result of a shortest path solver. It unpacks like a tuple: path, distance = result.
+
+    Attributes:
+    - path (list): The shortest path as a list of nodes from source to target (empty if the target is unreachable).
+    - distance (float): Total weight of the shortest path (inf if the target is unreachable).
+    - status (str): "Optimal", or "Unreachable" if no path connects the source and the target.
+    - solve_time (float): Time spent by the algorithm in seconds.
+    """
+    __slots__ = ("path", "distance", "status", "solve_time")
+
+    def __init__(self, path, distance, status, solve_time):
+        self.path = path
+        self.distance = distance
+        self.status = status
+        self.solve_time = solve_time
 
-def shortest_path_with_dijkstra(nodes, edges, source, target):
+    def __iter__(self):
+        return iter((self.path, self.distance))
+
+    def __repr__(self):
+        return (f"ShortestPathResult(distance={self.distance!r}, path={self.path!r}, "
+                f"status={self.status!r}, solve_time={self.solve_time:.6f})")
+
+def shortest_path_with_dijkstra(nodes, edges, source, target, show_plot=False):
     """
     Solves the shortest path problem using Dijkstra's algorithm.
 
@@ -12,7 +35,13 @@ def shortest_path_with_dijkstra(nodes, edges, source, target):
     - edges (dict): Dictionary with (node1, node2) tuples as keys and weights as values.
     - source (int): The starting node for the shortest path.
     - target (int): The destination node for the shortest path.
+    - show_plot (bool): If True, plots the graph with the shortest path highlighted. Defaults to False.
+
+    Returns:
+    - result (ShortestPathResult): The shortest path, its distance, the status and the solve time.
     """
+    solve_start = time.perf_counter()
+
     # Create adjacency list for the graph
     graph = {node: [] for node in nodes}
     for (node1, node2), weight in edges.items():
@@ -47,18 +76,31 @@ def shortest_path_with_dijkstra(nodes, edges, source, target):
 
     # Reconstruct the shortest path
     path = []
-    current = target
+    current = target if distances[target] < float('inf') else None
     while current is not None:
         path.append(current)
         current = parents[current]
     path.reverse()
 
-    # Display the total weight and the shortest path
-    print("Shortest Path Distance:", distances[target], "\n")
-    print("Shortest Path:", " -> ".join(map(str, path)), "\n")
+    status = "Optimal" if path else "Unreachable"
+    result = ShortestPathResult(path, distances[target], status, time.perf_counter() - solve_start)
 
-    # Plot the shortest path for visual understanding
-    plot_shortest_path(nodes, edges, path, distances[target])
+    # Plot the shortest path if show_plot is True
+    if show_plot:
+        plot_shortest_path(nodes, edges, path, distances[target])
+
+    return result
+
+
+def print_result(result):
+    """
+    Prints the distance and the nodes of a shortest path result.
+
+    Parameters:
+    - result (ShortestPathResult): The result returned by the solver.
+    """
+    print("Shortest Path Distance:", result.distance, "\n")
+    print("Shortest Path:", " -> ".join(map(str, result.path)) if result.path else "No path", "\n")
 
 
 def plot_shortest_path(nodes, edges, path, total_weight):
@@ -71,6 +113,10 @@ def plot_shortest_path(nodes, edges, path, total_weight):
     - path (list): The shortest path as a list of nodes.
     - total_weight (float): The total weight of the shortest path.
     """
+    # Plotting libraries are only imported when a plot is requested
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     # Set figure size for better visibility
     plt.figure(figsize=(10, 6))  # Adjust width and height as needed
 
@@ -122,4 +168,6 @@ if __name__ == "__main__":
     source = 1  # Starting node
     target = 7  # Destination node
 
-    shortest_path_with_dijkstra(nodes, edges, source, target)
\ No newline at end of file
+    result = shortest_path_with_dijkstra(nodes, edges, source, target)
+    print_result(result)
+    plot_shortest_path(nodes, edges, result.path, result.distance)
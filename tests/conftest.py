@@ -0,0 +1,22 @@
+import glob
+import importlib.util
+import os
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_script(file_name):
+    """Import a solver script by its file name; the scripts live in folders with spaces in their names."""
+    path, = glob.glob(os.path.join(ROOT, "**", file_name), recursive=True)
+    spec = importlib.util.spec_from_file_location(os.path.splitext(file_name)[0].replace(" ", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def script():
+    return load_script
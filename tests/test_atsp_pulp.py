@@ -0,0 +1,12 @@
+import numpy as np
+
+def test_out_of_time_still_returns_a_tour(script):
+    atsp = script("ATSP with Pulp.py")
+    rng = np.random.default_rng(0)
+    points = rng.random((150, 2)) * 1000
+    distances = (np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)) * rng.uniform(1, 1.1, (150, 150))).round()
+    np.fill_diagonal(distances, 0)
+    result = atsp.solve_atsp_with_pulp(distances.tolist(), time_limit=0.3)
+    assert result.status == "Feasible"
+    assert sorted(i for i, j in result.tour) == list(range(1, 151))
+    assert sorted(j for i, j in result.tour) == list(range(1, 151))
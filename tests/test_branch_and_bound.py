@@ -0,0 +1,22 @@
+import time
+
+import numpy as np
+
+def test_root_bound_meeting_the_tour_is_optimal_at_the_deadline(script):
+    bnb = script("TSP with Branch and Bound.py")
+    angles = np.linspace(0, 2 * np.pi, 10, endpoint=False)
+    points = np.column_stack([np.cos(angles), np.sin(angles)])
+    distances = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1))
+    result = bnb.solve_tsp_with_branch_and_bound(distances, time_limit=0)
+    assert result.status == "Optimal"
+    assert result.gap == 0
+
+def test_time_limit_covers_the_heuristic_and_the_root(script):
+    bnb = script("TSP with Branch and Bound.py")
+    points = np.random.default_rng(150).random((150, 2)) * 1000
+    distances = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).round()
+    start = time.perf_counter()
+    result = bnb.solve_tsp_with_branch_and_bound(distances, time_limit=0.05)
+    assert time.perf_counter() - start < 0.5
+    assert result.status == "Feasible"
+    assert result.bound <= result.total_distance
@@ -0,0 +1,13 @@
+import numpy as np
+
+def test_single_city_from_coordinates(script):
+    lk = script("TSP with Lin-Kernighan.py")
+    result = lk.solve_tsp_with_lin_kernighan(coordinates=np.array([[0.0, 0.0]]))
+    assert result.tour == [1, 1]
+    assert result.total_distance == 0.0
+
+def test_two_cities_from_coordinates(script):
+    lk = script("TSP with Lin-Kernighan.py")
+    result = lk.solve_tsp_with_lin_kernighan(coordinates=np.array([[0.0, 0.0], [3.0, 4.0]]))
+    assert result.tour == [1, 2, 1]
+    assert result.total_distance == 10.0
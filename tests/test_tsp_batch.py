@@ -0,0 +1,23 @@
+import numpy as np
+
+def test_condensed_instances_match_square_ones(script):
+    batch = script("TSP Batch Solve.py")
+    rng = np.random.default_rng(0)
+    square = []
+    for _ in range(5):
+        points = rng.random((8, 2))
+        square.append(np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)))
+    condensed = [matrix[np.triu_indices(8, 1)] for matrix in square]
+    for method in ("nearest_neighbor", "held_karp"):
+        expected = batch.solve_tsp_batch(square, method=method)
+        np.testing.assert_allclose(batch.solve_tsp_batch(condensed, method=method)["total_distance"],
+                                   expected["total_distance"])
+        np.testing.assert_allclose(batch.solve_tsp_batch(np.stack(condensed), method=method)["total_distance"],
+                                   expected["total_distance"])
+
+def test_held_karp_picks_the_shorter_direction_of_three_cities(script):
+    batch = script("TSP Batch Solve.py")
+    distances = np.array([[[0, 1, 10], [10, 0, 1], [1, 10, 0]],
+                          [[0, 10, 1], [1, 0, 10], [10, 1, 0]]], dtype=float)
+    results = batch.solve_tsp_batch(distances, method="held_karp")
+    np.testing.assert_allclose(results["total_distance"], [3, 3])
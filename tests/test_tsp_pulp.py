@@ -0,0 +1,13 @@
+import numpy as np
+
+def random_distances(n, seed=1):
+    points = np.random.default_rng(seed).random((n, 2)) * 1000
+    return np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).round().tolist()
+
+def test_lazy_rounds_keep_a_tour_when_out_of_time(script):
+    pulp_tsp = script("TSP with Pulp.py")
+    distances = random_distances(120)
+    result = pulp_tsp.solve_tsp_with_pulp(distances, formulation="symmetric", time_limit=0.3)
+    assert result.status == "Feasible"
+    assert sorted(i for i, j in result.tour) == list(range(1, 121))
+    assert result.bound <= result.total_distance
@@ -0,0 +1,9 @@
+import numpy as np
+
+def test_time_limit_without_a_solution_is_labelled(script):
+    vrp = script("VRP with Pulp.py")
+    points = np.random.default_rng(0).random((30, 2)) * 100
+    distances = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).round().tolist()
+    result = vrp.solve_VRP_with_pulp(distances, [0] + [1] * 29, 3, time_limit=0.01)
+    assert result.status == "Time Limit"
+    assert result.routes is None